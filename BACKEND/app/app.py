@@ -12,7 +12,9 @@ from app.routes.routes import router
 from app.routes.methods.routes import router as methods_router
 from app.routes.linear_equation_systems.routes import router as linear_equation_systems_router
 from app.routes.interpolation.routes import router as interpolation_router
+from app.routes.batch.routes import router as batch_router
 from app.utils.crud import init_db
+from app.utils.workers import shutdown_runner
 
 # FastAPI imports
 from fastapi.openapi.utils import get_openapi
@@ -27,6 +29,7 @@ async def lifespan(app: FastAPI):
     yield
     
     # Actions to be executed during shutdown
+    shutdown_runner()
     print('API shut down')
 
 
@@ -98,3 +101,4 @@ app.include_router(router, prefix=f'/api/{API_VERSION}/{API_NAME}')
 app.include_router(methods_router, prefix=f'/api/{API_VERSION}/{API_NAME}/methods')
 app.include_router(linear_equation_systems_router, prefix=f'/api/{API_VERSION}/{API_NAME}/linear_equations_system')
 app.include_router(interpolation_router, prefix=f'/api/{API_VERSION}/{API_NAME}/interpolation')
+app.include_router(batch_router, prefix=f'/api/{API_VERSION}/{API_NAME}/batch')
@@ -19,3 +19,13 @@ DATABASE_URL = f"mysql+pymysql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_H
 # Default user configuration
 DEFAULT_USER_PASSWORD = os.getenv('DEFAULT_USER_PASSWORD')
 DEFAULT_USER_NAME = os.getenv('DEFAULT_USER_NAME')
+
+# Cache configuration
+CACHE_MAX_SIZE = int(os.getenv('CACHE_MAX_SIZE', 1024)) # Maximum number of expressions stored in each cache
+FACTORIZATIONS_CACHE_MAX_SIZE = int(os.getenv('FACTORIZATIONS_CACHE_MAX_SIZE', 32)) # Maximum number of LU factorizations stored in the cache
+
+# Execution configuration
+EXECUTION_MODE = os.getenv('EXECUTION_MODE', 'process') # Where the methods run, process for a pool of worker processes or thread for threads of the server
+MAX_WORKERS = int(os.getenv('MAX_WORKERS', os.cpu_count() or 1)) # Number of worker processes which run the methods
+JOB_TIMEOUT = float(os.getenv('JOB_TIMEOUT', 120)) or None # Seconds a method can run before its worker is killed, 0 for no limit
+JACOBI_THREADS = int(os.getenv('JACOBI_THREADS', max(1, (os.cpu_count() or 1) // MAX_WORKERS))) # Number of threads which split the rows of the sparse Jacobi and multicolor iterations of big systems, by default the cores of every worker
@@ -0,0 +1,228 @@
+from app.domain.lu_factorization import LUFactorization, BLOCK_SIZE
+from app.utils.utils import raise_exception
+from app.routes.routes import logger
+from decimal import Decimal
+import math
+import numpy as np
+from typing import Optional, Tuple
+
+# Names of the factorizations of the symmetric positive definite matrices
+METHODS = ("cholesky", "ldlt")
+
+
+class CholeskyFactorization(LUFactorization):
+    """
+    Direct method for symmetric positive definite matrices, with the Cholesky factorization A = L L^T or the factorization A = L D L^T,
+    where L has ones in the diagonal and D is diagonal and doesn't need square roots. Both read only the lower triangle of A and store
+    only L, so they take about half the operations and the memory of the LU factorization.
+
+    The symmetry is checked before factorizing and a pivot which isn't positive shows that A isn't positive definite, in both cases the
+    method falls back to the LU factorization with partial pivot.
+    """
+    def is_symmetric(self, A: np.array) -> bool:
+        """
+        This function checks if the matrix is symmetric, up to the rounding errors of its values.
+
+        :param A: numpy array with float64 or Decimal numbers
+        :return: True if the matrix is symmetric
+        """
+        A = np.asarray(A, dtype=float)
+        return bool(np.allclose(A, A.T, rtol=1e-12, atol=0))
+
+    def factorize_symmetric_float64(self, A: np.array, n: int, method: str = "cholesky", block_size: int = BLOCK_SIZE) -> Optional[Tuple[np.array, np.array]]:
+        """
+        This function computes the Cholesky or the LDL^T factorization of the matrix of coefficients with float64 numbers, with the
+        blocked left-looking algorithm. Every panel of block_size columns is first updated with the columns of L to its left with one
+        matrix product, and then factorized column by column, so only the lower triangle is computed and most of the work is done by the
+        matrix products of BLAS.
+
+        :param A: numpy array with the coefficients of the system of equations
+        :param n: length of the system of equations
+        :param method: name of the factorization, cholesky or ldlt
+        :param block_size: number of columns of every panel
+        :return: the L matrix and the diagonal of D, None for the Cholesky factorization, or None if A isn't positive definite
+        """
+        if block_size <= 0:
+            raise_exception(ValueError("El tamaño del bloque debe ser un entero positivo"), logger)
+
+        A = np.array(A, dtype=float)
+        d = np.ones(n)
+
+        for start in range(0, n, block_size):
+            end = min(start + block_size, n)
+
+            # Update the panel with the columns of L to its left, scaled by D for the LDL^T factorization
+            if start > 0:
+                W = A[start:end, :start] * d[:start]
+                A[start:, start:end] -= A[start:, :start] @ W.T
+
+            for k in range(start, end):
+                pivot = A[k, k]
+                # The pivot isn't positive, or is not a number, so A isn't positive definite
+                if not pivot > 0:
+                    return None
+
+                column = A[k + 1:, k].copy()
+                if method == "cholesky":
+                    A[k, k] = math.sqrt(pivot)
+                    A[k + 1:, k] = column / A[k, k]
+                    A[k + 1:, k + 1:end] -= np.outer(A[k + 1:, k], A[k + 1:end, k])
+                else:
+                    d[k] = pivot
+                    A[k + 1:, k] = column / pivot
+                    A[k + 1:, k + 1:end] -= np.outer(A[k + 1:, k], column[:end - k - 1])
+
+        if method == "cholesky":
+            return np.tril(A), None
+
+        return np.tril(A, k=-1) + np.eye(n), d
+
+    def factorize_symmetric_decimal(self, A: np.array, n: int, method: str = "cholesky") -> Optional[Tuple[np.array, np.array]]:
+        """
+        This function computes the Cholesky or the LDL^T factorization of the matrix of coefficients with Decimal numbers, column by
+        column with the Cholesky-Crout algorithm.
+
+        :param A: numpy array with the coefficients of the system of equations as Decimal numbers
+        :param n: length of the system of equations
+        :param method: name of the factorization, cholesky or ldlt
+        :return: the L matrix and the diagonal of D, None for the Cholesky factorization, or None if A isn't positive definite
+        """
+        L = self.redefine_to_decimal(np.zeros((n, n)))
+        d = self.redefine_to_decimal(np.ones((1, n)))[0]
+
+        # Iterate over the columns
+        for j in range(n):
+            pivot = A[j, j] - sum(L[j, k] * L[j, k] * d[k] for k in range(j))
+            if pivot <= 0:
+                return None
+
+            if method == "cholesky":
+                L[j, j] = pivot.sqrt()
+            else:
+                d[j] = pivot
+                L[j, j] = Decimal(1)
+
+            # Iterate over the rows below the diagonal
+            for i in range(j + 1, n):
+                value = A[i, j] - sum(L[i, k] * L[j, k] * d[k] for k in range(j))
+                L[i, j] = value / (L[j, j] if method == "cholesky" else d[j])
+
+        return L, None if method == "cholesky" else d
+
+    def factorize(self, A: np.array = None, n: int = None, method: str = "cholesky", block_size: int = BLOCK_SIZE) -> Tuple[str, tuple]:
+        """
+        This function computes the Cholesky or the LDL^T factorization of the matrix of coefficients, or the LU factorization with
+        partial pivot if the matrix isn't symmetric positive definite.
+
+        :param A: numpy array with the coefficients of the system of equations
+        :param n: length of the system of equations
+        :param method: name of the factorization, cholesky or ldlt
+        :param block_size: number of columns of every panel of the float64 factorization
+        :return: the name of the computed factorization, cholesky, ldlt or lu, and its factors, the L matrix and the diagonal of D or
+        the L matrix, the U matrix and the permutation vector
+        """
+        if method not in METHODS:
+            raise_exception(ValueError("El método de factorización no es válido, este debe ser cholesky o ldlt"), logger)
+        if A is None:
+            A = self.A.copy()
+        if n is None:
+            n = self.n
+
+        if self.is_symmetric(A):
+            if self.engine == "float64":
+                factors = self.factorize_symmetric_float64(A, n, method, block_size)
+            else:
+                factors = self.factorize_symmetric_decimal(A, n, method)
+            if factors is not None:
+                return method, factors
+            logger.info("La matriz A no es definida positiva, se usa la factorización LU")
+        else:
+            logger.info("La matriz A no es simétrica, se usa la factorización LU")
+
+        return "lu", super().factorize(A, n, pivot_type=1, block_size=block_size)
+
+    @staticmethod
+    def reconstruct_matrix(method: str, factors: tuple) -> np.array:
+        """
+        This function computes the matrix of coefficients from its factorization, for the errors of the systems solved with a stored
+        factorization without the matrix.
+
+        :param method: name of the factorization, cholesky, ldlt or lu
+        :param factors: factors of the factorization, as returned by factorize
+        :return: numpy array with the matrix of coefficients, with the numbers of the factorization
+        """
+        if method == "lu":
+            return LUFactorization.reconstruct_matrix(*factors)
+
+        L, d = factors
+        if d is not None:
+            return np.dot(L * d, L.T)
+
+        return np.dot(L, L.T)
+
+    def substitute(self, method: str, factors: tuple, b: np.array = None, n: int = None) -> np.array:
+        """
+        This function solves the system of equations for every right-hand side with a computed factorization. For the Cholesky and the
+        LDL^T factorizations the progressive substitution is done with L and the regressive one with L^T, and every step computes one
+        unknown of all the right-hand sides at once.
+
+        :param method: name of the factorization, cholesky, ldlt or lu
+        :param factors: factors of the factorization, as returned by factorize
+        :param b: numpy array with a column vector or one right-hand side per row
+        :param n: length of the system of equations
+        :return: numpy array with the solution of every right-hand side in its own row
+        """
+        if method == "lu":
+            return super().substitute(*factors, b, n)
+
+        if b is None:
+            b = self.b
+        if n is None:
+            n = self.n
+
+        # Every row of b is a right-hand side, except for a column vector
+        if b.shape == (n, 1):
+            b = b.T
+
+        L, d = factors
+        if L.dtype != object:
+            b = np.asarray(b, dtype=float)
+
+        # Progressive substitution, L y = b
+        y = np.zeros(b.shape, dtype=L.dtype)
+        for i in range(n):
+            y[:, i] = b[:, i] - y[:, :i] @ L[i, :i]
+            if d is None:
+                y[:, i] = y[:, i] / L[i, i]
+
+        if d is not None:
+            y = y / d
+
+        # Regressive substitution, L^T x = y
+        x = np.zeros(b.shape, dtype=L.dtype)
+        for i in range(n - 1, -1, -1):
+            x[:, i] = y[:, i] - x[:, i + 1:] @ L[i + 1:, i]
+            if d is None:
+                x[:, i] = x[:, i] / L[i, i]
+
+        # Store the solution in the object
+        self.x = x
+
+        return x
+
+    def solve(self, A: np.array = None, b: np.array = None, n: int = None, method: str = "cholesky", block_size: int = BLOCK_SIZE) -> Tuple[np.array, str, tuple]:
+        """
+        This function performs the Cholesky or the LDL^T factorization method to solve a system of equations, with the LU factorization
+        if the matrix isn't symmetric positive definite.
+
+        :param A: numpy array with the coefficients of the system of equations
+        :param b: numpy array with a column vector or one right-hand side per row
+        :param n: length of the system of equations
+        :param method: name of the factorization, cholesky or ldlt
+        :param block_size: number of columns of every panel of the float64 factorization
+        :return: numpy array with the solutions of the system of equations, the name of the computed factorization and its factors
+        """
+        method, factors = self.factorize(A, n, method, block_size)
+        x = self.substitute(method, factors, b, n)
+
+        return x, method, factors
@@ -0,0 +1,235 @@
+from app.utils.utils import raise_exception
+from app.utils.tables import IterationTable
+from app.utils.sparse import CSRMatrix
+from app.utils.stationary import iterate
+from app.utils.triangular import lower_solver, upper_solver
+from app.routes.routes import logger
+import math
+import numpy as np
+from typing import Callable, List, Tuple, Union
+
+# Names of the preconditioners
+PRECONDITIONERS = ("none", "jacobi", "ssor", "incomplete_cholesky")
+
+
+class ConjugateGradient:
+    """
+    Preconditioned conjugate gradient method for systems with a symmetric positive definite matrix, dense or in compressed sparse row
+    format, with float64 numbers. Every iteration takes one product by A and one application of the preconditioner, and in exact
+    arithmetic the method ends in at most n iterations.
+
+    The preconditioners are M = K K^T with K lower triangular, so applying M^-1 takes a forward and a backward substitution:
+    Jacobi, K = D^1/2; SSOR, K = sqrt(w / (2 - w)) (D / w + L) (D / w)^-1/2; and the incomplete Cholesky factorization without fill-in,
+    with the nonzero values of K in the positions of the nonzero values of the lower triangle of A.
+    """
+    def __init__(self, A: Union[np.ndarray, CSRMatrix], b: np.array, x_initial: np.array, n: int = None):
+        self.sparse = isinstance(A, CSRMatrix)
+        self.A = A if self.sparse else np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float).ravel()
+        self.x_initial = np.asarray(x_initial, dtype=float).ravel()
+
+        self.validate_input(self.A, self.b, n, self.x_initial)
+        self.n = self.A.shape[0]
+        self.diagonal = self.A.diagonal() if self.sparse else np.diag(self.A)
+
+        self.x = None
+        self.scalar_error = None
+
+    def validate_input(self, A: Union[np.ndarray, CSRMatrix], b: np.array, n: int, x_initial: np.array):
+        """
+        This function validates the input for the conjugate gradient method.
+
+        :param A: dense or sparse matrix with the coefficients of the system of equations
+        :param b: vector with the solutions of the system of equations
+        :param n: length of the system of equations
+        :param x_initial: vector with the initial guess for the solution
+        """
+        # Check if the matrix A is square
+        if not self.sparse and A.ndim != 2:
+            raise_exception(ValueError("La matriz A debe ser una matriz de dos dimensiones"), logger)
+        if A.shape[0] != A.shape[1]:
+            raise_exception(ValueError("La matriz A no es cuadrada"), logger)
+
+        # Check if the vectors are correct
+        if b.size != A.shape[0]:
+            raise_exception(ValueError("La longitud del vector b no es igual al número de filas de la matriz A"), logger)
+        if x_initial.size != A.shape[0]:
+            raise_exception(ValueError("La longitud del vector x inicial no es igual al número de filas de la matriz A"), logger)
+
+        # Check if the length of n is equal to the number of rows in the matrix A
+        if n is not None and n != A.shape[0]:
+            raise_exception(ValueError("La longitud de n no es igual al número de filas y columnas de la matriz A"), logger)
+
+        if not self.is_symmetric(A):
+            raise_exception(ValueError("La matriz A no es simétrica, el método del gradiente conjugado requiere una matriz simétrica definida positiva"), logger)
+
+    def is_symmetric(self, A: Union[np.ndarray, CSRMatrix]) -> bool:
+        """
+        This function checks if the matrix is symmetric, up to the rounding errors of its values.
+
+        :param A: dense or sparse matrix
+        :return: True if the matrix is symmetric
+        """
+        if not self.sparse:
+            return bool(np.allclose(A, A.T, rtol=1e-12, atol=0))
+
+        # The transpose of the matrix, with the values sorted by row and column as in the matrix
+        transpose = CSRMatrix.from_coo(A.indices, A.rows, A.data, A.shape)
+        matrix = CSRMatrix.from_coo(A.rows, A.indices, A.data, A.shape)
+        if not np.array_equal(matrix.indices, transpose.indices) or not np.array_equal(matrix.indptr, transpose.indptr):
+            return False
+        return bool(np.allclose(matrix.data, transpose.data, rtol=1e-12, atol=0))
+
+    def lower_triangle(self, A: Union[np.ndarray, CSRMatrix] = None) -> Union[np.ndarray, CSRMatrix]:
+        """
+        This function gets the lower triangle of a matrix, with the diagonal.
+
+        :param A: dense or sparse matrix, by default the matrix of coefficients
+        :return: the lower triangle, dense or sparse like the matrix
+        """
+        if A is None:
+            A = self.A
+
+        if not isinstance(A, CSRMatrix):
+            return np.tril(A)
+
+        lower = A.indices <= A.rows
+        return CSRMatrix.from_coo(A.rows[lower], A.indices[lower], A.data[lower], A.shape)
+
+    def incomplete_cholesky(self) -> Union[np.ndarray, CSRMatrix]:
+        """
+        This function calculates the incomplete Cholesky factorization without fill-in, A ~ K K^T, where K only has nonzero values in
+        the positions of the nonzero values of the lower triangle of A.
+
+        :return: the lower triangular factor K, dense or sparse like A
+        """
+        message = "La factorización incompleta de Cholesky no existe porque un pivote no es positivo. Asegúrese que la matriz A sea definida positiva o use otro precondicionador"
+
+        # A dense matrix is factorized in compressed sparse row format too, so the work only depends on its nonzero values
+        lower = self.lower_triangle(self.A if self.sparse else CSRMatrix.from_dense(self.A))
+
+        # Every row of K is computed from the previous rows, with the values of the rows stored by column
+        data, indices, indptr = lower.data.tolist(), lower.indices.tolist(), lower.indptr.tolist()
+        rows = []
+        values = []
+        for i in range(self.n):
+            row = {}
+            for position in range(indptr[i], indptr[i + 1]):
+                k = indices[position]
+                row_k = rows[k] if k < i else row
+                # Products of the values of the rows i and k in the columns before k
+                value = data[position] - sum(value_j * row_k[j] for j, value_j in row.items() if j < k and j in row_k)
+                if k < i:
+                    row[k] = value / row_k[k]
+                elif value <= 0:
+                    raise_exception(ValueError(message), logger)
+                else:
+                    row[k] = math.sqrt(value)
+            if i not in row:
+                raise_exception(ValueError(message), logger)
+            rows.append(row)
+            values.extend(row.values())
+
+        K = CSRMatrix(values, [j for row in rows for j in row], np.concatenate(([0], np.cumsum([len(row) for row in rows]))), self.A.shape)
+
+        return K if self.sparse else K.to_dense()
+
+    def preconditioner(self, preconditioner: str = "jacobi", w: float = 1) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        This function builds the function which applies the inverse of the preconditioner to a residual, z = M^-1 r.
+
+        :param preconditioner: name of the preconditioner, none, jacobi, ssor or incomplete_cholesky
+        :param w: relaxation factor of the SSOR preconditioner, between 0 and 2
+        :return: the function which applies the preconditioner
+        """
+        if preconditioner not in PRECONDITIONERS:
+            raise_exception(ValueError("El precondicionador no es válido, este debe ser none, jacobi, ssor o incomplete_cholesky"), logger)
+
+        if preconditioner == "none":
+            return lambda r: r
+
+        if np.any(self.diagonal <= 0):
+            raise_exception(ValueError("La diagonal de la matriz A debe ser positiva, el método del gradiente conjugado requiere una matriz simétrica definida positiva"), logger)
+
+        if preconditioner == "jacobi":
+            return lambda r: r / self.diagonal
+
+        if preconditioner == "ssor":
+            if not 0 < w < 2:
+                raise_exception(ValueError("El factor de relajación debe ser mayor a 0 y menor a 2"), logger)
+            # K = sqrt(w / (2 - w)) (D / w + L) (D / w)^-1/2, scaling every column j of D / w + L by the inverse square root of d_j / w
+            scale = math.sqrt(w / (2 - w)) / np.sqrt(self.diagonal / w)
+            lower = self.lower_triangle()
+            if self.sparse:
+                on_diagonal = lower.rows == lower.indices
+                data = np.where(on_diagonal, lower.data / w, lower.data) * scale[lower.indices]
+                K = CSRMatrix(data, lower.indices, lower.indptr, lower.shape)
+            else:
+                K = (lower + np.diag(self.diagonal / w - self.diagonal)) * scale
+        else:
+            K = self.incomplete_cholesky()
+
+        return self.triangular_solver(K)
+
+    def triangular_solver(self, K: Union[np.ndarray, CSRMatrix]) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        This function builds the function which solves K K^T z = r with a forward substitution with K and a backward substitution with
+        K^T.
+
+        :param K: lower triangular matrix with a nonzero diagonal, dense or sparse
+        :return: the function which computes z from r
+        """
+        upper = CSRMatrix.from_coo(K.indices, K.rows, K.data, K.shape) if self.sparse else np.ascontiguousarray(K.T)
+        forward = lower_solver(K)
+        backward = upper_solver(upper)
+
+        return lambda r: backward(forward(r))
+
+    def solve(self, tol: float, max_iter: int = 100, preconditioner: str = "jacobi", w: float = 1, absolute_error: bool = True, order: int = 0, table: IterationTable = None) -> Tuple[List[int], List[List[str]], List[str], str]:
+        """
+        This function solves the system of linear equations with the preconditioned conjugate gradient method.
+
+        :param tol: tolerance for the solution
+        :param max_iter: maximum number of iterations
+        :param preconditioner: name of the preconditioner, none, jacobi, ssor or incomplete_cholesky
+        :param w: relaxation factor of the SSOR preconditioner
+        :param absolute_error: boolean to determine if the absolute or relative error is calculated
+        :param order: Order of the vectorial norm, 0 for infinite
+        :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
+        :return: List with the number of iterations, the solutions for each iteration, the absolute or relative error for each iteration and a message with the result
+        """
+        if order < 0:
+            raise_exception(ValueError("El orden de la norma no es válido, este debe ser 0 o entero positivo"), logger)
+
+        apply_preconditioner = self.preconditioner(preconditioner, w)
+        product = self.A.dot
+
+        # Residual, preconditioned residual and search direction, updated by every iteration
+        r = self.b - product(self.x_initial)
+        z = apply_preconditioner(r)
+        state = {"r": r, "z": z, "p": z.copy(), "rz": float(r @ z)}
+
+        def step(x: np.ndarray) -> np.ndarray:
+            # The residual is zero, so x is the solution
+            if state["rz"] == 0:
+                return x
+
+            Ap = product(state["p"])
+            pAp = float(state["p"] @ Ap)
+            if pAp <= 0:
+                raise_exception(ValueError("La matriz A no es definida positiva, el método del gradiente conjugado requiere una matriz simétrica definida positiva"), logger)
+
+            alpha = state["rz"] / pAp
+            x_new = x + alpha * state["p"]
+            state["r"] = state["r"] - alpha * Ap
+            state["z"] = apply_preconditioner(state["r"])
+
+            rz = float(state["r"] @ state["z"])
+            state["p"] = state["z"] + (rz / state["rz"]) * state["p"]
+            state["rz"] = rz
+            return x_new
+
+        # Store the values of the solution and the errors
+        self.x, self.scalar_error, result = iterate(step, self.x_initial, tol, max_iter, absolute_error, order, table)
+
+        return result
@@ -1,4 +1,4 @@
-from app.utils.utils import raise_exception, construct_augmented_matrix
+from app.utils.utils import raise_exception, construct_augmented_matrix, select_engine
 from app.routes.routes import logger
 from decimal import Decimal, getcontext
 import numpy as np
@@ -7,9 +7,13 @@ import sympy as sp
 
 
 class GaussianElimination:
-    def __init__(self, A: np.array, b: np.array, n: int = None, precision: int = 16):
+    def __init__(self, A: np.array, b: np.array, n: int = None, precision: int = 16, engine: str = None):
         getcontext().prec = precision
         self.precision = precision
+
+        # The float64 engine is used by default when the precision fits in a float64 number
+        self.engine = select_engine(precision, engine, logger)
+
         self.A = A.astype(float)
         self.b = b.astype(float)    
 
@@ -18,8 +22,9 @@ class GaussianElimination:
         except IndexError:
             raise_exception(IndexError("Las matrices deben ser definidas con 2 paréntesis, el principal y dentro de este las filas separadas por comas. Ejemplo: [[1, 2], [3, 4]]"), logger)
 
-        self.A = self.redefine_to_decimal(A)
-        self.b = self.redefine_to_decimal(b)
+        if self.engine == "decimal":
+            self.A = self.redefine_to_decimal(A)
+            self.b = self.redefine_to_decimal(b)
 
         if n is None:
             self.n = self.A.shape[0]
@@ -172,6 +177,98 @@ class GaussianElimination:
 
         # Return the coefficients of the system of equations after the total pivot method
         return Ab, mark
+
+    def pivot_float64(self, k: int, pivot_type: int, mark: np.array, Ab: np.array, n: int) -> np.array:
+        """
+        This function performs the partial or total pivot method on a float64 augmented matrix, finding the pivot with argmax instead of
+        iterating over the elements. The pivot is the first maximum in row order, like in the pivot function.
+
+        :param k: current iteration
+        :param pivot_type: number 1 or 2 to indicate if the pivot is partial or total
+        :param mark: numpy array with the permutation of the columns in order to keep track of the solutions
+        :param Ab: float64 numpy array with the coefficients of the system of equations
+        :param n: length of the system of equations
+        :return: numpy array with the coefficients of the system of equations after the pivot method and the permutation of the columns
+        """
+        if pivot_type == 1:
+            candidates = np.abs(Ab[k:, k:k + 1])
+        elif pivot_type == 2:
+            candidates = np.abs(Ab[k:, k:n])
+        else:
+            raise_exception(ValueError("El tipo de pivote no es válido"), logger)
+
+        max_row, max_col = np.unravel_index(np.argmax(candidates), candidates.shape)
+        if candidates[max_row, max_col] == 0:
+            raise_exception(SystemError("El sistema no tiene solución única"), logger)
+        max_row += k
+        max_col += k
+
+        # Swap the columns and the elements in the permutation array
+        if max_col != k:
+            Ab[:, [k, max_col]] = Ab[:, [max_col, k]]
+            mark[[k, max_col]] = mark[[max_col, k]]
+
+        # Swap the rows
+        if max_row != k:
+            Ab[[k, max_row]] = Ab[[max_row, k]]
+
+        return Ab, mark
+
+    def regressive_substitution_float64(self, Ab: np.array, n: int) -> np.array:
+        """
+        This function performs the regressive substitution method on a float64 upper triangular augmented matrix, computing the sum of
+        every equation as a dot product.
+
+        :param Ab: float64 numpy array with the coefficients of the upper triangular system of equations
+        :param n: length of the system of equations
+        :return: numpy array with the solution of the system of equations
+        """
+        if np.any(np.diagonal(Ab[:, :n]) == 0):
+            raise_exception(ValueError("El sistema no tiene solución única"), logger)
+
+        x = np.zeros(n)
+        for i in range(n - 1, -1, -1):
+            # x_i = (b_i - sum) / a_ii, with the sum of the products of the coefficients and the known solutions
+            x[i] = (Ab[i, n] - Ab[i, i + 1:n] @ x[i + 1:]) / Ab[i, i]
+
+        return x.reshape(1, n)
+
+    def solve_float64(self, A: np.array, b: np.array, n: int, pivot_type: int = None) -> np.array:
+        """
+        This function performs the Gaussian Elimination method with float64 numbers. Every step of the elimination is a rank-1 update of
+        the trailing submatrix, so the O(n^3) work is done by NumPy instead of Python loops.
+
+        :param A: numpy array with the coefficients of the system of equations
+        :param b: numpy array with the solutions of the system of equations
+        :param n: length of the system of equations
+        :param pivot_type: number 1 or 2 to indicate if the pivot is partial or total, None for no pivot
+        :return: numpy array with the solutions of the system of equations
+        """
+        # Construct the augmented matrix
+        Ab = construct_augmented_matrix(np.asarray(A, dtype=float), np.asarray(b, dtype=float))
+        # Build the mark array
+        mark = np.arange(n)
+
+        for k in range(n - 1):
+            # Perform the pivot method
+            if pivot_type is not None:
+                Ab, mark = self.pivot_float64(k, pivot_type, mark, Ab, n)
+
+            if Ab[k, k] == 0:
+                raise_exception(ValueError("La matriz A tiene un 0 en la diagonal, por lo que no se puede dividir por este valor. Se recomienda usar pivoteo"), logger)
+
+            # Eliminate the coefficients below the pivot, subtracting the pivot row times the factor of every row
+            factors = Ab[k + 1:, k] / Ab[k, k]
+            Ab[k + 1:, k:] -= np.outer(factors, Ab[k, k:])
+
+        # Perform the regressive substitution method
+        x = self.regressive_substitution_float64(Ab, n)
+
+        # Organize the solution
+        organized_x = np.empty_like(x)
+        organized_x[0, mark] = x[0]
+        self.x = organized_x
+        return organized_x
     
     def organize_solution(self, x: np.array, mark: np.array) -> np.array:
         """
@@ -254,7 +351,8 @@ class GaussianElimination:
     
     def solve(self, A: np.array = None, b: np.array = None, n: int = None, pivot_type: int = None) -> np.array:
         """
-        This function performs the Gaussian Elimination method to solve a system of equations.
+        This function performs the Gaussian Elimination method to solve a system of equations, with float64 numbers if the engine is
+        float64 or with Decimal numbers otherwise.
 
         :param A: numpy array with the coefficients of the system of equations
         :param b: numpy array with the solutions of the system of equations
@@ -269,6 +367,9 @@ class GaussianElimination:
         if n is None:
             n = self.n
 
+        if self.engine == "float64":
+            return self.solve_float64(A, b, n, pivot_type)
+
         # Construct the augmented matrix
         Ab = construct_augmented_matrix(A, b)
         # Build the mark array
@@ -0,0 +1,296 @@
+from app.utils.utils import raise_exception
+from app.utils.tables import IterationTable
+from app.utils.sparse import CSRMatrix
+from app.utils.triangular import lower_solver, upper_solver
+from app.routes.routes import logger
+import numpy as np
+from typing import Callable, List, Tuple, Union
+
+# Names of the methods and of the preconditioners
+KRYLOV_METHODS = ("gmres", "bicgstab")
+KRYLOV_PRECONDITIONERS = ("none", "ilu")
+
+
+class Krylov:
+    """
+    Restarted GMRES and BiCGSTAB methods for general systems, also nonsymmetric or indefinite ones, with a dense matrix or a matrix in
+    compressed sparse row format and float64 numbers. Every iteration takes one (GMRES) or two (BiCGSTAB) products by A, which are O(nnz)
+    operations for sparse matrices.
+
+    Both methods are preconditioned on the right, A M^-1 u = b with x = M^-1 u, so the residuals of the table are the residuals of the
+    original system. The ilu preconditioner is the incomplete LU factorization without fill-in, with the nonzero values of L and U in the
+    positions of the nonzero values of A.
+    """
+    def __init__(self, A: Union[np.ndarray, CSRMatrix], b: np.array, x_initial: np.array, n: int = None):
+        self.sparse = isinstance(A, CSRMatrix)
+        self.A = A if self.sparse else np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float).ravel()
+        self.x_initial = np.asarray(x_initial, dtype=float).ravel()
+
+        self.validate_input(self.A, self.b, n, self.x_initial)
+        self.n = self.A.shape[0]
+
+        self.x = None
+        self.residual = None
+
+    def validate_input(self, A: Union[np.ndarray, CSRMatrix], b: np.array, n: int, x_initial: np.array):
+        """
+        This function validates the input for the Krylov methods.
+
+        :param A: dense or sparse matrix with the coefficients of the system of equations
+        :param b: vector with the solutions of the system of equations
+        :param n: length of the system of equations
+        :param x_initial: vector with the initial guess for the solution
+        """
+        # Check if the matrix A is square
+        if not self.sparse and A.ndim != 2:
+            raise_exception(ValueError("La matriz A debe ser una matriz de dos dimensiones"), logger)
+        if A.shape[0] != A.shape[1]:
+            raise_exception(ValueError("La matriz A no es cuadrada"), logger)
+
+        # Check if the vectors are correct
+        if b.size != A.shape[0]:
+            raise_exception(ValueError("La longitud del vector b no es igual al número de filas de la matriz A"), logger)
+        if x_initial.size != A.shape[0]:
+            raise_exception(ValueError("La longitud del vector x inicial no es igual al número de filas de la matriz A"), logger)
+
+        # Check if the length of n is equal to the number of rows in the matrix A
+        if n is not None and n != A.shape[0]:
+            raise_exception(ValueError("La longitud de n no es igual al número de filas y columnas de la matriz A"), logger)
+
+    def incomplete_lu(self) -> Union[np.ndarray, CSRMatrix]:
+        """
+        This function calculates the incomplete LU factorization without fill-in, A ~ L U, with a unit diagonal in L. The values of L and
+        U are only computed in the positions of the nonzero values of A and are stored together, L below the diagonal and U on and above
+        it.
+
+        :return: the factors L and U in one matrix, dense or sparse like A
+        """
+        message = "La factorización LU incompleta no existe porque un pivote es 0. Use otro precondicionador o reordene las filas de la matriz A"
+
+        # A dense matrix is factorized in compressed sparse row format too, so the work only depends on its nonzero values
+        A = self.A if self.sparse else CSRMatrix.from_dense(self.A)
+
+        # Every row is computed from the upper part of the previous rows, with the values of the rows stored by column
+        data, indices, indptr = A.data.tolist(), A.indices.tolist(), A.indptr.tolist()
+        upper_rows = []
+        rows = []
+        for i in range(self.n):
+            row = {}
+            for position in range(indptr[i], indptr[i + 1]):
+                row[indices[position]] = row.get(indices[position], 0.0) + data[position]
+
+            for k in sorted(j for j in row if j < i):
+                row[k] /= upper_rows[k][k]
+                for j, value in upper_rows[k].items():
+                    if j > k and j in row:
+                        row[j] -= row[k] * value
+
+            if row.get(i, 0.0) == 0:
+                raise_exception(ValueError(message), logger)
+            upper_rows.append({j: value for j, value in row.items() if j >= i})
+            rows.append(row)
+
+        columns = [sorted(row) for row in rows]
+        LU = CSRMatrix([rows[i][j] for i in range(self.n) for j in columns[i]], [j for row in columns for j in row],
+                       np.concatenate(([0], np.cumsum([len(row) for row in columns]))), self.A.shape)
+
+        return LU if self.sparse else LU.to_dense()
+
+    def preconditioner(self, preconditioner: str = "none") -> Callable[[np.ndarray], np.ndarray]:
+        """
+        This function builds the function which applies the inverse of the preconditioner to a vector, z = M^-1 v.
+
+        :param preconditioner: name of the preconditioner, none or ilu
+        :return: the function which applies the preconditioner
+        """
+        if preconditioner not in KRYLOV_PRECONDITIONERS:
+            raise_exception(ValueError("El precondicionador no es válido, este debe ser none o ilu"), logger)
+
+        if preconditioner == "none":
+            return lambda v: v
+
+        LU = self.incomplete_lu()
+        forward = lower_solver(LU, unit_diagonal=True)
+        backward = upper_solver(LU)
+
+        return lambda v: backward(forward(v))
+
+    def gmres(self, tol: float, max_iter: int, restart: int, apply_preconditioner: Callable[[np.ndarray], np.ndarray], absolute_error: bool, table: IterationTable) -> bool:
+        """
+        This function runs the GMRES method restarted every m iterations. Every iteration adds a vector to an orthonormal basis of the
+        Krylov subspace and the solution minimizes the norm of the residual in the subspace, computed with Givens rotations of the
+        Hessenberg matrix, so the norm of the residual never increases.
+
+        :param tol: tolerance for the norm of the residual
+        :param max_iter: maximum number of iterations
+        :param restart: number of iterations between restarts, m
+        :param apply_preconditioner: function which applies the inverse of the preconditioner
+        :param absolute_error: boolean to determine if the norm of the residual is divided by the norm of b
+        :param table: table to store the iterations
+        :return: True if the method converged
+        """
+        scale = 1 if absolute_error else np.linalg.norm(self.b)
+        restart = min(restart, self.n)
+        x = self.x_initial
+        counter = 0
+
+        r = self.b - self.A.dot(x)
+        beta = np.linalg.norm(r)
+        self.residual = beta / scale
+        table.append(counter, x, self.residual)
+
+        while self.residual > tol and counter < max_iter:
+            # Orthonormal basis of the Krylov subspace, the preconditioned vectors and the Hessenberg matrix with the rotations applied
+            V = np.zeros((self.n, restart + 1))
+            Z = np.zeros((self.n, restart))
+            H = np.zeros((restart + 1, restart))
+            cosines = np.zeros(restart)
+            sines = np.zeros(restart)
+            g = np.zeros(restart + 1)
+            g[0] = beta
+            V[:, 0] = r / beta
+            x_start = x
+
+            for j in range(min(restart, max_iter - counter)):
+                Z[:, j] = apply_preconditioner(V[:, j])
+                w = self.A.dot(Z[:, j])
+
+                # Gram-Schmidt orthogonalization against the basis, repeated once to keep the basis orthogonal
+                for _ in range(2):
+                    h = V[:, :j + 1].T @ w
+                    w = w - V[:, :j + 1] @ h
+                    H[:j + 1, j] += h
+                H[j + 1, j] = np.linalg.norm(w)
+                breakdown = H[j + 1, j] <= np.finfo(float).eps * np.linalg.norm(H[:j + 2, j])
+                if not breakdown:
+                    V[:, j + 1] = w / H[j + 1, j]
+
+                # Rotations of the previous columns and the new rotation which eliminates H[j + 1, j]
+                for i in range(j):
+                    H[i, j], H[i + 1, j] = cosines[i] * H[i, j] + sines[i] * H[i + 1, j], -sines[i] * H[i, j] + cosines[i] * H[i + 1, j]
+                norm = np.hypot(H[j, j], H[j + 1, j])
+                if norm == 0:
+                    raise_exception(ValueError("El método GMRES se detuvo porque la matriz A es singular"), logger)
+                cosines[j], sines[j] = H[j, j] / norm, H[j + 1, j] / norm
+                H[j, j], H[j + 1, j] = norm, 0
+                g[j], g[j + 1] = cosines[j] * g[j], -sines[j] * g[j]
+
+                # Solution which minimizes the residual in the subspace, the norm of the residual is the last value of g
+                y = np.linalg.solve(np.triu(H[:j + 1, :j + 1]), g[:j + 1])
+                x = x_start + Z[:, :j + 1] @ y
+                self.residual = abs(g[j + 1]) / scale
+
+                counter += 1
+                table.append(counter, x, self.residual)
+
+                if self.residual <= tol or breakdown:
+                    break
+
+            # Restart from the residual of the current solution, which also corrects the rounding errors of the estimated residual
+            r = self.b - self.A.dot(x)
+            beta = np.linalg.norm(r)
+            self.residual = beta / scale
+            if beta == 0:
+                break
+
+        self.x = x
+        return self.residual <= tol
+
+    def bicgstab(self, tol: float, max_iter: int, apply_preconditioner: Callable[[np.ndarray], np.ndarray], absolute_error: bool, table: IterationTable) -> bool:
+        """
+        This function runs the BiCGSTAB method, which combines the biconjugate gradient method with a step which minimizes the residual,
+        so the residual converges smoothly with short recurrences and a fixed memory.
+
+        :param tol: tolerance for the norm of the residual
+        :param max_iter: maximum number of iterations
+        :param apply_preconditioner: function which applies the inverse of the preconditioner
+        :param absolute_error: boolean to determine if the norm of the residual is divided by the norm of b
+        :param table: table to store the iterations
+        :return: True if the method converged
+        """
+        breakdown_message = "El método BiCGSTAB se detuvo porque uno de sus productos internos es 0. Use el método GMRES"
+        scale = 1 if absolute_error else np.linalg.norm(self.b)
+        x = self.x_initial
+        counter = 0
+
+        r = self.b - self.A.dot(x)
+        self.residual = np.linalg.norm(r) / scale
+        table.append(counter, x, self.residual)
+
+        # The shadow residual is the initial residual
+        r_shadow = r.copy()
+        rho = alpha = omega = 1.0
+        v = np.zeros(self.n)
+        p = np.zeros(self.n)
+
+        while self.residual > tol and counter < max_iter:
+            rho_new = r_shadow @ r
+            if rho_new == 0 or omega == 0:
+                raise_exception(ValueError(breakdown_message), logger)
+
+            p = r + (rho_new / rho) * (alpha / omega) * (p - omega * v)
+            rho = rho_new
+            p_hat = apply_preconditioner(p)
+            v = self.A.dot(p_hat)
+            if r_shadow @ v == 0:
+                raise_exception(ValueError(breakdown_message), logger)
+            alpha = rho / (r_shadow @ v)
+
+            s = r - alpha * v
+            counter += 1
+            if np.linalg.norm(s) / scale <= tol:
+                x = x + alpha * p_hat
+                r = s
+            else:
+                s_hat = apply_preconditioner(s)
+                t = self.A.dot(s_hat)
+                omega = (t @ s) / (t @ t) if t @ t != 0 else 0.0
+                x = x + alpha * p_hat + omega * s_hat
+                r = s - omega * t
+
+            self.residual = np.linalg.norm(r) / scale
+            table.append(counter, x, self.residual)
+
+        self.x = x
+        return self.residual <= tol
+
+    def solve(self, method: str, tol: float, max_iter: int = 100, restart: int = 30, preconditioner: str = "none", absolute_error: bool = True, table: IterationTable = None) -> Tuple[List[int], List[List[str]], List[str], str]:
+        """
+        This function solves the system of linear equations with the GMRES or BiCGSTAB method, until the norm 2 of the residual,
+        b - A x, is less or equal than the tolerance.
+
+        :param method: name of the method, gmres or bicgstab
+        :param tol: tolerance for the norm of the residual
+        :param max_iter: maximum number of iterations
+        :param restart: number of iterations between the restarts of the GMRES method
+        :param preconditioner: name of the preconditioner, none or ilu
+        :param absolute_error: boolean to determine if the absolute residual or the residual relative to the norm of b is used
+        :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
+        :return: List with the number of iterations, the solutions for each iteration, the norm of the residual for each iteration and a message with the result
+        """
+        if method not in KRYLOV_METHODS:
+            raise_exception(ValueError("El método no es válido, este debe ser gmres o bicgstab"), logger)
+        if restart < 1:
+            raise_exception(ValueError("El número de iteraciones entre reinicios debe ser un entero positivo"), logger)
+        if not absolute_error and np.linalg.norm(self.b) == 0:
+            raise_exception(ValueError("El residuo relativo no se puede calcular porque el vector b es 0"), logger)
+
+        apply_preconditioner = self.preconditioner(preconditioner)
+
+        # Initialize the table to store the iterations, solutions and residuals
+        if table is None:
+            table = IterationTable()
+
+        if method == "gmres":
+            converged = self.gmres(tol, max_iter, restart, apply_preconditioner, absolute_error, table)
+        else:
+            converged = self.bicgstab(tol, max_iter, apply_preconditioner, absolute_error, table)
+
+        if converged:
+            message = f"{[str(value) for value in self.x]} es una aproximación de la solución del sistema con una tolerancia de {tol}"
+        else:
+            message = "El método no converge en {} iteraciones".format(max_iter)
+
+        iterations, x, residuals = table.columns(3)
+        return iterations, [list(values) for values in zip(*x)], residuals, message
@@ -1,15 +1,41 @@
-from app.utils.utils import raise_exception, construct_augmented_matrix
+from app.utils.utils import raise_exception, construct_augmented_matrix, select_engine
 from app.routes.routes import logger
 from decimal import Decimal, getcontext
+import hashlib
 import numpy as np
-from typing import List
+from typing import List, Tuple
 import sympy as sp
 
+# Default number of columns of the panels of the blocked float64 factorization
+BLOCK_SIZE = 64
+
+
+def factorization_handle(A: np.array, precision: int = 16, pivot_type: int = None, engine: str = "decimal", method: str = "lu") -> str:
+    """
+    This function computes the handle of the factorization of a matrix, a hash of its values, the precision, the pivot type, the engine
+    and the factorization method, so the same matrix factorized with the same options always gets the same handle.
+
+    :param A: numpy array with the coefficients of the system of equations
+    :param precision: number of significant digits of the factorization
+    :param pivot_type: number 1 for partial pivot or None if not pivot
+    :param engine: numbers of the factorization, float64 or decimal
+    :param method: name of the factorization, lu, cholesky or ldlt
+    :return: hexadecimal string with the handle
+    """
+    A = np.ascontiguousarray(A, dtype=float)
+    digest = hashlib.sha256(A.tobytes())
+    digest.update(f"{A.shape}:{precision}:{pivot_type}:{engine}:{method}".encode())
+
+    return digest.hexdigest()
+
 
 class LUFactorization:
-    def __init__(self, A: np.array, b: np.array, n: int = None, precision: int = 16):
+    def __init__(self, A: np.array, b: np.array, n: int = None, precision: int = 16, engine: str = None):
         getcontext().prec = precision
         self.precision = precision
+
+        # The float64 engine is used by default when the precision fits in a float64 number
+        self.engine = select_engine(precision, engine, logger)
         self.A = A.astype(float)
         self.b = b.astype(float)    
 
@@ -18,8 +44,9 @@ class LUFactorization:
         except IndexError:
             raise_exception(IndexError("Las matrices deben ser definidas con 2 paréntesis, el principal y dentro de este las filas separadas por comas. Ejemplo: [[1, 2], [3, 4]]"), logger)
 
-        self.A = self.redefine_to_decimal(A)
-        self.b = self.redefine_to_decimal(b)
+        if self.engine == "decimal":
+            self.A = self.redefine_to_decimal(A)
+            self.b = self.redefine_to_decimal(b)
 
         if n is None:
             self.n = self.A.shape[0]
@@ -64,11 +91,9 @@ class LUFactorization:
         if A.shape[0] != A.shape[1]:
             raise_exception(ValueError("La matriz A no es cuadrada"), logger)
 
-        # Check if the b vector is correct
-        if A.shape[0] != b.shape[0] and A.shape[0] != b.shape[1]:
+        # Check if b is a column vector or has one right-hand side per row
+        if b.shape != (A.shape[0], 1) and b.shape[1] != A.shape[0]:
             raise_exception(ValueError("La longitud del vector b no es igual al número de filas de la matriz A"), logger)
-        elif b.shape[0] != 1 and b.shape[1] != 1:
-            raise_exception(ValueError("b debe ser un vector columna, no una matriz"), logger)
 
         # Check if the length of n is equal to the number of rows in the matrix A
         if n is not None and n != A.shape[0]:
@@ -158,7 +183,7 @@ class LUFactorization:
 
         :param k: current iteration
         :param pivot_type: number 1 for partial pivot
-        :param permutation_matrix: numpy matrix with the permutation of the rows
+        :param permutation_matrix: numpy matrix with the permutation of the rows, or the vector with the index of every row
         :param Ab: numpy array with the coefficients of the system of equations
         :param n: length of the system of equations
         :return: numpy array with the coefficients of the system of equations after the total pivot method
@@ -233,8 +258,8 @@ class LUFactorization:
         if b is None:
             b = self.b
 
-        # Transpose if necessary
-        if b.shape == (1, A.shape[0]):
+        # Transpose if necessary, every row of b is a right-hand side
+        if b.shape != (A.shape[0], 1):
             b = b.T
 
         # Calculate the vectorial error
@@ -274,35 +299,90 @@ class LUFactorization:
         # Return the absolute error
         return error
     
-    def solve(self, A: np.array = None, b: np.array = None, n: int = None, pivot_type: int = None) -> List[np.array]:
+    def factorize_float64(self, A: np.array, n: int, pivot_type: int = None, block_size: int = BLOCK_SIZE) -> Tuple[np.array, np.array, np.array]:
         """
-        This function performs the Gaussian Elimination method to solve a system of equations.
+        This function computes the LU factorization of the matrix of coefficients with float64 numbers, with the blocked right-looking
+        algorithm. The columns are split in panels of block_size columns: every panel is factorized column by column with the pivot of
+        its columns, the rows of U to its right are solved with its L block, and the trailing submatrix is updated with one matrix
+        product, so most of the work is done by the matrix products of BLAS instead of moving the whole trailing submatrix per column.
 
         :param A: numpy array with the coefficients of the system of equations
-        :param b: numpy array with the solutions of the system of equations
         :param n: length of the system of equations
         :param pivot_type: number 1 indicate if the pivot is partial or None if not pivot
-        :return: numpy array with the solutions of the system of equations, the L matrix and the U matrix
+        :param block_size: number of columns of every panel
+        :return: the L matrix, the U matrix and the permutation, the row of A of every row of L U
+        """
+        if pivot_type is not None and pivot_type != 1:
+            raise_exception(ValueError("El tipo de pivote no es válido"), logger)
+        if block_size <= 0:
+            raise_exception(ValueError("El tamaño del bloque debe ser un entero positivo"), logger)
+
+        A = np.array(A, dtype=float)
+        permutation = np.arange(n)
+
+        for start in range(0, n, block_size):
+            end = min(start + block_size, n)
+
+            # Factorize the panel, the pivots swap the whole rows so the L columns to the left are permuted too
+            for k in range(start, min(end, n - 1)):
+                if pivot_type == 1:
+                    max_row = k + np.argmax(np.abs(A[k:, k]))
+                    if A[max_row, k] == 0:
+                        raise_exception(ValueError("El sistema no tiene solución única"), logger)
+                    if max_row != k:
+                        A[[k, max_row]] = A[[max_row, k]]
+                        permutation[[k, max_row]] = permutation[[max_row, k]]
+
+                if A[k, k] == 0:
+                    raise_exception(ValueError("La matriz A tiene un 0 en la diagonal, por lo que no se puede dividir por este valor. Se recomienda usar pivoteo"), logger)
+
+                # Store the factors in the lower triangular part and update the rest of the panel
+                A[k + 1:, k] /= A[k, k]
+                A[k + 1:, k + 1:end] -= np.outer(A[k + 1:, k], A[k, k + 1:end])
+
+            if end < n:
+                # Solve the rows of U to the right of the panel with the unit lower triangular block of the panel
+                for k in range(start, end - 1):
+                    A[k + 1:end, end:] -= np.outer(A[k + 1:end, k], A[k, end:])
+
+                # Update the trailing submatrix with one matrix product
+                A[end:, end:] -= A[end:, start:end] @ A[start:end, end:]
+
+        L = np.tril(A, k=-1) + np.eye(n)
+        U = np.triu(A)
+
+        return L, U, permutation
+
+    def factorize(self, A: np.array = None, n: int = None, pivot_type: int = None, block_size: int = BLOCK_SIZE) -> Tuple[np.array, np.array, np.array]:
+        """
+        This function computes the LU factorization of the matrix of coefficients, PA = LU, with float64 numbers if the engine is float64
+        or with Decimal numbers otherwise. The permutation is stored as the vector of the rows of A, A[permutation] = LU, so it takes n
+        integers instead of the n^2 numbers of P.
+
+        :param A: numpy array with the coefficients of the system of equations
+        :param n: length of the system of equations
+        :param pivot_type: number 1 indicate if the pivot is partial or None if not pivot
+        :param block_size: number of columns of every panel of the float64 factorization
+        :return: the L matrix, the U matrix and the permutation, the row of A of every row of L U
         """
         if A is None:
             A = self.A.copy()
-        if b is None:
-            b = self.b
         if n is None:
             n = self.n
 
-        # Construct the augmented matrix
-        
-        # Build the permutation matrix
-        permutation_matrix = self.redefine_to_decimal(np.eye(n))
-        L = permutation_matrix.copy()
+        if self.engine == "float64":
+            return self.factorize_float64(A, n, pivot_type, block_size)
+
+        # The pivot swaps the rows of the permutation vector like the rows of a permutation matrix
+        permutation = np.arange(n)
+        L = self.redefine_to_decimal(np.eye(n))
         U = self.redefine_to_decimal(np.zeros((n, n)))
 
         # Iterate over the rows
         for k in range(n - 1):
             # Perform the pivot method
             if pivot_type is not None and pivot_type == 1:
-                A, permutation_matrix = self.pivot(k, pivot_type, permutation_matrix, A, n)
+                A, permutation = self.pivot(k, pivot_type, permutation, A, n)
 
             # Iterate over the rows
             for i in range(k + 1, n):
@@ -322,21 +402,111 @@ class LUFactorization:
         U = np.triu(A) + U
         L = np.tril(A, k=-1) + L
 
-        if b.shape == (A.shape[0], 1):
-            b = self.organize_matrix(b, permutation_matrix=permutation_matrix)
-        elif b.shape == (1, A.shape[0]):
-            b = self.organize_matrix(b.T, permutation_matrix=permutation_matrix).T
+        return L, U, permutation
+
+    @staticmethod
+    def reconstruct_matrix(L: np.array, U: np.array, permutation: np.array) -> np.array:
+        """
+        This function computes the matrix of coefficients from its LU factorization, for the errors of the systems solved with a stored
+        factorization without the matrix.
+
+        :param L: numpy array with the L matrix of the factorization
+        :param U: numpy array with the U matrix of the factorization
+        :param permutation: numpy array with the row of A of every row of L U
+        :return: numpy array with the matrix of coefficients, with the numbers of the factorization
+        """
+        A = np.empty(L.shape, dtype=L.dtype)
+        A[permutation] = np.dot(L, U)
+
+        return A
 
-        LB = construct_augmented_matrix(L, b)
-        z = self.progressive_substitution(LB, n)
-        Uz = construct_augmented_matrix(U, z)
+    def substitute(self, L: np.array, U: np.array, permutation: np.array, b: np.array = None, n: int = None) -> np.array:
+        """
+        This function solves the system of equations for every right-hand side with a computed LU factorization, with a progressive and a
+        regressive substitution of O(n^2) operations per right-hand side.
+
+        :param L: numpy array with the L matrix of the factorization
+        :param U: numpy array with the U matrix of the factorization
+        :param permutation: numpy array with the row of A of every row of L U
+        :param b: numpy array with a column vector or one right-hand side per row
+        :param n: length of the system of equations
+        :return: numpy array with the solution of every right-hand side in its own row
+        """
+        if b is None:
+            b = self.b
+        if n is None:
+            n = self.n
+
+        # Every row of b is a right-hand side, except for a column vector
+        if b.shape == (n, 1):
+            b = b.T
 
-        # Perform the regressive substitution method
-        x = self.regressive_substitution(Ab=Uz, n=n)
+        # The substitutions use the numbers of the factorization
+        if L.dtype != object:
+            return self.substitute_float64(L, U, permutation, b, n)
+
+        b = b[:, permutation]
+
+        x = np.empty(b.shape, dtype=object)
+        for i in range(b.shape[0]):
+            LB = construct_augmented_matrix(L, b[i:i + 1])
+            z = self.progressive_substitution(LB, n)
+            Uz = construct_augmented_matrix(U, z)
+
+            # Perform the regressive substitution method
+            x[i] = self.regressive_substitution(Ab=Uz, n=n)[0]
 
         # Store the solution in the object
         self.x = x
 
+        return x
+
+    def substitute_float64(self, L: np.array, U: np.array, permutation: np.array, b: np.array, n: int) -> np.array:
+        """
+        This function solves the system of equations for every right-hand side with a float64 LU factorization. Every step of the
+        substitutions computes one unknown of all the right-hand sides at once with a matrix-vector product.
+
+        :param L: numpy array with the L matrix of the factorization
+        :param U: numpy array with the U matrix of the factorization
+        :param permutation: numpy array with the row of A of every row of L U
+        :param b: numpy array with one right-hand side per row
+        :param n: length of the system of equations
+        :return: numpy array with the solution of every right-hand side in its own row
+        """
+        if np.any(np.diagonal(U) == 0):
+            raise_exception(ValueError("El sistema no tiene solución única"), logger)
+
+        b = np.asarray(b, dtype=float)[:, permutation]
+
+        # Progressive substitution, L has ones in the diagonal
+        z = np.zeros(b.shape)
+        for i in range(n):
+            z[:, i] = b[:, i] - z[:, :i] @ L[i, :i]
+
+        # Regressive substitution
+        x = np.zeros(b.shape)
+        for i in range(n - 1, -1, -1):
+            x[:, i] = (z[:, i] - x[:, i + 1:] @ U[i, i + 1:]) / U[i, i]
+
+        # Store the solution in the object
+        self.x = x
+
+        return x
+
+    def solve(self, A: np.array = None, b: np.array = None, n: int = None, pivot_type: int = None, block_size: int = BLOCK_SIZE) -> List[np.array]:
+        """
+        This function performs the LU Factorization method to solve a system of equations.
+
+        :param A: numpy array with the coefficients of the system of equations
+        :param b: numpy array with a column vector or one right-hand side per row
+        :param n: length of the system of equations
+        :param pivot_type: number 1 indicate if the pivot is partial or None if not pivot
+        :param block_size: number of columns of every panel of the float64 factorization
+        :return: numpy array with the solutions of the system of equations, the L matrix and the U matrix
+        """
+        L, U, permutation = self.factorize(A, n, pivot_type, block_size)
+        x = self.substitute(L, U, permutation, b, n)
+
         return x, L, U
     
     def convert_matrix_to_string(self, matrix: np.array) -> List[List[str]]:
@@ -1,9 +1,12 @@
 from app.utils.utils import raise_exception
+from app.utils.compiler import create_evaluator, create_derivatives_evaluator
+from app.utils.tables import IterationTable
 from app.routes.routes import logger
+import math
 import sympy as sp
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-def bisection(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[str], List[str], List[str], List[str], str]:
+def bisection(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, table: IterationTable = None) -> Tuple[List[str], List[str], List[str], List[str], str]:
     """
     Find the root of a function using the bisection method. The function must have a sign change in the interval [initial, final].
 
@@ -15,24 +18,29 @@ def bisection(function: sp.Expr, variable: sp.Symbol, initial: float, final: flo
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
         List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
     # Calculate the function values at the inprecisionitial and final points
-    f_initial = function.subs(variable, initial).evalf(precision)
-    f_final = function.subs(variable, final).evalf(precision)
+    f_initial = evaluate_function(initial)
+    f_final = evaluate_function(final)
     # Check if the initial or final point is a root
     if f_initial == 0:
-        return [[0], [str(initial)], [str(f_initial)], ["0"], str(initial) + " es raíz de la función."]
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
     elif f_final == 0:
-        return [[0], [str(final)], [str(f_final)], ["0"], str(final) + " es raíz de la función."]
+        table.append(0, final, f_final, 0)
+        return (*table.columns(4), str(final) + " es raíz de la función.")
     # Check if there is a sign change in the interval [initial, final]
     
     elif f_initial * f_final > 0:
@@ -40,13 +48,10 @@ def bisection(function: sp.Expr, variable: sp.Symbol, initial: float, final: flo
     else:
         # Calculate the root using the bisection method, starting with the initial and final points
         medium = (initial + final) / 2
-        f_medium = function.subs(variable, medium).evalf(precision)
+        f_medium = evaluate_function(medium)
 
-        # Store values in the lists
-        values_list.append(str(medium))
-        function_values_list.append(str(f_medium))
-        error_values_list.append(str(1))
-        counter_values_list.append(counter + 1)
+        # Store the first row in the table
+        table.append(counter + 1, medium, f_medium, 1)
         previous_error = 1
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
@@ -62,19 +67,18 @@ def bisection(function: sp.Expr, variable: sp.Symbol, initial: float, final: flo
             # Temporarily store the previous medium point and calculate the new medium point
             previous_medium = medium
             medium = (initial + final) / 2
-            f_medium = function.subs(variable, medium).evalf(precision)
-            function_values_list.append(str(f_medium))
-            values_list.append(str(medium))
+            f_medium = evaluate_function(medium)
 
             # Calculate the error and increment the counter
             if absolute_error:
                 error = abs(medium - previous_medium)
             else:
                 error = abs((medium - previous_medium) / medium)
-            error_values_list.append(str(error))
             previous_error = error
             counter += 1
-            counter_values_list.append(counter + 1)
+
+            # Store the row in the table
+            table.append(counter + 1, medium, f_medium, error)
 
         if f_medium == 0:
             message = str(medium) + " es raíz de la función."
@@ -84,10 +88,10 @@ def bisection(function: sp.Expr, variable: sp.Symbol, initial: float, final: flo
             message = "El método no converge en " + str(iterations) + " iteraciones."
             
         # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
+        return (*table.columns(4), message)
     
 
-def false_rule(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[int], List[str], List[str], List[str], str]:
+def false_rule(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
     """
     Find the root of a function using the false rule method. The function must have a sign change in the interval [initial, final].
 
@@ -99,37 +103,39 @@ def false_rule(function: sp.Expr, variable: sp.Symbol, initial: float, final: fl
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
         List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
     # Calculate the function values at the initial and final points
-    f_initial = function.subs(variable, initial).evalf(precision)
-    f_final = function.subs(variable, final).evalf(precision)
+    f_initial = evaluate_function(initial)
+    f_final = evaluate_function(final)
     # Check if the initial or final point is a root
     if f_initial == 0:
-        return [[0], [str(initial)], [str(f_initial)], ["0"], str(initial) + " es raíz de la función."]
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
     elif f_final == 0:
-        return [[0], [str(final)], [str(f_final)], ["0"], str(final) + " es raíz de la función."]
+        table.append(0, final, f_final, 0)
+        return (*table.columns(4), str(final) + " es raíz de la función.")
     # Check if there is a sign change in the interval [initial, final]
     elif f_initial * f_final > 0:
         raise_exception(ValueError("La función no tiene cambio de signo en el intervalo dado"), logger)
     else:
         # Calculate the root using the false rule method, starting with the initial and final points
         medium = final - f_final * (final - initial) / (f_final - f_initial)
-        f_medium = function.subs(variable, medium).evalf(precision)
+        f_medium = evaluate_function(medium)
 
-        # Store values in the lists
-        values_list.append(str(medium))
-        function_values_list.append(str(f_medium))
-        error_values_list.append(str(1))
-        counter_values_list.append(counter + 1)
+        # Store the first row in the table
+        table.append(counter + 1, medium, f_medium, 1)
         previous_error = 1
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
@@ -148,19 +154,18 @@ def false_rule(function: sp.Expr, variable: sp.Symbol, initial: float, final: fl
             # Temporarily store the previous medium point and calculate the new medium point
             previous_medium = medium
             medium = final - f_final * (final - initial) / (f_final - f_initial)
-            f_medium = function.subs(variable, medium).evalf(precision)
-            function_values_list.append(str(f_medium))
-            values_list.append(str(medium))
+            f_medium = evaluate_function(medium)
 
             # Calculate the error and increment the counter
             if absolute_error:
                 error = abs(medium - previous_medium)
             else:
                 error = abs((medium - previous_medium) / medium)
-            error_values_list.append(str(error))
             previous_error = error
             counter += 1
-            counter_values_list.append(counter + 1)
+
+            # Store the row in the table
+            table.append(counter + 1, medium, f_medium, error)
 
         if f_medium == 0:
             message = str(medium) + " es raíz de la función."
@@ -170,12 +175,53 @@ def false_rule(function: sp.Expr, variable: sp.Symbol, initial: float, final: fl
             message = "El método no converge en " + str(iterations) + " iteraciones."
 
         # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
+        return (*table.columns(4), message)
     
 
-def fixed_point(function: sp.Expr, variable: sp.Symbol, g_function: sp.Expr, initial_value: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[int], List[str], List[str], List[str], str]:
+def aitken(x0: float, x1: float, x2: float) -> float:
+    """
+    Extrapolate the limit of a linearly convergent sequence from three consecutive terms with Aitken's delta-squared process.
+
+    Args:
+        x0: First term of the sequence.
+        x1: Second term of the sequence.
+        x2: Third term of the sequence.
+    Returns:
+        The extrapolated value, or the third term if the second difference is zero.
+    """
+    denominator = x2 - 2 * x1 + x0
+    if denominator == 0:
+        return x2
+
+    return x0 - (x1 - x0) ** 2 / denominator
+
+
+def convergence_order(errors: List[float]) -> Optional[float]:
+    """
+    Estimate the observed order of convergence from the last three errors, as log(e[n] / e[n-1]) / log(e[n-1] / e[n-2]).
+
+    Args:
+        errors: Errors of the iterations.
+    Returns:
+        The observed order of convergence, or None if there are less than three errors or they are not positive and decreasing.
+    """
+    if len(errors) < 3:
+        return None
+
+    e0, e1, e2 = (float(error) for error in errors[-3:])
+    if not e0 > e1 > e2 > 0:
+        return None
+
+    return math.log(e2 / e1) / math.log(e1 / e0)
+
+
+def fixed_point(function: sp.Expr, variable: sp.Symbol, g_function: sp.Expr, initial_value: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, acceleration: str = None, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str, Optional[str]]:
     """
     Find the root of a function using the fixed point method.
+
+    The iterations can be accelerated with Aitken's delta-squared process over the sequence of the fixed point method, which needs one
+    evaluation of g per iteration, or with Steffensen's method, which restarts every iteration from the extrapolated value and converges
+    quadratically with two evaluations of g per iteration.
     
     Args:
         function: The function for which to find the root.
@@ -185,34 +231,46 @@ def fixed_point(function: sp.Expr, variable: sp.Symbol, g_function: sp.Expr, ini
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        acceleration: None for the fixed point method, "aitken" for Aitken's extrapolation or "steffensen" for Steffensen's method (default None).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
-        List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
+        List or table with the iterations, the values of x, the values of f(x), the errors, a message indicating the result and the observed order of convergence.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    if acceleration not in (None, "aitken", "steffensen"):
+        raise_exception(ValueError("El método de aceleración debe ser aitken o steffensen"), logger)
+
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+    evaluate_g_function = create_evaluator(g_function, variable, precision, compiled)
+
     # Calculate the function value at the initial point
-    f_initial = function.subs(variable, initial_value).evalf(precision)
+    f_initial = evaluate_function(initial_value)
 
     # Check if the initial point is a root
     if f_initial == 0:
-        return [[0], [str(initial_value)], [str(f_initial)], ["0"], str(initial_value) + " es raíz de la función."]
+        table.append(0, initial_value, f_initial, 0)
+        return (*table.columns(4), str(initial_value) + " es raíz de la función.", None)
     else:
         # Set the variables needed for the iterations
         x = initial_value
         f_x = f_initial
         # Initialize the error
         previous_error = 1
+        # Last errors above the rounding error, to estimate the order of convergence
+        errors = []
+
+        # Add the initial values to the table
+        table.append(counter, x, f_x, previous_error)
 
-        # Add the initial values to the lists
-        values_list.append(str(x))
-        function_values_list.append(str(f_x))
-        error_values_list.append(str(previous_error))
-        counter_values_list.append(counter)
+        # Aitken's extrapolation keeps the last two terms of the sequence of the fixed point method
+        if acceleration == "aitken":
+            sequence = (x, evaluate_g_function(x))
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
         while previous_error > tolerance and f_x != 0 and counter < iterations:
@@ -220,24 +278,31 @@ def fixed_point(function: sp.Expr, variable: sp.Symbol, g_function: sp.Expr, ini
             x_previous = x
 
             # Calculate the new value of x using the g function
-            x = g_function.subs(variable, x).evalf(precision)
-            f_x = function.subs(variable, x).evalf(precision)
-
-            # Store the values in the lists
-            values_list.append(str(x))
-            function_values_list.append(str(f_x))
+            if acceleration == "aitken":
+                next_term = evaluate_g_function(sequence[1])
+                x = aitken(sequence[0], sequence[1], next_term)
+                sequence = (sequence[1], next_term)
+            elif acceleration == "steffensen":
+                x_1 = evaluate_g_function(x)
+                x = aitken(x, x_1, evaluate_g_function(x_1))
+            else:
+                x = evaluate_g_function(x)
+            f_x = evaluate_function(x)
 
             # Calculate the error and increment the counter
-            if absolute_error: 
+            if absolute_error:
                 error = abs(x - x_previous)
             else:
                 error = abs((x - x_previous) / x)
             counter += 1
 
-            # Store the error in the list, update the previous error and add the counter to the list
-            error_values_list.append(str(error))
+            # Store the row in the table and update the previous error
+            table.append(counter, x, f_x, error)
             previous_error = error
-            counter_values_list.append(counter)
+
+            # The errors close to the rounding error of the precision don't follow the order of convergence
+            if error > (max(1, abs(x)) if absolute_error else 1) * 10 ** (2 - precision):
+                errors = (errors + [error])[-3:]
 
         if f_x == 0:
             message = str(x) + " es raíz de la función."
@@ -246,11 +311,13 @@ def fixed_point(function: sp.Expr, variable: sp.Symbol, g_function: sp.Expr, ini
         else:
             message = "El método no converge en " + str(iterations) + " iteraciones."
 
-        # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
-    
+        order = convergence_order(errors)
+
+        # Return the list of iterations, values, function values, errors and the observed order of convergence
+        return (*table.columns(4), message, str(order) if order is not None else None)
 
-def newton_raphson(function: sp.Expr, variable: sp.Symbol, initial: float, derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[int], List[str], List[str], List[str], str]:
+
+def newton_raphson(function: sp.Expr, variable: sp.Symbol, initial: float, derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, automatic_differentiation: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
     """
     Find the root of a function using the Newton-Raphson method.
     
@@ -262,22 +329,27 @@ def newton_raphson(function: sp.Expr, variable: sp.Symbol, initial: float, deriv
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        automatic_differentiation: If True and the derivatives are not provided, they are computed by forward-mode automatic differentiation over the compiled function instead of symbolic differentiation (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
         List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
     # Calculate the function value at the initial point
-    f_initial = function.subs(variable, initial).evalf(precision)
+    f_initial = evaluate_function(initial)
 
     # Check if the initial point is a root
     if f_initial == 0:
-        return [[0], [str(initial)], [str(f_initial)], ["0"], str(initial) + " es raíz de la función."]
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
     else:
         # Set the variables needed for the iterations
         x = initial
@@ -285,35 +357,26 @@ def newton_raphson(function: sp.Expr, variable: sp.Symbol, initial: float, deriv
         # Initialize the error
         previous_error = 1
 
-        # Add the initial values to the lists
-        values_list.append(str(x))
-        function_values_list.append(str(f_x))
-        error_values_list.append(str(previous_error))
-        counter_values_list.append(counter)
+        # Add the initial values to the table
+        table.append(counter, x, f_x, previous_error)
 
-        # Calculate the derivative of the function if it is not provided
-        if derivative is None:
-            derivative = sp.diff(function, variable)
+        # Evaluate the function and its derivative together, calculating the derivative if it is not provided
+        evaluate_fused = create_derivatives_evaluator(function, variable, (derivative,), precision, compiled, automatic_differentiation)
+        f_x, derivative_x = evaluate_fused(x)
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
         while previous_error > tolerance and f_x != 0 and counter < iterations:
             # Sets the previous x value and calculate the new value of x using the Newton-Raphson method
             x_previous = x
 
-            # Calculate the derivate of the current x value
-            derivative_x = derivative.subs(variable, x).evalf(precision)
-
+            # Check the derivative at the current x value
             if derivative_x == 0:
                 break
 
             x = x - f_x / derivative_x
 
-            # Calculate the function value at the new x value
-            f_x = function.subs(variable, x).evalf(precision)
-
-            # Store the values in the lists
-            values_list.append(str(x))
-            function_values_list.append(str(f_x))
+            # Calculate the function and derivative values at the new x value
+            f_x, derivative_x = evaluate_fused(x)
 
             # Calculate the error and increment the counter
             if absolute_error:
@@ -322,10 +385,9 @@ def newton_raphson(function: sp.Expr, variable: sp.Symbol, initial: float, deriv
                 error = abs((x - x_previous) / x)
             counter += 1
 
-            # Store the error in the list, update the previous error and add the counter to the list
-            error_values_list.append(str(error))
+            # Store the row in the table and update the previous error
+            table.append(counter, x, f_x, error)
             previous_error = error
-            counter_values_list.append(counter)
 
         if f_x == 0:
             message = str(x) + " es raíz de la función."
@@ -337,10 +399,10 @@ def newton_raphson(function: sp.Expr, variable: sp.Symbol, initial: float, deriv
             message = "El método no converge en " + str(iterations) + " iteraciones."
 
         # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
+        return (*table.columns(4), message)
     
 
-def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initial: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[int], List[str], List[str], List[str], str]:
+def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initial: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
     """
     Find the root of a function using the secant method.
     
@@ -352,25 +414,30 @@ def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initia
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
         List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
     # Calculate the function values at the initial points
-    f_initial = function.subs(variable, initial).evalf(precision)
-    f_second_initial = function.subs(variable, second_initial).evalf(precision)
+    f_initial = evaluate_function(initial)
+    f_second_initial = evaluate_function(second_initial)
 
     # Check if the initial or second initial points are roots
     if f_initial == 0:
-        return [[0], [str(initial)], [str(f_initial)], ["0"], str(initial) + " es raíz de la función."]
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
     elif f_second_initial == 0:
-        return [[0], [str(second_initial)], [str(f_second_initial)], ["0"], str(second_initial) + " es raíz de la función."]
+        table.append(0, second_initial, f_second_initial, 0)
+        return (*table.columns(4), str(second_initial) + " es raíz de la función.")
     else:
         # Set the variables needed for the iterations
         x = second_initial
@@ -380,17 +447,11 @@ def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initia
         # Initialize the error
         previous_error = 1
 
-        # Add the initial previous values to the lists
-        values_list.append(str(x_previous))
-        function_values_list.append(str(f_x_previous))
-        error_values_list.append(str(previous_error))
-        counter_values_list.append(counter)
+        # Add the initial previous values to the table
+        table.append(counter, x_previous, f_x_previous, previous_error)
 
-        # Add the initial values to the lists
-        values_list.append(str(x))
-        function_values_list.append(str(f_x))
-        error_values_list.append(str(previous_error))
-        counter_values_list.append(counter)
+        # Add the initial values to the table
+        table.append(counter, x, f_x, previous_error)
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
         while previous_error > tolerance and f_x != 0 and counter < iterations:
@@ -404,16 +465,12 @@ def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initia
             x = x_new
 
             # Calculate the function value at the new x value
-            f_x_new = function.subs(variable, x_new).evalf(precision)
+            f_x_new = evaluate_function(x_new)
 
             # Set the previous function value and the current function value
             f_x_previous = f_x
             f_x = f_x_new
 
-            # Store the values in the lists
-            values_list.append(str(x))
-            function_values_list.append(str(f_x))
-
             # Calculate the error and increment the counter
             if absolute_error:
                 error = abs(x - x_previous)
@@ -421,10 +478,9 @@ def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initia
                 error = abs((x - x_previous) / x)
             counter += 1
 
-            # Store the error in the list, update the previous error and add the counter to the list
-            error_values_list.append(str(error))
+            # Store the row in the table and update the previous error
+            table.append(counter, x, f_x, error)
             previous_error = error
-            counter_values_list.append(counter)
 
         if f_x == 0:
             message = str(x) + " es raíz de la función."
@@ -434,10 +490,10 @@ def secant(function: sp.Expr, variable: sp.Symbol, initial: float, second_initia
             message = "El método no converge en " + str(iterations) + " iteraciones."
 
         # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
+        return (*table.columns(4), message)
     
 
-def first_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial: float, multiplicity: int, derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[int], List[str], List[str], List[str], str]:
+def first_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial: float, multiplicity: int, derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, automatic_differentiation: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
     """
     Find the root of a function using the first modified Newton method. This method is for multiple roots.
 
@@ -451,22 +507,27 @@ def first_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        automatic_differentiation: If True and the derivatives are not provided, they are computed by forward-mode automatic differentiation over the compiled function instead of symbolic differentiation (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
         List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
     # Calculate the function value at the initial point
-    f_initial = function.subs(variable, initial).evalf(precision)
+    f_initial = evaluate_function(initial)
 
     # Check if the initial point is a root
     if f_initial == 0:
-        return [[0], [str(initial)], [str(f_initial)], ["0"], str(initial) + " es raíz de la función."]
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
     else:
         # Set the variables needed for the iterations
         x = initial
@@ -474,34 +535,26 @@ def first_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial
         # Initialize the error
         previous_error = 1
 
-        # Add the initial values to the lists
-        values_list.append(str(x))
-        function_values_list.append(str(f_x))
-        error_values_list.append(str(previous_error))
-        counter_values_list.append(counter)
+        # Add the initial values to the table
+        table.append(counter, x, f_x, previous_error)
 
-        # Calculate the derivative of the function if it is not provided
-        if derivative is None:
-            derivative = sp.diff(function, variable)
+        # Evaluate the function and its derivative together, calculating the derivative if it is not provided
+        evaluate_fused = create_derivatives_evaluator(function, variable, (derivative,), precision, compiled, automatic_differentiation)
+        f_x, derivative_x = evaluate_fused(x)
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
         while previous_error > tolerance and f_x != 0 and counter < iterations:
             # Sets the previous x value and calculate the new value of x using the first modified Newton method
             x_previous = x
 
-            # Calculate the derivate of the current x value
-            derivative_x = derivative.subs(variable, x).evalf(precision)
+            # Check the derivative at the current x value
             if derivative_x == 0:
                 break
 
             x = x - multiplicity * f_x / derivative_x
 
-            # Calculate the function value at the new x value
-            f_x = function.subs(variable, x).evalf(precision)
-
-            # Store the values in the lists
-            values_list.append(str(x))
-            function_values_list.append(str(f_x))
+            # Calculate the function and derivative values at the new x value
+            f_x, derivative_x = evaluate_fused(x)
 
             # Calculate the error and increment the counter
             if absolute_error:
@@ -510,10 +563,9 @@ def first_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial
                 error = abs((x - x_previous) / x)
             counter += 1
 
-            # Store the error in the list, update the previous error and add the counter to the list
-            error_values_list.append(str(error))
+            # Store the row in the table and update the previous error
+            table.append(counter, x, f_x, error)
             previous_error = error
-            counter_values_list.append(counter)
 
         if f_x == 0:
             message = str(x) + " es raíz de la función."
@@ -525,10 +577,10 @@ def first_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial
             message = "El método no converge en " + str(iterations) + " iteraciones."
 
         # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
+        return (*table.columns(4), message)
     
 
-def second_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial: float,  derivative: sp.Expr = None, second_derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16) -> Tuple[List[int], List[str], List[str], List[str], str]:
+def second_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initial: float,  derivative: sp.Expr = None, second_derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, automatic_differentiation: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
     """
     Find the root of a function using the second modified Newton method. This method is for multiple roots.
 
@@ -542,22 +594,27 @@ def second_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initia
         iterations: Maximum number of iterations to perform (default 100).
         absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
         precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        automatic_differentiation: If True and the derivatives are not provided, they are computed by forward-mode automatic differentiation over the compiled function instead of symbolic differentiation (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
     Returns:
         List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
     """
-    # Initialize the lists to store the function values and errors
-    function_values_list = []
-    values_list = []
-    error_values_list = []
-    counter_values_list = []
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
     counter = 0
 
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
     # Calculate the function value at the initial point
-    f_initial = function.subs(variable, initial).evalf(precision)
+    f_initial = evaluate_function(initial)
 
     # Check if the initial point is a root
     if f_initial == 0:
-        return [[0], [str(initial)], [str(f_initial)], ["0"], str(initial) + " es raíz de la función."]
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
     else:
         # Set the variables needed for the iterations
         x = initial
@@ -565,34 +622,24 @@ def second_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initia
         # Initialize the error
         previous_error = 1
 
-        # Add the initial values to the lists
-        values_list.append(str(x))
-        function_values_list.append(str(f_x))
-        error_values_list.append(str(previous_error))
-        counter_values_list.append(counter)
-
-        # Calculate the derivative of the function if it is not provided
-        if derivative is None:
-            derivative = sp.diff(function, variable)
+        # Add the initial values to the table
+        table.append(counter, x, f_x, previous_error)
 
-        # Calculate the second derivative of the function if it is not provided
-        if second_derivative is None:
-            second_derivative = sp.diff(derivative, variable)
+        # Evaluate the function and its derivatives together, calculating the derivatives if they are not provided
+        evaluate_fused = create_derivatives_evaluator(function, variable, (derivative, second_derivative), precision, compiled, automatic_differentiation)
+        f_x, derivative_x, second_derivative_x = evaluate_fused(x)
 
         # Iterate until the error is less than the tolerance, the function value is zero or the maximum number of iterations is reached
         while previous_error > tolerance and f_x != 0 and counter < iterations:
             # Sets the previous x value and calculate the new value of x using the second modified Newton method
             x_previous = x
-            if (derivative.subs(variable, x).evalf(precision) ** 2 - f_x * second_derivative.subs(variable, x).evalf(precision)) == 0:
+            denominator = derivative_x ** 2 - f_x * second_derivative_x
+            if denominator == 0:
                 break
-            x = x - f_x * derivative.subs(variable, x).evalf(precision) / (derivative.subs(variable, x).evalf(precision) ** 2 - f_x * second_derivative.subs(variable, x).evalf(precision))
-
-            # Calculate the function value at the new x value
-            f_x = function.subs(variable, x).evalf(precision)
+            x = x - f_x * derivative_x / denominator
 
-            # Store the values in the lists
-            values_list.append(str(x))
-            function_values_list.append(str(f_x))
+            # Calculate the function and derivatives values at the new x value
+            f_x, derivative_x, second_derivative_x = evaluate_fused(x)
 
             # Calculate the error and increment the counter
             if absolute_error:
@@ -601,19 +648,216 @@ def second_modified_newton_method(function: sp.Expr, variable: sp.Symbol, initia
                 error = abs((x - x_previous) / x)
             counter += 1
 
-            # Store the error in the list, update the previous error and add the counter to the list
-            error_values_list.append(str(error))
+            # Store the row in the table and update the previous error
+            table.append(counter, x, f_x, error)
             previous_error = error
-            counter_values_list.append(counter)
 
         if f_x == 0:
             message = str(x) + " es raíz de la función."
         elif previous_error < tolerance:
             message = str(x) + " es una aproximación a la raíz con una tolerancia de " + str(tolerance) + "."
-        elif (derivative.subs(variable, x).evalf(precision) ** 2 - f_x * second_derivative.subs(variable, x).evalf(precision)) == 0:
+        elif derivative_x ** 2 - f_x * second_derivative_x == 0:
             message = "El denominador de la fórmula es cero, no se puede continuar con el método."
         else:
             message = "El método no converge en " + str(iterations) + " iteraciones."
 
         # Return the list of iterations, values, function values and errors
-        return counter_values_list, values_list, function_values_list, error_values_list, message
+        return (*table.columns(4), message)
+
+
+def bracket_error(x: float, contrapoint: float, absolute_error: bool = True) -> float:
+    """
+    Calculate the error of a bracketing method as the width of the bracket which contains the root, so it is an upper bound of the distance
+    between the approximation and the root.
+
+    Args:
+        x: Current approximation of the root.
+        contrapoint: Bound of the bracket where the function has the opposite sign.
+        absolute_error: If True, the error is the absolute width of the bracket. If False, the width is divided by the approximation (default True).
+    Returns:
+        The error of the approximation.
+    """
+    if absolute_error:
+        return abs(contrapoint - x)
+    return abs((contrapoint - x) / x)
+
+
+def brent(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
+    """
+    Find the root of a function using Brent's method. The function must have a sign change in the interval [initial, final]. Every step
+    is an inverse quadratic interpolation through the bounds of the bracket and the bound dropped by the last step, and with Chandrupatla's
+    criterion it is used only when the interpolating function is monotone in the bracket, otherwise the step is a bisection step. It
+    converges superlinearly on smooth simple roots, and on multiple roots, where the interpolation is rejected, it takes about the same
+    number of steps as the bisection method. The error is the width of the bracket which contains the root.
+
+    Args:
+        function: The function for which to find the root.
+        initial: Initial value of the independent variable.
+        final: Final value of the independent variable.
+        tolerance: Tolerance for the root (default 0.5).
+        iterations: Maximum number of iterations to perform (default 100).
+        absolute_error: If True, the error is the width of the bracket. If False, the error is the width of the bracket divided by the current value (default True).
+        precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
+    Returns:
+        List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
+    """
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
+    counter = 0
+
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
+    # Calculate the function values at the initial and final points
+    f_initial = evaluate_function(initial)
+    f_final = evaluate_function(final)
+    # Check if the initial or final point is a root
+    if f_initial == 0:
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
+    elif f_final == 0:
+        table.append(0, final, f_final, 0)
+        return (*table.columns(4), str(final) + " es raíz de la función.")
+    # Check if there is a sign change in the interval [initial, final]
+    elif f_initial * f_final > 0:
+        raise_exception(ValueError("La función no tiene cambio de signo en el intervalo dado"), logger)
+
+    # The root is in the bracket between the last point and the contrapoint, and the third point is the bound dropped by the last iteration
+    x, f_x = final, f_final
+    contrapoint, f_contrapoint = initial, f_initial
+    x_third, f_third = initial, f_initial
+    # Fraction of the bracket from the last point to the next one, the first step is a bisection step
+    fraction = 0.5
+    error = tolerance + 1
+
+    while counter < iterations:
+        # Keep the new point at least at the minimum step from the bounds, so the bracket shrinks from both sides near the root
+        minimum_step = tolerance / 2 if absolute_error else tolerance * abs(x) / 2
+        width = abs(contrapoint - x)
+        fraction = min(max(fraction, minimum_step / width), 1 - minimum_step / width)
+
+        # Calculate the new point
+        x_new = x + fraction * (contrapoint - x)
+        f_new = evaluate_function(x_new)
+        counter += 1
+
+        # Keep the bound where the function has the opposite sign of the new point
+        if f_new * f_x > 0:
+            x_third, f_third = x, f_x
+        else:
+            x_third, f_third = contrapoint, f_contrapoint
+            contrapoint, f_contrapoint = x, f_x
+        x, f_x = x_new, f_new
+
+        # Calculate the error and store the row in the table
+        error = bracket_error(x, contrapoint, absolute_error)
+        table.append(counter, x, f_x, error)
+
+        if f_x == 0 or error < tolerance:
+            break
+
+        # Use the inverse quadratic interpolation only if the interpolating function is monotone in the bracket, otherwise bisect
+        xi = (x - contrapoint) / (x_third - contrapoint)
+        phi = (f_x - f_contrapoint) / (f_third - f_contrapoint)
+        if phi ** 2 < xi and (1 - phi) ** 2 < 1 - xi:
+            fraction = (f_x / (f_contrapoint - f_x) * f_third / (f_contrapoint - f_third)
+                        + (x_third - x) / (contrapoint - x) * f_x / (f_third - f_x) * f_contrapoint / (f_third - f_contrapoint))
+        else:
+            fraction = 0.5
+
+    if f_x == 0:
+        message = str(x) + " es raíz de la función."
+    elif error < tolerance:
+        message = str(x) + " es una aproximación a la raíz con una tolerancia de " + str(tolerance) + "."
+    else:
+        message = "El método no converge en " + str(iterations) + " iteraciones."
+
+    # Return the list of iterations, values, function values and errors
+    return (*table.columns(4), message)
+
+
+def illinois(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, precision: int = 16, compiled: bool = False, table: IterationTable = None) -> Tuple[List[int], List[str], List[str], List[str], str]:
+    """
+    Find the root of a function using the Illinois method. The function must have a sign change in the interval [initial, final]. It is
+    the false rule method, but the function value of a bound which is kept in two consecutive iterations is halved, so both bounds move
+    and the bracket shrinks to the root instead of converging from one side. The error is the width of the bracket which contains the root.
+
+    Args:
+        function: The function for which to find the root.
+        initial: Initial value of the independent variable.
+        final: Final value of the independent variable.
+        tolerance: Tolerance for the root (default 0.5).
+        iterations: Maximum number of iterations to perform (default 100).
+        absolute_error: If True, the error is the width of the bracket. If False, the error is the width of the bracket divided by the current value (default True).
+        precision: Number of decimal places to round the values (default 15).
+        compiled: If True, the functions are compiled into native callables, with float64 numbers if the precision is less or equal than 15 and mpmath numbers otherwise (default False).
+        table: Table to store the iterations, a streaming table sends every row as soon as it is computed (default None).
+    Returns:
+        List or table with the iterations, the values of x, the values of f(x), the errors and a message indicating the result.
+    """
+    # Initialize the table to store the iterations, values, function values and errors
+    if table is None:
+        table = IterationTable()
+    counter = 0
+
+    # Create the function evaluator
+    evaluate_function = create_evaluator(function, variable, precision, compiled)
+
+    # Calculate the function values at the initial and final points
+    f_initial = evaluate_function(initial)
+    f_final = evaluate_function(final)
+    # Check if the initial or final point is a root
+    if f_initial == 0:
+        table.append(0, initial, f_initial, 0)
+        return (*table.columns(4), str(initial) + " es raíz de la función.")
+    elif f_final == 0:
+        table.append(0, final, f_final, 0)
+        return (*table.columns(4), str(final) + " es raíz de la función.")
+    # Check if there is a sign change in the interval [initial, final]
+    elif f_initial * f_final > 0:
+        raise_exception(ValueError("La función no tiene cambio de signo en el intervalo dado"), logger)
+
+    # Bound replaced in the last iteration, -1 for the initial bound and 1 for the final bound
+    replaced = 0
+    medium, f_medium = final, f_final
+    error = tolerance + 1
+
+    while counter < iterations:
+        # Calculate the intersection of the secant line with the x axis
+        medium = final - f_final * (final - initial) / (f_final - f_initial)
+        f_medium = evaluate_function(medium)
+        counter += 1
+
+        # Replace the bound with the same sign and halve the function value of the bound kept twice
+        if f_initial * f_medium < 0:
+            final, f_final = medium, f_medium
+            if replaced == 1:
+                f_initial = f_initial / 2
+            replaced = 1
+            contrapoint = initial
+        else:
+            initial, f_initial = medium, f_medium
+            if replaced == -1:
+                f_final = f_final / 2
+            replaced = -1
+            contrapoint = final
+
+        # Calculate the error and store the row in the table
+        error = bracket_error(medium, contrapoint, absolute_error)
+        table.append(counter, medium, f_medium, error)
+
+        if f_medium == 0 or error < tolerance:
+            break
+
+    if f_medium == 0:
+        message = str(medium) + " es raíz de la función."
+    elif error < tolerance:
+        message = str(medium) + " es una aproximación a la raíz con una tolerancia de " + str(tolerance) + "."
+    else:
+        message = "El método no converge en " + str(iterations) + " iteraciones."
+
+    # Return the list of iterations, values, function values and errors
+    return (*table.columns(4), message)
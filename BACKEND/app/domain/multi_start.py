@@ -0,0 +1,404 @@
+from app.utils.utils import raise_exception
+from app.utils.compiler import compile_vectorized_expression, differentiate
+from app.routes.routes import logger
+import numpy as np
+import sympy as sp
+from typing import Callable, List, Tuple
+
+# Status of each lane (starting point or bracket) of a multi-start run
+RUNNING = 0
+ROOT = 1
+APPROXIMATION = 2
+NOT_CONVERGED = 3
+ZERO_DERIVATIVE = 4
+ZERO_DENOMINATOR = 5
+DIVERGED = 6
+NO_SIGN_CHANGE = 7
+
+
+def validate_starts(*starts: List[float]) -> List[np.ndarray]:
+    """
+    Validate the starting points or brackets of a multi-start run and convert them to float64 arrays.
+
+    Args:
+        starts: Lists with the starting values, all of them must have the same length.
+    Returns:
+        List with the starting values as float64 arrays.
+    """
+    if any(len(start) == 0 for start in starts):
+        raise_exception(ValueError("Debe proporcionar al menos un valor inicial"), logger)
+    if any(len(start) != len(starts[0]) for start in starts):
+        raise_exception(ValueError("Las listas de valores iniciales deben tener la misma longitud"), logger)
+
+    return [np.array(start, dtype=float) for start in starts]
+
+
+def calculate_error(x_new: np.ndarray, x_previous: np.ndarray, absolute_error: bool = True) -> np.ndarray:
+    """
+    Calculate the absolute or relative error of every lane.
+
+    Args:
+        x_new: New values of x.
+        x_previous: Previous values of x.
+        absolute_error: If True, the error is the absolute value of the difference, otherwise it is divided by the new value (default True).
+    Returns:
+        Array with the error of every lane.
+    """
+    with np.errstate(all="ignore"):
+        if absolute_error:
+            return np.abs(x_new - x_previous)
+        return np.abs((x_new - x_previous) / x_new)
+
+
+def update_status(status: np.ndarray, lanes: np.ndarray, x: np.ndarray, f_x: np.ndarray, error: np.ndarray, tolerance: float):
+    """
+    Update the status of the lanes which were advanced in the current iteration.
+
+    Args:
+        status: Status of every lane, it is updated in place.
+        lanes: Indexes of the lanes advanced in the current iteration.
+        x: Values of x of the advanced lanes.
+        f_x: Values of f(x) of the advanced lanes.
+        error: Errors of the advanced lanes.
+        tolerance: Tolerance for the root.
+    """
+    lane_status = np.full(lanes.shape, RUNNING)
+    lane_status[error <= tolerance] = APPROXIMATION
+    lane_status[f_x == 0] = ROOT
+    lane_status[~np.isfinite(x) | ~np.isfinite(f_x)] = DIVERGED
+    status[lanes] = lane_status
+
+
+def build_messages(x: np.ndarray, status: np.ndarray, tolerance: float, iterations: int) -> List[str]:
+    """
+    Build the result message of every lane.
+
+    Args:
+        x: Final values of x.
+        status: Final status of every lane.
+        tolerance: Tolerance for the root.
+        iterations: Maximum number of iterations.
+    Returns:
+        List with the message of every lane.
+    """
+    messages = []
+    for x_value, lane_status in zip(x, status):
+        if lane_status == ROOT:
+            messages.append(str(x_value) + " es raíz de la función.")
+        elif lane_status == APPROXIMATION:
+            messages.append(str(x_value) + " es una aproximación a la raíz con una tolerancia de " + str(tolerance) + ".")
+        elif lane_status == ZERO_DERIVATIVE:
+            messages.append("La derivada de la función en x = " + str(x_value) + " es cero, podría haber una raíz múltiple.")
+        elif lane_status == ZERO_DENOMINATOR:
+            messages.append("El denominador de la fórmula es cero en x = " + str(x_value) + ", no se puede continuar con el método.")
+        elif lane_status == DIVERGED:
+            messages.append("El método diverge o la función no está definida en x = " + str(x_value) + ".")
+        elif lane_status == NO_SIGN_CHANGE:
+            messages.append("La función no tiene cambio de signo en el intervalo dado")
+        else:
+            messages.append("El método no converge en " + str(iterations) + " iteraciones.")
+
+    return messages
+
+
+def build_result(counter: np.ndarray, x: np.ndarray, f_x: np.ndarray, error: np.ndarray, status: np.ndarray, tolerance: float, iterations: int) -> Tuple[List[int], List[str], List[str], List[str], List[str]]:
+    """
+    Build the table of a multi-start run, one row per lane.
+
+    Args:
+        counter: Number of iterations performed by every lane.
+        x: Final values of x.
+        f_x: Final values of f(x).
+        error: Final errors.
+        status: Final status of every lane.
+        tolerance: Tolerance for the root.
+        iterations: Maximum number of iterations.
+    Returns:
+        Lists with the iterations, the values of x, the values of f(x), the errors and the messages of every lane.
+    """
+    # The lanes which are still running reached the maximum number of iterations
+    status[status == RUNNING] = NOT_CONVERGED
+
+    return counter.tolist(), [str(value) for value in x.tolist()], [str(value) for value in f_x.tolist()], [str(value) for value in error.tolist()], build_messages(x.tolist(), status, tolerance, iterations)
+
+
+def newton_raphson_multi_start(function: sp.Expr, variable: sp.Symbol, initials: List[float], derivative: sp.Expr = None, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True) -> Tuple[List[int], List[str], List[str], List[str], List[str]]:
+    """
+    Find the roots of a function using the Newton-Raphson method from many initial values at once. All the initial values are advanced
+    together as float64 arrays, and the lanes which already converged are masked out of the next iterations.
+
+    Args:
+        function: The function for which to find the root.
+        variable: The independent variable of the function.
+        initials: Initial values of the independent variable.
+        derivative: The derivative of the function (default None).
+        tolerance: Tolerance for the root (default 0.5).
+        iterations: Maximum number of iterations to perform (default 100).
+        absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
+    Returns:
+        List or table with one row per initial value with the iterations, the final values of x, the values of f(x), the errors and a message indicating the result.
+    """
+    x, = validate_starts(initials)
+
+    # Compile the function and its derivative for arrays
+    if derivative is None:
+        derivative = differentiate(function, variable)
+    evaluate_function = compile_vectorized_expression(function, variable)
+    evaluate_derivative = compile_vectorized_expression(derivative, variable)
+
+    # Initialize the state of every lane
+    f_x = evaluate_function(x)
+    error = np.ones_like(x)
+    counter = np.zeros(x.shape, dtype=int)
+    status = np.full(x.shape, RUNNING)
+    status[f_x == 0] = ROOT
+    status[~np.isfinite(f_x)] = DIVERGED
+
+    for _ in range(iterations):
+        # Get the lanes which didn't converge yet
+        lanes = np.flatnonzero(status == RUNNING)
+        if lanes.size == 0:
+            break
+
+        # Stop the lanes with a zero derivative
+        derivative_x = evaluate_derivative(x[lanes])
+        zero_derivative = derivative_x == 0
+        status[lanes[zero_derivative]] = ZERO_DERIVATIVE
+        lanes = lanes[~zero_derivative]
+        derivative_x = derivative_x[~zero_derivative]
+
+        # Calculate the new values of x and f(x)
+        with np.errstate(all="ignore"):
+            x_new = x[lanes] - f_x[lanes] / derivative_x
+        f_new = evaluate_function(x_new)
+
+        # Store the values and update the status of the lanes
+        error[lanes] = calculate_error(x_new, x[lanes], absolute_error)
+        x[lanes] = x_new
+        f_x[lanes] = f_new
+        counter[lanes] += 1
+        update_status(status, lanes, x_new, f_new, error[lanes], tolerance)
+
+    return build_result(counter, x, f_x, error, status, tolerance, iterations)
+
+
+def secant_multi_start(function: sp.Expr, variable: sp.Symbol, initials: List[float], second_initials: List[float], tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True) -> Tuple[List[int], List[str], List[str], List[str], List[str]]:
+    """
+    Find the roots of a function using the secant method from many pairs of initial values at once. All the pairs are advanced together
+    as float64 arrays, and the lanes which already converged are masked out of the next iterations.
+
+    Args:
+        function: The function for which to find the root.
+        variable: The independent variable of the function.
+        initials: Initial values of the independent variable.
+        second_initials: Second initial values of the independent variable.
+        tolerance: Tolerance for the root (default 0.5).
+        iterations: Maximum number of iterations to perform (default 100).
+        absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
+    Returns:
+        List or table with one row per pair of initial values with the iterations, the final values of x, the values of f(x), the errors and a message indicating the result.
+    """
+    x_previous, x = validate_starts(initials, second_initials)
+
+    # Compile the function for arrays
+    evaluate_function = compile_vectorized_expression(function, variable)
+
+    # Initialize the state of every lane
+    f_x_previous = evaluate_function(x_previous)
+    f_x = evaluate_function(x)
+    error = np.ones_like(x)
+    counter = np.zeros(x.shape, dtype=int)
+    status = np.full(x.shape, RUNNING)
+    status[f_x == 0] = ROOT
+
+    # The lanes whose first initial value is a root keep that value
+    first_is_root = (f_x_previous == 0) & (f_x != 0)
+    x[first_is_root] = x_previous[first_is_root]
+    f_x[first_is_root] = 0
+    status[first_is_root] = ROOT
+    status[~np.isfinite(f_x) | ~np.isfinite(f_x_previous)] = DIVERGED
+
+    for _ in range(iterations):
+        # Get the lanes which didn't converge yet
+        lanes = np.flatnonzero(status == RUNNING)
+        if lanes.size == 0:
+            break
+
+        # Stop the lanes with a zero denominator
+        denominator = f_x[lanes] - f_x_previous[lanes]
+        zero_denominator = denominator == 0
+        status[lanes[zero_denominator]] = ZERO_DENOMINATOR
+        lanes = lanes[~zero_denominator]
+        denominator = denominator[~zero_denominator]
+
+        # Calculate the new values of x and f(x)
+        with np.errstate(all="ignore"):
+            x_new = x[lanes] - f_x[lanes] * (x[lanes] - x_previous[lanes]) / denominator
+        f_new = evaluate_function(x_new)
+
+        # Store the values and update the status of the lanes
+        error[lanes] = calculate_error(x_new, x[lanes], absolute_error)
+        x_previous[lanes] = x[lanes]
+        f_x_previous[lanes] = f_x[lanes]
+        x[lanes] = x_new
+        f_x[lanes] = f_new
+        counter[lanes] += 1
+        update_status(status, lanes, x_new, f_new, error[lanes], tolerance)
+
+    return build_result(counter, x, f_x, error, status, tolerance, iterations)
+
+
+def next_bracket_points(initial: np.ndarray, final: np.ndarray, f_initial: np.ndarray, f_final: np.ndarray, false_rule: bool = False, stalled: np.ndarray = None) -> np.ndarray:
+    """
+    Calculate the next point of every bracket. The bisection method takes the medium point. The false rule method takes the intersection
+    of the secant line with the x axis, and it is safeguarded with the medium point when the intersection is not strictly inside the
+    bracket or when the same bound was kept in the last two iterations.
+
+    Args:
+        initial: Left bounds of the brackets.
+        final: Right bounds of the brackets.
+        f_initial: Values of f at the left bounds.
+        f_final: Values of f at the right bounds.
+        false_rule: If True, use the safeguarded false rule method, otherwise use the bisection method (default False).
+        stalled: Brackets which kept the same bound in the last two iterations (default None).
+    Returns:
+        Array with the next point of every bracket.
+    """
+    medium = (initial + final) / 2
+    if not false_rule:
+        return medium
+
+    with np.errstate(all="ignore"):
+        point = final - f_final * (final - initial) / (f_final - f_initial)
+    inside = np.isfinite(point) & (point > np.minimum(initial, final)) & (point < np.maximum(initial, final))
+    if stalled is not None:
+        inside &= ~stalled
+
+    return np.where(inside, point, medium)
+
+
+def record_traces(traces: List[Tuple[List[int], List[str], List[str], List[str]]], lanes: np.ndarray, counter: np.ndarray, x: np.ndarray, f_x: np.ndarray, error: np.ndarray):
+    """
+    Append the current row of the lanes advanced in the iteration to their traces.
+
+    Args:
+        traces: Trace of every lane with the iterations, the values of x, the values of f(x) and the errors, it is updated in place.
+        lanes: Indexes of the lanes advanced in the current iteration.
+        counter: Number of iterations performed by every lane.
+        x: Values of x of every lane.
+        f_x: Values of f(x) of every lane.
+        error: Errors of every lane.
+    """
+    for lane, lane_counter, x_value, f_value, error_value in zip(lanes.tolist(), counter[lanes].tolist(), x[lanes].tolist(), f_x[lanes].tolist(), error[lanes].tolist()):
+        trace = traces[lane]
+        trace[0].append(lane_counter)
+        trace[1].append(str(x_value))
+        trace[2].append(str(f_value))
+        trace[3].append(str(error_value))
+
+
+def bracketing_multi_start(evaluate_function: Callable[[np.ndarray], np.ndarray], initial: np.ndarray, final: np.ndarray, false_rule: bool = False, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, traces: List[Tuple[List[int], List[str], List[str], List[str]]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Refine many brackets at once with the bisection or the safeguarded false rule method. All the brackets are advanced together as
+    float64 arrays, and the lanes which already converged are masked out of the next iterations. Brackets without a sign change are
+    marked instead of stopping the whole run.
+
+    Args:
+        evaluate_function: Compiled function which evaluates f over an array.
+        initial: Left bounds of the brackets, it is updated in place.
+        final: Right bounds of the brackets, it is updated in place.
+        false_rule: If True, use the safeguarded false rule method, otherwise use the bisection method (default False).
+        tolerance: Tolerance for the root (default 0.5).
+        iterations: Maximum number of iterations to perform (default 100).
+        absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
+        traces: If given, an empty list which is filled with the trace of every lane (default None).
+    Returns:
+        Arrays with the iterations, the final values of x, the values of f(x), the errors and the status of every lane.
+    """
+    # Evaluate the function at the bounds of the brackets
+    f_initial = evaluate_function(initial)
+    f_final = evaluate_function(final)
+    counter = np.zeros(initial.shape, dtype=int)
+    error = np.zeros_like(initial)
+    status = np.full(initial.shape, RUNNING)
+
+    # Check the bounds which are roots and the brackets without a sign change
+    status[f_initial * f_final > 0] = NO_SIGN_CHANGE
+    status[f_final == 0] = ROOT
+    status[f_initial == 0] = ROOT
+    status[~np.isfinite(f_initial) | ~np.isfinite(f_final)] = DIVERGED
+    x = np.where(f_initial == 0, initial, final)
+    f_x = np.where(f_initial == 0, f_initial, f_final)
+    if traces is not None:
+        traces.extend(([], [], [], []) for _ in range(initial.size))
+        record_traces(traces, np.flatnonzero(status == ROOT), counter, x, f_x, error)
+
+    # Calculate the first point of the running lanes
+    lanes = np.flatnonzero(status == RUNNING)
+    x[lanes] = next_bracket_points(initial[lanes], final[lanes], f_initial[lanes], f_final[lanes], false_rule)
+    f_x[lanes] = evaluate_function(x[lanes])
+    error[lanes] = 1
+    counter[lanes] = 1
+    update_status(status, lanes, x[lanes], f_x[lanes], error[lanes], tolerance)
+    if traces is not None:
+        record_traces(traces, lanes, counter, x, f_x, error)
+
+    # Side of the bracket moved in the last iteration, to detect the false rule lanes which keep the same bound
+    moved = np.zeros(initial.shape, dtype=int)
+
+    for _ in range(iterations - 1):
+        # Get the lanes which didn't converge yet
+        lanes = np.flatnonzero(status == RUNNING)
+        if lanes.size == 0:
+            break
+
+        # Check if the root is in the left or right subinterval
+        left = f_initial[lanes] * f_x[lanes] < 0
+        final[lanes[left]] = x[lanes[left]]
+        f_final[lanes[left]] = f_x[lanes[left]]
+        initial[lanes[~left]] = x[lanes[~left]]
+        f_initial[lanes[~left]] = f_x[lanes[~left]]
+        side = np.where(left, 1, -1)
+        repeated = moved[lanes] == side
+        moved[lanes] = side
+
+        # Calculate the new points
+        x_new = next_bracket_points(initial[lanes], final[lanes], f_initial[lanes], f_final[lanes], false_rule, repeated)
+        f_new = evaluate_function(x_new)
+
+        # Store the values and update the status of the lanes
+        error[lanes] = calculate_error(x_new, x[lanes], absolute_error)
+        x[lanes] = x_new
+        f_x[lanes] = f_new
+        counter[lanes] += 1
+        update_status(status, lanes, x_new, f_new, error[lanes], tolerance)
+        if traces is not None:
+            record_traces(traces, lanes, counter, x, f_x, error)
+
+    return counter, x, f_x, error, status
+
+
+def bisection_multi_start(function: sp.Expr, variable: sp.Symbol, initials: List[float], finals: List[float], tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True) -> Tuple[List[int], List[str], List[str], List[str], List[str]]:
+    """
+    Find the roots of a function using the bisection method over many intervals at once. All the intervals are advanced together as
+    float64 arrays, and the lanes which already converged are masked out of the next iterations. Intervals without a sign change are
+    reported in their message instead of stopping the whole run.
+
+    Args:
+        function: The function for which to find the root.
+        variable: The independent variable of the function.
+        initials: Left bounds of the intervals.
+        finals: Right bounds of the intervals.
+        tolerance: Tolerance for the root (default 0.5).
+        iterations: Maximum number of iterations to perform (default 100).
+        absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
+    Returns:
+        List or table with one row per interval with the iterations, the final values of x, the values of f(x), the errors and a message indicating the result.
+    """
+    initial, final = validate_starts(initials, finals)
+
+    # Compile the function for arrays and refine all the intervals together
+    evaluate_function = compile_vectorized_expression(function, variable)
+    counter, x, f_x, error, status = bracketing_multi_start(evaluate_function, initial, final, False, tolerance, iterations, absolute_error)
+
+    return build_result(counter, x, f_x, error, status, tolerance, iterations)
@@ -0,0 +1,205 @@
+from app.utils.utils import raise_exception
+from app.utils.compiler import FLOAT64_MAX_PRECISION
+from app.routes.routes import logger
+import mpmath
+import numpy as np
+import sympy as sp
+from typing import List, Optional, Sequence, Tuple, Union
+
+# Extra decimal digits used by the iterations of the high precision roots, so the rounding errors don't reach the requested digits
+GUARD_DIGITS = 10
+
+Number = Union[complex, mpmath.mpc]
+
+
+def polynomial_coefficients(function: sp.Expr, variable: sp.Symbol) -> Optional[List[sp.Expr]]:
+    """
+    Get the coefficients of a function if it is a polynomial in the variable with numeric coefficients.
+
+    Args:
+        function: The function to check.
+        variable: The independent variable of the function.
+    Returns:
+        List with the coefficients from the highest to the lowest degree, or None if the function is not a polynomial.
+    """
+    try:
+        polynomial = sp.Poly(function, variable)
+    except sp.PolynomialError:
+        return None
+
+    coefficients = polynomial.all_coeffs()
+    if not all(coefficient.is_number for coefficient in coefficients):
+        return None
+
+    return coefficients
+
+
+def companion_roots(coefficients: Sequence[complex]) -> np.ndarray:
+    """
+    Find all the roots of a polynomial as the eigenvalues of its companion matrix, using float64 numbers.
+
+    Args:
+        coefficients: Coefficients of the polynomial from the highest to the lowest degree, the first one is not zero.
+    Returns:
+        Array with the roots.
+    """
+    coefficients = np.asarray(coefficients, dtype=complex)
+    # With real coefficients the real eigenvalue solver is used, which returns the real roots without imaginary part
+    if np.all(coefficients.imag == 0):
+        coefficients = coefficients.real
+    degree = coefficients.size - 1
+
+    companion = np.zeros((degree, degree), dtype=coefficients.dtype)
+    companion[0, :] = -coefficients[1:] / coefficients[0]
+    companion[np.arange(1, degree), np.arange(degree - 1)] = 1
+
+    return np.linalg.eigvals(companion).astype(complex)
+
+
+def aberth_roots(coefficients: Sequence[mpmath.mpc], initials: Sequence[Number], tolerance: mpmath.mpf, iterations: int) -> Tuple[List[mpmath.mpc], int, bool]:
+    """
+    Polish all the roots of a polynomial together with the Aberth-Ehrlich iteration, which converges cubically to every simple root. Every
+    root is corrected with the Newton step of the polynomial divided by the repulsion of the other roots, so two approximations don't
+    converge to the same root. A root stops being corrected when the value of the polynomial is below the rounding errors of its evaluation.
+
+    Args:
+        coefficients: Coefficients of the polynomial from the highest to the lowest degree, as mpmath numbers of the working precision.
+        initials: Initial approximations of the roots.
+        tolerance: Maximum relative correction of a root to stop the iteration.
+        iterations: Maximum number of iterations to perform.
+    Returns:
+        List with the roots, number of iterations performed and whether the tolerance was reached.
+    """
+    roots = [mpmath.mpc(root) for root in initials]
+    magnitudes = [abs(coefficient) for coefficient in coefficients]
+    # Bound of the rounding error of Horner's method relative to the polynomial evaluated with the magnitudes of the coefficients
+    noise = 4 * len(coefficients) * mpmath.eps
+
+    for iteration in range(1, iterations + 1):
+        converged = True
+        for index, root in enumerate(roots):
+            # Horner's method for the value of the polynomial and its derivative
+            value = coefficients[0]
+            derivative = mpmath.mpc(0)
+            bound = magnitudes[0]
+            modulus = abs(root)
+            for coefficient, magnitude in zip(coefficients[1:], magnitudes[1:]):
+                derivative = derivative * root + value
+                value = value * root + coefficient
+                bound = bound * modulus + magnitude
+
+            # The value is below the rounding errors, so the root can't be improved with the working precision
+            if abs(value) <= noise * bound:
+                continue
+
+            repulsion = mpmath.fsum(1 / (root - other) for other_index, other in enumerate(roots) if other_index != index and other != root)
+            denominator = derivative - value * repulsion
+            if denominator == 0:
+                converged = False
+                continue
+
+            correction = value / denominator
+            # The roots are updated in place, so the next roots use the corrected ones
+            roots[index] = root - correction
+            if abs(correction) > tolerance * max(1, abs(roots[index])):
+                converged = False
+
+        if converged:
+            return roots, iteration, True
+
+    return roots, iterations, False
+
+
+def is_real(root: Number, precision: int) -> bool:
+    """
+    Check if the imaginary part of a root is negligible for the precision of the roots.
+
+    Args:
+        root: The root to check.
+        precision: Number of significant digits of the root.
+    Returns:
+        True if the root is real.
+    """
+    return abs(root.imag) <= 10 ** (2 - precision) * max(1, abs(root))
+
+
+def format_root(root: Number, precision: int) -> str:
+    """
+    Format a root as a string, with the imaginary part only when it is not negligible.
+
+    Args:
+        root: The root to format.
+        precision: Number of significant digits of the root.
+    Returns:
+        The formatted root, like -1.5 or 0.5 - 2.0*I.
+    """
+    # A real part which is negligible compared with the imaginary part is written as zero
+    real = root.real if abs(root.real) > 10 ** (2 - precision) * max(1, abs(root)) else type(root.real)(0)
+
+    if not isinstance(root, mpmath.mpc):
+        # nstr writes the float numbers with all their digits, as mpf numbers they are rounded to the requested digits
+        real, root = mpmath.mpf(float(real)), mpmath.mpc(root)
+
+    # The sign is removed from the string, abs would round the part to the default precision of mpmath
+    real, imaginary = mpmath.nstr(real, precision), mpmath.nstr(root.imag, precision).lstrip("-")
+
+    if is_real(root, precision):
+        return real
+
+    return real + (" - " if root.imag < 0 else " + ") + imaginary + "*I"
+
+
+def polynomial_roots(function: sp.Expr, variable: sp.Symbol, precision: int = 16, tolerance: float = None, iterations: int = 100) -> Tuple[List[str], List[str], int, str]:
+    """
+    Find all the real and complex roots of a polynomial at once. For precisions up to 15 digits the roots are the eigenvalues of the
+    companion matrix computed with float64 numbers; for higher precisions those eigenvalues are polished with the Aberth-Ehrlich iteration
+    using mpmath numbers.
+
+    Args:
+        function: The polynomial for which to find the roots.
+        variable: The independent variable of the polynomial.
+        precision: Number of significant digits of the roots (default 16).
+        tolerance: Maximum relative correction of a root to stop the Aberth-Ehrlich iteration (default 10**-precision).
+        iterations: Maximum number of iterations of the Aberth-Ehrlich iteration (default 100).
+    Returns:
+        List with all the roots repeated by their multiplicity, list with the real roots, number of iterations performed and a message
+        indicating the result.
+    """
+    coefficients = polynomial_coefficients(function, variable)
+    if coefficients is None:
+        raise_exception(ValueError("La función no es un polinomio con coeficientes numéricos en la variable " + str(variable)), logger)
+
+    # The zero roots are removed, so the remaining polynomial has a nonzero constant term
+    zeros = 0
+    while len(coefficients) > 1 and coefficients[-1] == 0:
+        coefficients = coefficients[:-1]
+        zeros += 1
+
+    degree = len(coefficients) - 1 + zeros
+    if degree == 0:
+        raise_exception(ValueError("El polinomio es constante, no tiene raíces"), logger)
+
+    roots = companion_roots([complex(sp.N(coefficient)) for coefficient in coefficients]) if len(coefficients) > 1 else []
+    count = 0
+    converged = True
+
+    if precision > FLOAT64_MAX_PRECISION:
+        with mpmath.workdps(precision + GUARD_DIGITS):
+            mp_coefficients = [coefficient._to_mpmath(mpmath.mp.prec) for coefficient in coefficients]
+            tolerance = mpmath.mpf(tolerance) if tolerance is not None else mpmath.mpf(10) ** -precision
+            roots, count, converged = aberth_roots(mp_coefficients, roots, tolerance, iterations) if len(roots) > 0 else ([], 0, True)
+            roots = [mpmath.mpc(0)] * zeros + roots
+    else:
+        roots = [0j] * zeros + list(roots)
+
+    # The roots are sorted by their real part and then by their imaginary part
+    roots.sort(key=lambda root: (float(root.real), float(root.imag)))
+    all_roots = [format_root(root, precision) for root in roots]
+    real_roots = [format_root(root, precision) for root in roots if is_real(root, precision)]
+
+    if converged:
+        message = "Se encontraron las " + str(degree) + " raíces del polinomio, " + str(len(real_roots)) + " de ellas reales."
+    else:
+        message = "Se encontraron las " + str(degree) + " raíces del polinomio, " + str(len(real_roots)) + " de ellas reales. Fracasó en " + str(iterations) + " iteraciones al pulir las raíces con la tolerancia dada, las raíces múltiples convergen lentamente."
+
+    return all_roots, real_roots, count, message
@@ -0,0 +1,112 @@
+from app.utils.utils import raise_exception
+from app.utils.compiler import compile_vectorized_expression, differentiate
+from app.domain.multi_start import bracketing_multi_start, build_messages, ROOT, APPROXIMATION, RUNNING, NOT_CONVERGED
+from app.routes.routes import logger
+import numpy as np
+import sympy as sp
+from typing import List, Tuple
+
+
+def find_brackets(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the candidate roots of a function sampled over a grid.
+
+    Args:
+        values: Values of the function at the points of the grid.
+    Returns:
+        Indexes of the grid points which are roots, indexes of the left points of the subintervals with a sign change and indexes of the
+        interior points where the absolute value of the function has a local minimum without a sign change.
+    """
+    finite = np.isfinite(values)
+    zeros = np.flatnonzero(values == 0)
+
+    # Subintervals where the function changes its sign
+    with np.errstate(all="ignore"):
+        products = values[:-1] * values[1:]
+    sign_changes = np.flatnonzero(finite[:-1] & finite[1:] & (products < 0))
+
+    # Interior points where |f| has a local minimum and the function keeps its sign, which may be roots of even multiplicity
+    magnitude = np.abs(values)
+    interior = np.arange(1, values.size - 1)
+    minima = interior[
+        finite[interior - 1] & finite[interior] & finite[interior + 1]
+        & (products[interior - 1] > 0) & (products[interior] > 0)
+        & (magnitude[interior] <= magnitude[interior - 1]) & (magnitude[interior] < magnitude[interior + 1])
+    ]
+
+    return zeros, sign_changes, minima
+
+
+def roots_scan(function: sp.Expr, variable: sp.Symbol, initial: float, final: float, samples: int = 1000, false_rule: bool = True, tolerance: float = 0.5, iterations: int = 100, absolute_error: bool = True, zero_tolerance: float = 1e-10) -> Tuple[List[str], List[Tuple[List[int], List[str], List[str], List[str], str]], str]:
+    """
+    Find all the roots of a function in the interval [initial, final]. The function is sampled over a grid to find the subintervals with a
+    sign change and the local minima of |f| which are close to zero. Every subinterval with a sign change is refined with the bisection or
+    the safeguarded false rule method, and every local minimum is refined as a root of the derivative. All the brackets are refined
+    together as float64 arrays, sharing one compilation of the function.
+
+    Args:
+        function: The function for which to find the roots.
+        variable: The independent variable of the function.
+        initial: Left bound of the interval.
+        final: Right bound of the interval.
+        samples: Number of subintervals of the grid (default 1000).
+        false_rule: If True, refine the brackets with the safeguarded false rule method, otherwise with the bisection method (default True).
+        tolerance: Tolerance for the roots (default 0.5).
+        iterations: Maximum number of iterations to perform for every bracket (default 100).
+        absolute_error: If True, the error is calculated as the absolute value of the difference between the current and previous values. If False, the error is calculated as the absolute value of the difference between the current and previous values divided by the current value (default True).
+        zero_tolerance: Maximum absolute value of the function at a refined local minimum to consider it a root (default 1e-10).
+    Returns:
+        List with the roots sorted in ascending order, list with the table of iterations, values of x, values of f(x), errors and message of every root, and a message indicating the result.
+    """
+    if initial >= final:
+        raise_exception(ValueError("El valor inicial del intervalo debe ser menor que el valor final"), logger)
+    if samples < 2:
+        raise_exception(ValueError("El número de muestras debe ser mayor o igual a 2"), logger)
+
+    # Compile the function once and sample it over the grid
+    evaluate_function = compile_vectorized_expression(function, variable)
+    grid = np.linspace(initial, final, samples + 1)
+    values = evaluate_function(grid)
+    zeros, sign_changes, minima = find_brackets(values)
+
+    # Every root found is stored with its value, its trace and its status
+    roots = [(grid[index], ([0], [str(grid[index])], [str(values[index])], ["0"]), ROOT) for index in zeros]
+
+    # Refine all the subintervals with a sign change together
+    if sign_changes.size > 0:
+        traces = []
+        counter, x, f_x, error, status = bracketing_multi_start(evaluate_function, grid[sign_changes].copy(), grid[sign_changes + 1].copy(), false_rule, tolerance, iterations, absolute_error, traces)
+        status[status == RUNNING] = NOT_CONVERGED
+
+        # A sign change across a discontinuity makes |f| grow while the bracket shrinks, so those brackets are discarded
+        bound = np.maximum(np.abs(values[sign_changes]), np.abs(values[sign_changes + 1]))
+        valid = np.isin(status, (ROOT, APPROXIMATION, NOT_CONVERGED)) & (np.abs(f_x) <= bound)
+        roots.extend((x[lane], traces[lane], status[lane]) for lane in np.flatnonzero(valid))
+
+    # Refine the local minima as roots of the derivative and keep the ones where the function is close to zero
+    if minima.size > 0:
+        evaluate_derivative = compile_vectorized_expression(differentiate(function, variable), variable)
+        traces = []
+        counter, x, derivative_x, error, status = bracketing_multi_start(evaluate_derivative, grid[minima - 1].copy(), grid[minima + 1].copy(), false_rule, tolerance, iterations, absolute_error, traces)
+        status[status == RUNNING] = NOT_CONVERGED
+        f_x = evaluate_function(x)
+
+        valid = np.isin(status, (ROOT, APPROXIMATION, NOT_CONVERGED)) & (np.abs(f_x) <= zero_tolerance)
+        for lane in np.flatnonzero(valid):
+            # The trace stores the values of the derivative, so they are replaced by the values of the function
+            lane_iterations, lane_x, _, lane_error = traces[lane]
+            lane_f_x = [str(value) for value in evaluate_function(np.array(lane_x, dtype=float)).tolist()]
+            lane_status = ROOT if f_x[lane] == 0 else APPROXIMATION if status[lane] == ROOT else status[lane]
+            roots.append((x[lane], (lane_iterations, lane_x, lane_f_x, lane_error), lane_status))
+
+    # Sort the roots and build the message of every root
+    roots.sort(key=lambda root: root[0])
+    messages = build_messages([float(root[0]) for root in roots], [root[2] for root in roots], tolerance, iterations)
+    tables = [(*trace, message) for (_, trace, _), message in zip(roots, messages)]
+
+    if roots:
+        message = "Se encontraron " + str(len(roots)) + " raíces en el intervalo [" + str(initial) + ", " + str(final) + "]."
+    else:
+        message = "No se encontraron raíces en el intervalo [" + str(initial) + ", " + str(final) + "]."
+
+    return [str(float(root[0])) for root in roots], tables, message
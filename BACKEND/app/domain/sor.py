@@ -1,13 +1,18 @@
-from app.utils.utils import raise_exception, calculate_spectral_radius, is_strictly_diagonally_dominant
+from app.utils.utils import raise_exception, calculate_spectral_radius, is_strictly_diagonally_dominant, select_engine
+from app.utils.tables import IterationTable
+from app.utils.stationary import iterate
 from app.routes.routes import logger
+import numpy as np
 from typing import List, Tuple
 import sympy as sp
 from sympy import oo as sp_inf
 
 
 class Sor:
-    def __init__(self, A: sp.Matrix, b: sp.Matrix, x_initial:sp.Matrix, n: int = None, precision: int = 16):
+    def __init__(self, A: sp.Matrix, b: sp.Matrix, x_initial:sp.Matrix, n: int = None, precision: int = 16, engine: str = None):
         self.precision = precision
+        # Numbers of the matrix method, float64 or the given precision
+        self.engine = select_engine(precision, engine, logger)
         self.A = A
         self.b = b    
         self.x_initial = x_initial
@@ -69,6 +74,11 @@ class Sor:
         if A is None:
             A = self.A
 
+        # The T matrix of the float64 engine is computed with NumPy
+        if self.engine == "float64":
+            T, _ = self.iteration_matrices_float64(w, A, self.b)
+            return calculate_spectral_radius(T, self.precision)
+
         # Calculate the T matrix
         D = sp.diag(*A.diagonal())  # Diagonal matrix from A
         L = - (A.lower_triangular() - D)  # Strict lower triangular (excluding diagonal)
@@ -115,7 +125,7 @@ class Sor:
         """
         return sp.Matrix([[A[i, j] / B[i, j] for j in range(A.shape[1])] for i in range(A.shape[0])])
 
-    def iterative_solve(self, w: float, tol: float, max_iter: int = 100, A: sp.Matrix = None, b: sp.Matrix = None, x_initial: sp.Matrix = None, absolute_error: bool = True, order: int = 0) -> Tuple[List[int], List[List[str]], List[str], str]:
+    def iterative_solve(self, w: float, tol: float, max_iter: int = 100, A: sp.Matrix = None, b: sp.Matrix = None, x_initial: sp.Matrix = None, absolute_error: bool = True, order: int = 0, table: IterationTable = None) -> Tuple[List[int], List[List[str]], List[str], str]:
         """
         This function solves a system of linear equations using the iterative Jacobi method.
 
@@ -127,6 +137,7 @@ class Sor:
         :param max_iter: maximum number of iterations
         :param absolute_error: boolean to determine if the absolute or relative error is calculated
         :param order: Order of the vectorial norm, 0 for infinite
+        :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
         :return: List with the number of iterations, the solutions for each iteration, the absolute or relative error for each iteration and a message with the result
         """
         if A is None:
@@ -141,10 +152,9 @@ class Sor:
         elif order < 0:
             raise_exception(ValueError("El orden de la norma no es válido, este debe ser 0 o entero positivo"), logger)
 
-        # Initialize the lists to store the function values and errors
-        values_list = None
-        error_values_list = []
-        counter_values_list = []
+        # Initialize the table to store the iterations, solutions and errors
+        if table is None:
+            table = IterationTable()
         counter = 0
         error = tol + 1
 
@@ -152,14 +162,12 @@ class Sor:
         x_current = x_initial.copy()
 
         # Fill the table with the initial values
-        counter_values_list.append(counter)
-    
         if x_current.shape[0] == 1:
-            values_list = [[str(x_current[0, i])] for i in range(x_current.shape[1])]
+            splitted = [x_current[0, i] for i in range(x_current.shape[1])]
         elif x_current.shape[1] == 1:
-            values_list = [[str(x_current[i, 0])] for i in range(x_current.shape[0])]
+            splitted = [x_current[i, 0] for i in range(x_current.shape[0])]
 
-        error_values_list.append("-")
+        table.append(counter, splitted, "-")
 
         # Iterate while the error is greater than the tolerance and the number of iterations is less than the maximum
         while error > tol and counter < max_iter:
@@ -218,17 +226,14 @@ class Sor:
             # Update the current x vector
             x_current = x_new
 
-            # Append the values to the lists
+            # Append the values to the table
             counter += 1
-            counter_values_list.append(counter)
             if x_current.shape[0] == 1:
                 splitted = [x_current[0, i] for i in range(x_current.shape[1])]
             elif x_current.shape[1] == 1:
                 splitted = [x_current[i, 0] for i in range(x_current.shape[0])]
 
-            [values_list[i].append(str(splitted[i])) for i in range(len(values_list))]
-
-            error_values_list.append(str(error))
+            table.append(counter, splitted, error)
 
         # Store the values of the solution and the errors
         self.x = x_current
@@ -238,11 +243,60 @@ class Sor:
         if error > tol:
             message = "El método no converge en {} iteraciones".format(max_iter)
         else:
-            message = f"{[str(splitted[i]) for i in range(len(values_list))]} es una aproximación de la solución del sistema con una tolerancia de {tol}"
+            message = f"{[str(value) for value in splitted]} es una aproximación de la solución del sistema con una tolerancia de {tol}"
 
-        return counter_values_list, values_list, error_values_list, message
+        iterations, x, errors = table.columns(3)
+        return iterations, [list(values) for values in zip(*x)], errors, message
     
-    def matrix_solve(self, w: float, tol: float, max_iter: int = 100, A: sp.Matrix = None, b: sp.Matrix = None, x_initial: sp.Matrix = None, absolute_error: bool = True, order: int = 0) -> Tuple[List[int], List[List[str]], List[str], str]:
+    def iteration_matrices_float64(self, w: float, A: sp.Matrix, b: sp.Matrix) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        This function calculates the T matrix and the C vector of the SOR method with float64 numbers.
+
+        :param w: relaxation factor
+        :param A: matrix with the coefficients of the system of equations
+        :param b: vector with the solutions of the system of equations
+        :return: the T matrix and the C vector
+        """
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float).ravel()
+        diagonal = np.diag(A)
+
+        # The D matrix, and so the D - L matrix, is invertible only without zeros in the diagonal
+        if np.any(diagonal == 0):
+            raise sp.matrices.exceptions.NonInvertibleMatrixError("La matriz D no es invertible")
+
+        # T = (D - wL)^-1 ((1 - w) D + wU) and C = w (D - wL)^-1 b
+        lower = np.diag(diagonal) + w * np.tril(A, -1)
+        T = np.linalg.solve(lower, (1 - w) * np.diag(diagonal) - w * np.triu(A, 1))
+        C = w * np.linalg.solve(lower, b)
+
+        return T, C
+
+    def matrix_solve_float64(self, w: float, tol: float, max_iter: int, A: sp.Matrix, b: sp.Matrix, x_initial: sp.Matrix, absolute_error: bool, order: int, table: IterationTable) -> Tuple[List[int], List[List[str]], List[str], str]:
+        """
+        This function solves a system of linear equations using the matrix SOR method with float64 numbers. The T matrix and the C
+        vector are computed once, so every iteration is one matrix-vector product and a vectorized norm.
+
+        :param A: matrix with the coefficients of the system of equations
+        :param b: vector with the solutions of the system of equations
+        :param x_initial: vector with the initial guess for the solution
+        :param w: relaxation factor
+        :param tol: tolerance for the solution
+        :param max_iter: maximum number of iterations
+        :param absolute_error: boolean to determine if the absolute or relative error is calculated
+        :param order: Order of the vectorial norm, 0 for infinite
+        :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
+        :return: List with the number of iterations, the solutions for each iteration, the absolute or relative error for each iteration and a message with the result
+        """
+        T, C = self.iteration_matrices_float64(w, A, b)
+
+        # Store the values of the solution and the errors
+        self.x, self.scalar_error, result = iterate(lambda x: T @ x + C, x_initial, tol, max_iter, absolute_error, order, table)
+        self.vectorial_error = self.scalar_error
+
+        return result
+
+    def matrix_solve(self, w: float, tol: float, max_iter: int = 100, A: sp.Matrix = None, b: sp.Matrix = None, x_initial: sp.Matrix = None, absolute_error: bool = True, order: int = 0, table: IterationTable = None) -> Tuple[List[int], List[List[str]], List[str], str]:
         """
         This function solves a system of linear equations using the matrix Jacobi method.
 
@@ -254,6 +308,7 @@ class Sor:
         :param max_iter: maximum number of iterations
         :param absolute_error: boolean to determine if the absolute or relative error is calculated
         :param order: Order of the vectorial norm, 0 for infinite
+        :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
         :return: List with the number of iterations, the solutions for each iteration, the absolute or relative error for each iteration and a message with the result
         """
         if A is None:
@@ -263,15 +318,18 @@ class Sor:
         if x_initial is None:
             x_initial = sp.Matrix(self.x_initial)
 
+        if order < 0:
+            raise_exception(ValueError("El orden de la norma no es válido, este debe ser 0 o entero positivo"), logger)
+
+        if self.engine == "float64":
+            return self.matrix_solve_float64(w, tol, max_iter, A, b, x_initial, absolute_error, order, table)
+
         if order == 0:
             order = sp_inf
-        elif order < 0:
-            raise_exception(ValueError("El orden de la norma no es válido, este debe ser 0 o entero positivo"), logger)
 
-        # Initialize the lists to store the function values and errors
-        values_list = None
-        error_values_list = []
-        counter_values_list = []
+        # Initialize the table to store the iterations, solutions and errors
+        if table is None:
+            table = IterationTable()
         counter = 0
         error = tol + 1
 
@@ -279,20 +337,27 @@ class Sor:
         x_current = x_initial
 
         # Fill the table with the initial values
-        counter_values_list.append(counter)
-    
         if x_current.shape[0] == 1:
-            values_list = [[str(x_current[0, i])] for i in range(x_current.shape[1])]
+            splitted = [x_current[0, i] for i in range(x_current.shape[1])]
         elif x_current.shape[1] == 1:
-            values_list = [[str(x_current[i, 0])] for i in range(x_current.shape[0])]
+            splitted = [x_current[i, 0] for i in range(x_current.shape[0])]
 
-        error_values_list.append("-")
+        table.append(counter, splitted, "-")
 
         # Initialize the D, L and U matrices
         D = sp.diag(*A.diagonal())  # Diagonal matrix from A
         L = - (A.lower_triangular() - D)  # Strict lower triangular (excluding diagonal)
         U = - (A.upper_triangular() - D) # Strict upper triangular (excluding diagonal)
 
+        if b.shape[0] == 1:
+            b_element = b.T
+        elif b.shape[1] == 1:
+            b_element = b
+
+        # Calculate the T and C matrices once, they don't change between the iterations
+        T = ((D - w * L).inv() * ((1 - w) * D + w * U))
+        C = (w * (D - w * L).inv() * b_element)
+
         # Iterate while the error is greater than the tolerance and the number of iterations is less than the maximum
         while error > tol and counter < max_iter:
             if x_current.shape[0] == 1:
@@ -300,15 +365,6 @@ class Sor:
             elif x_current.shape[1] == 1:
                 x_element = x_current
 
-            if b.shape[0] == 1:
-                b_element = b.T
-            elif b.shape[1] == 1:
-                b_element = b
-
-            # Calculate the T and C matrices
-            T = ((D - w * L).inv() * ((1 - w) * D + w * U))
-            C = (w * (D - w * L).inv() * b_element)
-
             # Calculate the new x vector
             x_new = ((T * x_element) + C).evalf(self.precision)
 
@@ -326,17 +382,14 @@ class Sor:
             # Update the current x vector
             x_current = x_new
 
-            # Append the values to the lists
+            # Append the values to the table
             counter += 1
-            counter_values_list.append(counter)
             if x_current.shape[0] == 1:
                 splitted = [x_current[0, i] for i in range(x_current.shape[1])]
             elif x_current.shape[1] == 1:
                 splitted = [x_current[i, 0] for i in range(x_current.shape[0])]
 
-            [values_list[i].append(str(splitted[i])) for i in range(len(values_list))]
-            
-            error_values_list.append(str(error))
+            table.append(counter, splitted, error)
 
 
         # Store the values of the solution and the errors
@@ -347,6 +400,7 @@ class Sor:
         if error > tol:
             message = "El método no converge en {} iteraciones".format(max_iter)
         else:
-            message = f"{[str(splitted[i]) for i in range(len(values_list))]} es una aproximación de la solución del sistema con una tolerancia de {tol}"
+            message = f"{[str(value) for value in splitted]} es una aproximación de la solución del sistema con una tolerancia de {tol}"
 
-        return counter_values_list, values_list, error_values_list, message
\ No newline at end of file
+        iterations, x, errors = table.columns(3)
+        return iterations, [list(values) for values in zip(*x)], errors, message
\ No newline at end of file
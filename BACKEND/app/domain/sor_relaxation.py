@@ -0,0 +1,142 @@
+from app.utils.utils import raise_exception
+from app.utils.sparse import CSRMatrix
+from app.utils.spectral import dominant_eigenpair
+from app.domain.sparse_stationary import SparseStationary
+from app.routes.routes import logger
+import math
+import numpy as np
+from typing import List, Optional, Sequence, Union
+
+
+class SorRelaxation:
+    """
+    Search of the relaxation factor of the SOR method with the smallest spectral radius of its T matrix, which is the one that makes the
+    method converge in the fewest iterations. The spectral radii are computed with float64 numbers, with the dense eigenvalue solver or the
+    Arnoldi iteration for dense matrices and with the Arnoldi iteration over the sparse sweeps for sparse matrices.
+    """
+    def __init__(self, A: Union[np.ndarray, CSRMatrix]):
+        self.sparse = isinstance(A, CSRMatrix)
+        self.A = A if self.sparse else np.array(A, dtype=float)
+
+        if not self.sparse and self.A.ndim != 2:
+            raise_exception(ValueError("La matriz A debe ser una matriz de dos dimensiones"), logger)
+        if self.A.shape[0] != self.A.shape[1]:
+            raise_exception(ValueError("La matriz A no es cuadrada"), logger)
+        self.n = self.A.shape[0]
+
+        self.diagonal = self.A.diagonal() if self.sparse else np.diag(self.A)
+        if np.any(self.diagonal == 0):
+            raise_exception(ValueError("La diagonal de la matriz A no puede contener ceros"), logger)
+
+        # The sparse matrices use the sweeps of the sparse methods with a zero vector b, which are products by the T matrix
+        self.sparse_object = SparseStationary(self.A, np.zeros(self.n), np.zeros(self.n)) if self.sparse else None
+
+        # Spectral radius of the T matrix of the Jacobi method when the theorem of Young can be applied, None otherwise
+        self.jacobi_spectral_radius = self.young_jacobi_spectral_radius()
+
+    def is_consistently_ordered(self) -> bool:
+        """
+        This function checks if the matrix is tridiagonal and the products of its symmetric off-diagonal values aren't negative. Such a
+        matrix is consistently ordered and the T matrix of its Jacobi method has real eigenvalues, which are the conditions of the theorem
+        of Young.
+
+        :return: True if the theorem of Young can be applied to the matrix
+        """
+        if self.sparse:
+            if np.any(np.abs(self.A.rows - self.A.indices) > 1):
+                return False
+            # Values above and below the diagonal, indexed by the smaller of their row and column
+            above = self.A.indices == self.A.rows + 1
+            below = self.A.indices == self.A.rows - 1
+            upper = np.bincount(self.A.rows[above], weights=self.A.data[above], minlength=self.n)[:-1]
+            lower = np.bincount(self.A.indices[below], weights=self.A.data[below], minlength=self.n)[:-1]
+        else:
+            if np.any(np.triu(self.A, 2) != 0) or np.any(np.tril(self.A, -2) != 0):
+                return False
+            upper = np.diag(self.A, 1)
+            lower = np.diag(self.A, -1)
+
+        return bool(np.all(upper * lower >= 0))
+
+    def young_jacobi_spectral_radius(self) -> Optional[float]:
+        """
+        This function calculates the spectral radius of the T matrix of the Jacobi method for the consistently ordered matrices whose
+        Jacobi method converges, which determines the spectral radius of the SOR method for every relaxation factor.
+
+        :return: the spectral radius of the Jacobi method, or None if the theorem of Young can't be applied
+        """
+        if not self.is_consistently_ordered():
+            return None
+
+        if self.sparse:
+            jacobi_spectral_radius = self.sparse_object.spectral_radius("jacobi")
+        else:
+            eigenvalue, _ = dominant_eigenpair(-(self.A - np.diag(self.diagonal)) / self.diagonal[:, np.newaxis])
+            jacobi_spectral_radius = abs(eigenvalue)
+
+        return jacobi_spectral_radius if jacobi_spectral_radius < 1 else None
+
+    def optimal_omega(self) -> Optional[float]:
+        """
+        This function calculates the optimal relaxation factor with the theorem of Young, w = 2 / (1 + sqrt(1 - p^2)) with p the spectral
+        radius of the T matrix of the Jacobi method. The spectral radius of the SOR method with this factor is w - 1.
+
+        :return: the optimal relaxation factor, or None if the theorem can't be applied
+        """
+        if self.jacobi_spectral_radius is None:
+            return None
+
+        return 2 / (1 + math.sqrt(1 - self.jacobi_spectral_radius ** 2))
+
+    def spectral_radius(self, w: float) -> float:
+        """
+        This function calculates the spectral radius of the T matrix of the SOR method, T = (D - wL)^-1 ((1 - w) D + wU). With the
+        theorem of Young it is w - 1 from the optimal relaxation factor on, and ((w p + sqrt(w^2 p^2 - 4 (w - 1))) / 2)^2 before it, with
+        p the spectral radius of the Jacobi method, otherwise it is computed numerically.
+
+        :param w: relaxation factor
+        :return: the spectral radius of the T matrix
+        """
+        if self.jacobi_spectral_radius is not None:
+            if w >= self.optimal_omega():
+                return w - 1
+            p = self.jacobi_spectral_radius
+            return ((w * p + math.sqrt(max(w ** 2 * p ** 2 - 4 * (w - 1), 0))) / 2) ** 2
+
+        if self.sparse:
+            return self.sparse_object.spectral_radius("sor", w)
+
+        lower = np.diag(self.diagonal) + w * np.tril(self.A, -1)
+        T = np.linalg.solve(lower, (1 - w) * np.diag(self.diagonal) - w * np.triu(self.A, 1))
+        eigenvalue, _ = dominant_eigenpair(T)
+
+        return abs(eigenvalue)
+
+    def spectral_radii(self, omegas: Sequence[float]) -> List[float]:
+        """
+        This function calculates the spectral radius of the T matrix of the SOR method for every relaxation factor.
+
+        :param omegas: relaxation factors, between 0 and 2
+        :return: list with the spectral radius of every relaxation factor
+        """
+        if any(not 0 < w < 2 for w in omegas):
+            raise_exception(ValueError("Los factores de relajación deben ser mayores a 0 y menores a 2"), logger)
+
+        return [float(self.spectral_radius(w)) for w in omegas]
+
+
+def expected_iterations(spectral_radius: float, tol: float) -> Optional[int]:
+    """
+    Estimate the number of iterations of a stationary method to reduce the error by the tolerance, which is log(tol) / log(p) for a
+    spectral radius p of its T matrix.
+
+    :param spectral_radius: spectral radius of the T matrix
+    :param tol: factor to reduce the error
+    :return: the number of iterations, or None if the method doesn't converge
+    """
+    if spectral_radius >= 1:
+        return None
+    if spectral_radius == 0 or tol >= 1:
+        return 1
+
+    return max(1, math.ceil(math.log(tol) / math.log(spectral_radius)))
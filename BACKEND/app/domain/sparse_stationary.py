@@ -0,0 +1,245 @@
+from app.utils.utils import raise_exception
+from app.utils.tables import IterationTable
+from app.utils.sparse import CSRMatrix, greedy_coloring
+from app.utils.stationary import iterate
+from app.utils.spectral import operator_spectral_radius
+from app.utils.parallel import RowBlockProduct, PARALLEL_MIN_SIZE
+from app.config.env import JACOBI_THREADS
+from app.routes.routes import logger
+import numpy as np
+from typing import Callable, List, Tuple
+
+# Messages of the methods when the matrix A has a zero in the diagonal
+ZERO_DIAGONAL_MESSAGES = {
+    "jacobi": "La matriz A tiene un 0 en la diagonal, por lo que no se puede dividir por este valor. Asegúrese que la matriz A sea no singular (det(A) != 0) y este condicionada para el método de Jacobi",
+    "gauss_seidel": "La matriz A tiene un 0 en la diagonal, por lo que no se puede dividir por este valor. Asegúrese que la matriz A sea no singular (det(A) != 0) y este condicionada para el método de Gauss-Seidel",
+    "sor": "La diagonal de la matriz A no puede contener ceros",
+}
+
+
+class SparseStationary:
+    """
+    Jacobi, Gauss Seidel and SOR methods for systems with a sparse matrix in compressed sparse row format, with float64 numbers. Every
+    iteration takes O(nnz) operations and only the nonzero values of A are stored. The Jacobi iterations of big systems split the rows
+    in blocks computed by threads.
+
+    The Gauss Seidel and SOR methods can also use a multicolor ordering, where the rows are colored so no two rows of the same color are
+    adjacent and every color is updated at once with one vectorized product, which uses the values of the previous colors of the same
+    iteration. The red-black ordering of the 5-point and 7-point stencils takes two products per iteration.
+    """
+    def __init__(self, A: CSRMatrix, b: np.array, x_initial: np.array, n: int = None, threads: int = None):
+        self.A = A
+        self.b = np.asarray(b, dtype=float).ravel()
+        self.x_initial = np.asarray(x_initial, dtype=float).ravel()
+
+        self.validate_input(A, self.b, n, self.x_initial)
+        self.n = A.shape[0]
+        self.diagonal = A.diagonal()
+
+        # Threads of the Jacobi iterations, by default the configured ones for big systems and one for the small ones
+        if threads is None:
+            threads = JACOBI_THREADS if self.n >= PARALLEL_MIN_SIZE else 1
+        self.threads = threads
+        # Products computed by threads, which are stopped after solving the system
+        self.products = []
+
+        # Values of A, b and the diagonal as Python lists for the sequential sweeps
+        self.data_lists = None
+        self.b_list = None
+        self.diagonal_list = None
+
+        self.x = None
+        self.scalar_error = None
+
+    def validate_input(self, A: CSRMatrix, b: np.array, n: int, x_initial: np.array):
+        """
+        This function validates the input for the sparse methods.
+
+        :param A: sparse matrix with the coefficients of the system of equations
+        :param b: vector with the solutions of the system of equations
+        :param n: length of the system of equations
+        :param x_initial: vector with the initial guess for the solution
+        """
+        # Check if the matrix A is square
+        if A.shape[0] != A.shape[1]:
+            raise_exception(ValueError("La matriz A no es cuadrada"), logger)
+
+        # Check if the vectors are correct
+        if b.size != A.shape[0]:
+            raise_exception(ValueError("La longitud del vector b no es igual al número de filas de la matriz A"), logger)
+        if x_initial.size != A.shape[0]:
+            raise_exception(ValueError("La longitud del vector x inicial no es igual al número de filas de la matriz A"), logger)
+
+        # Check if the length of n is equal to the number of rows in the matrix A
+        if n is not None and n != A.shape[0]:
+            raise_exception(ValueError("La longitud de n no es igual al número de filas y columnas de la matriz A"), logger)
+
+    def gauss_seidel_sweep(self, x: np.array, w: float = 1, b: List[float] = None) -> np.array:
+        """
+        This function performs one iteration of the SOR method, which is the Gauss Seidel method when w is 1. The unknowns are updated in
+        order, so every row uses the values of the previous rows of the same iteration and only reads the nonzero values of its row.
+
+        :param x: current approximation of the solution
+        :param w: relaxation factor
+        :param b: vector with the solutions of the system as a list, by default the one of the system
+        :return: new approximation of the solution
+        """
+        data, indices, indptr = self.data_lists
+        b = self.b_list if b is None else b
+        x_new = x.tolist()
+
+        for i in range(self.n):
+            # Sum of the products of the values of the row outside of the diagonal and the current solution
+            sum_row = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if j != i:
+                    sum_row += data[k] * x_new[j]
+
+            x_new[i] = w * (b[i] - sum_row) / self.diagonal_list[i] + (1 - w) * x_new[i]
+
+        return np.array(x_new)
+
+    def multicolor_sweep(self, w: float = 1, homogeneous: bool = False) -> Callable[[np.array], np.array]:
+        """
+        This function builds the function which performs one iteration of the SOR method with the multicolor ordering. The rows of every
+        color aren't adjacent, so they are updated together with an affine map of the current solution, x[R] = T_R x + C_R, where T_R
+        has the values -w A[i, j] / A[i, i] outside of the diagonal and 1 - w in it, and C_R = w b[R] / A[R, R].
+
+        :param w: relaxation factor
+        :param homogeneous: whether to use a zero vector b, so the function is the product by the T matrix
+        :return: the function which computes the next approximation of the solution from the current one
+        """
+        colors = greedy_coloring(self.A)
+        row_colors = colors[self.A.rows]
+        off_diagonal = self.A.rows != self.A.indices
+
+        updates = []
+        for color in range(colors.max() + 1):
+            rows = np.flatnonzero(colors == color)
+            selected = off_diagonal & (row_colors == color)
+            local_rows = np.searchsorted(rows, self.A.rows[selected])
+            local_columns = self.A.indices[selected]
+            values = -w * self.A.data[selected] / self.diagonal[self.A.rows[selected]]
+            # The diagonal values keep 1 - w of the current solution
+            if w != 1:
+                local_rows = np.concatenate((local_rows, np.arange(rows.size)))
+                local_columns = np.concatenate((local_columns, rows))
+                values = np.concatenate((values, np.full(rows.size, 1 - w)))
+            T = CSRMatrix.from_coo(local_rows, local_columns, values, (rows.size, self.n))
+
+            if homogeneous:
+                updates.append((rows, T.dot))
+            elif self.threads > 1:
+                self.products.append(RowBlockProduct(T, w * self.b[rows] / self.diagonal[rows], self.threads))
+                updates.append((rows, self.products[-1]))
+            else:
+                C = w * self.b[rows] / self.diagonal[rows]
+                updates.append((rows, lambda x, T=T, C=C: T.dot(x) + C))
+
+        def sweep(x: np.array) -> np.array:
+            x_new = x.copy()
+            for rows, update in updates:
+                x_new[rows] = update(x_new)
+            return x_new
+
+        return sweep
+
+    def iteration(self, method: str, w: float = 1, homogeneous: bool = False, ordering: str = "natural") -> Callable[[np.array], np.array]:
+        """
+        This function builds the function which performs one iteration of the Jacobi, Gauss Seidel or SOR method, x_new = T x + C.
+
+        :param method: name of the method, jacobi, gauss_seidel or sor
+        :param w: relaxation factor of the SOR method
+        :param homogeneous: whether to use a zero vector b, so the function is the product by the T matrix
+        :param ordering: order of the updates of the Gauss Seidel and SOR methods, natural or multicolor
+        :return: the function which computes the next approximation of the solution from the current one
+        """
+        if method not in ZERO_DIAGONAL_MESSAGES:
+            raise_exception(ValueError("El método no es válido, este debe ser jacobi, gauss_seidel o sor"), logger)
+        if ordering not in ("natural", "multicolor"):
+            raise_exception(ValueError("El orden no es válido, este debe ser natural o multicolor"), logger)
+        if np.any(self.diagonal == 0):
+            raise_exception(ValueError(ZERO_DIAGONAL_MESSAGES[method]), logger)
+
+        if method == "jacobi":
+            # Iteration matrix T = D^-1 (L + U) without the diagonal and vector C = D^-1 b, so every iteration is x = T x + C
+            off_diagonal = self.A.rows != self.A.indices
+            T = CSRMatrix.from_coo(self.A.rows[off_diagonal], self.A.indices[off_diagonal], -self.A.data[off_diagonal] / self.diagonal[self.A.rows[off_diagonal]], self.A.shape)
+            if homogeneous:
+                return T.dot
+            C = self.b / self.diagonal
+            if self.threads > 1:
+                self.products.append(RowBlockProduct(T, C, self.threads))
+                return self.products[-1]
+            return lambda x: T.dot(x) + C
+
+        w = w if method == "sor" else 1
+        if ordering == "multicolor":
+            return self.multicolor_sweep(w, homogeneous)
+
+        # The sequential sweeps read Python lists, which are faster than indexing NumPy arrays one value at a time
+        self.data_lists = (self.A.data.tolist(), self.A.indices.tolist(), self.A.indptr.tolist())
+        self.b_list = self.b.tolist()
+        self.diagonal_list = self.diagonal.tolist()
+        b = [0.0] * self.n if homogeneous else None
+
+        return lambda x: self.gauss_seidel_sweep(x, w, b)
+
+    def spectral_radius(self, method: str, w: float = 1, ordering: str = "natural") -> float:
+        """
+        This function calculates the spectral radius of the T matrix of the method from its products by vectors, so T is only formed for
+        small systems and big ones use the Arnoldi iteration.
+
+        :param method: name of the method, jacobi, gauss_seidel or sor
+        :param w: relaxation factor of the SOR method
+        :param ordering: order of the updates of the Gauss Seidel and SOR methods, natural or multicolor
+        :return: the spectral radius of the T matrix
+        """
+        return operator_spectral_radius(self.iteration(method, w, homogeneous=True, ordering=ordering), self.n)
+
+    def converges(self, spectral_radius: float) -> str:
+        """
+        This function checks if the method converges using the spectral radius of its T matrix.
+
+        :param spectral_radius: spectral radius of the T matrix of the method
+        :return: String with the result of the convergence
+        """
+        # Sum of the absolute values of every row without the diagonal element
+        row_sum = np.bincount(self.A.rows, weights=np.abs(self.A.data), minlength=self.n) - np.abs(self.diagonal)
+        diagonally_dominant_condition = np.all(np.abs(self.diagonal) > row_sum)
+
+        if spectral_radius < 1 or diagonally_dominant_condition:
+            return "El método converge, el radio espectral de T es menor a 1 y/o la matriz es estrictamente diagonal dominante"
+        else:
+            return "El método no converge, el radio espectral de T es mayor o igual a 1 y la matriz no es estrictamente diagonal dominante"
+
+    def solve(self, method: str, tol: float, max_iter: int = 100, w: float = 1, absolute_error: bool = True, order: int = 0, table: IterationTable = None, ordering: str = "natural") -> Tuple[List[int], List[List[str]], List[str], str]:
+        """
+        This function solves the system of linear equations with the Jacobi, Gauss Seidel or SOR method.
+
+        :param method: name of the method, jacobi, gauss_seidel or sor
+        :param tol: tolerance for the solution
+        :param max_iter: maximum number of iterations
+        :param w: relaxation factor of the SOR method
+        :param absolute_error: boolean to determine if the absolute or relative error is calculated
+        :param order: Order of the vectorial norm, 0 for infinite
+        :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
+        :param ordering: order of the updates of the Gauss Seidel and SOR methods, natural or multicolor
+        :return: List with the number of iterations, the solutions for each iteration, the absolute or relative error for each iteration and a message with the result
+        """
+        if order < 0:
+            raise_exception(ValueError("El orden de la norma no es válido, este debe ser 0 o entero positivo"), logger)
+
+        try:
+            sweep = self.iteration(method, w, ordering=ordering)
+
+            # Store the values of the solution and the errors
+            self.x, self.scalar_error, result = iterate(sweep, self.x_initial, tol, max_iter, absolute_error, order, table)
+        finally:
+            # Stop the threads of the parallel products
+            for product in self.products:
+                product.close()
+            self.products = []
+
+        return result
@@ -1,4 +1,4 @@
-from typing import Optional, Literal, List
+from typing import Optional, Literal, List, Union
 from pydantic import BaseModel, Field
 
 
@@ -46,6 +46,44 @@ class UserLoginResponse(BaseModel):
     token_type: str = Field(description="Type of token.")
 
 
+class CacheStats(BaseModel):
+    """
+    Data model for the counters of a cache.
+
+    This model is used to report the usage of the expressions caches, so they can be monitored.
+
+    Attributes:
+        size (int): Number of values stored in the cache.
+        max_size (int): Maximum number of values stored in the cache.
+        hits (int): Number of lookups which found the value in the cache.
+        misses (int): Number of lookups which didn't find the value in the cache.
+        evictions (int): Number of values removed from the cache because it was full.
+    """
+    size: int = Field(description="Number of values stored in the cache.")
+    max_size: int = Field(description="Maximum number of values stored in the cache.")
+    hits: int = Field(description="Number of lookups which found the value in the cache.")
+    misses: int = Field(description="Number of lookups which didn't find the value in the cache.")
+    evictions: int = Field(description="Number of values removed from the cache because it was full.")
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    Data model for the cache statistics responses.
+
+    This model contains the counters of the parsed expressions, symbolic derivatives, compiled callables and LU factorizations caches.
+
+    Attributes:
+        expressions (CacheStats): Counters of the parsed expressions cache.
+        derivatives (CacheStats): Counters of the symbolic derivatives cache.
+        compiled (CacheStats): Counters of the compiled callables cache.
+        factorizations (CacheStats): Counters of the LU factorizations cache.
+    """
+    expressions: CacheStats = Field(description="Counters of the parsed expressions cache.")
+    derivatives: CacheStats = Field(description="Counters of the symbolic derivatives cache.")
+    compiled: CacheStats = Field(description="Counters of the compiled callables cache.")
+    factorizations: CacheStats = Field(description="Counters of the LU factorizations cache.")
+
+
 class NumericalMethodRequest(BaseModel):
     """
     Data model for numerical method requests.
@@ -58,12 +96,20 @@ class NumericalMethodRequest(BaseModel):
         tolerance (float): Tolerance value for the error in the method.
         max_iterations (int): Maximum number of iterations for the method.
         precision (int): Number of decimal places to round the values.
+        compiled (bool): Whether to compile the expressions into native callables instead of evaluating them symbolically.
+        stream (str): Streaming format of the response, or None to send the whole table at once.
+        trace (str): Rows of the table of iterations to return.
+        trace_size (int): Number of last rows or step between the rows to return.
     """
     expression: str = Field(..., description="Mathematical expression or function to be evaluated.")
     error_type: Literal["absolute", "relative"] = Field("absolute", description="Type of error to be used in the method.")
     tolerance: float = Field(..., description="Tolerance value for the error in the method.")
     max_iterations: int = Field(..., description="Maximum number of iterations for the method.")
     precision: int = Field(16, description="Number of decimal places to round the values.")
+    compiled: bool = Field(False, description="Whether to compile the expressions into native callables, using float64 numbers for precisions up to 15 and mpmath numbers for higher precisions.")
+    stream: Optional[Literal["ndjson", "sse"]] = Field(None, description="Streaming format of the response, ndjson for newline delimited JSON or sse for server-sent events. Every iteration is sent as soon as it is computed and the message is sent in the last event. Default is None to send the whole table at once.")
+    trace: Literal["full", "final", "last", "every"] = Field("full", description="Rows of the table of iterations to return: full for every row, final for the last row, last for the last trace_size rows or every for one of every trace_size rows and the last row. Streamed tables send every row.")
+    trace_size: int = Field(10, ge=1, description="Number of last rows to return with the last trace, or step between the rows returned with the every trace.")
 
 class NumericalMethodResponse(BaseModel):
     """
@@ -97,6 +143,17 @@ class BisectionFalseRuleModel(NumericalMethodRequest):
     initial: float = Field(..., description="Initial left bound of the interval.")
     final: float = Field(..., description="Initial right bound of the interval.")
 
+class BrentModel(BisectionFalseRuleModel):
+    """
+    Data model for the hybrid bracketing methods.
+
+    This model extends the `BisectionFalseRuleModel` model and adds the hybrid bracketing method to be used.
+
+    Attributes:
+        method (str): Brent's method or the Illinois method.
+    """
+    method: Literal["brent", "illinois"] = Field("brent", description="Hybrid bracketing method, brent for Brent's method with Chandrupatla's criterion, which takes inverse quadratic interpolation or bisection steps, or illinois for the Illinois modified false rule method.")
+
 class FixedPointModel(NumericalMethodRequest):
     """
     Data model for the Fixed Point method.
@@ -105,9 +162,22 @@ class FixedPointModel(NumericalMethodRequest):
 
     Attributes:
         initial (float): Initial guess for the root.
+        acceleration (str): Acceleration of the fixed point method, or None to use the fixed point method.
     """
     g_expression: str = Field(..., description="Function g(x) to be used in the fixed point method.")
     initial: float = Field(..., description="Initial value for the fixed point calculation.")
+    acceleration: Optional[Literal["aitken", "steffensen"]] = Field(None, description="Acceleration of the fixed point method, aitken for Aitken's extrapolation over the sequence of the fixed point method or steffensen for Steffensen's method, which converges quadratically. Default is None to use the fixed point method.")
+
+class FixedPointResponse(NumericalMethodResponse):
+    """
+    Data model for the Fixed Point method responses.
+
+    This model extends the `NumericalMethodResponse` model and adds the observed order of convergence.
+
+    Attributes:
+        Order (Optional[str]): Observed order of convergence, estimated from the last errors.
+    """
+    Order: Optional[str] = Field(None, description="Observed order of convergence, estimated from the last three errors, or None if it can't be estimated.")
 
 class NewtonRaphsonModel(NumericalMethodRequest):
     """
@@ -118,9 +188,11 @@ class NewtonRaphsonModel(NumericalMethodRequest):
     Attributes:
         initial (float): Initial guess for the root.
         derivative_expression (Optional[str])
+        automatic_differentiation (bool): Whether to compute the derivatives which are not provided by automatic differentiation.
     """
     initial: float = Field(..., description="Initial value for the Newton-Raphson calculation.")
     derivative_expression: Optional[str] = Field(None, description="Derivative expression of the function to be used in the Newton-Raphson method.")
+    automatic_differentiation: bool = Field(False, description="Whether to compute the derivatives by forward-mode automatic differentiation over the compiled function instead of symbolic differentiation, when they are not provided.")
 
 class SecantModel(NumericalMethodRequest):
     """
@@ -158,6 +230,150 @@ class SecondNewtonModified(NewtonRaphsonModel):
     second_derivative_expression: Optional[str] = Field(None, description="Second derivative expression of the function to be used in the Second Modified Newton-Raphson method.")
 
 
+class MultiStartRequest(BaseModel):
+    """
+    Data model for multi-start numerical method requests.
+
+    This model is used to solve the same expression from many initial values or intervals in one call. All of them are advanced together with float64 numbers.
+
+    Attributes:
+        expression (str): Mathematical expression to be evaluated.
+        error_type (str): Type of error to be used in the method.
+        tolerance (float): Tolerance value for the error in the method.
+        max_iterations (int): Maximum number of iterations for the method.
+    """
+    expression: str = Field(..., description="Mathematical expression or function to be evaluated.")
+    error_type: Literal["absolute", "relative"] = Field("absolute", description="Type of error to be used in the method.")
+    tolerance: float = Field(..., description="Tolerance value for the error in the method.")
+    max_iterations: int = Field(..., description="Maximum number of iterations for the method.")
+
+class MultiStartResponse(BaseModel):
+    """
+    Data model for multi-start numerical method responses.
+
+    This model is used for multi-start numerical method responses, it has one element per initial value or interval.
+
+    Attributes:
+        Iterations (List[int]): Number of iterations taken by each initial value.
+        Xn (List[str]): Final approximation of the root of each initial value.
+        Fx (List[str]): Function value at each final approximation.
+        Error (List[str]): Final error of each initial value.
+        Message (List[str]): Message with the result of each initial value.
+    """
+    Iterations: List[int] = Field(description="Number of iterations taken by each initial value.")
+    Xn: List[str] = Field(description="Final approximation of the root of each initial value.")
+    Fx: List[str] = Field(description="Function value at each final approximation.")
+    Error: List[str] = Field(description="Final error of each initial value.")
+    Message: List[str] = Field(description="Message with the result of each initial value.")
+
+
+class BisectionMultiStartModel(MultiStartRequest):
+    """
+    Data model for the multi-start Bisection method.
+
+    This model extends the `MultiStartRequest` model and adds the intervals for the Bisection method.
+
+    Attributes:
+        initials (List[float]): Left bounds of the intervals.
+        finals (List[float]): Right bounds of the intervals.
+    """
+    initials: List[float] = Field(..., description="Left bounds of the intervals.")
+    finals: List[float] = Field(..., description="Right bounds of the intervals.")
+
+class NewtonRaphsonMultiStartModel(MultiStartRequest):
+    """
+    Data model for the multi-start Newton-Raphson method.
+
+    This model extends the `MultiStartRequest` model and adds the initial values for the Newton-Raphson method.
+
+    Attributes:
+        initials (List[float]): Initial values for the root.
+        derivative_expression (Optional[str]): Derivative expression of the function.
+    """
+    initials: List[float] = Field(..., description="Initial values for the Newton-Raphson calculation.")
+    derivative_expression: Optional[str] = Field(None, description="Derivative expression of the function to be used in the Newton-Raphson method.")
+
+class SecantMultiStartModel(MultiStartRequest):
+    """
+    Data model for the multi-start Secant method.
+
+    This model extends the `MultiStartRequest` model and adds the pairs of initial values for the Secant method.
+
+    Attributes:
+        initials (List[float]): First initial values for the root.
+        second_initials (List[float]): Second initial values for the root.
+    """
+    initials: List[float] = Field(..., description="First initial values for the secant calculation.")
+    second_initials: List[float] = Field(..., description="Second initial values for the secant calculation.")
+
+
+class RootsScanModel(MultiStartRequest):
+    """
+    Data model for the roots scan.
+
+    This model extends the `MultiStartRequest` model and adds the interval and the sampling options to find all the roots in the interval.
+
+    Attributes:
+        initial (float): Left bound of the interval.
+        final (float): Right bound of the interval.
+        samples (int): Number of subintervals of the grid used to find the brackets.
+        method (str): Method used to refine the brackets.
+        zero_tolerance (float): Maximum absolute value of the function at a local minimum to consider it a root.
+    """
+    initial: float = Field(..., description="Left bound of the interval.")
+    final: float = Field(..., description="Right bound of the interval.")
+    samples: int = Field(1000, ge=2, description="Number of subintervals of the grid used to find the brackets.")
+    method: Literal["bisection", "false_rule"] = Field("false_rule", description="Method used to refine the brackets, the false rule method is safeguarded with bisection steps.")
+    zero_tolerance: float = Field(1e-10, description="Maximum absolute value of the function at a local minimum without a sign change to consider it a root.")
+
+class RootsScanResponse(BaseModel):
+    """
+    Data model for the roots scan responses.
+
+    Attributes:
+        Roots (List[str]): Roots found in the interval, in ascending order.
+        Traces (List[NumericalMethodResponse]): Table of iterations of every root.
+        Message (str): Message to be displayed to the user.
+    """
+    Roots: List[str] = Field(description="Roots found in the interval, in ascending order.")
+    Traces: List[NumericalMethodResponse] = Field(description="Table of iterations, xn, f(xn), error and message of every root.")
+    Message: str = Field(description="Message to be displayed to the user.")
+
+
+class PolynomialRootsModel(BaseModel):
+    """
+    Data model for the polynomial roots requests.
+
+    This model is used to find all the roots of a polynomial at once.
+
+    Attributes:
+        expression (str): Polynomial whose roots are found.
+        precision (int): Number of significant digits of the roots.
+        tolerance (float): Maximum relative correction of a root to stop polishing it.
+        max_iterations (int): Maximum number of iterations to polish the roots.
+    """
+    expression: str = Field(..., description="Polynomial in one variable with numeric coefficients whose roots are found.")
+    precision: int = Field(16, ge=1, description="Number of significant digits of the roots. Up to 15 digits the roots are the eigenvalues of the companion matrix computed with float64 numbers; for more digits they are polished with the Aberth-Ehrlich iteration.")
+    tolerance: Optional[float] = Field(None, gt=0, description="Maximum relative correction of a root to stop polishing it. Default is None to use 10**-precision.")
+    max_iterations: int = Field(100, ge=1, description="Maximum number of iterations to polish the roots.")
+
+
+class PolynomialRootsResponse(BaseModel):
+    """
+    Data model for the polynomial roots responses.
+
+    Attributes:
+        Roots (List[str]): All the real and complex roots, repeated by their multiplicity.
+        RealRoots (List[str]): Real roots.
+        Iterations (int): Number of iterations performed to polish the roots.
+        Message (str): Message to be displayed to the user.
+    """
+    Roots: List[str] = Field(description="All the real and complex roots, repeated by their multiplicity and sorted by their real and imaginary parts.")
+    RealRoots: List[str] = Field(description="Real roots, in ascending order.")
+    Iterations: int = Field(description="Number of iterations performed to polish the roots, 0 if they were not polished.")
+    Message: str = Field(description="Message to be displayed to the user.")
+
+
 class SpectralAndConvergenceResponse(BaseModel):
     """
     Data model for spectral radius and convergence responses.
@@ -198,9 +414,11 @@ class GaussEliminationRequest(EquationSystemsRequest):
     Attributes:
         pivot_type (Optional[int]): Type of pivot to be used in the method. Default is None and just can take the 1 and 2 values.
         n (Optional[int]): Number of equations in the system.
+        engine (Optional[str]): Numbers used in the elimination, float64 or decimal. Default is None to use float64 up to 15 digits of precision.
     """
     pivot_type: Optional[Literal[1, 2]] = Field(None, description="Type of pivot to be used in the method. Default is None and just can take the 1 and 2 values.")
     n: Optional[int] = Field(None, description="Number of equations in the system.")
+    engine: Optional[Literal["float64", "decimal"]] = Field(None, description="Numbers used in the elimination, float64 for vectorized NumPy operations or decimal for Decimal numbers with the given precision. Default is None to use float64 when the precision is 15 or less and decimal otherwise.")
 
 class EquationSystemsResponse(BaseModel):
     """
@@ -234,11 +452,21 @@ class LUFactorizationRequest(EquationSystemsRequest):
     This model extends the `EquationSystemsRequest` model and adds specific attributes for the LU Factorization method.
 
     Attributes:
+        A (Optional[List[List[float]]]): Matrix of coefficients of the system of equations, not needed if the handle of its factorization is given.
+        b (List[List[float]]): Vector of solutions of the system of equations, or matrix with one vector of solutions per row.
         pivot_type (Optional[int]): Type of pivot to be used in the method. Default is None and just can take the 1 and 2 values.
         n (Optional[int]): Number of equations in the system.
+        handle (Optional[str]): Handle of a stored factorization to reuse instead of factorizing A.
+        engine (Optional[str]): Numbers used in the factorization, float64 or decimal. Default is None to use float64 up to 15 digits of precision.
+        block_size (int): Number of columns of the panels of the blocked float64 factorization.
     """
+    A: Optional[List[List[float]]] = Field(None, description="Matrix of coefficients of the system of equations. It can be omitted if the handle of its factorization is given.")
+    b: List[List[float]] = Field(..., description="Vector of solutions of the system of equations, or matrix with one vector of solutions per row to solve the system for every one of them with the same factorization.")
     pivot_type: Optional[Literal[1]] = Field(None, description="Type of pivot to be used in the method. Default is None and just can take the 1 value.")
     n: Optional[int] = Field(None, description="Number of equations in the system.")
+    handle: Optional[str] = Field(None, description="Handle of the factorization returned by a previous request, to solve new vectors of solutions without factorizing A again. It is used only when A is not given.")
+    engine: Optional[Literal["float64", "decimal"]] = Field(None, description="Numbers used in the factorization, float64 for the blocked factorization with NumPy or decimal for Decimal numbers with the given precision. Default is None to use float64 when the precision is 15 or less and decimal otherwise.")
+    block_size: int = Field(64, ge=1, description="Number of columns of the panels of the blocked float64 factorization. Every panel is factorized column by column and the rest of the matrix is updated with one matrix product per panel.")
 
 
 class LUFactorizationResponse(EquationSystemsResponse):
@@ -252,11 +480,61 @@ class LUFactorizationResponse(EquationSystemsResponse):
         absolute_error (str): Absolute error of the system of equations solution by gauss elimination.
         L (List[List[str]]): Lower triangular matrix of the LU factorization.
         U (List[List[str]]): Upper triangular matrix of the LU factorization.
+        handle (str): Handle of the factorization, to reuse it in later requests.
     """
     vectorial_error: List[List[str]] = Field(description="List of the vectorial errors of the system of  solution by gauss elimination.")
     absolute_error: str = Field(description="Absolute error of the system of equations solution by gauss elimination.")
     L: List[List[str]] = Field(description="Lower triangular matrix of the LU factorization.")
     U: List[List[str]] = Field(description="Upper triangular matrix of the LU factorization.")
+    handle: str = Field(description="Handle of the factorization, which can be sent instead of A while the factorization is stored in the cache.")
+
+
+class CholeskyFactorizationRequest(EquationSystemsRequest):
+    """
+    Data model for the Cholesky Factorization method.
+
+    This model extends the `EquationSystemsRequest` model and adds specific attributes for the Cholesky Factorization method.
+
+    Attributes:
+        A (Optional[List[List[float]]]): Matrix of coefficients of the system of equations, not needed if the handle of its factorization is given.
+        b (List[List[float]]): Vector of solutions of the system of equations, or matrix with one vector of solutions per row.
+        method (str): Factorization of the symmetric positive definite matrices, cholesky for A = L L^T or ldlt for A = L D L^T.
+        n (Optional[int]): Number of equations in the system.
+        handle (Optional[str]): Handle of a stored factorization to reuse instead of factorizing A.
+        engine (Optional[str]): Numbers used in the factorization, float64 or decimal. Default is None to use float64 up to 15 digits of precision.
+        block_size (int): Number of columns of the panels of the blocked float64 factorization.
+    """
+    A: Optional[List[List[float]]] = Field(None, description="Matrix of coefficients of the system of equations. It can be omitted if the handle of its factorization is given.")
+    b: List[List[float]] = Field(..., description="Vector of solutions of the system of equations, or matrix with one vector of solutions per row to solve the system for every one of them with the same factorization.")
+    method: Literal["cholesky", "ldlt"] = Field("cholesky", description="Factorization used when A is symmetric positive definite, cholesky for A = L L^T or ldlt for A = L D L^T, which doesn't take square roots. Otherwise the LU factorization with partial pivot is used.")
+    n: Optional[int] = Field(None, description="Number of equations in the system.")
+    handle: Optional[str] = Field(None, description="Handle of the factorization returned by a previous request, to solve new vectors of solutions without factorizing A again. It is used only when A is not given.")
+    engine: Optional[Literal["float64", "decimal"]] = Field(None, description="Numbers used in the factorization, float64 for the blocked factorization with NumPy or decimal for Decimal numbers with the given precision. Default is None to use float64 when the precision is 15 or less and decimal otherwise.")
+    block_size: int = Field(64, ge=1, description="Number of columns of the panels of the blocked float64 factorization. Every panel is updated with one matrix product and then factorized column by column.")
+
+
+class CholeskyFactorizationResponse(EquationSystemsResponse):
+    """
+    Data model for the Cholesky Factorization method response.
+
+    This model is used for the Cholesky Factorization method response.
+
+    Attributes:
+        vectorial_error (List[List[str]]): List of the vectorial errors of the system of equations solution.
+        absolute_error (str): Absolute error of the system of equations solution.
+        method (str): Computed factorization, cholesky, ldlt or lu if A is not symmetric positive definite.
+        L (List[List[str]]): Lower triangular matrix of the factorization.
+        D (Optional[List[str]]): Diagonal of the D matrix of the LDL^T factorization.
+        U (Optional[List[List[str]]]): Upper triangular matrix of the LU factorization.
+        handle (str): Handle of the factorization, to reuse it in later requests.
+    """
+    vectorial_error: List[List[str]] = Field(description="List of the vectorial errors of the system of equations solution.")
+    absolute_error: str = Field(description="Absolute error of the system of equations solution.")
+    method: Literal["cholesky", "ldlt", "lu"] = Field(description="Computed factorization, cholesky or ldlt, or lu when A is not symmetric positive definite.")
+    L: List[List[str]] = Field(description="Lower triangular matrix of the factorization, with A = L L^T, A = L D L^T or PA = LU.")
+    D: Optional[List[str]] = Field(None, description="Diagonal of the D matrix of the LDL^T factorization.")
+    U: Optional[List[List[str]]] = Field(None, description="Upper triangular matrix of the LU factorization, only when A is not symmetric positive definite.")
+    handle: str = Field(description="Handle of the factorization, which can be sent instead of A while the factorization is stored in the cache.")
 
 
 class IterativeMatrixEquationSystemResponse(BaseModel):
@@ -276,6 +554,28 @@ class IterativeMatrixEquationSystemResponse(BaseModel):
     error: List[str] = Field(description="List of the errors at each iteration.")
     message: str = Field(description="Message to be displayed to the user.")
 
+class SparseMatrix(BaseModel):
+    """
+    Data model for sparse matrices.
+
+    This model is used to send only the nonzero values of a matrix, as triplets in coordinate format (coo) or as arrays in compressed sparse row format (csr).
+
+    Attributes:
+        format (str): Format of the matrix, coo or csr.
+        shape (List[int]): Number of rows and columns of the matrix.
+        data (List[float]): Nonzero values of the matrix.
+        indices (List[int]): Column of every value.
+        rows (Optional[List[int]]): Row of every value, for the coo format.
+        indptr (Optional[List[int]]): Position in data of the first value of every row, followed by the number of values, for the csr format.
+    """
+    format: Literal["coo", "csr"] = Field("csr", description="Format of the matrix, coo for triplets with the row, the column and the value of every nonzero value, or csr for compressed sparse rows.")
+    shape: List[int] = Field(..., min_length=2, max_length=2, description="Number of rows and columns of the matrix.")
+    data: List[float] = Field(..., description="Nonzero values of the matrix.")
+    indices: List[int] = Field(..., description="Column of every value.")
+    rows: Optional[List[int]] = Field(None, description="Row of every value, required by the coo format.")
+    indptr: Optional[List[int]] = Field(None, description="Position in data of the first value of every row, followed by the number of values, required by the csr format.")
+
+
 class IterativeMatrixEquationSystemRequest(EquationSystemsRequest):
     """
     Data model for iterative matrix equation system requests.
@@ -283,16 +583,28 @@ class IterativeMatrixEquationSystemRequest(EquationSystemsRequest):
     This model extends the `EquationSystemsRequest` model and adds specific attributes for iterative matrix equation system methods.
 
     Attributes:
+        A (Union[List[List[float]], SparseMatrix]): Dense or sparse matrix of coefficients of the system of equations.
         tol (float): Tolerance for the solution.
         max_iter (int): Maximum number of iterations.
         error_type (str): Type of error to be used in the method
         method_type (str): Type of iterative or matrix method to be used.
+        stream (str): Streaming format of the response, or None to send the whole table at once.
+        trace (str): Rows of the table of iterations to return.
+        trace_size (int): Number of last rows or step between the rows to return.
+        engine (Optional[str]): Numbers used by the matrix method, float64 or decimal. Default is None to use float64 up to 15 digits of precision.
+        ordering (str): Order of the updates of the Gauss Seidel and SOR methods, natural or multicolor.
     """
+    A: Union[List[List[float]], SparseMatrix] = Field(..., description="Matrix of coefficients of the system of equations, as a list of rows or as a sparse matrix. Sparse matrices are solved with float64 numbers in O(nnz) operations per iteration, and both method types perform the same iterations.")
     tol: float = Field(..., description="Tolerance for the solution.")
     max_iter: int = Field(100, description="Maximum number of iterations.")
     error_type: Literal["absolute", "relative"] = Field("absolute", description="Type of error to be used in the method.")
     x_initial: List[List[float]] = Field(..., description="Initial guess for the solution.")
     method_type: Literal["iterative", "matrix"] = Field("matrix", description="Type of iterative or matrix method to be used.")
+    stream: Optional[Literal["ndjson", "sse"]] = Field(None, description="Streaming format of the response, ndjson for newline delimited JSON or sse for server-sent events. Every iteration is sent as soon as it is computed and the message is sent in the last event. Default is None to send the whole table at once.")
+    trace: Literal["full", "final", "last", "every"] = Field("full", description="Rows of the table of iterations to return: full for every row, final for the last row, last for the last trace_size rows or every for one of every trace_size rows and the last row. Streamed tables send every row.")
+    trace_size: int = Field(10, ge=1, description="Number of last rows to return with the last trace, or step between the rows returned with the every trace.")
+    engine: Optional[Literal["float64", "decimal"]] = Field(None, description="Numbers used by the matrix method with dense matrices, float64 to compute the T matrix and the C vector once and perform every iteration as one NumPy matrix-vector product, or decimal for numbers with the given precision. Default is None to use float64 when the precision is 15 or less and decimal otherwise.")
+    ordering: Literal["natural", "multicolor"] = Field("natural", description="Order of the updates of the Gauss Seidel and SOR methods: natural for the order of the rows, or multicolor to color the rows greedily so no two rows of the same color are adjacent and update every color at once with float64 numbers and the sparse kernels, which is the red-black ordering for the 5-point and 7-point stencils. Dense matrices need the float64 engine, with the precision of 15 or less or engine=float64. Not used by the Jacobi method.")
 
 
 class SorRequest(IterativeMatrixEquationSystemRequest):
@@ -308,6 +620,142 @@ class SorRequest(IterativeMatrixEquationSystemRequest):
     omega: float = Field(..., description="Relaxation factor.", alias="w")
 
 
+class ConjugateGradientRequest(EquationSystemsRequest):
+    """
+    Data model for the preconditioned conjugate gradient method.
+
+    This model extends the `EquationSystemsRequest` model and adds specific attributes for the conjugate gradient method, which solves
+    systems with a symmetric positive definite matrix with float64 numbers.
+
+    Attributes:
+        A (Union[List[List[float]], SparseMatrix]): Dense or sparse symmetric positive definite matrix of coefficients of the system of equations.
+        tol (float): Tolerance for the solution.
+        max_iter (int): Maximum number of iterations.
+        error_type (str): Type of error to be used in the method.
+        x_initial (List[List[float]]): Initial guess for the solution.
+        preconditioner (str): Preconditioner of the method.
+        omega (float): Relaxation factor of the SSOR preconditioner.
+        stream (str): Streaming format of the response, or None to send the whole table at once.
+        trace (str): Rows of the table of iterations to return.
+        trace_size (int): Number of last rows or step between the rows to return.
+    """
+    A: Union[List[List[float]], SparseMatrix] = Field(..., description="Symmetric positive definite matrix of coefficients of the system of equations, as a list of rows or as a sparse matrix.")
+    tol: float = Field(..., description="Tolerance for the solution.")
+    max_iter: int = Field(100, description="Maximum number of iterations.")
+    error_type: Literal["absolute", "relative"] = Field("absolute", description="Type of error to be used in the method.")
+    x_initial: List[List[float]] = Field(..., description="Initial guess for the solution.")
+    preconditioner: Literal["none", "jacobi", "ssor", "incomplete_cholesky"] = Field("jacobi", description="Preconditioner of the method: none, jacobi for the diagonal of A, ssor for the symmetric SOR method or incomplete_cholesky for the Cholesky factorization without fill-in.")
+    # Omega, but sent as w by users
+    omega: float = Field(1, gt=0, lt=2, description="Relaxation factor of the SSOR preconditioner.", alias="w")
+    stream: Optional[Literal["ndjson", "sse"]] = Field(None, description="Streaming format of the response, ndjson for newline delimited JSON or sse for server-sent events. Every iteration is sent as soon as it is computed and the message is sent in the last event. Default is None to send the whole table at once.")
+    trace: Literal["full", "final", "last", "every"] = Field("full", description="Rows of the table of iterations to return: full for every row, final for the last row, last for the last trace_size rows or every for one of every trace_size rows and the last row. Streamed tables send every row.")
+    trace_size: int = Field(10, ge=1, description="Number of last rows to return with the last trace, or step between the rows returned with the every trace.")
+
+
+class KrylovRequest(BaseModel):
+    """
+    Data model for the GMRES and BiCGSTAB methods.
+
+    This model contains the system of equations, dense or sparse, and the options of the Krylov methods, which solve general systems with
+    float64 numbers until the norm 2 of the residual is less or equal than the tolerance.
+
+    Attributes:
+        A (Union[List[List[float]], SparseMatrix]): Dense or sparse matrix of coefficients of the system of equations.
+        b (List[List[float]]): Vector of solutions of the system of equations.
+        x_initial (List[List[float]]): Initial guess for the solution.
+        tol (float): Tolerance for the norm of the residual.
+        max_iter (int): Maximum number of iterations.
+        error_type (str): Whether the residual is absolute or relative to the norm of b.
+        restart (int): Number of iterations between the restarts of the GMRES method.
+        preconditioner (str): Preconditioner of the method.
+        stream (str): Streaming format of the response, or None to send the whole table at once.
+        trace (str): Rows of the table of iterations to return.
+        trace_size (int): Number of last rows or step between the rows to return.
+    """
+    A: Union[List[List[float]], SparseMatrix] = Field(..., description="Matrix of coefficients of the system of equations, as a list of rows or as a sparse matrix.")
+    b: List[List[float]] = Field(..., description="Vector of solutions of the system of equations.")
+    x_initial: List[List[float]] = Field(..., description="Initial guess for the solution.")
+    tol: float = Field(..., gt=0, description="Tolerance for the norm 2 of the residual, b - A x.")
+    max_iter: int = Field(100, ge=1, description="Maximum number of iterations.")
+    error_type: Literal["absolute", "relative"] = Field("absolute", description="Type of residual, absolute or relative to the norm of b.")
+    restart: int = Field(30, ge=1, description="Number of iterations between the restarts of the GMRES method, which bounds its memory to restart + 1 vectors.")
+    preconditioner: Literal["none", "ilu"] = Field("none", description="Preconditioner of the method: none or ilu for the incomplete LU factorization without fill-in.")
+    stream: Optional[Literal["ndjson", "sse"]] = Field(None, description="Streaming format of the response, ndjson for newline delimited JSON or sse for server-sent events. Every iteration is sent as soon as it is computed and the message is sent in the last event. Default is None to send the whole table at once.")
+    trace: Literal["full", "final", "last", "every"] = Field("full", description="Rows of the table of iterations to return: full for every row, final for the last row, last for the last trace_size rows or every for one of every trace_size rows and the last row. Streamed tables send every row.")
+    trace_size: int = Field(10, ge=1, description="Number of last rows to return with the last trace, or step between the rows returned with the every trace.")
+
+
+class KrylovResponse(BaseModel):
+    """
+    Data model for the GMRES and BiCGSTAB methods responses.
+
+    This model contains the table of iterations of the method, with the solution and the norm of the residual of every iteration.
+
+    Attributes:
+        iterations (List[int]): List of the number of iterations taken to reach the result.
+        x (List[List[str]]): List of the solutions of the system of equations.
+        residual (List[str]): List of the norms of the residual at each iteration.
+        message (str): Message to be displayed to the user.
+    """
+    iterations: List[int] = Field(description="List of the number of iterations taken to reach the result.")
+    x: List[List[str]] = Field(description="List of the solutions of the system of equations.")
+    residual: List[str] = Field(description="List of the norms of the residual, absolute or relative, at each iteration.")
+    message: str = Field(description="Message to be displayed to the user.")
+
+
+class SorRelaxationRequest(BaseModel):
+    """
+    Data model for the search of the optimal relaxation factor of the SOR method.
+
+    This model contains the matrix of the system and the relaxation factors to compare, as a range split in a number of points or as a list.
+
+    Attributes:
+        A (Union[List[List[float]], SparseMatrix]): Dense or sparse matrix of coefficients of the system of equations.
+        w_min (float): Smallest relaxation factor of the range.
+        w_max (float): Largest relaxation factor of the range.
+        points (int): Number of relaxation factors of the range.
+        w_values (List[float]): Relaxation factors to compare instead of the range.
+        tol (float): Factor to reduce the error, used to estimate the number of iterations.
+        precision (int): Number of significant digits of the results, at most 15.
+    """
+    A: Union[List[List[float]], SparseMatrix] = Field(..., description="Matrix of coefficients of the system of equations, as a list of rows or as a sparse matrix.")
+    w_min: float = Field(0.1, gt=0, lt=2, description="Smallest relaxation factor of the range.")
+    w_max: float = Field(1.9, gt=0, lt=2, description="Largest relaxation factor of the range.")
+    points: int = Field(19, ge=2, le=1000, description="Number of equally spaced relaxation factors of the range.")
+    w_values: Optional[List[float]] = Field(None, min_length=1, description="Relaxation factors to compare, between 0 and 2. Default is None to use the range.")
+    tol: float = Field(1e-6, gt=0, lt=1, description="Factor to reduce the error of the initial guess, used to estimate the number of iterations.")
+    precision: int = Field(16, ge=1, description="Number of significant digits of the results. The spectral radii are computed with float64 numbers, so at most 15 digits are returned.")
+
+
+class SorRelaxationResponse(BaseModel):
+    """
+    Data model for the search of the optimal relaxation factor of the SOR method.
+
+    This model contains the spectral radius of the T matrix, the asymptotic convergence rate and the estimated number of iterations for
+    every relaxation factor, and the optimal relaxation factor.
+
+    Attributes:
+        w (List[str]): Relaxation factors compared.
+        spectral_radius (List[str]): Spectral radius of the T matrix for every relaxation factor.
+        convergence_rate (List[str]): Asymptotic convergence rate, -log10 of the spectral radius, for every relaxation factor.
+        iterations (List[Optional[int]]): Estimated number of iterations for every relaxation factor, None if the method diverges.
+        optimal_w (str): Relaxation factor with the smallest spectral radius.
+        optimal_spectral_radius (str): Spectral radius of the T matrix for the optimal relaxation factor.
+        expected_iterations (Optional[int]): Estimated number of iterations for the optimal relaxation factor.
+        analytic (bool): Whether the results were obtained with the theorem of Young.
+        message (str): Message with the result.
+    """
+    w: List[str] = Field(description="Relaxation factors compared.")
+    spectral_radius: List[str] = Field(description="Spectral radius of the T matrix for every relaxation factor.")
+    convergence_rate: List[str] = Field(description="Asymptotic convergence rate, the number of correct digits gained per iteration, -log10 of the spectral radius.")
+    iterations: List[Optional[int]] = Field(description="Estimated number of iterations to reduce the error by the tolerance for every relaxation factor, None if the method diverges.")
+    optimal_w: str = Field(description="Relaxation factor with the smallest spectral radius. With the theorem of Young it is the exact optimum, which may be outside of the compared factors.")
+    optimal_spectral_radius: str = Field(description="Spectral radius of the T matrix for the optimal relaxation factor.")
+    expected_iterations: Optional[int] = Field(description="Estimated number of iterations to reduce the error by the tolerance for the optimal relaxation factor, None if the method diverges.")
+    analytic: bool = Field(description="Whether the matrix is tridiagonal and consistently ordered, so the spectral radii and the optimum come from the theorem of Young.")
+    message: str = Field(description="Message with the result.")
+
+
 class InterpolationRequest(BaseModel):
     """
     Data model for interpolation requests.
@@ -411,4 +859,64 @@ class SplineResponse(BaseModel):
     """
     functions: List[SplineFunction] = Field(description="List of functions obtained from the spline method.")
     coefficients: List[List[str]] = Field(description="List of coefficients of the functions.")
-    
\ No newline at end of file
+    
+
+class BatchJob(BaseModel):
+    """
+    Data model for the jobs of a batch.
+
+    This model is used for every job of a batch request. It contains the name of the method and the request of the method, with the same
+    attributes as the request of its own route.
+
+    Attributes:
+        method (str): Name of the method to be used.
+        data (dict): Request of the method.
+    """
+    method: Literal[
+        "bisection", "false_rule", "brent", "fixed_point", "newton_raphson", "secant", "first_modified_newton_method",
+        "second_modified_newton_method", "bisection_multi_start", "newton_raphson_multi_start", "secant_multi_start", "roots_scan", "polynomial_roots",
+        "gauss_elimination", "lu_factorization", "cholesky", "jacobi", "jacobi_spectral_radius_and_convergence", "gauss_seidel",
+        "gauss_seidel_spectral_radius_and_convergence", "sor", "sor_spectral_radius_and_convergence", "sor_optimal_w", "conjugate_gradient", "gmres", "bicgstab",
+        "vandermonde", "newton", "lagrange", "spline"
+    ] = Field(..., description="Name of the method to be used.")
+    data: dict = Field(..., description="Request of the method, with the same attributes as the request of its own route. Streaming is not supported in a batch.")
+
+
+class BatchRequest(BaseModel):
+    """
+    Data model for batch requests.
+
+    This model is used to solve many problems in one call. The jobs are solved in parallel by a pool of worker processes.
+
+    Attributes:
+        jobs (List[BatchJob]): Jobs to be solved.
+    """
+    jobs: List[BatchJob] = Field(..., min_length=1, description="Jobs to be solved.")
+
+
+class BatchJobResult(BaseModel):
+    """
+    Data model for the results of the jobs of a batch.
+
+    This model contains the response of the method of a job, or the error raised while solving it.
+
+    Attributes:
+        method (str): Name of the method used.
+        result (dict): Response of the method, or None if the job failed.
+        error (str): Error raised while solving the job, or None if the job succeeded.
+    """
+    method: str = Field(description="Name of the method used.")
+    result: Optional[dict] = Field(None, description="Response of the method, with the same attributes as the response of its own route, or None if the job failed.")
+    error: Optional[str] = Field(None, description="Error raised while solving the job, or None if the job succeeded.")
+
+
+class BatchResponse(BaseModel):
+    """
+    Data model for batch responses.
+
+    This model contains the result of every job, in the same order as the jobs of the request.
+
+    Attributes:
+        results (List[BatchJobResult]): Results of the jobs.
+    """
+    results: List[BatchJobResult] = Field(description="Results of the jobs, in the same order as the jobs of the request.")
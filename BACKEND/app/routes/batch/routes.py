@@ -0,0 +1,161 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Request, Depends, status
+from slowapi.errors import RateLimitExceeded
+from typing import Any, Dict, Optional, Tuple
+
+# Configuration, models, methods and authentication modules imports
+from app.config.limiter import limiter
+from app.models.models import ResponseError, BatchRequest, BatchResponse, BatchJobResult, BisectionFalseRuleModel, BrentModel, FixedPointModel, NewtonRaphsonModel, SecantModel, FirstNewtonModified, SecondNewtonModified, BisectionMultiStartModel, NewtonRaphsonMultiStartModel, SecantMultiStartModel, RootsScanModel, PolynomialRootsModel, GaussEliminationRequest, LUFactorizationRequest, CholeskyFactorizationRequest, IterativeMatrixEquationSystemRequest, SorRequest, SorRelaxationRequest, ConjugateGradientRequest, KrylovRequest, InterpolationRequest, SplineRequest
+from app.auth.auth import auth_handler
+from app.utils.utils import raise_exception
+from app.utils.workers import run_job
+from app.routes.routes import logger
+from app.routes.methods import routes as methods
+from app.routes.linear_equation_systems import routes as linear_equation_systems
+from app.routes.interpolation import routes as interpolation
+
+
+router = APIRouter()
+
+# Request model and solver of every method which can be used in a batch
+BATCH_METHODS = {
+    "bisection": (BisectionFalseRuleModel, methods.solve_bisection),
+    "false_rule": (BisectionFalseRuleModel, methods.solve_false_rule),
+    "brent": (BrentModel, methods.solve_brent),
+    "fixed_point": (FixedPointModel, methods.solve_fixed_point),
+    "newton_raphson": (NewtonRaphsonModel, methods.solve_newton_raphson),
+    "secant": (SecantModel, methods.solve_secant),
+    "first_modified_newton_method": (FirstNewtonModified, methods.solve_first_modified_newton),
+    "second_modified_newton_method": (SecondNewtonModified, methods.solve_second_modified_newton),
+    "bisection_multi_start": (BisectionMultiStartModel, methods.solve_bisection_multi_start),
+    "newton_raphson_multi_start": (NewtonRaphsonMultiStartModel, methods.solve_newton_raphson_multi_start),
+    "secant_multi_start": (SecantMultiStartModel, methods.solve_secant_multi_start),
+    "roots_scan": (RootsScanModel, methods.solve_roots_scan),
+    "polynomial_roots": (PolynomialRootsModel, methods.solve_polynomial_roots),
+    "gauss_elimination": (GaussEliminationRequest, linear_equation_systems.solve_gauss_elimination),
+    "lu_factorization": (LUFactorizationRequest, linear_equation_systems.solve_lu_factorization),
+    "cholesky": (CholeskyFactorizationRequest, linear_equation_systems.solve_cholesky_factorization),
+    "jacobi": (IterativeMatrixEquationSystemRequest, linear_equation_systems.solve_jacobi),
+    "jacobi_spectral_radius_and_convergence": (IterativeMatrixEquationSystemRequest, linear_equation_systems.solve_jacobi_spectral_radius_and_convergence),
+    "gauss_seidel": (IterativeMatrixEquationSystemRequest, linear_equation_systems.solve_gauss_seidel),
+    "gauss_seidel_spectral_radius_and_convergence": (IterativeMatrixEquationSystemRequest, linear_equation_systems.solve_gauss_seidel_spectral_radius_and_convergence),
+    "sor": (SorRequest, linear_equation_systems.solve_sor),
+    "sor_spectral_radius_and_convergence": (SorRequest, linear_equation_systems.solve_sor_spectral_radius_and_convergence),
+    "sor_optimal_w": (SorRelaxationRequest, linear_equation_systems.solve_sor_relaxation),
+    "conjugate_gradient": (ConjugateGradientRequest, linear_equation_systems.solve_conjugate_gradient),
+    "gmres": (KrylovRequest, linear_equation_systems.solve_gmres),
+    "bicgstab": (KrylovRequest, linear_equation_systems.solve_bicgstab),
+    "vandermonde": (InterpolationRequest, interpolation.solve_vandermonde),
+    "newton": (InterpolationRequest, interpolation.solve_newton),
+    "lagrange": (InterpolationRequest, interpolation.solve_lagrange),
+    "spline": (SplineRequest, interpolation.solve_spline),
+}
+
+# Functions which get the handle and compute the factorization of the methods whose factorizations are stored in the cache
+BATCH_FACTORIZATIONS = {
+    "lu_factorization": (linear_equation_systems.get_lu_factorization_handle, linear_equation_systems.factorize_lu),
+    "cholesky": (linear_equation_systems.get_cholesky_factorization_handle, linear_equation_systems.factorize_cholesky),
+}
+
+
+def solve_job(method: str, data: Dict[str, Any], *args) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Solve a job of a batch in a worker process.
+
+    The request is validated in the worker, so an invalid job only fails itself instead of the whole batch.
+
+    Args:
+        method (str): Name of the method to be used.
+        data (dict): Request of the method.
+        args: Extra arguments of the solver, like the stored factorization.
+
+    Returns:
+        tuple: Response of the method as a dictionary and None, or None and the error raised while solving the job.
+    """
+    model, solve = BATCH_METHODS[method]
+    try:
+        return solve(model.model_validate(data), *args).model_dump(), None
+    except HTTPException as e:
+        return None, e.detail
+    except Exception as e:
+        return None, str(e)
+
+
+async def run_batch_job(method: str, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Run a job of a batch in a worker process. The factorizations are taken from the cache of the server process or stored in it before
+    the job is sent, like in the routes of their methods, so their handles work in the batches and in the routes.
+
+    Args:
+        method (str): Name of the method to be used.
+        data (dict): Request of the method.
+
+    Returns:
+        tuple: Response of the method as a dictionary and None, or None and the error raised while solving the job.
+    """
+    if method not in BATCH_FACTORIZATIONS:
+        return await run_job(solve_job, method, data)
+
+    try:
+        request = BATCH_METHODS[method][0].model_validate(data)
+        factorization = await linear_equation_systems.get_stored_factorization(request, *BATCH_FACTORIZATIONS[method])
+    except HTTPException as e:
+        return None, e.detail
+    except Exception as e:
+        return None, str(e)
+
+    return await run_job(solve_job, method, data, factorization)
+
+
+@router.post('/',
+                tags=["Batch", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Batch of numerical methods",
+                response_model=BatchResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def batch(request: Request, data: BatchRequest, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Batch route.
+
+    This route is used to solve many problems of any of the methods in one call. The jobs are sent to the worker processes, so they are
+    solved in parallel on every core, and the results are returned in the same order as the jobs. A job which fails or exceeds the time
+    limit returns its error without failing the other jobs.
+
+    Args:
+        request (Request): The request object.
+        data (BatchRequest): The batch model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        BatchResponse: The response model. Response or error of every job.
+
+    Raises:
+        HTTPException: If an error occurs during the batch.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {len(data.jobs)} jobs")
+
+        outcomes = await asyncio.gather(*(run_batch_job(job.method, job.data) for job in data.jobs), return_exceptions=True)
+
+        results = []
+        for job, outcome in zip(data.jobs, outcomes):
+            # The errors raised outside of the solver, like the time limit, are errors of the job too
+            if isinstance(outcome, BaseException):
+                outcome = None, outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
+            result, error = outcome
+            results.append(BatchJobResult(method=job.method, result=result, error=error))
+
+        logger.info(f"Request successful: {sum(result.error is None for result in results)} of {len(results)} jobs solved")
+
+        return BatchResponse(results=results)
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
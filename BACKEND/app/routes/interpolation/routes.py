@@ -8,6 +8,7 @@ from app.config.limiter import limiter
 from app.models.models import ResponseError, InterpolationRequest, SplineRequest, SplineResponse, SplineFunction, VandermondeResponse, NewtonResponse, LagrangeResponse
 from app.auth.auth import auth_handler
 from app.utils.utils import raise_exception
+from app.utils.workers import run_job
 from app.routes.routes import logger
 
 # Module imports
@@ -20,6 +21,24 @@ from app.domain.spline import Spline
 router = APIRouter()
 
 
+def solve_vandermonde(data: InterpolationRequest) -> VandermondeResponse:
+    """
+    Find the interpolating polynomial of the points of the request using the Vandermonde method.
+
+    :param data: InterpolationRequest object.
+    :return: VandermondeResponse object.
+    """
+    x = data.x
+    y = data.y
+
+    vandermonde = Vandermonde(x, y, precision=data.precision)
+    coefficients = vandermonde.solve()
+
+    polynomial = vandermonde.convert_coefficients_to_polynomial(coefficients)
+    coefficients = vandermonde.convert_1_n_matrix_to_array(coefficients)
+    return VandermondeResponse(polynomial=polynomial, coefficients=coefficients, vandermonde_matrix=vandermonde.float_matrix_to_string_array(vandermonde.vandermonde_matrix))
+
+
 @router.post('/vandermonde/',
                 tags=["Interpolation", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -27,10 +46,11 @@ router = APIRouter()
                 response_model=VandermondeResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def vandermonde(request: Request, data: InterpolationRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def vandermonde(request: Request, data: InterpolationRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Find a interpolating polynomial using the Vandermonde method.
 
@@ -40,15 +60,7 @@ def vandermonde(request: Request, data: InterpolationRequest, auth: dict = Depen
     :return: InterpolationResponse object.
     """
     try:
-        x = data.x
-        y = data.y
-
-        vandermonde = Vandermonde(x, y, precision=data.precision)
-        coefficients = vandermonde.solve()
-
-        polynomial = vandermonde.convert_coefficients_to_polynomial(coefficients)
-        coefficients = vandermonde.convert_1_n_matrix_to_array(coefficients)
-        return VandermondeResponse(polynomial=polynomial, coefficients=coefficients, vandermonde_matrix=vandermonde.float_matrix_to_string_array(vandermonde.vandermonde_matrix))
+        return await run_job(solve_vandermonde, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -57,6 +69,22 @@ def vandermonde(request: Request, data: InterpolationRequest, auth: dict = Depen
         raise_exception(e, logger)
 
 
+def solve_newton(data: InterpolationRequest) -> NewtonResponse:
+    """
+    Find the interpolating polynomial of the points of the request using the Newton's Divided Difference method.
+
+    :param data: InterpolationRequest object.
+    :return: NewtonResponse object.
+    """
+    x = data.x
+    y = data.y
+
+    newton = Newton(x, y, precision=data.precision)
+    polynomial, coefficients = newton.get_polynomial()
+
+    return NewtonResponse(polynomial=polynomial, coefficients=coefficients, difference_table=newton.float_matrix_to_string_array(newton.difference_table))
+
+
 @router.post('/newton/',
                 tags=["Interpolation", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -64,10 +92,11 @@ def vandermonde(request: Request, data: InterpolationRequest, auth: dict = Depen
                 response_model=NewtonResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def newton(request: Request, data: InterpolationRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def newton(request: Request, data: InterpolationRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Find a interpolating polynomial using the Newton's Divided Difference method.
 
@@ -77,13 +106,7 @@ def newton(request: Request, data: InterpolationRequest, auth: dict = Depends(au
     :return: InterpolationResponse object.
     """
     try:
-        x = data.x
-        y = data.y
-
-        newton = Newton(x, y, precision=data.precision)
-        polynomial, coefficients = newton.get_polynomial()
-
-        return NewtonResponse(polynomial=polynomial, coefficients=coefficients, difference_table=newton.float_matrix_to_string_array(newton.difference_table))
+        return await run_job(solve_newton, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -92,6 +115,22 @@ def newton(request: Request, data: InterpolationRequest, auth: dict = Depends(au
         raise_exception(e, logger)
 
 
+def solve_lagrange(data: InterpolationRequest) -> LagrangeResponse:
+    """
+    Find the interpolating polynomial of the points of the request using the Lagrange method.
+
+    :param data: InterpolationRequest object.
+    :return: LagrangeResponse object.
+    """
+    x = data.x
+    y = data.y
+
+    lagrange = Lagrange(x, y, precision=data.precision)
+    polynomial, coefficients, lagrange_polynomials = lagrange.solve()
+
+    return LagrangeResponse(polynomial=polynomial, coefficients=coefficients, lagrange_polynomials=lagrange_polynomials)
+
+
 @router.post('/lagrange/',
                 tags=["Interpolation", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -99,10 +138,11 @@ def newton(request: Request, data: InterpolationRequest, auth: dict = Depends(au
                 response_model=LagrangeResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def lagrange(request: Request, data: InterpolationRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def lagrange(request: Request, data: InterpolationRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Find a interpolating polynomial using the Lagrange method.
 
@@ -112,13 +152,7 @@ def lagrange(request: Request, data: InterpolationRequest, auth: dict = Depends(
     :return: InterpolationResponse object.
     """
     try:
-        x = data.x
-        y = data.y
-
-        lagrange = Lagrange(x, y, precision=data.precision)
-        polynomial, coefficients, lagrange_polynomials = lagrange.solve()
-
-        return LagrangeResponse(polynomial=polynomial, coefficients=coefficients, lagrange_polynomials=lagrange_polynomials)
+        return await run_job(solve_lagrange, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -127,6 +161,23 @@ def lagrange(request: Request, data: InterpolationRequest, auth: dict = Depends(
         raise_exception(e, logger)
         
         
+def solve_spline(data: SplineRequest) -> SplineResponse:
+    """
+    Find the interpolating polynomial of the points of the request using the Spline method.
+
+    :param data: SplineRequest object.
+    :return: SplineResponse object.
+    """
+    x = data.x
+    y = data.y
+
+    spline = Spline(x, y, precision=data.precision)
+    result_array, result_coefficient_array = spline.solve(data.degree)
+    functions = [SplineFunction(function=func[0], interval=func[1]) for func in result_array]
+
+    return SplineResponse(functions=functions, coefficients=result_coefficient_array)
+
+
 @router.post('/spline/',
                 tags=["Interpolation", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -134,10 +185,11 @@ def lagrange(request: Request, data: InterpolationRequest, auth: dict = Depends(
                 response_model=SplineResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def spline(request: Request, data: SplineRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def spline(request: Request, data: SplineRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Find a interpolating polynomial using the Spline method.
 
@@ -147,14 +199,7 @@ def spline(request: Request, data: SplineRequest, auth: dict = Depends(auth_hand
     :return: SplineResponse object.
     """
     try:
-        x = data.x
-        y = data.y
-
-        spline = Spline(x, y, precision=data.precision)
-        result_array, result_coefficient_array = spline.solve(data.degree)
-        functions = [SplineFunction(function=func[0], interval=func[1]) for func in result_array]
-
-        return SplineResponse(functions=functions, coefficients=result_coefficient_array)
+        return await run_job(solve_spline, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
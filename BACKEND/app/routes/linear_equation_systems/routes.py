@@ -1,24 +1,74 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Request, Depends, status
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.orm import Session
 import numpy as np
 import sympy as sp
+from typing import Callable, List, Tuple, Union
 
 # Configuration, models, methods and authentication modules imports
 from app.config.limiter import limiter
-from app.models.models import ResponseError, GaussEliminationRequest, GaussEliminationResponse, LUFactorizationRequest, LUFactorizationResponse, IterativeMatrixEquationSystemRequest, IterativeMatrixEquationSystemResponse, SorRequest, SpectralAndConvergenceResponse
+from app.config.env import MAX_WORKERS
+from app.models.models import ResponseError, GaussEliminationRequest, GaussEliminationResponse, LUFactorizationRequest, LUFactorizationResponse, CholeskyFactorizationRequest, CholeskyFactorizationResponse, IterativeMatrixEquationSystemRequest, IterativeMatrixEquationSystemResponse, SorRequest, SpectralAndConvergenceResponse, SparseMatrix, SorRelaxationRequest, SorRelaxationResponse, ConjugateGradientRequest, KrylovRequest, KrylovResponse
 from app.domain.jacobi import Jacobi
 from app.domain.gauss_seidel import GaussSeidel
 from app.domain.sor import Sor
+from app.domain.sparse_stationary import SparseStationary
+from app.domain.sor_relaxation import SorRelaxation, expected_iterations
+from app.domain.conjugate_gradient import ConjugateGradient
+from app.domain.krylov import Krylov
 from app.domain.gaussian_elimination import GaussianElimination
-from app.domain.lu_factorization import LUFactorization
+from app.domain.lu_factorization import LUFactorization, factorization_handle
+from app.domain.cholesky import CholeskyFactorization
 from app.auth.auth import auth_handler
-from app.utils.utils import raise_exception, calculate_spectral_radius
+from app.utils.utils import raise_exception, select_engine
+from app.utils.compiler import FLOAT64_MAX_PRECISION
+from app.utils.cache import factorizations_cache
+from app.utils.tables import IterationTable, create_table
+from app.utils.sparse import CSRMatrix
+from app.utils.workers import run_job, stream_job
 from app.routes.routes import logger
 
 
 router = APIRouter()
 
+# Names of the columns of the table and of the result sent in the last event of a streaming response
+TABLE_COLUMNS = ["iterations", "x", "error"]
+KRYLOV_TABLE_COLUMNS = ["iterations", "x", "residual"]
+RESULT_COLUMNS = ["message"]
+
+
+def solve_gauss_elimination(data: GaussEliminationRequest) -> GaussEliminationResponse:
+    """
+    Solve the system of equations of the request with the Gauss Elimination method.
+
+    Args:
+        data (GaussEliminationRequest): The request data.
+
+    Returns:
+        GaussEliminationResponse: The response model.
+    """
+    # Get the data from the request
+    A = np.array(data.A)
+    b = np.array(data.b)
+    n = data.n
+    pivot_type = data.pivot_type
+
+    # Create the object to solve the system of equations
+    gauss_elimination_object = GaussianElimination(A, b, n, precision=data.precision, engine=data.engine)
+
+    # Solve the system of equations
+    x = gauss_elimination_object.solve(pivot_type=pivot_type)
+    vectorial_error = gauss_elimination_object.get_set_vectorial_error()
+    absolute_error = gauss_elimination_object.get_set_absolute_error(order=data.order)
+
+    # Convert to Strings
+    x = gauss_elimination_object.convert_matrix_to_string(x)
+    vectorial_error = gauss_elimination_object.convert_matrix_to_string(vectorial_error)
+    absolute_error = str(absolute_error)
+
+    return GaussEliminationResponse(x=x, vectorial_error=vectorial_error, absolute_error=absolute_error)
+
 
 @router.post('/gauss_elimination/',
                 tags=["Linear Equations System", "Protected"],
@@ -27,10 +77,11 @@ router = APIRouter()
                 response_model=GaussEliminationResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def gauss_elimination(request: Request, data: GaussEliminationRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def gauss_elimination(request: Request, data: GaussEliminationRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Gauss Elimination method.
     
@@ -44,27 +95,8 @@ def gauss_elimination(request: Request, data: GaussEliminationRequest, auth: dic
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = np.array(data.A)
-        b = np.array(data.b)
-        n = data.n
-        pivot_type = data.pivot_type
 
-        # Create the object to solve the system of equations
-        gauss_elimination_object = GaussianElimination(A, b, n, precision=data.precision)
-
-        # Solve the system of equations
-        x = gauss_elimination_object.solve(pivot_type=pivot_type)
-        vectorial_error = gauss_elimination_object.get_set_vectorial_error()
-        absolute_error = gauss_elimination_object.get_set_absolute_error(order=data.order)
-
-        # Convert to Strings
-        x = gauss_elimination_object.convert_matrix_to_string(x)
-        vectorial_error = gauss_elimination_object.convert_matrix_to_string(vectorial_error)
-        absolute_error = str(absolute_error)
-
-        return GaussEliminationResponse(x=x, vectorial_error=vectorial_error, absolute_error=absolute_error)
+        return await run_job(solve_gauss_elimination, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -73,53 +105,136 @@ def gauss_elimination(request: Request, data: GaussEliminationRequest, auth: dic
         raise_exception(e, logger)
 
 
+def get_lu_factorization_handle(data: LUFactorizationRequest) -> str:
+    """
+    Get the handle of the factorization of the request, the one computed from A or the one sent by the client if A is not given.
+
+    Args:
+        data (LUFactorizationRequest): The request data.
+
+    Returns:
+        str: The handle of the factorization.
+    """
+    if data.A is not None:
+        return factorization_handle(np.array(data.A), data.precision, data.pivot_type, select_engine(data.precision, data.engine, logger))
+    if data.handle is None:
+        raise_exception(ValueError("Se debe enviar la matriz A o el identificador de una factorización"), logger)
+
+    return data.handle
+
+
+def factorize_lu(data: LUFactorizationRequest) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the LU factorization of the matrix of the request.
+
+    Args:
+        data (LUFactorizationRequest): The request data.
+
+    Returns:
+        tuple: The L matrix, the U matrix and the permutation vector, the factors stored in the cache without A.
+    """
+    if data.A is None:
+        raise HTTPException(status_code=404, detail="La factorización no está almacenada, envíe la matriz A para calcularla de nuevo")
+
+    lu_factorization_object = LUFactorization(np.array(data.A), np.array(data.b), data.n, precision=data.precision, engine=data.engine)
+    return lu_factorization_object.factorize(pivot_type=data.pivot_type, block_size=data.block_size)
+
+
+async def get_stored_factorization(data: Union[LUFactorizationRequest, CholeskyFactorizationRequest], get_handle: Callable, factorize: Callable) -> tuple:
+    """
+    Get the factorization of the request from the cache of the server process, or compute it in a worker and store it in the cache.
+
+    The factorizations are stored in the server process, so the handles are shared by every worker and by the batch jobs. The hash of A
+    is computed outside of the event loop.
+
+    Args:
+        data (Union[LUFactorizationRequest, CholeskyFactorizationRequest]): The request data.
+        get_handle (Callable): Function which gets the handle of the factorization of the request.
+        factorize (Callable): Function which computes the factorization of the request in a worker.
+
+    Returns:
+        tuple: The factors of the factorization.
+    """
+    handle = await asyncio.to_thread(get_handle, data)
+    factorization = factorizations_cache.get(handle)
+    if factorization is None:
+        factorization = await run_job(factorize, data)
+        factorizations_cache.put(handle, factorization)
+
+    return factorization
+
+
+def solve_lu_factorization(data: LUFactorizationRequest, factorization: Tuple[np.ndarray, np.ndarray, np.ndarray] = None) -> LUFactorizationResponse:
+    """
+    Solve the system of equations of the request with the LU Factorization method, for every vector of solutions of the request.
+
+    Args:
+        data (LUFactorizationRequest): The request data.
+        factorization (tuple): The stored factorization to reuse, by default a new one which isn't stored.
+
+    Returns:
+        LUFactorizationResponse: The response model.
+    """
+    handle = get_lu_factorization_handle(data)
+    if factorization is None:
+        factorization = factorize_lu(data)
+    # The handles of the Cholesky Factorization method store the name of the factorization with its factors
+    if len(factorization) != 3:
+        raise_exception(ValueError("El identificador no corresponde a una factorización del método de Factorización LU"), logger)
+    L, U, permutation = factorization
+
+    # The errors are computed with the A of the request, or with the one of the factorization if only the handle is sent
+    A = np.array(data.A) if data.A is not None else LUFactorization.reconstruct_matrix(L, U, permutation)
+
+    # Create the object to solve the system of equations with the stored factorization, using the numbers of the factorization
+    lu_factorization_object = LUFactorization(A, np.array(data.b), data.n, precision=data.precision, engine="decimal" if L.dtype == object else "float64")
+
+    # Solve the system of equations
+    x = lu_factorization_object.substitute(L, U, permutation)
+    vectorial_error = lu_factorization_object.get_set_vectorial_error()
+    absolute_error = lu_factorization_object.get_set_absolute_error(order=data.order)
+
+    # Convert to Strings
+    x = lu_factorization_object.convert_matrix_to_string(x)
+    L = lu_factorization_object.convert_matrix_to_string(L)
+    U = lu_factorization_object.convert_matrix_to_string(U)
+    vectorial_error = lu_factorization_object.convert_matrix_to_string(vectorial_error)
+    absolute_error = str(absolute_error)
+
+    return LUFactorizationResponse(x=x, L=L, U=U, vectorial_error=vectorial_error, absolute_error=absolute_error, handle=handle)
+
+
 @router.post('/lu_factorization/',
                 tags=["Linear Equations System", "Protected"],
                 status_code=status.HTTP_200_OK,
                 summary="LU Factorization method",
                 response_model=LUFactorizationResponse,
                 responses={
+                    404: {"model": ResponseError, "description": "The factorization of the handle is not stored."},
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def lu_factorization(request: Request, data: LUFactorizationRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def lu_factorization(request: Request, data: LUFactorizationRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     LU Factorization method.
     
-    This endpoint solves a system of linear equations using the LU Factorization method.
+    This endpoint solves a system of linear equations using the LU Factorization method. The factorization is stored in a cache with its
+    handle, so later requests with the same matrix or with the handle only solve the new vectors of solutions.
     
     Arguments:
-    data: LUFactorizationRequest: JSON with the matrix of coefficients, the vector of solutions, and the number of equations.
+    data: LUFactorizationRequest: JSON with the matrix of coefficients or the handle of its factorization, the vectors of solutions, and the number of equations.
     
     Returns:
-    LUFactorizationResponse: JSON with the solutions of the system of equations, the vectorial errors, and the absolute error.
+    LUFactorizationResponse: JSON with the solutions of the system of equations, the vectorial errors, the absolute error and the handle of the factorization.
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = np.array(data.A)
-        b = np.array(data.b)
-        n = data.n
-        pivot_type = data.pivot_type
 
-        # Create the object to solve the system of equations
-        lu_factorization_object = LUFactorization(A, b, n, precision=data.precision)
+        factorization = await get_stored_factorization(data, get_lu_factorization_handle, factorize_lu)
 
-        # Solve the system of equations
-        x, L, U = lu_factorization_object.solve(pivot_type=pivot_type)
-        vectorial_error = lu_factorization_object.get_set_vectorial_error()
-        absolute_error = lu_factorization_object.get_set_absolute_error(order=data.order)
-
-        # Convert to Strings
-        x = lu_factorization_object.convert_matrix_to_string(x)
-        L = lu_factorization_object.convert_matrix_to_string(L)
-        U = lu_factorization_object.convert_matrix_to_string(U)
-        vectorial_error = lu_factorization_object.convert_matrix_to_string(vectorial_error)
-        absolute_error = str(absolute_error)
-
-        return LUFactorizationResponse(x=x, L=L, U=U, vectorial_error=vectorial_error, absolute_error=absolute_error)
+        return await run_job(solve_lu_factorization, data, factorization)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -128,6 +243,272 @@ def lu_factorization(request: Request, data: LUFactorizationRequest, auth: dict
         raise_exception(e, logger)
 
 
+def get_cholesky_factorization_handle(data: CholeskyFactorizationRequest) -> str:
+    """
+    Get the handle of the Cholesky factorization of the request, the one computed from A or the one sent by the client if A is not given.
+
+    Args:
+        data (CholeskyFactorizationRequest): The request data.
+
+    Returns:
+        str: The handle of the factorization.
+    """
+    if data.A is not None:
+        return factorization_handle(np.array(data.A), data.precision, None, select_engine(data.precision, data.engine, logger), data.method)
+    if data.handle is None:
+        raise_exception(ValueError("Se debe enviar la matriz A o el identificador de una factorización"), logger)
+
+    return data.handle
+
+
+def factorize_cholesky(data: CholeskyFactorizationRequest) -> Tuple[str, tuple]:
+    """
+    Compute the Cholesky or the LDL^T factorization of the matrix of the request, or its LU factorization if it is not symmetric
+    positive definite.
+
+    Args:
+        data (CholeskyFactorizationRequest): The request data.
+
+    Returns:
+        tuple: The name of the computed factorization and its factors, stored in the cache without A.
+    """
+    if data.A is None:
+        raise HTTPException(status_code=404, detail="La factorización no está almacenada, envíe la matriz A para calcularla de nuevo")
+
+    cholesky_object = CholeskyFactorization(np.array(data.A), np.array(data.b), data.n, precision=data.precision, engine=data.engine)
+    return cholesky_object.factorize(method=data.method, block_size=data.block_size)
+
+
+def solve_cholesky_factorization(data: CholeskyFactorizationRequest, factorization: Tuple[str, tuple] = None) -> CholeskyFactorizationResponse:
+    """
+    Solve the system of equations of the request with the Cholesky Factorization method, for every vector of solutions of the request.
+
+    Args:
+        data (CholeskyFactorizationRequest): The request data.
+        factorization (tuple): The stored factorization to reuse, by default a new one which isn't stored.
+
+    Returns:
+        CholeskyFactorizationResponse: The response model.
+    """
+    handle = get_cholesky_factorization_handle(data)
+    if factorization is None:
+        factorization = factorize_cholesky(data)
+    # The handles of the LU Factorization method store the factors without the name of the factorization
+    if len(factorization) != 2:
+        raise_exception(ValueError("El identificador no corresponde a una factorización del método de Cholesky"), logger)
+    method, factors = factorization
+    L = factors[0]
+
+    # The errors are computed with the A of the request, or with the one of the factorization if only the handle is sent
+    A = np.array(data.A) if data.A is not None else CholeskyFactorization.reconstruct_matrix(method, factors)
+
+    # Create the object to solve the system of equations with the stored factorization, using the numbers of the factorization
+    cholesky_object = CholeskyFactorization(A, np.array(data.b), data.n, precision=data.precision, engine="decimal" if L.dtype == object else "float64")
+
+    # Solve the system of equations
+    x = cholesky_object.substitute(method, factors)
+    vectorial_error = cholesky_object.get_set_vectorial_error()
+    absolute_error = cholesky_object.get_set_absolute_error(order=data.order)
+
+    # Convert to Strings, D is only given by the LDL^T factorization and U by the LU factorization
+    D = None
+    U = None
+    if method == "ldlt":
+        D = [str(value) for value in factors[1]]
+    elif method == "lu":
+        U = cholesky_object.convert_matrix_to_string(factors[1])
+    x = cholesky_object.convert_matrix_to_string(x)
+    L = cholesky_object.convert_matrix_to_string(L)
+    vectorial_error = cholesky_object.convert_matrix_to_string(vectorial_error)
+    absolute_error = str(absolute_error)
+
+    return CholeskyFactorizationResponse(x=x, method=method, L=L, D=D, U=U, vectorial_error=vectorial_error, absolute_error=absolute_error, handle=handle)
+
+
+@router.post('/cholesky/',
+                tags=["Linear Equations System", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Cholesky Factorization method",
+                response_model=CholeskyFactorizationResponse,
+                responses={
+                    404: {"model": ResponseError, "description": "The factorization of the handle is not stored."},
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def cholesky_factorization(request: Request, data: CholeskyFactorizationRequest, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Cholesky Factorization method.
+
+    This endpoint solves a system of linear equations with the Cholesky factorization, A = L L^T, or the LDL^T factorization when A is
+    symmetric positive definite, and with the LU factorization with partial pivot otherwise. The factorization is stored in a cache with
+    its handle, so later requests with the same matrix or with the handle only solve the new vectors of solutions.
+
+    Arguments:
+    data: CholeskyFactorizationRequest: JSON with the matrix of coefficients or the handle of its factorization, the vectors of solutions, the factorization and the number of equations.
+
+    Returns:
+    CholeskyFactorizationResponse: JSON with the solutions of the system of equations, the computed factorization, the vectorial errors, the absolute error and the handle of the factorization.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
+
+        factorization = await get_stored_factorization(data, get_cholesky_factorization_handle, factorize_cholesky)
+
+        return await run_job(solve_cholesky_factorization, data, factorization)
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def to_csr(matrix: SparseMatrix) -> CSRMatrix:
+    """
+    Build the sparse matrix of a request in compressed sparse row format.
+
+    Args:
+        matrix (SparseMatrix): The sparse matrix of the request, in coo or csr format.
+
+    Returns:
+        CSRMatrix: The matrix in compressed sparse row format.
+    """
+    if matrix.format == "coo":
+        if matrix.rows is None:
+            raise ValueError("La matriz dispersa en formato coo debe tener la fila de cada valor")
+        return CSRMatrix.from_coo(matrix.rows, matrix.indices, matrix.data, matrix.shape)
+
+    if matrix.indptr is None:
+        raise ValueError("La matriz dispersa en formato csr debe tener los punteros de las filas")
+    return CSRMatrix(matrix.data, matrix.indices, matrix.indptr, matrix.shape)
+
+
+def sparse_matrix(matrix: Union[List[List[float]], SparseMatrix]) -> CSRMatrix:
+    """
+    Build the matrix of a request in compressed sparse row format, from its sparse or dense representation.
+
+    Args:
+        matrix (Union[List[List[float]], SparseMatrix]): The matrix of the request.
+
+    Returns:
+        CSRMatrix: The matrix in compressed sparse row format.
+    """
+    if isinstance(matrix, SparseMatrix):
+        return to_csr(matrix)
+    return CSRMatrix.from_dense(np.array(matrix, dtype=float))
+
+
+def uses_sparse_kernels(data: IterativeMatrixEquationSystemRequest) -> bool:
+    """
+    Check whether the Gauss Seidel or SOR method of a request runs with the sparse kernels, which is the case of the sparse matrices and
+    of the multicolor ordering. The kernels use float64 numbers, so the multicolor ordering of a dense matrix is rejected if the request
+    selects the decimal engine, explicitly or with more than 15 digits of precision.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+
+    Returns:
+        bool: Whether the method runs with the sparse kernels.
+    """
+    if isinstance(data.A, SparseMatrix):
+        return True
+    if data.ordering != "multicolor":
+        return False
+    if select_engine(data.precision, data.engine, logger) != "float64":
+        raise_exception(ValueError(f"El ordenamiento multicolor usa números float64, use una precisión de {FLOAT64_MAX_PRECISION} dígitos o menos o el motor float64"), logger)
+
+    return True
+
+
+def solve_sparse_stationary(data: IterativeMatrixEquationSystemRequest, method: str, table: IterationTable) -> IterativeMatrixEquationSystemResponse:
+    """
+    Solve the system of equations of a request with a sparse matrix with the Jacobi, Gauss Seidel or SOR method.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+        method (str): Name of the method, jacobi, gauss_seidel or sor.
+        table (IterationTable): The table of iterations.
+
+    Returns:
+        IterativeMatrixEquationSystemResponse: The response model.
+    """
+    sparse_object = SparseStationary(sparse_matrix(data.A), np.array(data.b), np.array(data.x_initial))
+
+    # Create the absolute_error boolean
+    error = True if data.error_type == "absolute" else False
+
+    # Solve the system of equations, the relaxation factor is used only by the SOR method and the ordering by the Gauss Seidel and SOR methods
+    iterations, x, error, message = sparse_object.solve(method, tol=data.tol, max_iter=data.max_iter, w=getattr(data, "omega", 1), order=data.order, absolute_error=error,
+                                                        table=table, ordering=data.ordering)
+
+    return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+
+
+def solve_sparse_spectral_radius_and_convergence(data: IterativeMatrixEquationSystemRequest, method: str) -> SpectralAndConvergenceResponse:
+    """
+    Calculate the spectral radius of the iteration matrix of the Jacobi, Gauss Seidel or SOR method for a request with a sparse matrix
+    and whether the method converges. The spectral radius is computed with float64 numbers, with at most 15 digits of precision.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+        method (str): Name of the method, jacobi, gauss_seidel or sor.
+
+    Returns:
+        SpectralAndConvergenceResponse: The response model.
+    """
+    sparse_object = SparseStationary(sparse_matrix(data.A), np.array(data.b), np.array(data.x_initial))
+
+    # Calculate the spectral radius and the convergence, the relaxation factor is used only by the SOR method
+    spectral_radius = sparse_object.spectral_radius(method, w=getattr(data, "omega", 1), ordering=data.ordering)
+    convergence = sparse_object.converges(spectral_radius)
+
+    return SpectralAndConvergenceResponse(spectral_radius=str(sp.Float(spectral_radius, min(data.precision, FLOAT64_MAX_PRECISION))), convergence=convergence)
+
+
+def solve_jacobi(data: IterativeMatrixEquationSystemRequest, table: IterationTable = None) -> IterativeMatrixEquationSystemResponse:
+    """
+    Solve the system of equations of the request with the Jacobi method, iterative or matrix.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        IterativeMatrixEquationSystemResponse: The response model.
+
+    Raises:
+        HTTPException: If the matrix of the method is not invertible.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    # Sparse matrices are solved with the sparse kernels
+    if isinstance(data.A, SparseMatrix):
+        return solve_sparse_stationary(data, "jacobi", table)
+
+    # Get the data from the request
+    A = np.array(data.A)
+    b = np.array(data.b)
+    x_initial = np.array(data.x_initial)
+
+    try:
+        # Create the object to solve the system of equations
+        jacobi_object = Jacobi(A, b, x_initial, precision=data.precision, engine=data.engine)
+
+        # Create the absolute_error boolean
+        error = True if data.error_type == "absolute" else False
+
+        # Solve the system of equations
+        solve = jacobi_object.iterative_solve if data.method_type == "iterative" else jacobi_object.matrix_solve
+        iterations, x, error, message = solve(tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error, table=table)
+    except sp.matrices.exceptions.NonInvertibleMatrixError:
+        raise HTTPException(status_code=500, detail="La matriz D no es invertible porque su determinante es 0. Verifique que la matriz A cumpla con las condiciones necesarias para aplicar el método de Jacobi.")
+
+    return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+
+
 @router.post('/jacobi/',
                 tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -135,10 +516,11 @@ def lu_factorization(request: Request, data: LUFactorizationRequest, auth: dict
                 response_model=IterativeMatrixEquationSystemResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def jacobi(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def jacobi(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Jacobi method.
     
@@ -152,39 +534,49 @@ def jacobi(request: Request, data: IterativeMatrixEquationSystemRequest, auth: d
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = np.array(data.A)
-        b = np.array(data.b)
-        x_initial = np.array(data.x_initial)
 
-        # Create the object to solve the system of equations
-        jacobi_object = Jacobi(A, b, x_initial, precision=data.precision)
-
-        # Create the absolute_error boolean
-        error = True if data.error_type == "absolute" else False
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_jacobi, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        # Solve the system of equations
-        if data.method_type == "iterative":
-            result = jacobi_object.iterative_solve(tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error)
-        else:
-            result = jacobi_object.matrix_solve(tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error)
-        iterations = result[0]
-        x = result[1]
-        error = result[2]
-        message = result[3]
-
-        return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+        return await run_job(solve_jacobi, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
         raise e
-    except sp.matrices.exceptions.NonInvertibleMatrixError:
-        raise HTTPException(status_code=500, detail="La matriz D no es invertible porque su determinante es 0. Verifique que la matriz A cumpla con las condiciones necesarias para aplicar el método de Jacobi.")
     except Exception as e:
         raise_exception(e, logger)
 
 
+def solve_jacobi_spectral_radius_and_convergence(data: IterativeMatrixEquationSystemRequest) -> SpectralAndConvergenceResponse:
+    """
+    Calculate the spectral radius of the iteration matrix of the Jacobi method for the system of the request and whether it converges.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+
+    Returns:
+        SpectralAndConvergenceResponse: The response model.
+    """
+    # Sparse matrices are solved with the sparse kernels
+    if isinstance(data.A, SparseMatrix):
+        return solve_sparse_spectral_radius_and_convergence(data, "jacobi")
+
+    # Get the data from the request
+    A = np.array(data.A)
+    b = np.array(data.b)
+    x_initial = np.array(data.x_initial)
+
+    # Create the object to solve the system of equations
+    jacobi_object = Jacobi(A, b, x_initial, precision=data.precision, engine=data.engine)
+
+    # Calculate the spectral radius and the convergence
+    spectral_radius = jacobi_object.get_t_spectral_radius()
+    convergence = jacobi_object.converges()
+
+    return SpectralAndConvergenceResponse(spectral_radius=spectral_radius, convergence=convergence)
+
+
 @router.post('/jacobi/spectral_radius_and_convergence/',
                 tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -192,10 +584,11 @@ def jacobi(request: Request, data: IterativeMatrixEquationSystemRequest, auth: d
                 response_model=SpectralAndConvergenceResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def jacobi_spectral_radius_and_convergence(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def jacobi_spectral_radius_and_convergence(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Get the spectral radius and the convergence of the Jacobi method.
     
@@ -209,20 +602,8 @@ def jacobi_spectral_radius_and_convergence(request: Request, data: IterativeMatr
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = np.array(data.A)
-        b = np.array(data.b)
-        x_initial = np.array(data.x_initial)
 
-        # Create the object to solve the system of equations
-        jacobi_object = Jacobi(A, b, x_initial, precision=data.precision)
-
-        # Calculate the spectral radius and the convergence
-        spectral_radius = jacobi_object.get_t_spectral_radius()
-        convergence = jacobi_object.converges()
-
-        return SpectralAndConvergenceResponse(spectral_radius=spectral_radius, convergence=convergence)
+        return await run_job(solve_jacobi_spectral_radius_and_convergence, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -231,6 +612,48 @@ def jacobi_spectral_radius_and_convergence(request: Request, data: IterativeMatr
         raise_exception(e, logger)
     
 
+def solve_gauss_seidel(data: IterativeMatrixEquationSystemRequest, table: IterationTable = None) -> IterativeMatrixEquationSystemResponse:
+    """
+    Solve the system of equations of the request with the Gauss Seidel method, iterative or matrix.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        IterativeMatrixEquationSystemResponse: The response model.
+
+    Raises:
+        HTTPException: If the matrix of the method is not invertible.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    # Sparse matrices and the multicolor ordering are solved with the sparse kernels
+    if uses_sparse_kernels(data):
+        return solve_sparse_stationary(data, "gauss_seidel", table)
+
+    # Get the data from the request
+    A = sp.Matrix(data.A)
+    b = sp.Matrix(data.b)
+    x_initial = sp.Matrix(data.x_initial)
+
+    try:
+        # Create the object to solve the system of equations
+        gauss_seidel_object = GaussSeidel(A, b, x_initial, precision=data.precision, engine=data.engine)
+
+        # Create the absolute_error boolean
+        error = True if data.error_type == "absolute" else False
+
+        # Solve the system of equations
+        solve = gauss_seidel_object.iterative_solve if data.method_type == "iterative" else gauss_seidel_object.matrix_solve
+        iterations, x, error, message = solve(tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error, table=table)
+    except sp.matrices.exceptions.NonInvertibleMatrixError:
+        raise HTTPException(status_code=500, detail="La matriz D - L no es invertible porque su determinante es 0. Verifique que la matriz A cumpla con las condiciones necesarias para aplicar el método de Gauss Seidel.")
+
+    return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+
+
 @router.post('/gauss_seidel/',
                 tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -238,10 +661,11 @@ def jacobi_spectral_radius_and_convergence(request: Request, data: IterativeMatr
                 response_model=IterativeMatrixEquationSystemResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def gauss_seidel(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def gauss_seidel(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Gauss Seidel method.
     
@@ -255,39 +679,49 @@ def gauss_seidel(request: Request, data: IterativeMatrixEquationSystemRequest, a
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = sp.Matrix(data.A)
-        b = sp.Matrix(data.b)
-        x_initial = sp.Matrix(data.x_initial)
 
-        # Create the object to solve the system of equations
-        gauss_seidel_object = GaussSeidel(A, b, x_initial, precision=data.precision)
-
-        # Create the absolute_error boolean
-        error = True if data.error_type == "absolute" else False
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_gauss_seidel, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        # Solve the system of equations
-        if data.method_type == "iterative":
-            result = gauss_seidel_object.iterative_solve(tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error)
-        else:
-            result = gauss_seidel_object.matrix_solve(tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error)
-        iterations = result[0]
-        x = result[1]
-        error = result[2]
-        message = result[3]
-
-        return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+        return await run_job(solve_gauss_seidel, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
         raise e
-    except sp.matrices.exceptions.NonInvertibleMatrixError:
-        raise HTTPException(status_code=500, detail="La matriz D - L no es invertible porque su determinante es 0. Verifique que la matriz A cumpla con las condiciones necesarias para aplicar el método de Gauss Seidel.")
     except Exception as e:
         raise_exception(e, logger)
 
 
+def solve_gauss_seidel_spectral_radius_and_convergence(data: IterativeMatrixEquationSystemRequest) -> SpectralAndConvergenceResponse:
+    """
+    Calculate the spectral radius of the iteration matrix of the Gauss Seidel method for the system of the request and whether it converges.
+
+    Args:
+        data (IterativeMatrixEquationSystemRequest): The request data.
+
+    Returns:
+        SpectralAndConvergenceResponse: The response model.
+    """
+    # Sparse matrices and the multicolor ordering are solved with the sparse kernels
+    if uses_sparse_kernels(data):
+        return solve_sparse_spectral_radius_and_convergence(data, "gauss_seidel")
+
+    # Get the data from the request
+    A = sp.Matrix(data.A)
+    b = sp.Matrix(data.b)
+    x_initial = sp.Matrix(data.x_initial)
+
+    # Create the object to solve the system of equations
+    gauss_seidel_object = GaussSeidel(A, b, x_initial, precision=data.precision, engine=data.engine)
+
+    # Calculate the spectral radius and the convergence
+    spectral_radius = gauss_seidel_object.get_t_spectral_radius()
+    convergence = gauss_seidel_object.converges()
+
+    return SpectralAndConvergenceResponse(spectral_radius=spectral_radius, convergence=convergence)
+
+
 @router.post('/gauss_seidel/spectral_radius_and_convergence/',
                 tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -295,10 +729,11 @@ def gauss_seidel(request: Request, data: IterativeMatrixEquationSystemRequest, a
                 response_model=SpectralAndConvergenceResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def gauss_seidel_spectral_radius_and_convergence(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def gauss_seidel_spectral_radius_and_convergence(request: Request, data: IterativeMatrixEquationSystemRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Get the spectral radius and the convergence of the Gauss Seidel method.
     
@@ -312,20 +747,8 @@ def gauss_seidel_spectral_radius_and_convergence(request: Request, data: Iterati
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = sp.Matrix(data.A)
-        b = sp.Matrix(data.b)
-        x_initial = sp.Matrix(data.x_initial)
 
-        # Create the object to solve the system of equations
-        gauss_seidel_object = GaussSeidel(A, b, x_initial, precision=data.precision)
-
-        # Calculate the spectral radius and the convergence
-        spectral_radius = gauss_seidel_object.get_t_spectral_radius()
-        convergence = gauss_seidel_object.converges()
-
-        return SpectralAndConvergenceResponse(spectral_radius=spectral_radius, convergence=convergence)
+        return await run_job(solve_gauss_seidel_spectral_radius_and_convergence, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -334,6 +757,48 @@ def gauss_seidel_spectral_radius_and_convergence(request: Request, data: Iterati
         raise_exception(e, logger)
 
 
+def solve_sor(data: SorRequest, table: IterationTable = None) -> IterativeMatrixEquationSystemResponse:
+    """
+    Solve the system of equations of the request with the SOR method, iterative or matrix.
+
+    Args:
+        data (SorRequest): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        IterativeMatrixEquationSystemResponse: The response model.
+
+    Raises:
+        HTTPException: If the matrix of the method is not invertible.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    # Sparse matrices and the multicolor ordering are solved with the sparse kernels
+    if uses_sparse_kernels(data):
+        return solve_sparse_stationary(data, "sor", table)
+
+    # Get the data from the request
+    A = sp.Matrix(data.A)
+    b = sp.Matrix(data.b)
+    x_initial = sp.Matrix(data.x_initial)
+
+    try:
+        # Create the object to solve the system of equations
+        sor_object = Sor(A, b, x_initial, precision=data.precision, engine=data.engine)
+
+        # Create the absolute_error boolean
+        error = True if data.error_type == "absolute" else False
+
+        # Solve the system of equations
+        solve = sor_object.iterative_solve if data.method_type == "iterative" else sor_object.matrix_solve
+        iterations, x, error, message = solve(w=data.omega, tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error, table=table)
+    except sp.matrices.exceptions.NonInvertibleMatrixError:
+        raise HTTPException(status_code=500, detail="La matriz D - wL no es invertible porque su determinante es 0. Verifique que la matriz A y w cumplan con las condiciones necesarias para aplicar el método de SOR.")
+
+    return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+
+
 @router.post('/sor/',
                 tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -341,10 +806,11 @@ def gauss_seidel_spectral_radius_and_convergence(request: Request, data: Iterati
                 response_model=IterativeMatrixEquationSystemResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def sor(request: Request, data: SorRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def sor(request: Request, data: SorRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     SOR method.
     
@@ -358,39 +824,49 @@ def sor(request: Request, data: SorRequest, auth: dict = Depends(auth_handler.au
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = sp.Matrix(data.A)
-        b = sp.Matrix(data.b)
-        x_initial = sp.Matrix(data.x_initial)
 
-        # Create the object to solve the system of equations
-        sor_object = Sor(A, b, x_initial, precision=data.precision)
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_sor, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        # Create the absolute_error boolean
-        error = True if data.error_type == "absolute" else False
-
-        # Solve the system of equations
-        if data.method_type == "iterative":
-            result = sor_object.iterative_solve(w=data.omega, tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error)
-        else:
-            result = sor_object.matrix_solve(w=data.omega, tol=data.tol, max_iter=data.max_iter, order=data.order, absolute_error=error)
-        iterations = result[0]
-        x = result[1]
-        error = result[2]
-        message = result[3]
-
-        return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+        return await run_job(solve_sor, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
         raise e
-    except sp.matrices.exceptions.NonInvertibleMatrixError:
-        raise HTTPException(status_code=500, detail="La matriz D - wL no es invertible porque su determinante es 0. Verifique que la matriz A y w cumplan con las condiciones necesarias para aplicar el método de SOR.")
     except Exception as e:
         raise_exception(e, logger)
 
 
+def solve_sor_spectral_radius_and_convergence(data: SorRequest) -> SpectralAndConvergenceResponse:
+    """
+    Calculate the spectral radius of the iteration matrix of the SOR method for the system of the request and whether it converges.
+
+    Args:
+        data (SorRequest): The request data.
+
+    Returns:
+        SpectralAndConvergenceResponse: The response model.
+    """
+    # Sparse matrices and the multicolor ordering are solved with the sparse kernels
+    if uses_sparse_kernels(data):
+        return solve_sparse_spectral_radius_and_convergence(data, "sor")
+
+    # Get the data from the request
+    A = sp.Matrix(data.A)
+    b = sp.Matrix(data.b)
+    x_initial = sp.Matrix(data.x_initial)
+
+    # Create the object to solve the system of equations
+    sor_object = Sor(A, b, x_initial, precision=data.precision, engine=data.engine)
+
+    # Calculate the spectral radius and the convergence
+    spectral_radius = sor_object.get_t_spectral_radius(w=data.omega)
+    convergence = sor_object.converges(w=data.omega)
+
+    return SpectralAndConvergenceResponse(spectral_radius=spectral_radius, convergence=convergence)
+
+
 @router.post('/sor/spectral_radius_and_convergence/',
                 tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -398,10 +874,11 @@ def sor(request: Request, data: SorRequest, auth: dict = Depends(auth_handler.au
                 response_model=SpectralAndConvergenceResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def sor_spectral_radius_and_convergence(request: Request, data: SorRequest, auth: dict = Depends(auth_handler.authenticate)):
+async def sor_spectral_radius_and_convergence(request: Request, data: SorRequest, auth: dict = Depends(auth_handler.authenticate)):
     """
     Get the spectral radius and the convergence of the SOR method.
     
@@ -415,21 +892,346 @@ def sor_spectral_radius_and_convergence(request: Request, data: SorRequest, auth
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        # Get the data from the request
-        A = sp.Matrix(data.A)
-        b = sp.Matrix(data.b)
-        x_initial = sp.Matrix(data.x_initial)
-        w = data.omega
 
-        # Create the object to solve the system of equations
-        sor_object = Sor(A, b, x_initial, precision=data.precision)
+        return await run_job(solve_sor_spectral_radius_and_convergence, data)
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def relaxation_factors(data: SorRelaxationRequest) -> np.ndarray:
+    """
+    Get the relaxation factors to compare of a request, the list of factors or the equally spaced factors of the range.
+
+    Args:
+        data (SorRelaxationRequest): The request data.
+
+    Returns:
+        np.ndarray: The relaxation factors.
+    """
+    if data.w_values is not None:
+        return np.array(data.w_values, dtype=float)
+
+    if data.w_min >= data.w_max:
+        raise ValueError("El factor de relajación mínimo debe ser menor al máximo")
+    return np.linspace(data.w_min, data.w_max, data.points)
+
+
+def sor_relaxation_object(data: SorRelaxationRequest) -> SorRelaxation:
+    """
+    Create the object to search the optimal relaxation factor of the SOR method for the dense or sparse matrix of a request.
+
+    Args:
+        data (SorRelaxationRequest): The request data.
+
+    Returns:
+        SorRelaxation: The object to compute the spectral radii.
+    """
+    return SorRelaxation(to_csr(data.A) if isinstance(data.A, SparseMatrix) else np.array(data.A, dtype=float))
+
+
+def solve_sor_spectral_radii(data: SorRelaxationRequest, omegas: np.ndarray) -> list:
+    """
+    Calculate the spectral radius of the iteration matrix of the SOR method for some of the relaxation factors of a request, so the
+    factors can be split between the workers.
+
+    Args:
+        data (SorRelaxationRequest): The request data.
+        omegas (np.ndarray): The relaxation factors.
+
+    Returns:
+        list: The spectral radius of every relaxation factor.
+    """
+    return sor_relaxation_object(data).spectral_radii(omegas.tolist())
+
+
+def solve_sor_relaxation(data: SorRelaxationRequest, spectral_radii: list = None) -> SorRelaxationResponse:
+    """
+    Search the relaxation factor of the SOR method with the smallest spectral radius of its iteration matrix and estimate the number of
+    iterations for every relaxation factor of a request.
+
+    Args:
+        data (SorRelaxationRequest): The request data.
+        spectral_radii (list): The spectral radius of every relaxation factor, computed here if it is None.
+
+    Returns:
+        SorRelaxationResponse: The response model.
+    """
+    omegas = relaxation_factors(data)
+    relaxation_object = sor_relaxation_object(data)
+    if spectral_radii is None:
+        spectral_radii = relaxation_object.spectral_radii(omegas.tolist())
+
+    # The theorem of Young gives the exact optimum, otherwise the best of the compared factors is taken
+    optimal_w = relaxation_object.optimal_omega()
+    analytic = optimal_w is not None
+    if analytic:
+        optimal_spectral_radius = optimal_w - 1
+    else:
+        k = int(np.argmin(spectral_radii))
+        optimal_w, optimal_spectral_radius = float(omegas[k]), spectral_radii[k]
+
+    precision = min(data.precision, FLOAT64_MAX_PRECISION)
+
+    def format_number(value: float) -> str:
+        return str(sp.Float(value, precision))
+
+    # The convergence rate is the number of correct digits gained per iteration, infinite when the method ends in one iteration
+    convergence_rate = [format_number(-np.log10(p)) if p > 0 else "oo" for p in spectral_radii]
+    expected = expected_iterations(optimal_spectral_radius, data.tol)
+
+    if optimal_spectral_radius < 1:
+        message = f"El factor de relajación óptimo es {format_number(optimal_w)}, con radio espectral {format_number(optimal_spectral_radius)} el método converge en aproximadamente {expected} iteraciones"
+    else:
+        message = "El método no converge con ninguno de los factores de relajación, el radio espectral de T es mayor o igual a 1"
+
+    return SorRelaxationResponse(w=[format_number(w) for w in omegas], spectral_radius=[format_number(p) for p in spectral_radii],
+                                 convergence_rate=convergence_rate, iterations=[expected_iterations(p, data.tol) for p in spectral_radii],
+                                 optimal_w=format_number(optimal_w), optimal_spectral_radius=format_number(optimal_spectral_radius),
+                                 expected_iterations=expected, analytic=analytic, message=message)
+
+
+@router.post('/sor/optimal_w/',
+                tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Optimal relaxation factor of the SOR method",
+                response_model=SorRelaxationResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def sor_optimal_w(request: Request, data: SorRelaxationRequest, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Search the optimal relaxation factor of the SOR method.
+
+    This endpoint calculates the spectral radius of the iteration matrix of the SOR method for every relaxation factor of a range or a list,
+    split between the workers, and returns the factor with the smallest spectral radius, the convergence rate and the estimated number of
+    iterations for the tolerance.
+
+    Arguments:
+    data: SorRelaxationRequest: JSON with the matrix of coefficients, the range or list of relaxation factors, the tolerance, and the precision.
+
+    Returns:
+    SorRelaxationResponse: JSON with the spectral radii, the convergence rates, the estimated iterations and the optimal relaxation factor.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
+
+        # Every worker computes the spectral radii of a chunk of the relaxation factors
+        omegas = relaxation_factors(data)
+        chunks = np.array_split(omegas, min(MAX_WORKERS, len(omegas)))
+        results = await asyncio.gather(*(run_job(solve_sor_spectral_radii, data, chunk) for chunk in chunks))
+
+        return await run_job(solve_sor_relaxation, data, [p for result in results for p in result])
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_conjugate_gradient(data: ConjugateGradientRequest, table: IterationTable = None) -> IterativeMatrixEquationSystemResponse:
+    """
+    Solve the system of equations of a request with a symmetric positive definite matrix with the preconditioned conjugate gradient
+    method.
+
+    Args:
+        data (ConjugateGradientRequest): The request data.
+        table (IterationTable): The table of iterations, a streaming table sends every row as soon as it is computed.
+
+    Returns:
+        IterativeMatrixEquationSystemResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    A = to_csr(data.A) if isinstance(data.A, SparseMatrix) else np.array(data.A, dtype=float)
+    conjugate_gradient_object = ConjugateGradient(A, np.array(data.b), np.array(data.x_initial))
+
+    # Create the absolute_error boolean
+    error = True if data.error_type == "absolute" else False
+
+    # Solve the system of equations
+    iterations, x, error, message = conjugate_gradient_object.solve(tol=data.tol, max_iter=data.max_iter, preconditioner=data.preconditioner, w=data.omega,
+                                                                    absolute_error=error, order=data.order, table=table)
+
+    return IterativeMatrixEquationSystemResponse(iterations=iterations, x=x, error=error, message=message)
+
+
+@router.post('/conjugate_gradient/',
+                tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Preconditioned conjugate gradient method",
+                response_model=IterativeMatrixEquationSystemResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def conjugate_gradient(request: Request, data: ConjugateGradientRequest, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Preconditioned conjugate gradient method.
+
+    This endpoint solves a system of linear equations with a symmetric positive definite matrix using the conjugate gradient method with
+    a Jacobi, SSOR or incomplete Cholesky preconditioner.
+
+    Arguments:
+    data: ConjugateGradientRequest: JSON with the matrix of coefficients, the vector of solutions, the initial guess, the preconditioner, and the tolerance.
+
+    Returns:
+    IterativeMatrixEquationSystemResponse: JSON with the solutions of the system of equations, the vectorial errors, and the absolute error.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
+
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_conjugate_gradient, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
+
+        return await run_job(solve_conjugate_gradient, data)
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_krylov(data: KrylovRequest, method: str, table: IterationTable = None) -> KrylovResponse:
+    """
+    Solve the system of equations of a request with the GMRES or BiCGSTAB method.
+
+    Args:
+        data (KrylovRequest): The request data.
+        method (str): Name of the method, gmres or bicgstab.
+        table (IterationTable): The table of iterations, a streaming table sends every row as soon as it is computed.
+
+    Returns:
+        KrylovResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    A = to_csr(data.A) if isinstance(data.A, SparseMatrix) else np.array(data.A, dtype=float)
+    krylov_object = Krylov(A, np.array(data.b), np.array(data.x_initial))
+
+    # Create the absolute_error boolean
+    error = True if data.error_type == "absolute" else False
+
+    # Solve the system of equations, the restarts are used only by the GMRES method
+    iterations, x, residual, message = krylov_object.solve(method, tol=data.tol, max_iter=data.max_iter, restart=data.restart, preconditioner=data.preconditioner,
+                                                           absolute_error=error, table=table)
+
+    return KrylovResponse(iterations=iterations, x=x, residual=residual, message=message)
+
+
+def solve_gmres(data: KrylovRequest, table: IterationTable = None) -> KrylovResponse:
+    """
+    Solve the system of equations of a request with the restarted GMRES method.
+
+    Args:
+        data (KrylovRequest): The request data.
+        table (IterationTable): The table of iterations.
+
+    Returns:
+        KrylovResponse: The response model.
+    """
+    return solve_krylov(data, "gmres", table)
+
+
+def solve_bicgstab(data: KrylovRequest, table: IterationTable = None) -> KrylovResponse:
+    """
+    Solve the system of equations of a request with the BiCGSTAB method.
+
+    Args:
+        data (KrylovRequest): The request data.
+        table (IterationTable): The table of iterations.
+
+    Returns:
+        KrylovResponse: The response model.
+    """
+    return solve_krylov(data, "bicgstab", table)
+
+
+@router.post('/gmres/',
+                tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="GMRES method",
+                response_model=KrylovResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def gmres(request: Request, data: KrylovRequest, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Restarted GMRES method.
+
+    This endpoint solves a general system of linear equations, also nonsymmetric or indefinite, using the GMRES method restarted every
+    restart iterations, optionally preconditioned with the incomplete LU factorization.
+
+    Arguments:
+    data: KrylovRequest: JSON with the matrix of coefficients, the vector of solutions, the initial guess, the restart, the preconditioner, and the tolerance.
+
+    Returns:
+    KrylovResponse: JSON with the solutions of the system of equations and the norm of the residual of every iteration.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
+
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_gmres, data, KRYLOV_TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
+
+        return await run_job(solve_gmres, data)
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+@router.post('/bicgstab/',
+                tags=["Linear Equations System", "Matrix and Iterative", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="BiCGSTAB method",
+                response_model=KrylovResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def bicgstab(request: Request, data: KrylovRequest, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    BiCGSTAB method.
+
+    This endpoint solves a general system of linear equations, also nonsymmetric, using the BiCGSTAB method, optionally preconditioned
+    with the incomplete LU factorization.
+
+    Arguments:
+    data: KrylovRequest: JSON with the matrix of coefficients, the vector of solutions, the initial guess, the preconditioner, and the tolerance.
+
+    Returns:
+    KrylovResponse: JSON with the solutions of the system of equations and the norm of the residual of every iteration.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        # Calculate the spectral radius and the convergence
-        spectral_radius = sor_object.get_t_spectral_radius(w=data.omega)
-        convergence = sor_object.converges(w=data.omega)
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_bicgstab, data, KRYLOV_TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        return SpectralAndConvergenceResponse(spectral_radius=spectral_radius, convergence=convergence)
+        return await run_job(solve_bicgstab, data)
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
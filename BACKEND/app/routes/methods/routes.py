@@ -4,14 +4,49 @@ from sqlalchemy.orm import Session
 
 # Configuration, models, methods and authentication modules imports
 from app.config.limiter import limiter
-from app.models.models import ResponseError, NumericalMethodResponse, BisectionFalseRuleModel, FixedPointModel, NewtonRaphsonModel, SecantModel, FirstNewtonModified, SecondNewtonModified
+from app.models.models import ResponseError, NumericalMethodResponse, BisectionFalseRuleModel, BrentModel, FixedPointModel, FixedPointResponse, NewtonRaphsonModel, SecantModel, FirstNewtonModified, SecondNewtonModified, MultiStartResponse, BisectionMultiStartModel, NewtonRaphsonMultiStartModel, SecantMultiStartModel, RootsScanModel, RootsScanResponse, PolynomialRootsModel, PolynomialRootsResponse
 from app.auth.auth import auth_handler
 from app.utils.utils import raise_exception, parse_expression
-from app.domain.methods import bisection as bisection_method, false_rule as false_rule_method, fixed_point as fixed_point_method, newton_raphson as newton_raphson_method, secant as secant_method, first_modified_newton_method as first_modified_newton_method, second_modified_newton_method as second_modified_newton_method
+from app.utils.tables import IterationTable, create_table
+from app.domain.methods import bisection as bisection_method, false_rule as false_rule_method, fixed_point as fixed_point_method, newton_raphson as newton_raphson_method, secant as secant_method, first_modified_newton_method as first_modified_newton_method, second_modified_newton_method as second_modified_newton_method, brent as brent_method, illinois as illinois_method
+from app.domain.multi_start import bisection_multi_start, newton_raphson_multi_start, secant_multi_start
+from app.domain.roots_scan import roots_scan as roots_scan_method
+from app.domain.polynomial_roots import polynomial_roots as polynomial_roots_method
+from app.utils.workers import run_job, stream_job
 from app.routes.routes import logger
 
 router = APIRouter()
 
+# Names of the columns of the table and of the result sent in the last event of a streaming response
+TABLE_COLUMNS = ["Iterations", "Xn", "Fx", "Error"]
+RESULT_COLUMNS = ["Message"]
+FIXED_POINT_RESULT_COLUMNS = ["Message", "Order"]
+
+
+def solve_bisection(data: BisectionFalseRuleModel, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the Bisection method.
+
+    Args:
+        data (BisectionFalseRuleModel): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message = bisection_method(function, variable, data.initial, data.final, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, compiled=data.compiled, table=table)
+
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
 @router.post('/bisection/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -19,10 +54,11 @@ router = APIRouter()
                 response_model=NumericalMethodResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def bisection(request: Request, data: BisectionFalseRuleModel, auth: dict = Depends(auth_handler.authenticate)):
+async def bisection(request: Request, data: BisectionFalseRuleModel, auth: dict = Depends(auth_handler.authenticate)):
     """
     Bisection method route.
 
@@ -42,16 +78,15 @@ def bisection(request: Request, data: BisectionFalseRuleModel, auth: dict = Depe
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
-
-        absolute_error = True if data.error_type == "absolute" else False
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_bisection, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        iterations, x, fx, error, message = bisection_method(function, variable, data.initial, data.final, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision)
+        response = await run_job(solve_bisection, data)
 
-        logger.info(f"Request successful: {message}")
+        logger.info(f"Request successful: {response.Message}")
 
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -60,6 +95,30 @@ def bisection(request: Request, data: BisectionFalseRuleModel, auth: dict = Depe
         raise_exception(e, logger)
 
 
+def solve_false_rule(data: BisectionFalseRuleModel, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the False Rule method.
+
+    Args:
+        data (BisectionFalseRuleModel): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message = false_rule_method(function, variable, data.initial, data.final, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, compiled=data.compiled, table=table)
+
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
 @router.post('/false_rule/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -67,10 +126,11 @@ def bisection(request: Request, data: BisectionFalseRuleModel, auth: dict = Depe
                 response_model=NumericalMethodResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def false_rule(request: Request, data: BisectionFalseRuleModel, auth: dict = Depends(auth_handler.authenticate)):
+async def false_rule(request: Request, data: BisectionFalseRuleModel, auth: dict = Depends(auth_handler.authenticate)):
     """
     False Rule method route.
 
@@ -90,16 +150,89 @@ def false_rule(request: Request, data: BisectionFalseRuleModel, auth: dict = Dep
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_false_rule, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
+
+        response = await run_job(solve_false_rule, data)
+
+        logger.info(f"Request successful: {response.Message}")
+
+        return response
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+def solve_brent(data: BrentModel, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the Brent or the Illinois method.
+
+    Args:
+        data (BrentModel): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
 
-        absolute_error = True if data.error_type == "absolute" else False
+    method = brent_method if data.method == "brent" else illinois_method
 
-        iterations, x, fx, error, message = false_rule_method(function, variable, data.initial, data.final, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision)
+    iterations, x, fx, error, message = method(function, variable, data.initial, data.final, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, compiled=data.compiled, table=table)
 
-        logger.info(f"Request successful: {message}")
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
 
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+@router.post('/brent/',
+                tags=["Numerical Methods", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Brent and Illinois methods",
+                response_model=NumericalMethodResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def brent(request: Request, data: BrentModel, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Brent and Illinois methods route.
+
+    This route is used to calculate the roots of a mathematical expression using Brent's method or the Illinois method. Both of them
+    keep a bracket with a sign change like the Bisection and False Rule methods, but need less evaluations of the function.
+
+    Args:
+        request (Request): The request object.
+        data (BrentModel): The Brent model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        NumericalMethodResponse: The response model. Table with iterations, xn, f(xn) and error.
+
+    Raises:
+        HTTPException: If an error occurs during the method.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
+
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_brent, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
+
+        response = await run_job(solve_brent, data)
+
+        logger.info(f"Request successful: {response.Message}")
+
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -107,21 +240,50 @@ def false_rule(request: Request, data: BisectionFalseRuleModel, auth: dict = Dep
     except Exception as e:
         raise_exception(e, logger)
 
+
+def solve_fixed_point(data: FixedPointModel, table: IterationTable = None) -> FixedPointResponse:
+    """
+    Find a root of the expression of the request with the Fixed Point method.
+
+    Args:
+        data (FixedPointModel): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        FixedPointResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    function_g = parse_expression(data.g_expression, logger, variable_character=variable.name)[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message, order = fixed_point_method(function, variable, function_g, data.initial, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, compiled=data.compiled, acceleration=data.acceleration, table=table)
+
+    return FixedPointResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message, Order=order)
+
+
 @router.post('/fixed_point/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
                 summary="Fixed Point method",
-                response_model=NumericalMethodResponse,
+                response_model=FixedPointResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 }) 
 @limiter.limit("15/minute")
-def fixed_point(request: Request, data: FixedPointModel, auth: dict = Depends(auth_handler.authenticate)):
+async def fixed_point(request: Request, data: FixedPointModel, auth: dict = Depends(auth_handler.authenticate)):
     """
     Fixed Point method route.
 
-    This route is used to calculate the roots of a mathematical expression using the Fixed Point method.
+    This route is used to calculate the roots of a mathematical expression using the Fixed Point method, optionally accelerated with
+    Aitken's extrapolation or Steffensen's method.
 
     Args:
         request (Request): The request object.
@@ -129,7 +291,7 @@ def fixed_point(request: Request, data: FixedPointModel, auth: dict = Depends(au
         auth (dict): The authentication dictionary.
 
     Returns:
-        NumericalMethodResponse: The response model. Table with iterations, xn, f(xn) and error.
+        FixedPointResponse: The response model. Table with iterations, xn, f(xn) and error, and the observed order of convergence.
 
     Raises:
         HTTPException: If an error occurs during the method.
@@ -137,18 +299,15 @@ def fixed_point(request: Request, data: FixedPointModel, auth: dict = Depends(au
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
-
-        function_g = parse_expression(data.g_expression, logger, variable_character=variable.name)[0]
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_fixed_point, data, TABLE_COLUMNS, FIXED_POINT_RESULT_COLUMNS, data.stream)
 
-        absolute_error = True if data.error_type == "absolute" else False
+        response = await run_job(solve_fixed_point, data)
 
-        iterations, x, fx, error, message = fixed_point_method(function, variable, function_g, data.initial, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision)
+        logger.info(f"Request successful: {response.Message}")
 
-        logger.info(f"Request successful: {message}")
-
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -157,6 +316,35 @@ def fixed_point(request: Request, data: FixedPointModel, auth: dict = Depends(au
         raise_exception(e, logger)
 
 
+def solve_newton_raphson(data: NewtonRaphsonModel, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the Newton Raphson method.
+
+    Args:
+        data (NewtonRaphsonModel): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    if data.derivative_expression is not None:
+        derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
+    else:
+        derivative = None
+
+    iterations, x, fx, error, message = newton_raphson_method(function, variable, data.initial, derivative=derivative, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, compiled=data.compiled, automatic_differentiation=data.automatic_differentiation, table=table)
+
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
 @router.post('/newton_raphson/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -164,10 +352,11 @@ def fixed_point(request: Request, data: FixedPointModel, auth: dict = Depends(au
                 response_model=NumericalMethodResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def newton_raphson(request: Request, data: NewtonRaphsonModel, auth: dict = Depends(auth_handler.authenticate)):
+async def newton_raphson(request: Request, data: NewtonRaphsonModel, auth: dict = Depends(auth_handler.authenticate)):
     """
     Newton Raphson method route.
 
@@ -187,21 +376,15 @@ def newton_raphson(request: Request, data: NewtonRaphsonModel, auth: dict = Depe
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
-
-        if data.derivative_expression is not None:
-            derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
-        else:
-            derivative = None
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_newton_raphson, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        absolute_error = True if data.error_type == "absolute" else False
+        response = await run_job(solve_newton_raphson, data)
 
-        iterations, x, fx, error, message = newton_raphson_method(function, variable, data.initial, derivative=derivative, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision)
+        logger.info(f"Request successful: {response.Message}")
 
-        logger.info(f"Request successful: {message}")
-
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -210,6 +393,30 @@ def newton_raphson(request: Request, data: NewtonRaphsonModel, auth: dict = Depe
         raise_exception(e, logger)
 
 
+def solve_secant(data: SecantModel, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the Secant method.
+
+    Args:
+        data (SecantModel): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message = secant_method(function, variable, data.initial, data.second_initial, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, compiled=data.compiled, table=table)
+
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
 @router.post('/secant/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -217,10 +424,11 @@ def newton_raphson(request: Request, data: NewtonRaphsonModel, auth: dict = Depe
                 response_model=NumericalMethodResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def secant(request: Request, data: SecantModel, auth: dict = Depends(auth_handler.authenticate)):
+async def secant(request: Request, data: SecantModel, auth: dict = Depends(auth_handler.authenticate)):
     """
     Secant method route.
 
@@ -240,16 +448,15 @@ def secant(request: Request, data: SecantModel, auth: dict = Depends(auth_handle
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
-
-        absolute_error = True if data.error_type == "absolute" else False
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_secant, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        iterations, x, fx, error, message = secant_method(function, variable, data.initial, data.second_initial, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision)
+        response = await run_job(solve_secant, data)
 
-        logger.info(f"Request successful: {message}")
+        logger.info(f"Request successful: {response.Message}")
 
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -257,6 +464,35 @@ def secant(request: Request, data: SecantModel, auth: dict = Depends(auth_handle
     except Exception as e:
         raise_exception(e, logger)
 
+def solve_first_modified_newton(data: FirstNewtonModified, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the First Modified Newton method.
+
+    Args:
+        data (FirstNewtonModified): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    if data.derivative_expression is not None:
+        derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
+    else:
+        derivative = None
+
+    iterations, x, fx, error, message = first_modified_newton_method(function, variable, data.initial, multiplicity=data.multiplicity, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, derivative=derivative, compiled=data.compiled, automatic_differentiation=data.automatic_differentiation, table=table)
+
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
 @router.post('/first_modified_newton_method/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -264,10 +500,11 @@ def secant(request: Request, data: SecantModel, auth: dict = Depends(auth_handle
                 response_model=NumericalMethodResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def first_modified_newton(request: Request, data: FirstNewtonModified, auth: dict = Depends(auth_handler.authenticate)):
+async def first_modified_newton(request: Request, data: FirstNewtonModified, auth: dict = Depends(auth_handler.authenticate)):
     """
     First Modified Newton method route.
 
@@ -287,21 +524,15 @@ def first_modified_newton(request: Request, data: FirstNewtonModified, auth: dic
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
-
-        absolute_error = True if data.error_type == "absolute" else False
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_first_modified_newton, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
 
-        if data.derivative_expression is not None:
-            derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
-        else:
-            derivative = None
+        response = await run_job(solve_first_modified_newton, data)
 
-        iterations, x, fx, error, message = first_modified_newton_method(function, variable, data.initial, multiplicity=data.multiplicity, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, derivative=derivative)
+        logger.info(f"Request successful: {response.Message}")
 
-        logger.info(f"Request successful: {message}")
-
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
@@ -310,6 +541,40 @@ def first_modified_newton(request: Request, data: FirstNewtonModified, auth: dic
         raise_exception(e, logger) 
 
 
+def solve_second_modified_newton(data: SecondNewtonModified, table: IterationTable = None) -> NumericalMethodResponse:
+    """
+    Find a root of the expression of the request with the Second Modified Newton method.
+
+    Args:
+        data (SecondNewtonModified): The request data.
+        table (IterationTable): The table of iterations, by default the one of the trace requested by the client.
+
+    Returns:
+        NumericalMethodResponse: The response model.
+    """
+    if table is None:
+        table = create_table(data.trace, data.trace_size)
+
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    if data.derivative_expression is not None:
+        derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
+    else:
+        derivative = None
+
+    if data.second_derivative_expression is not None:
+        second_derivative = parse_expression(data.second_derivative_expression, logger, variable_character=variable.name)[0]
+    else:
+        second_derivative = None
+
+    iterations, x, fx, error, message = second_modified_newton_method(function, variable, data.initial, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, derivative=derivative, second_derivative=second_derivative, compiled=data.compiled, automatic_differentiation=data.automatic_differentiation, table=table)
+
+    return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
 @router.post('/second_modified_newton_method/',
                 tags=["Numerical Methods", "Protected"],
                 status_code=status.HTTP_200_OK,
@@ -317,10 +582,11 @@ def first_modified_newton(request: Request, data: FirstNewtonModified, auth: dic
                 response_model=NumericalMethodResponse,
                 responses={
                     500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
                     429: {"model": ResponseError, "description": "Too many requests."}
                 })
 @limiter.limit("15/minute")
-def second_modified_newton(request: Request, data: SecondNewtonModified, auth: dict = Depends(auth_handler.authenticate)):
+async def second_modified_newton(request: Request, data: SecondNewtonModified, auth: dict = Depends(auth_handler.authenticate)):
     """
     Second Modified Newton method route.
 
@@ -339,27 +605,342 @@ def second_modified_newton(request: Request, data: SecondNewtonModified, auth: d
     """
     try:
         logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
-        
-        function, variables = parse_expression(data.expression, logger)
-        variable = variables[0]
 
-        absolute_error = True if data.error_type == "absolute" else False
+        # Stream the rows of the table as they are computed
+        if data.stream is not None:
+            return await stream_job(solve_second_modified_newton, data, TABLE_COLUMNS, RESULT_COLUMNS, data.stream)
+
+        response = await run_job(solve_second_modified_newton, data)
+
+        logger.info(f"Request successful: {response.Message}")
+
+        return response
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_bisection_multi_start(data: BisectionMultiStartModel) -> MultiStartResponse:
+    """
+    Find the roots of the expression of the request with the Bisection method over many intervals.
+
+    Args:
+        data (BisectionMultiStartModel): The request data.
+
+    Returns:
+        MultiStartResponse: The response model.
+    """
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message = bisection_multi_start(function, variable, data.initials, data.finals, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error)
+
+    return MultiStartResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
 
-        if data.derivative_expression is not None:
-            derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
-        else:
-            derivative = None
 
-        if data.second_derivative_expression is not None:
-            second_derivative = parse_expression(data.second_derivative_expression, logger, variable_character=variable.name)[0]
-        else:
-            second_derivative = None
+@router.post('/bisection/batch/',
+                tags=["Numerical Methods", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Multi-start Bisection method",
+                response_model=MultiStartResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def bisection_batch(request: Request, data: BisectionMultiStartModel, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Multi-start Bisection method route.
+
+    This route is used to calculate the roots of a mathematical expression using the Bisection method over many intervals in one call.
+
+    Args:
+        request (Request): The request object.
+        data (BisectionMultiStartModel): The multi-start Bisection model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        MultiStartResponse: The response model. Table with one row per interval with iterations, xn, f(xn), error and message.
+
+    Raises:
+        HTTPException: If an error occurs during the method.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {len(data.initials)} intervals for {data.expression}")
+
+        response = await run_job(solve_bisection_multi_start, data)
+
+        logger.info(f"Request successful: {len(response.Message)} intervals solved")
+
+        return response
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_newton_raphson_multi_start(data: NewtonRaphsonMultiStartModel) -> MultiStartResponse:
+    """
+    Find the roots of the expression of the request with the Newton Raphson method from many initial values.
+
+    Args:
+        data (NewtonRaphsonMultiStartModel): The request data.
+
+    Returns:
+        MultiStartResponse: The response model.
+    """
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    if data.derivative_expression is not None:
+        derivative = parse_expression(data.derivative_expression, logger, variable_character=variable.name)[0]
+    else:
+        derivative = None
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message = newton_raphson_multi_start(function, variable, data.initials, derivative=derivative, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error)
+
+    return MultiStartResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
+@router.post('/newton_raphson/batch/',
+                tags=["Numerical Methods", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Multi-start Newton Raphson method",
+                response_model=MultiStartResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def newton_raphson_batch(request: Request, data: NewtonRaphsonMultiStartModel, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Multi-start Newton Raphson method route.
+
+    This route is used to calculate the roots of a mathematical expression using the Newton Raphson method from many initial values in one call.
+
+    Args:
+        request (Request): The request object.
+        data (NewtonRaphsonMultiStartModel): The multi-start Newton Raphson model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        MultiStartResponse: The response model. Table with one row per initial value with iterations, xn, f(xn), error and message.
+
+    Raises:
+        HTTPException: If an error occurs during the method.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {len(data.initials)} initial values for {data.expression}")
+
+        response = await run_job(solve_newton_raphson_multi_start, data)
+
+        logger.info(f"Request successful: {len(response.Message)} initial values solved")
+
+        return response
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_secant_multi_start(data: SecantMultiStartModel) -> MultiStartResponse:
+    """
+    Find the roots of the expression of the request with the Secant method from many pairs of initial values.
+
+    Args:
+        data (SecantMultiStartModel): The request data.
+
+    Returns:
+        MultiStartResponse: The response model.
+    """
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    iterations, x, fx, error, message = secant_multi_start(function, variable, data.initials, data.second_initials, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error)
+
+    return MultiStartResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+
+
+@router.post('/secant/batch/',
+                tags=["Numerical Methods", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Multi-start Secant method",
+                response_model=MultiStartResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def secant_batch(request: Request, data: SecantMultiStartModel, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Multi-start Secant method route.
+
+    This route is used to calculate the roots of a mathematical expression using the Secant method from many pairs of initial values in one call.
+
+    Args:
+        request (Request): The request object.
+        data (SecantMultiStartModel): The multi-start Secant model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        MultiStartResponse: The response model. Table with one row per pair of initial values with iterations, xn, f(xn), error and message.
+
+    Raises:
+        HTTPException: If an error occurs during the method.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {len(data.initials)} initial values for {data.expression}")
+
+        response = await run_job(solve_secant_multi_start, data)
+
+        logger.info(f"Request successful: {len(response.Message)} initial values solved")
+
+        return response
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_roots_scan(data: RootsScanModel) -> RootsScanResponse:
+    """
+    Find all the roots of the expression of the request in an interval.
+
+    Args:
+        data (RootsScanModel): The request data.
+
+    Returns:
+        RootsScanResponse: The response model.
+    """
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    absolute_error = True if data.error_type == "absolute" else False
+
+    roots, tables, message = roots_scan_method(function, variable, data.initial, data.final, samples=data.samples, false_rule=data.method == "false_rule", tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, zero_tolerance=data.zero_tolerance)
+
+    traces = [NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=root_message) for iterations, x, fx, error, root_message in tables]
+    return RootsScanResponse(Roots=roots, Traces=traces, Message=message)
+
+
+@router.post('/roots_scan/',
+                tags=["Numerical Methods", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Roots scan",
+                response_model=RootsScanResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def roots_scan(request: Request, data: RootsScanModel, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Roots scan route.
+
+    This route is used to find all the roots of a mathematical expression in an interval. The expression is sampled over a grid to find
+    the brackets, and all of them are refined together with the Bisection or the safeguarded False Rule method.
+
+    Args:
+        request (Request): The request object.
+        data (RootsScanModel): The roots scan model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        RootsScanResponse: The response model. Roots found and the table of iterations, xn, f(xn), error and message of every root.
+
+    Raises:
+        HTTPException: If an error occurs during the method.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data.expression} in [{data.initial}, {data.final}] with {data.samples} samples")
+
+        response = await run_job(solve_roots_scan, data)
+
+        logger.info(f"Request successful: {response.Message}")
+
+        return response
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise_exception(e, logger)
+
+
+def solve_polynomial_roots(data: PolynomialRootsModel) -> PolynomialRootsResponse:
+    """
+    Find all the real and complex roots of the polynomial of the request.
+
+    Args:
+        data (PolynomialRootsModel): The request data.
+
+    Returns:
+        PolynomialRootsResponse: The response model.
+    """
+    function, variables = parse_expression(data.expression, logger)
+    variable = variables[0]
+
+    roots, real_roots, iterations, message = polynomial_roots_method(function, variable, precision=data.precision, tolerance=data.tolerance, iterations=data.max_iterations)
+
+    return PolynomialRootsResponse(Roots=roots, RealRoots=real_roots, Iterations=iterations, Message=message)
+
+
+@router.post('/polynomial_roots/',
+                tags=["Numerical Methods", "Protected"],
+                status_code=status.HTTP_200_OK,
+                summary="Polynomial roots",
+                response_model=PolynomialRootsResponse,
+                responses={
+                    500: {"model": ResponseError, "description": "Internal server error."},
+                    504: {"model": ResponseError, "description": "The method exceeded the time limit."},
+                    429: {"model": ResponseError, "description": "Too many requests."}
+                })
+@limiter.limit("15/minute")
+async def polynomial_roots(request: Request, data: PolynomialRootsModel, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Polynomial roots route.
+
+    This route is used to find all the real and complex roots of a polynomial at once, as the eigenvalues of its companion matrix, polished
+    with the Aberth-Ehrlich iteration when more than 15 digits are requested. Expressions which are not polynomials are rejected.
+
+    Args:
+        request (Request): The request object.
+        data (PolynomialRootsModel): The polynomial roots model.
+        auth (dict): The authentication dictionary.
+
+    Returns:
+        PolynomialRootsResponse: The response model. All the roots, the real roots, the iterations and the message.
+
+    Raises:
+        HTTPException: If an error occurs during the method.
+    """
+    try:
+        logger.info(f"Request from {request.client.host} to {request.url.path}: {data}")
 
-        iterations, x, fx, error, message = second_modified_newton_method(function, variable, data.initial, tolerance=data.tolerance, iterations=data.max_iterations, absolute_error=absolute_error, precision=data.precision, derivative=derivative, second_derivative=second_derivative)
+        response = await run_job(solve_polynomial_roots, data)
 
-        logger.info(f"Request successful: {message}")
+        logger.info(f"Request successful: {response.Message}")
 
-        return NumericalMethodResponse(Iterations=iterations, Xn=x, Fx=fx, Error=error, Message=message)
+        return response
     except RateLimitExceeded:
         raise HTTPException(status_code=429, detail="Too many requests.")
     except HTTPException as e:
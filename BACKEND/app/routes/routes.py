@@ -7,10 +7,12 @@ from sqlalchemy.orm import Session
 from app.config.database import get_db
 from app.config.limiter import limiter
 from app.config.env import API_NAME
-from app.models.models import ResponseError, UserLogin, UserLoginResponse
+from app.models.models import ResponseError, UserLogin, UserLoginResponse, CacheStatsResponse
 from app.auth.auth import auth_handler
 from app.utils.utils import raise_exception
 from app.utils.crud import get_user_by_username
+from app.utils.cache import factorizations_cache
+from app.utils.workers import caches_stats
 
 router = APIRouter()
 
@@ -118,4 +120,33 @@ def protected(request: Request, auth: dict = Depends(auth_handler.authenticate))
         raise HTTPException(status_code=429, detail="Too many requests.")
     except Exception as e:
         raise_exception(e, logger)
-        
\ No newline at end of file
+        
+
+
+@router.get('/cache/stats/',
+            tags=["Monitoring", "Protected"],
+            status_code=status.HTTP_200_OK,
+            summary="Expressions cache statistics.",
+            response_model=CacheStatsResponse,
+            responses={
+                500: {"model": ResponseError, "description": "Internal server error."},
+                429: {"model": ResponseError, "description": "Too many requests."}
+            })
+@limiter.limit("60/minute")
+def cache_stats(request: Request, auth: dict = Depends(auth_handler.authenticate)):
+    """
+    Cache statistics endpoint.
+
+    The parsed expressions, derivatives and compiled callables caches of the server process and of every worker process are added, with
+    the counters of every worker as they were after its last job.
+
+    Returns:
+        (CacheStatsResponse): Size, hits, misses and evictions of the parsed expressions, derivatives, compiled callables and LU factorizations caches.
+    """
+    try:
+        logger.info("Cache statistics endpoint.")
+        return CacheStatsResponse(**caches_stats(), factorizations=factorizations_cache.stats())
+    except RateLimitExceeded:
+        raise HTTPException(status_code=429, detail="Too many requests.")
+    except Exception as e:
+        raise_exception(e, logger)
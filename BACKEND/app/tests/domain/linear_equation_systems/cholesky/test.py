@@ -0,0 +1,94 @@
+from app.domain.cholesky import CholeskyFactorization
+from app.domain.lu_factorization import factorization_handle
+from fastapi.exceptions import HTTPException
+from decimal import Decimal
+import numpy as np
+
+
+def test_cholesky_factorization():
+    """
+    Test the Cholesky and the LDL^T factorizations of a symmetric positive definite matrix.
+    """
+    A = np.array([[4, 12, -16], [12, 37, -43], [-16, -43, 98]])
+    b = np.array([[0, 6, 39], [-40, -111, 223]])
+    x = np.array([[1, 1, 1], [1, -1, 2]])
+
+    for engine in ["float64", "decimal"]:
+        object = CholeskyFactorization(A, b, 3, engine=engine)
+        result, method, (L, d) = object.solve()
+        assert method == "cholesky"
+        assert d is None
+        assert np.allclose(L.astype(float), [[2, 0, 0], [6, 1, 0], [-8, 5, 3]]), "Test failed for the " + engine + " engine"
+        assert np.allclose(result.astype(float), x), "Test failed for the " + engine + " engine"
+
+        result, method, (L, d) = object.solve(method="ldlt")
+        assert method == "ldlt"
+        assert np.allclose(L.astype(float), [[1, 0, 0], [3, 1, 0], [-4, 5, 1]]), "Test failed for the " + engine + " engine"
+        assert np.allclose(d.astype(float), [4, 1, 9]), "Test failed for the " + engine + " engine"
+        assert np.allclose(result.astype(float), x), "Test failed for the " + engine + " engine"
+
+    # The Decimal engine keeps the precision of the numbers
+    L, _ = CholeskyFactorization(A, b, 3).factorize()[1]
+    assert L[2, 2] == Decimal("3")
+
+    # Test with an invalid method
+    try:
+        CholeskyFactorization(A, b, 3).factorize(method="qr")
+        assert False, "Test failed for an invalid method"
+    except HTTPException as e:
+        assert e.detail == "El método de factorización no es válido, este debe ser cholesky o ldlt"
+
+
+def test_blocked_factorization():
+    """
+    Test the blocked float64 factorizations of a big matrix, with panels which don't divide the size of the matrix.
+    """
+    rng = np.random.default_rng(0)
+    M = rng.standard_normal((200, 200))
+    A = M @ M.T + 200 * np.eye(200)
+    b = rng.standard_normal((4, 200))
+    object = CholeskyFactorization(A, b, engine="float64")
+
+    for block_size in [1, 48, 64, 256]:
+        x, method, (L, d) = object.solve(block_size=block_size)
+        assert np.allclose(L, np.linalg.cholesky(A)), "Test failed for blocks of " + str(block_size) + " columns"
+        assert np.allclose(x.T, np.linalg.solve(A, b.T)), "Test failed for blocks of " + str(block_size) + " columns"
+        assert np.allclose(CholeskyFactorization.reconstruct_matrix(method, (L, d)), A), "Test failed for blocks of " + str(block_size) + " columns"
+
+        x, method, (L, d) = object.solve(method="ldlt", block_size=block_size)
+        assert np.allclose(CholeskyFactorization.reconstruct_matrix(method, (L, d)), A), "Test failed for blocks of " + str(block_size) + " columns"
+        assert np.allclose(x.T, np.linalg.solve(A, b.T)), "Test failed for blocks of " + str(block_size) + " columns"
+
+
+def test_lu_fallback():
+    """
+    Test the LU factorization for the matrices which aren't symmetric positive definite.
+    """
+    # Symmetric but not positive definite
+    A = np.array([[1, 2], [2, 1]])
+    b = np.array([[3, 3]])
+    for engine in ["float64", "decimal"]:
+        for method in ["cholesky", "ldlt"]:
+            x, result_method, factors = CholeskyFactorization(A, b, engine=engine).solve(method=method)
+            assert result_method == "lu"
+            assert len(factors) == 3
+            assert np.allclose(x.astype(float), [[1, 1]]), "Test failed for the " + engine + " engine"
+
+    # Not symmetric
+    A = np.array([[3, 4, -2], [2, -3, 4], [1, -2, 3]])
+    x, method, (L, U, permutation) = CholeskyFactorization(A, np.array([[0, 11, 7]]), 3, engine="float64").solve()
+    assert method == "lu"
+    assert np.allclose(A[permutation], L @ U)
+    assert np.allclose(CholeskyFactorization.reconstruct_matrix(method, (L, U, permutation)), A)
+    assert np.allclose(x, [[2, -1, 1]])
+
+
+def test_factorization_handle():
+    """
+    Test that the handles of the factorizations of the same matrix are different for every method.
+    """
+    A = np.array([[4, 12, -16], [12, 37, -43], [-16, -43, 98]])
+
+    assert factorization_handle(A, 16) == factorization_handle(A, 16, method="lu")
+    assert factorization_handle(A, 16, method="cholesky") != factorization_handle(A, 16)
+    assert factorization_handle(A, 16, method="cholesky") != factorization_handle(A, 16, method="ldlt")
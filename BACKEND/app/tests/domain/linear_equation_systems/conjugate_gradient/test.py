@@ -0,0 +1,102 @@
+from app.domain.conjugate_gradient import ConjugateGradient
+from app.utils.sparse import CSRMatrix
+from fastapi.exceptions import HTTPException
+import numpy as np
+import time
+
+
+def poisson_matrix(m: int) -> CSRMatrix:
+    """
+    Build the matrix of the 5-point discretization of the Poisson equation in a grid of m x m points.
+    """
+    index = np.arange(m * m).reshape(m, m)
+    rows = [index.ravel()]
+    columns = [index.ravel()]
+    values = [np.full(m * m, 4.0)]
+    for source, target in [(index[1:, :], index[:-1, :]), (index[:-1, :], index[1:, :]), (index[:, 1:], index[:, :-1]), (index[:, :-1], index[:, 1:])]:
+        rows.append(source.ravel())
+        columns.append(target.ravel())
+        values.append(np.full(source.size, -1.0))
+
+    return CSRMatrix.from_coo(np.concatenate(rows), np.concatenate(columns), np.concatenate(values), (m * m, m * m))
+
+
+def test_solve():
+    # test 1, every preconditioner with dense and sparse matrices
+    A = poisson_matrix(10)
+    b = np.arange(100, dtype=float)
+    exact = np.linalg.solve(A.to_dense(), b)
+
+    for preconditioner in ["none", "jacobi", "ssor", "incomplete_cholesky"]:
+        for matrix in [A, A.to_dense()]:
+            object = ConjugateGradient(matrix, b, np.zeros(100))
+            result = object.solve(1e-10, 200, preconditioner=preconditioner, w=1.5)
+
+            assert float(result[2][-1]) <= 1e-10, f"Test 1 failed for solve with {preconditioner}"
+            assert np.allclose(object.x, exact, atol=1e-8), f"Test 1 failed for solve with {preconditioner}"
+
+    # test 2, the preconditioners reduce the number of iterations
+    A = poisson_matrix(30)
+    b = np.ones(900)
+    iterations = {}
+    for preconditioner in ["none", "ssor", "incomplete_cholesky"]:
+        object = ConjugateGradient(A, b, np.zeros(900))
+        iterations[preconditioner] = object.solve(1e-8, 500, preconditioner=preconditioner, w=1.5)[0][-1]
+
+    assert iterations["ssor"] < iterations["none"], "Test 2 failed for solve"
+    assert iterations["incomplete_cholesky"] < iterations["none"], "Test 2 failed for solve"
+
+    # test 3, the method ends when the residual is zero
+    A = np.array([[4, 1], [1, 3]])
+    object = ConjugateGradient(A, np.array([1, 2]), np.zeros(2))
+    result = object.solve(1e-12, 100, preconditioner="none")
+
+    assert result[0][-1] <= 3, "Test 3 failed for solve"
+    assert np.allclose(object.x, [1 / 11, 7 / 11]), "Test 3 failed for solve"
+
+
+def test_incomplete_cholesky():
+    # test 1, without zeros the factorization is the Cholesky factorization
+    M = np.random.default_rng(1).standard_normal((6, 6))
+    M = M @ M.T + 6 * np.eye(6)
+
+    assert np.allclose(ConjugateGradient(M, np.ones(6), np.zeros(6)).incomplete_cholesky(), np.linalg.cholesky(M)), "Test 1 failed for incomplete_cholesky"
+    assert np.allclose(ConjugateGradient(CSRMatrix.from_dense(M), np.ones(6), np.zeros(6)).incomplete_cholesky().to_dense(), np.linalg.cholesky(M)), "Test 1 failed for incomplete_cholesky"
+
+    # test 2, the dense and sparse factorizations keep the pattern of A
+    A = poisson_matrix(5)
+    K = ConjugateGradient(A, np.ones(25), np.zeros(25)).incomplete_cholesky().to_dense()
+
+    assert np.allclose(K, ConjugateGradient(A.to_dense(), np.ones(25), np.zeros(25)).incomplete_cholesky()), "Test 2 failed for incomplete_cholesky"
+    assert np.all((K != 0) <= (np.tril(A.to_dense()) != 0)), "Test 2 failed for incomplete_cholesky"
+
+    # test 3, the work of a dense matrix only depends on its nonzero values
+    A = poisson_matrix(30)
+    start = time.perf_counter()
+    K = ConjugateGradient(A.to_dense(), np.ones(900), np.zeros(900)).incomplete_cholesky()
+
+    assert time.perf_counter() - start < 0.5, "Test 3 failed for incomplete_cholesky"
+    assert np.allclose(K, ConjugateGradient(A, np.ones(900), np.zeros(900)).incomplete_cholesky().to_dense()), "Test 3 failed for incomplete_cholesky"
+
+
+def test_validate_input():
+    # test 1, a matrix which isn't symmetric
+    try:
+        ConjugateGradient(np.array([[4, 1], [2, 3]]), np.ones(2), np.zeros(2))
+        assert False, "Test 1 failed for validate_input"
+    except HTTPException as e:
+        assert e.detail == "La matriz A no es simétrica, el método del gradiente conjugado requiere una matriz simétrica definida positiva", "Test 1 failed for validate_input"
+
+    # test 2, a symmetric matrix which isn't positive definite
+    try:
+        ConjugateGradient(np.array([[1, 2], [2, 1]]), np.array([1, -1]), np.zeros(2)).solve(1e-10, 10, preconditioner="none")
+        assert False, "Test 2 failed for validate_input"
+    except HTTPException as e:
+        assert e.detail == "La matriz A no es definida positiva, el método del gradiente conjugado requiere una matriz simétrica definida positiva", "Test 2 failed for validate_input"
+
+    # test 3, a negative diagonal with a preconditioner
+    try:
+        ConjugateGradient(np.array([[-4, 1], [1, 3]]), np.ones(2), np.zeros(2)).solve(1e-10, 10)
+        assert False, "Test 3 failed for validate_input"
+    except HTTPException as e:
+        assert e.detail == "La diagonal de la matriz A debe ser positiva, el método del gradiente conjugado requiere una matriz simétrica definida positiva", "Test 3 failed for validate_input"
@@ -217,6 +217,54 @@ def test_gaussian_elimination_solve():
     assert allclose_decimal((object.A @ result.T - object.b.T).T, np.array([[Decimal("0"), Decimal("0"), Decimal("0")]])), "Test failed for a system of equations with 3 variables"
 
 
+def test_gaussian_elimination_solve_float64():
+    # The float64 engine is chosen for precisions up to 15 digits
+    A = np.array([[3, 4, -2], [2, -3, 4], [1, -2, 3]])
+    object = GaussianElimination(A, np.array([[0, 11, 7]]), 3, precision=15)
+    assert object.engine == "float64"
+    assert GaussianElimination(A, np.array([[0, 11, 7]]), 3).engine == "decimal"
+
+    for pivot_type in [None, 1, 2]:
+        result = object.solve(pivot_type=pivot_type)
+        assert result.dtype == float
+        assert np.allclose(result, np.array([[2, -1, 1]])), "Test failed for pivot type " + str(pivot_type)
+
+    # Test with a big system, compared with the solution of NumPy
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((300, 300))
+    b = rng.standard_normal((300, 1))
+    object = GaussianElimination(A, b, engine="float64")
+    for pivot_type in [1, 2]:
+        result = object.solve(pivot_type=pivot_type)
+        assert np.allclose(result.T, np.linalg.solve(A, b)), "Test failed for pivot type " + str(pivot_type)
+
+    # The pivots match the ones of the Decimal engine
+    A = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+    b = np.array([[1, 2, 3]])
+    for pivot_type in [1, 2]:
+        decimal_result = GaussianElimination(A, b, precision=16).solve(pivot_type=pivot_type)
+        float_result = GaussianElimination(A, b, precision=15).solve(pivot_type=pivot_type)
+        assert np.allclose(float_result, decimal_result.astype(float)), "Test failed for pivot type " + str(pivot_type)
+
+    # Test with a zero in the diagonal without pivot
+    object = GaussianElimination(np.array([[0, 1], [1, 0]]), np.array([[1, 2]]), engine="float64")
+    try:
+        object.solve()
+        assert False, "Test failed for a zero in the diagonal"
+    except HTTPException as e:
+        assert e.detail == "La matriz A tiene un 0 en la diagonal, por lo que no se puede dividir por este valor. Se recomienda usar pivoteo"
+    assert np.allclose(object.solve(pivot_type=1), np.array([[2, 1]]))
+
+    # Test with a singular matrix
+    object = GaussianElimination(np.array([[1, 2], [2, 4]]), np.array([[1, 2]]), engine="float64")
+    for pivot_type in [1, 2]:
+        try:
+            object.solve(pivot_type=pivot_type)
+            assert False, "Test failed for a singular matrix"
+        except HTTPException as e:
+            assert e.detail == "El sistema no tiene solución única"
+
+
 def test_get_set_vectorial_error():
     # Test for a system of equations with 3 variables
     A = np.array([[3, 4, -2], [2, -3, 4], [1, -2, 3]])
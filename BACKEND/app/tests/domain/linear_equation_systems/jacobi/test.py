@@ -1,6 +1,7 @@
 from app.domain.jacobi import Jacobi
 from fastapi.exceptions import HTTPException
 import numpy as np
+import sympy as sp
 from decimal import Decimal
 
 def allclose_decimal(A, B, tol=Decimal("1e-20")):
@@ -208,6 +209,36 @@ def test_matrix_solve():
     assert "0.4700089" in result[1][3][-1], "Test 5 failed for matrix_solve"
     assert "es una aproximación de la solución del sistema con una tolerancia de" in result[-1], "Test 5 failed for iterative_solve"
 
+def test_matrix_solve_float64():
+    # test 1, the float64 engine performs the same iterations than the numbers with the given precision
+    A = np.array([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
+    b = np.array([[-25], [82], [75], [-43]])
+    x_initial = np.array([[2, 2, 2, 2]])
+
+    float_result = Jacobi(A, b, x_initial, precision=15).matrix_solve(0.5e-4)
+    decimal_result = Jacobi(A, b, x_initial, precision=16, engine="decimal").matrix_solve(0.5e-4)
+
+    assert float_result[0] == decimal_result[0], "Test 1 failed for matrix_solve_float64"
+    for float_values, decimal_values in zip(float_result[1], decimal_result[1]):
+        assert abs(float(float_values[-1]) - float(decimal_values[-1])) < 1e-12, "Test 1 failed for matrix_solve_float64"
+    assert abs(float(float_result[2][-1]) - float(decimal_result[2][-1])) < 1e-12, "Test 1 failed for matrix_solve_float64"
+    assert "es una aproximación de la solución del sistema con una tolerancia de" in float_result[-1], "Test 1 failed for matrix_solve_float64"
+
+    # test 2, relative error with the norm 1
+    float_result = Jacobi(A, b, x_initial, engine="float64").matrix_solve(0.5e-4, absolute_error=False, order=1)
+    decimal_result = Jacobi(A, b, x_initial, engine="decimal").matrix_solve(0.5e-4, absolute_error=False, order=1)
+
+    assert float_result[0] == decimal_result[0], "Test 2 failed for matrix_solve_float64"
+    assert abs(float(float_result[2][-1]) - float(decimal_result[2][-1])) < 1e-12, "Test 2 failed for matrix_solve_float64"
+
+    # test 3, a zero in the diagonal
+    A = np.array([[0, 1], [1, 2]])
+    try:
+        Jacobi(A, np.array([[1], [2]]), np.array([[0, 0]]), precision=15).matrix_solve(0.5e-4)
+        assert False, "Test 3 failed for matrix_solve_float64"
+    except sp.matrices.exceptions.NonInvertibleMatrixError:
+        pass
+
 def test_get_t_spectral_radius():
     # test 1
     A = np.array([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
@@ -219,6 +250,12 @@ def test_get_t_spectral_radius():
 
     assert "0.33974160954560" in result, "Test 1 failed for get_t_spectral_radius"
 
+    # test 2, with the float64 engine
+    object = Jacobi(A, b, x_initial, precision=15)
+    result = object.get_t_spectral_radius()
+
+    assert result.startswith("0.33974160954560") and len(result) == 17, "Test 2 failed for get_t_spectral_radius"
+
 def test_converges():
     # test 1
     A = np.array([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
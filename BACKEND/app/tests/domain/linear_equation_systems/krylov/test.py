@@ -0,0 +1,95 @@
+from app.domain.krylov import Krylov
+from app.utils.sparse import CSRMatrix
+from fastapi.exceptions import HTTPException
+import numpy as np
+import time
+
+
+def convection_diffusion_matrix(m: int, c: float = 20) -> CSRMatrix:
+    """
+    Build the nonsymmetric matrix of the upwind discretization of the convection-diffusion equation in a grid of m x m points.
+    """
+    h = 1 / (m + 1)
+    index = np.arange(m * m).reshape(m, m)
+    rows = [index.ravel()]
+    columns = [index.ravel()]
+    values = [np.full(m * m, 4 + c * h)]
+    for source, target, value in [(index[1:, :], index[:-1, :], -1 - c * h), (index[:-1, :], index[1:, :], -1), (index[:, 1:], index[:, :-1], -1), (index[:, :-1], index[:, 1:], -1)]:
+        rows.append(source.ravel())
+        columns.append(target.ravel())
+        values.append(np.full(source.size, value))
+
+    return CSRMatrix.from_coo(np.concatenate(rows), np.concatenate(columns), np.concatenate(values), (m * m, m * m))
+
+
+def test_solve():
+    # test 1, both methods and preconditioners with dense and sparse matrices
+    A = convection_diffusion_matrix(8)
+    b = np.arange(64, dtype=float)
+    exact = np.linalg.solve(A.to_dense(), b)
+
+    for method in ["gmres", "bicgstab"]:
+        for preconditioner in ["none", "ilu"]:
+            for matrix in [A, A.to_dense()]:
+                object = Krylov(matrix, b, np.zeros(64))
+                result = object.solve(method, 1e-10, 200, restart=10, preconditioner=preconditioner, absolute_error=False)
+
+                assert float(result[2][-1]) <= 1e-10, f"Test 1 failed for solve with {method} and {preconditioner}"
+                assert np.allclose(object.x, exact, atol=1e-8), f"Test 1 failed for solve with {method} and {preconditioner}"
+
+    # test 2, the incomplete LU factorization reduces the number of iterations and the residual of GMRES never increases
+    A = convection_diffusion_matrix(20)
+    b = np.ones(400)
+    iterations = {}
+    for preconditioner in ["none", "ilu"]:
+        object = Krylov(A, b, np.zeros(400))
+        result = object.solve("gmres", 1e-8, 500, restart=20, preconditioner=preconditioner)
+        iterations[preconditioner] = result[0][-1]
+        residuals = [float(value) for value in result[2]]
+
+        assert all(residuals[i + 1] <= residuals[i] * (1 + 1e-8) for i in range(len(residuals) - 1)), "Test 2 failed for solve"
+    assert iterations["ilu"] < iterations["none"], "Test 2 failed for solve"
+
+    # test 3, an indefinite matrix where the stationary methods can't be used
+    object = Krylov(np.array([[0, 1], [1, 0]]), np.array([1, 2]), np.zeros(2))
+    result = object.solve("gmres", 1e-12, 10)
+
+    assert result[0][-1] == 2, "Test 3 failed for solve"
+    assert np.allclose(object.x, [2, 1]), "Test 3 failed for solve"
+
+    # test 4, the maximum number of iterations
+    object = Krylov(A, b, np.zeros(400))
+    result = object.solve("bicgstab", 1e-14, 3)
+
+    assert result[0][-1] == 3, "Test 4 failed for solve"
+    assert result[3] == "El método no converge en 3 iteraciones", "Test 4 failed for solve"
+
+
+def test_incomplete_lu():
+    # test 1, without zeros the factorization is the LU factorization
+    M = np.random.default_rng(0).standard_normal((5, 5)) + 5 * np.eye(5)
+    LU = Krylov(M, np.ones(5), np.zeros(5)).incomplete_lu()
+
+    assert np.allclose((np.tril(LU, -1) + np.eye(5)) @ np.triu(LU), M), "Test 1 failed for incomplete_lu"
+
+    # test 2, the dense and sparse factorizations keep the pattern of A
+    A = convection_diffusion_matrix(5)
+    LU = Krylov(A, np.ones(25), np.zeros(25)).incomplete_lu().to_dense()
+
+    assert np.allclose(LU, Krylov(A.to_dense(), np.ones(25), np.zeros(25)).incomplete_lu()), "Test 2 failed for incomplete_lu"
+    assert np.all((LU != 0) <= (A.to_dense() != 0)), "Test 2 failed for incomplete_lu"
+
+    # test 3, the work of a dense matrix only depends on its nonzero values
+    A = convection_diffusion_matrix(30)
+    start = time.perf_counter()
+    LU = Krylov(A.to_dense(), np.ones(900), np.zeros(900)).incomplete_lu()
+
+    assert time.perf_counter() - start < 0.5, "Test 3 failed for incomplete_lu"
+    assert np.allclose(LU, Krylov(A, np.ones(900), np.zeros(900)).incomplete_lu().to_dense()), "Test 3 failed for incomplete_lu"
+
+    # test 4, a zero pivot
+    try:
+        Krylov(np.array([[0, 1], [1, 0]]), np.ones(2), np.zeros(2)).solve("gmres", 1e-10, 10, preconditioner="ilu")
+        assert False, "Test 4 failed for incomplete_lu"
+    except HTTPException as e:
+        assert e.detail == "La factorización LU incompleta no existe porque un pivote es 0. Use otro precondicionador o reordene las filas de la matriz A", "Test 4 failed for incomplete_lu"
@@ -1,4 +1,4 @@
-from app.domain.lu_factorization import LUFactorization
+from app.domain.lu_factorization import LUFactorization, factorization_handle
 from app.utils.utils import construct_augmented_matrix
 from fastapi.exceptions import HTTPException
 import numpy as np
@@ -122,3 +122,92 @@ def test_lu_factorization():
     assert allclose_decimal(object.x, x_expected), "Test failed for a system of equations with 4 variables"
     assert allclose_decimal(L, L_expected)
     assert allclose_decimal(U, U_expected)
+
+
+def test_multiple_right_hand_sides():
+    # Every row of b is a right-hand side, solved with the same factorization
+    A = np.array([[4, 3, 2, 1], [3, 12, 3, -2], [-2, 8, -9, -5], [-7, -3, 3, 6]])
+    b = np.array([[0, 8, 7, 1], [1, 0, 0, 0], [4, 3, -2, -7]])
+    object = LUFactorization(A, b, 4)
+
+    x, L, U = object.solve(pivot_type=1)
+    assert x.shape == (3, 4)
+    assert np.allclose(x.astype(float), np.linalg.solve(A, b.T).T)
+    assert object.get_set_vectorial_error().shape == (3, 4)
+    assert object.get_set_absolute_error() < Decimal("1e-14")
+
+    # The last right-hand side is the first column of A, so its solution is the first vector of the canonical basis
+    assert allclose_decimal(x[2:], np.array([[Decimal("1"), Decimal("0"), Decimal("0"), Decimal("0")]]), tol=Decimal("1e-14"))
+
+    # The factorization can be reused for new right-hand sides
+    L, U, permutation = object.factorize(pivot_type=1)
+    x = object.substitute(L, U, permutation, object.redefine_to_decimal(np.array([[0], [8], [7], [1]])))
+    assert x.shape == (1, 4)
+    assert np.allclose(x.astype(float), np.linalg.solve(A, np.array([0, 8, 7, 1])))
+
+    # The permutation is a vector with the row of A of every row of L U, and the factors give back A
+    assert permutation.shape == (4,)
+    assert np.allclose(LUFactorization.reconstruct_matrix(L, U, permutation).astype(float), A)
+
+    # Test with a matrix of right-hand sides with the wrong length
+    try:
+        LUFactorization(A, np.array([[1, 2, 3], [4, 5, 6]]), 4)
+        assert False, "Test failed for right-hand sides with the wrong length"
+    except HTTPException as e:
+        assert e.detail == "La longitud del vector b no es igual al número de filas de la matriz A"
+
+
+def test_factorization_handle():
+    A = np.array([[3, 4, -2], [2, -3, 4], [1, -2, 3]])
+
+    assert factorization_handle(A, 16) == factorization_handle(A.astype(float), 16)
+    assert factorization_handle(A, 16) != factorization_handle(A, 20)
+    assert factorization_handle(A, 16) != factorization_handle(A, 16, 1)
+    assert factorization_handle(A, 16) != factorization_handle(A.T, 16)
+    assert factorization_handle(A, 16) != factorization_handle(A, 16, engine="float64")
+
+
+def test_blocked_factorization():
+    # The float64 engine is chosen for precisions up to 15 digits
+    A = np.array([[4, 3, 2, 1], [3, 12, 3, -2], [-2, 8, -9, -5], [-7, -3, 3, 6]])
+    b = np.array([[0, 8, 7, 1]])
+    assert LUFactorization(A, b, 4, precision=15).engine == "float64"
+
+    # The factorization matches the one of the Decimal engine for every size of the panels
+    decimal_object = LUFactorization(A, b, 4)
+    decimal_L, decimal_U, decimal_permutation = decimal_object.factorize(pivot_type=1)
+    for block_size in [1, 2, 3, 64]:
+        object = LUFactorization(A, b, 4, precision=15)
+        L, U, permutation = object.factorize(pivot_type=1, block_size=block_size)
+        assert np.allclose(L, decimal_L.astype(float)), "Test failed for blocks of " + str(block_size) + " columns"
+        assert np.allclose(U, decimal_U.astype(float)), "Test failed for blocks of " + str(block_size) + " columns"
+        assert np.array_equal(permutation, decimal_permutation), "Test failed for blocks of " + str(block_size) + " columns"
+        assert np.allclose(object.substitute(L, U, permutation), decimal_object.substitute(decimal_L, decimal_U, decimal_permutation).astype(float))
+
+    # Test with a big system, with panels which don't divide the size of the matrix
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((300, 300))
+    b = rng.standard_normal((5, 300))
+    object = LUFactorization(A, b, engine="float64")
+    for pivot_type in [None, 1]:
+        x, L, U = object.solve(pivot_type=pivot_type, block_size=48)
+        assert np.allclose(L, np.tril(L)) and np.allclose(np.diagonal(L), 1)
+        assert np.allclose(U, np.triu(U))
+        assert np.allclose(x.T, np.linalg.solve(A, b.T)), "Test failed for pivot type " + str(pivot_type)
+
+    # Test with a zero in the diagonal without pivot
+    object = LUFactorization(np.array([[0, 1], [1, 0]]), np.array([[1, 2]]), engine="float64")
+    try:
+        object.solve()
+        assert False, "Test failed for a zero in the diagonal"
+    except HTTPException as e:
+        assert e.detail == "La matriz A tiene un 0 en la diagonal, por lo que no se puede dividir por este valor. Se recomienda usar pivoteo"
+    assert np.allclose(object.solve(pivot_type=1)[0], np.array([[2, 1]]))
+
+    # Test with a singular matrix
+    object = LUFactorization(np.array([[1, 2], [2, 4]]), np.array([[1, 2]]), engine="float64")
+    try:
+        object.solve(pivot_type=1)
+        assert False, "Test failed for a singular matrix"
+    except HTTPException as e:
+        assert e.detail == "El sistema no tiene solución única"
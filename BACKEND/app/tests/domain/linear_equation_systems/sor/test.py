@@ -144,6 +144,36 @@ def test_matrix_solve():
     assert "0.47001177633405" in result[1][3][-1], "Test 5 failed for matrix_solve"
     assert "es una aproximación de la solución del sistema con una tolerancia de" in result[-1], "Test 5 failed for iterative_solve"
 
+def test_matrix_solve_float64():
+    # test 1, the float64 engine performs the same iterations than the numbers with the given precision
+    A = sp.Matrix([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
+    b = sp.Matrix([[-25], [82], [75], [-43]])
+    x_initial = sp.Matrix([[2, 2, 2, 2]])
+
+    float_result = Sor(A, b, x_initial, precision=15).matrix_solve(1.001, 0.5e-5)
+    decimal_result = Sor(A, b, x_initial, precision=16, engine="decimal").matrix_solve(1.001, 0.5e-5)
+
+    assert float_result[0] == decimal_result[0], "Test 1 failed for matrix_solve_float64"
+    for float_values, decimal_values in zip(float_result[1], decimal_result[1]):
+        assert abs(float(float_values[-1]) - float(decimal_values[-1])) < 1e-12, "Test 1 failed for matrix_solve_float64"
+    assert abs(float(float_result[2][-1]) - float(decimal_result[2][-1])) < 1e-12, "Test 1 failed for matrix_solve_float64"
+    assert "es una aproximación de la solución del sistema con una tolerancia de" in float_result[-1], "Test 1 failed for matrix_solve_float64"
+
+    # test 2, relative error with the norm 1
+    float_result = Sor(A, b, x_initial, engine="float64").matrix_solve(1.001, 0.5e-5, absolute_error=False, order=1)
+    decimal_result = Sor(A, b, x_initial, engine="decimal").matrix_solve(1.001, 0.5e-5, absolute_error=False, order=1)
+
+    assert float_result[0] == decimal_result[0], "Test 2 failed for matrix_solve_float64"
+    assert abs(float(float_result[2][-1]) - float(decimal_result[2][-1])) < 1e-12, "Test 2 failed for matrix_solve_float64"
+
+    # test 3, a zero in the diagonal
+    A = sp.Matrix([[0, 1], [1, 2]])
+    try:
+        Sor(A, sp.Matrix([[1], [2]]), sp.Matrix([[0, 0]]), precision=15).matrix_solve(1.001, 0.5e-5)
+        assert False, "Test 3 failed for matrix_solve_float64"
+    except sp.matrices.exceptions.NonInvertibleMatrixError:
+        pass
+
 def test_get_t_spectral_radius():
     # test 1
     A = sp.Matrix([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
@@ -155,6 +185,12 @@ def test_get_t_spectral_radius():
 
     assert "0.19091650493849" in result, "Test 1 failed for get_t_spectral_radius"
 
+    # test 2, with the float64 engine
+    object = Sor(A, b, x_initial, precision=15)
+    result = object.get_t_spectral_radius(w=1.001)
+
+    assert result.startswith("0.19091650493849") and len(result) == 17, "Test 2 failed for get_t_spectral_radius"
+
 def test_converges():
     # test 1
     A = sp.Matrix([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
@@ -0,0 +1,72 @@
+from app.domain.sor_relaxation import SorRelaxation, expected_iterations
+from app.utils.sparse import CSRMatrix
+from fastapi.exceptions import HTTPException
+import math
+import numpy as np
+
+
+def tridiagonal_matrix(n: int) -> np.ndarray:
+    """
+    Build the matrix of the 3-point discretization of the Poisson equation in n points.
+    """
+    return 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+def test_optimal_omega():
+    # test 1, the theorem of Young for a tridiagonal matrix
+    n = 20
+    object = SorRelaxation(tridiagonal_matrix(n))
+    p = math.cos(math.pi / (n + 1))
+
+    assert object.is_consistently_ordered(), "Test 1 failed for optimal_omega"
+    assert abs(object.optimal_omega() - 2 / (1 + math.sin(math.pi / (n + 1)))) < 1e-12, "Test 1 failed for optimal_omega"
+    assert abs(object.spectral_radius(1) - p ** 2) < 1e-12, "Test 1 failed for optimal_omega"
+    assert abs(object.spectral_radius(1.9) - 0.9) < 1e-12, "Test 1 failed for optimal_omega"
+
+    # test 2, the same matrix in sparse format
+    A = tridiagonal_matrix(n)
+    rows, columns = np.nonzero(A)
+    sparse_object = SorRelaxation(CSRMatrix.from_coo(rows, columns, A[rows, columns], A.shape))
+
+    assert abs(sparse_object.optimal_omega() - object.optimal_omega()) < 1e-10, "Test 2 failed for optimal_omega"
+
+    # test 3, a matrix which isn't tridiagonal is computed numerically
+    A = [[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]]
+    object = SorRelaxation(np.array(A))
+
+    assert object.optimal_omega() is None, "Test 3 failed for optimal_omega"
+    assert abs(object.spectral_radius(1.001) - 0.19091650493849) < 1e-12, "Test 3 failed for optimal_omega"
+
+
+def test_spectral_radii():
+    # test 1, the numeric spectral radii agree with the theorem of Young
+    n = 12
+    object = SorRelaxation(tridiagonal_matrix(n))
+    numeric_object = SorRelaxation(tridiagonal_matrix(n))
+    numeric_object.jacobi_spectral_radius = None
+    omegas = [0.5, 1, 1.3]
+    result = object.spectral_radii(omegas)
+
+    assert all(isinstance(value, float) for value in result), "Test 1 failed for spectral_radii"
+    assert np.allclose(result, numeric_object.spectral_radii(omegas), atol=1e-8), "Test 1 failed for spectral_radii"
+
+    # test 2, relaxation factors out of the interval (0, 2)
+    try:
+        object.spectral_radii([0.5, 2])
+        assert False, "Test 2 failed for spectral_radii"
+    except HTTPException as e:
+        assert e.detail == "Los factores de relajación deben ser mayores a 0 y menores a 2", "Test 2 failed for spectral_radii"
+
+    # test 3, a zero in the diagonal
+    try:
+        SorRelaxation(np.array([[0, 1], [1, 2]]))
+        assert False, "Test 3 failed for spectral_radii"
+    except HTTPException as e:
+        assert e.detail == "La diagonal de la matriz A no puede contener ceros", "Test 3 failed for spectral_radii"
+
+
+def test_expected_iterations():
+    assert expected_iterations(0.1, 1e-6) == 6, "Test 1 failed for expected_iterations"
+    assert expected_iterations(0.5, 1e-3) == 10, "Test 2 failed for expected_iterations"
+    assert expected_iterations(1, 1e-6) is None, "Test 3 failed for expected_iterations"
+    assert expected_iterations(0, 1e-6) == 1, "Test 4 failed for expected_iterations"
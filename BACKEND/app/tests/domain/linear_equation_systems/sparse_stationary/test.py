@@ -0,0 +1,157 @@
+from app.domain.sparse_stationary import SparseStationary
+from app.domain.jacobi import Jacobi
+from app.domain.gauss_seidel import GaussSeidel
+from app.domain.sor import Sor
+from app.utils.sparse import CSRMatrix, greedy_coloring
+from app.utils.tables import create_table
+from fastapi.exceptions import HTTPException
+import numpy as np
+import sympy as sp
+
+
+def poisson_matrix(m: int) -> CSRMatrix:
+    """
+    Build the matrix of the 5-point discretization of the Poisson equation in a grid of m x m points.
+    """
+    index = np.arange(m * m).reshape(m, m)
+    rows = [index.ravel()]
+    columns = [index.ravel()]
+    values = [np.full(m * m, 4.0)]
+    for source, target in [(index[1:, :], index[:-1, :]), (index[:-1, :], index[1:, :]), (index[:, 1:], index[:, :-1]), (index[:, :-1], index[:, 1:])]:
+        rows.append(source.ravel())
+        columns.append(target.ravel())
+        values.append(np.full(source.size, -1.0))
+
+    return CSRMatrix.from_coo(np.concatenate(rows), np.concatenate(columns), np.concatenate(values), (m * m, m * m))
+
+
+def test_sparse_matches_dense():
+    A = [[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]]
+    b = [[-25, 82, 75, -43]]
+    x_initial = [[2, 2, 2, 2]]
+    object = SparseStationary(CSRMatrix.from_dense(np.array(A)), np.array(b), np.array(x_initial))
+
+    # The sparse methods perform the same iterations of the dense methods
+    dense_results = {
+        "jacobi": Jacobi(np.array(A), np.array(b), np.array(x_initial)).iterative_solve(0.5e-5),
+        "gauss_seidel": GaussSeidel(sp.Matrix(A), sp.Matrix(b), sp.Matrix(x_initial)).iterative_solve(0.5e-5),
+        "sor": Sor(sp.Matrix(A), sp.Matrix(b), sp.Matrix(x_initial)).iterative_solve(1.001, 0.5e-5),
+    }
+    for method, dense_result in dense_results.items():
+        result = object.solve(method, 0.5e-5, w=1.001)
+        assert result[0] == dense_result[0], "Test failed for the " + method + " method"
+        for values, dense_values in zip(result[1], dense_result[1]):
+            assert np.allclose([float(value) for value in values], [float(value) for value in dense_values]), "Test failed for the " + method + " method"
+        assert "es una aproximación de la solución del sistema con una tolerancia de" in result[3]
+
+    # Test with the relative error and the norm of order 2
+    result = object.solve("jacobi", 0.5e-5, absolute_error=False, order=2)
+    assert float(result[2][-1]) < 0.5e-5
+
+
+def test_sparse_poisson():
+    # Test with a big system, only the nonzero values are stored
+    A = poisson_matrix(100)
+    assert A.nnz == 5 * 100 * 100 - 4 * 100
+    b = np.ones(A.shape[0])
+
+    object = SparseStationary(A, b, np.zeros(A.shape[0]))
+    for method in ["jacobi", "gauss_seidel", "sor"]:
+        iterations, x, error, message = object.solve(method, 1e-12, max_iter=5, w=1.5, table=create_table("final"))
+        assert iterations == [5]
+        assert len(x) == A.shape[0]
+        assert "El método no converge en 5 iteraciones" == message
+
+    # The Gauss Seidel method reduces the residual faster than the Jacobi method
+    object.solve("jacobi", 1e-12, max_iter=20, table=create_table("final"))
+    jacobi_residual = np.linalg.norm(b - A.dot(object.x))
+    object.solve("gauss_seidel", 1e-12, max_iter=20, table=create_table("final"))
+    assert np.linalg.norm(b - A.dot(object.x)) < jacobi_residual
+
+
+def test_sparse_spectral_radius():
+    A = [[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]]
+    object = SparseStationary(CSRMatrix.from_dense(np.array(A)), np.ones(4), np.zeros(4))
+
+    # The spectral radius is the one of the T matrix of the dense methods
+    assert abs(object.spectral_radius("jacobi") - 0.33974160954560) < 1e-12
+    assert abs(object.spectral_radius("gauss_seidel") - 0.18881517244860) < 1e-12
+    assert abs(object.spectral_radius("sor", w=1.001) - 0.19091650493849) < 1e-12
+    assert object.converges(0.5) == "El método converge, el radio espectral de T es menor a 1 y/o la matriz es estrictamente diagonal dominante"
+
+    # Test with a big system, the spectral radius of the Jacobi method is cos(pi / (m + 1)) and the one of Gauss Seidel is its square
+    m = 30
+    object = SparseStationary(poisson_matrix(m), np.ones(m * m), np.zeros(m * m))
+    assert abs(object.spectral_radius("jacobi") - np.cos(np.pi / (m + 1))) < 1e-10
+    assert abs(object.spectral_radius("gauss_seidel") - np.cos(np.pi / (m + 1)) ** 2) < 1e-10
+
+    # A matrix which isn't diagonally dominant and diverges
+    object = SparseStationary(CSRMatrix.from_dense(np.array([[1, 2], [3, 1]])), np.ones(2), np.zeros(2))
+    spectral_radius = object.spectral_radius("jacobi")
+    assert abs(spectral_radius - np.sqrt(6)) < 1e-12
+    assert object.converges(spectral_radius) == "El método no converge, el radio espectral de T es mayor o igual a 1 y la matriz no es estrictamente diagonal dominante"
+
+
+def test_sparse_errors():
+    # Test with a zero in the diagonal
+    object = SparseStationary(CSRMatrix.from_dense(np.array([[0, 1], [1, 2]])), np.array([[1, 1]]), np.array([[0, 0]]))
+    try:
+        object.solve("sor", 1e-5, w=1.5)
+        assert False, "Test failed for a zero in the diagonal"
+    except HTTPException as e:
+        assert e.detail == "La diagonal de la matriz A no puede contener ceros"
+
+    # Test with a vector b with the wrong length
+    try:
+        SparseStationary(CSRMatrix.from_dense(np.eye(3)), np.array([[1, 1]]), np.array([[0, 0, 0]]))
+        assert False, "Test failed for a vector b with the wrong length"
+    except HTTPException as e:
+        assert e.detail == "La longitud del vector b no es igual al número de filas de la matriz A"
+
+
+def test_parallel_jacobi():
+    # The iterations split between threads are the same as the sequential ones
+    A = poisson_matrix(20)
+    b = np.arange(A.shape[0], dtype=float)
+
+    sequential_object = SparseStationary(A, b, np.zeros(A.shape[0]), threads=1)
+    parallel_object = SparseStationary(A, b, np.zeros(A.shape[0]), threads=4)
+    sequential_result = sequential_object.solve("jacobi", 1e-6, max_iter=50)
+    parallel_result = parallel_object.solve("jacobi", 1e-6, max_iter=50)
+
+    assert parallel_result[0] == sequential_result[0]
+    assert np.allclose(parallel_object.x, sequential_object.x, rtol=1e-14)
+    assert parallel_result[3] == sequential_result[3]
+
+
+def test_multicolor_ordering():
+    # The red-black ordering of the 5-point stencil is consistently ordered, so it keeps the spectral radius
+    A = poisson_matrix(8)
+    b = np.ones(A.shape[0])
+    object = SparseStationary(A, b, np.zeros(A.shape[0]))
+
+    for method, w in [("gauss_seidel", 1), ("sor", 1.5)]:
+        assert abs(object.spectral_radius(method, w) - object.spectral_radius(method, w, ordering="multicolor")) < 1e-10
+        object.solve(method, 1e-10, max_iter=500, w=w, ordering="multicolor")
+        assert np.allclose(A.dot(object.x), b, atol=1e-8)
+
+    # The multicolor iterations are the natural ones of the matrix with the rows and columns sorted by color
+    A = CSRMatrix.from_dense(np.array([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]]))
+    b = np.array([-25, 82, 75, -43])
+    colors = greedy_coloring(A)
+    permutation = np.argsort(colors, kind="stable")
+    permuted = CSRMatrix.from_dense(A.to_dense()[np.ix_(permutation, permutation)])
+
+    object = SparseStationary(A, b, np.full(4, 2.0))
+    permuted_object = SparseStationary(permuted, b[permutation], np.full(4, 2.0))
+    result = object.solve("sor", 0.5e-5, w=1.1, ordering="multicolor")
+    permuted_result = permuted_object.solve("sor", 0.5e-5, w=1.1)
+
+    assert result[0] == permuted_result[0]
+    assert np.allclose(object.x[permutation], permuted_object.x)
+
+    # The threads give the same iterations, up to the rounding errors of the sums
+    parallel_object = SparseStationary(A, b, np.full(4, 2.0), threads=2)
+    parallel_result = parallel_object.solve("sor", 0.5e-5, w=1.1, ordering="multicolor")
+    assert parallel_result[0] == result[0]
+    assert np.allclose(parallel_object.x, object.x, rtol=1e-14)
@@ -0,0 +1,80 @@
+from app.domain.multi_start import newton_raphson_multi_start, secant_multi_start, bisection_multi_start
+from app.domain.methods import newton_raphson
+from app.utils.utils import parse_expression
+from app.routes.routes import logger
+from fastapi.exceptions import HTTPException
+import numpy as np
+
+
+def test_newton_raphson_multi_start():
+    # Test 1: every initial value converges to the nearest root of x**3 - x
+    function, variables = parse_expression("x**3 - x", logger)
+    variable = variables[0]
+    initials = [-2, -0.3, 0.3, 2]
+    result = newton_raphson_multi_start(function, variable, initials, tolerance=0.5e-12, iterations=100)
+
+    assert [round(float(x), 10) for x in result[1]] == [-1.0, 0.0, 0.0, 1.0]
+    assert all("raíz" in message for message in result[4])
+
+    # Test 2: the lanes match the scalar method
+    function, variables = parse_expression("(exp(x)/x) + 3", logger)
+    variable = variables[0]
+    initials = [-0.5, -0.4, -0.1]
+    result = newton_raphson_multi_start(function, variable, initials, tolerance=0.5e-10, iterations=100)
+    for i, initial in enumerate(initials):
+        scalar = newton_raphson(function, variable, initial, tolerance=0.5e-10, iterations=100, precision=15, compiled=True)
+        assert result[0][i] == scalar[0][-1]
+        assert abs(float(result[1][i]) - float(scalar[1][-1])) < 1e-12
+
+    # Test 3: zero derivative and initial roots
+    function, variables = parse_expression("x**2 - 4", logger)
+    variable = variables[0]
+    result = newton_raphson_multi_start(function, variable, [0, 2], tolerance=0.5e-10, iterations=100)
+
+    assert result[4][0] == "La derivada de la función en x = 0.0 es cero, podría haber una raíz múltiple."
+    assert result[4][1] == "2.0 es raíz de la función."
+    assert result[0][1] == 0
+
+
+def test_secant_multi_start():
+    # Test 1
+    function, variables = parse_expression("x**2 - 4", logger)
+    variable = variables[0]
+    result = secant_multi_start(function, variable, [0, -3, 1], [3, -1, 1], tolerance=0.5e-10, iterations=100)
+
+    assert float(result[1][0]) == 2.0
+    assert float(result[1][1]) == -2.0
+    assert result[4][2] == "El denominador de la fórmula es cero en x = 1.0, no se puede continuar con el método."
+
+    # Test 2: the lists of initial values must have the same length
+    try:
+        secant_multi_start(function, variable, [0, 1], [3], tolerance=0.5e-10, iterations=100)
+        raise AssertionError("The initial values have different lengths and should raise an exception")
+    except HTTPException as e:
+        assert e.detail == "Las listas de valores iniciales deben tener la misma longitud"
+
+
+def test_bisection_multi_start():
+    # Test 1
+    function, variables = parse_expression("x**2 - 4", logger)
+    variable = variables[0]
+    result = bisection_multi_start(function, variable, [0, -3, 5, 2], [3, 0, 6, 5], tolerance=0.5e-10, iterations=100)
+
+    assert abs(float(result[1][0]) - 2) < 1e-10
+    assert abs(float(result[1][1]) + 2) < 1e-10
+    assert result[4][2] == "La función no tiene cambio de signo en el intervalo dado"
+    assert result[4][3] == "2.0 es raíz de la función."
+
+    # Test 2: the iterations are limited
+    result = bisection_multi_start(function, variable, [0], [3], tolerance=0.5e-100, iterations=10)
+
+    assert result[0][0] == 10
+    assert result[4][0] == "El método no converge en 10 iteraciones."
+
+    # Test 3: many lanes at once
+    function, variables = parse_expression("sin(x)", logger)
+    variable = variables[0]
+    k = np.arange(1, 201)
+    result = bisection_multi_start(function, variable, list(k * np.pi - 1), list(k * np.pi + 1), tolerance=0.5e-12, iterations=100)
+
+    assert np.allclose([float(x) for x in result[1]], k * np.pi, atol=1e-11)
@@ -0,0 +1,83 @@
+from app.domain.polynomial_roots import polynomial_roots, polynomial_coefficients, companion_roots
+from app.utils.utils import parse_expression
+from app.routes.routes import logger
+from fastapi.exceptions import HTTPException
+import numpy as np
+import sympy as sp
+import time
+
+
+def test_polynomial_coefficients():
+    # Test 1: polynomials with numeric coefficients are detected
+    function, variables = parse_expression("3*x**3 - 2*x + 1/2", logger)
+    assert polynomial_coefficients(function, variables[0]) == [3, 0, -2, sp.Rational(1, 2)]
+
+    # Test 2: other functions are not polynomials
+    for expression in ["sin(x) + x", "x**(1/2) + 1", "exp(x)*x"]:
+        function, variables = parse_expression(expression, logger)
+        assert polynomial_coefficients(function, variables[0]) is None
+
+
+def test_polynomial_roots():
+    # Test 1: real roots with float64 numbers
+    function, variables = parse_expression("x**3 - 6*x**2 + 11*x - 6", logger)
+    variable = variables[0]
+    roots, real_roots, iterations, message = polynomial_roots(function, variable, precision=15)
+
+    assert [round(float(root), 12) for root in roots] == [1, 2, 3]
+    assert real_roots == roots
+    assert iterations == 0
+    assert message == "Se encontraron las 3 raíces del polinomio, 3 de ellas reales."
+
+    # Test 2: the roots are polished to the requested digits
+    roots, real_roots, iterations, message = polynomial_roots(function, variable, precision=40)
+    assert roots == ["1.0", "2.0", "3.0"]
+    assert iterations > 0
+
+    function, variables = parse_expression("x**2 - 2", logger)
+    roots, real_roots, iterations, message = polynomial_roots(function, variables[0], precision=50)
+    assert roots == ["-" + str(sp.N(sp.sqrt(2), 50)), str(sp.N(sp.sqrt(2), 50))]
+
+    # Test 3: complex roots and zero roots
+    function, variables = parse_expression("x**6 + x**2", logger)
+    roots, real_roots, iterations, message = polynomial_roots(function, variables[0], precision=20)
+    assert real_roots == ["0.0", "0.0"]
+    assert roots[0] == "-0.7071067811865475244 - 0.7071067811865475244*I"
+    assert roots[-1] == "0.7071067811865475244 + 0.7071067811865475244*I"
+    assert message == "Se encontraron las 6 raíces del polinomio, 2 de ellas reales."
+
+    # Test 4: every root of a polynomial of degree 50 in milliseconds
+    coefficients = np.random.default_rng(0).integers(-9, 10, 51)
+    coefficients[0] = 1
+    function = sp.Poly(coefficients.tolist(), variable).as_expr()
+    start = time.perf_counter()
+    roots, real_roots, iterations, message = polynomial_roots(function, variable, precision=15)
+    assert time.perf_counter() - start < 0.5
+    assert len(roots) == 50
+    assert np.allclose(sorted(np.roots(coefficients).real), sorted(complex(sp.sympify(root)).real for root in roots))
+
+    # Test 5: the float64 roots are written with the requested digits
+    function, variables = parse_expression("(x - 1)**2*(x + 2)", logger)
+    roots, real_roots, iterations, message = polynomial_roots(function, variables[0], precision=10)
+    assert roots[0] == "-2.0"
+
+    function, variables = parse_expression("x**2 - 2", logger)
+    roots, real_roots, iterations, message = polynomial_roots(function, variables[0], precision=10)
+    assert roots == ["-1.414213562", "1.414213562"]
+
+    # Test 6: companion matrix of a polynomial with complex coefficients
+    assert np.allclose(sorted(companion_roots([1, -3j, -2]), key=lambda root: root.imag), [1j, 2j])
+
+    # Test 7: expressions which are not polynomials and constant polynomials are rejected
+    function, variables = parse_expression("sin(x)", logger)
+    try:
+        polynomial_roots(function, variables[0])
+        assert False
+    except HTTPException as e:
+        assert e.detail == "La función no es un polinomio con coeficientes numéricos en la variable x"
+
+    try:
+        polynomial_roots(sp.Integer(4), variable)
+        assert False
+    except HTTPException as e:
+        assert e.detail == "El polinomio es constante, no tiene raíces"
@@ -0,0 +1,59 @@
+from app.domain.roots_scan import roots_scan
+from app.domain.multi_start import bracketing_multi_start
+from app.utils.compiler import compile_vectorized_expression
+from app.utils.utils import parse_expression
+from app.routes.routes import logger
+from fastapi.exceptions import HTTPException
+import numpy as np
+
+
+def test_roots_scan():
+    # Test 1: all the roots of sin(x) in [-10, 10]
+    function, variables = parse_expression("sin(x)", logger)
+    variable = variables[0]
+    roots, tables, message = roots_scan(function, variable, -10, 10, tolerance=0.5e-12, iterations=100)
+
+    assert [round(float(root), 10) for root in roots] == [round(k * np.pi, 10) for k in range(-3, 4)]
+    assert message == "Se encontraron 7 raíces en el intervalo [-10, 10]."
+    assert len(tables) == 7
+    assert all(len(table[0]) == len(table[1]) == len(table[2]) == len(table[3]) for table in tables)
+
+    # Test 2: the bisection and false rule methods find the same roots, the false rule method with less iterations
+    bisection_roots, bisection_tables, _ = roots_scan(function, variable, -10, 10, false_rule=False, tolerance=0.5e-12, iterations=100)
+    assert [round(float(root), 10) for root in bisection_roots] == [round(float(root), 10) for root in roots]
+    assert sum(len(table[0]) for table in tables) < sum(len(table[0]) for table in bisection_tables)
+
+    # Test 3: double root without a sign change and simple root
+    function, variables = parse_expression("(x - 0.3337)**2*(x + 0.77)", logger)
+    variable = variables[0]
+    roots, tables, message = roots_scan(function, variable, -1, 1, tolerance=0.5e-12, iterations=100)
+
+    assert [round(float(root), 8) for root in roots] == [-0.77, 0.3337]
+
+    # Test 4: discontinuities are not reported as roots
+    function, variables = parse_expression("tan(x)", logger)
+    variable = variables[0]
+    roots, tables, message = roots_scan(function, variable, 0.5, 3, tolerance=0.5e-12, iterations=100)
+
+    assert roots == []
+    assert message == "No se encontraron raíces en el intervalo [0.5, 3]."
+
+    # Test 5: invalid interval
+    try:
+        roots_scan(function, variable, 1, -1)
+        assert False
+    except HTTPException as e:
+        assert e.detail == "El valor inicial del intervalo debe ser menor que el valor final"
+
+
+def test_bracketing_multi_start():
+    # Test 1: the safeguarded false rule method converges on a function where the plain false rule method keeps one bound
+    function, variables = parse_expression("x**10 - 1", logger)
+    variable = variables[0]
+    evaluate_function = compile_vectorized_expression(function, variable)
+    traces = []
+    counter, x, f_x, error, status = bracketing_multi_start(evaluate_function, np.array([0.0, 0.5]), np.array([1.3, 2.0]), True, 0.5e-12, 100, True, traces)
+
+    assert np.allclose(x, 1)
+    assert all(counter < 100)
+    assert [len(trace[0]) for trace in traces] == counter.tolist()
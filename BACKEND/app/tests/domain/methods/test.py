@@ -1,4 +1,4 @@
-from app.domain.methods import bisection, false_rule, fixed_point, newton_raphson, secant, first_modified_newton_method, second_modified_newton_method
+from app.domain.methods import bisection, false_rule, fixed_point, newton_raphson, secant, first_modified_newton_method, second_modified_newton_method, brent, illinois
 from app.utils.utils import parse_expression
 from app.routes.routes import logger
 from fastapi.exceptions import HTTPException
@@ -131,6 +131,42 @@ def test_fixed_point():
     assert result[3][1] == "7.154845485377136"
 
 
+def test_fixed_point_acceleration():
+    # g'(x) is close to 1 at the fixed point, so the fixed point method converges slowly
+    function, variables = parse_expression("x**2 - 2", logger)
+    variable = variables[0]
+    function_g = parse_expression("x - 0.01*(x**2 - 2)", logger, variable_character=variable.name)[0]
+
+    # Test 1: the fixed point method converges linearly
+    result = fixed_point(function, variable, function_g, 1, 0.5e-12, 5000, False, precision=16)
+    assert result[0][-1] > 800
+    assert abs(float(result[5]) - 1) < 0.01
+
+    # Test 2: Aitken's extrapolation needs less evaluations of g
+    result = fixed_point(function, variable, function_g, 1, 0.5e-10, 5000, False, precision=16, acceleration="aitken")
+    assert result[0][-1] < 400
+    assert abs(float(result[1][-1]) - 1.4142135623730951) < 1e-8
+
+    # Test 3: Steffensen's method converges quadratically
+    for precision, compiled in [(16, False), (15, True), (30, True)]:
+        result = fixed_point(function, variable, function_g, 1, 0.5e-12, 5000, False, precision=precision, compiled=compiled, acceleration="steffensen")
+        assert result[0][-1] == 6
+        assert abs(float(result[1][-1]) - 1.4142135623730951) < 1e-12
+        assert abs(float(result[5]) - 2) < 0.01
+
+    # Test 4: the order can't be estimated with less than three errors
+    assert result[0] == [0, 1, 2, 3, 4, 5, 6]
+    result = fixed_point(function, variable, function_g, 1, 0.5e-12, 2, False, precision=16, acceleration="steffensen")
+    assert result[5] is None
+    assert "no converge" in result[4]
+
+    # Test 5: invalid acceleration
+    try:
+        fixed_point(function, variable, function_g, 1, 0.5e-12, 2, acceleration="newton")
+        assert False
+    except HTTPException as e:
+        assert e.detail == "El método de aceleración debe ser aitken o steffensen"
+
 def test_newton_raphson():
     # Test 1
     function, variables = parse_expression("(exp(x)/x) + 3", logger)
@@ -302,3 +338,152 @@ def test_second_modified_newton_method():
     assert result[1][-1] == "2.000000000000000"
     assert result[2][-1] == "0"
     assert result[3][-1] == "1.387778780781446e-17"
+
+def test_compiled_methods():
+    # Test 1: float64 compiled evaluation gives the same table as the symbolic evaluation
+    function, variables = parse_expression("exp(x) + 3 * cos(x)", logger)
+    variable = variables[0]
+    symbolic = false_rule(function, variable, -2, -1.5, 0.5e-10, 20, True, precision=15)
+    compiled = false_rule(function, variable, -2, -1.5, 0.5e-10, 20, True, precision=15, compiled=True)
+
+    assert compiled[0] == symbolic[0]
+    assert abs(float(compiled[1][-1]) - float(symbolic[1][-1])) < 1e-12
+    assert abs(float(compiled[2][-1])) < 1e-10
+
+    # Test 2: high precision compiled evaluation with mpmath
+    function, variables = parse_expression("(exp(x)/x) + 3", logger)
+    variable = variables[0]
+    symbolic = newton_raphson(function, variable, -0.5, tolerance=0.5e-25, iterations=100, precision=30)
+    compiled = newton_raphson(function, variable, -0.5, tolerance=0.5e-25, iterations=100, precision=30, compiled=True)
+
+    assert compiled[0] == symbolic[0]
+    assert compiled[1][-1][:28] == symbolic[1][-1][:28]
+    assert len(compiled[1][-1].replace("-0.", "")) == 30
+
+    # Test 3: every method works with the compiled evaluation
+    function, variables = parse_expression("x**2 - 4", logger)
+    variable = variables[0]
+    function_g = parse_expression("(x + 4/x)/2", logger, variable_character=variable.name)[0]
+    for precision in [15, 20]:
+        results = [
+            bisection(function, variable, 0, 3, 0.5e-10, 100, precision=precision, compiled=True),
+            false_rule(function, variable, 0, 3, 0.5e-10, 100, precision=precision, compiled=True),
+            fixed_point(function, variable, function_g, 3, 0.5e-10, 100, precision=precision, compiled=True),
+            newton_raphson(function, variable, 3, tolerance=0.5e-10, iterations=100, precision=precision, compiled=True),
+            secant(function, variable, 0, 3, tolerance=0.5e-10, iterations=100, precision=precision, compiled=True),
+            first_modified_newton_method(function, variable, 3, multiplicity=1, tolerance=0.5e-10, iterations=100, precision=precision, compiled=True),
+            second_modified_newton_method(function, variable, 3, tolerance=0.5e-10, iterations=100, precision=precision, compiled=True),
+        ]
+        for result in results:
+            assert abs(float(result[1][-1]) - 2) < 1e-9
+
+    # Test 4: the compiled function is not defined in the point
+    function, variables = parse_expression("log(x)", logger)
+    variable = variables[0]
+    try:
+        newton_raphson(function, variable, -1, tolerance=0.5e-10, iterations=10, precision=15, compiled=True)
+        raise AssertionError("The function is not defined in the initial point and should raise an exception")
+    except ValueError as e:
+        assert str(e) == "La función no está definida en x = -1"
+
+
+def test_automatic_differentiation():
+    # Test 1: the methods converge to the same root with automatic and symbolic derivatives
+    function, variables = parse_expression("exp(sin(x)**2)*log(x + 2) - 1", logger)
+    variable = variables[0]
+    for precision in [15, 30]:
+        for method in [
+            lambda **kwargs: newton_raphson(function, variable, 1, tolerance=0.5e-12, iterations=100, precision=precision, compiled=True, **kwargs),
+            lambda **kwargs: first_modified_newton_method(function, variable, 1, multiplicity=1, tolerance=0.5e-12, iterations=100, precision=precision, compiled=True, **kwargs),
+            lambda **kwargs: second_modified_newton_method(function, variable, 1, tolerance=0.5e-12, iterations=100, precision=precision, compiled=True, **kwargs),
+        ]:
+            symbolic = method()
+            automatic = method(automatic_differentiation=True)
+            # The rounding of the derivatives may differ in the last digit, which can take one more iteration to reach a zero
+            assert abs(len(automatic[0]) - len(symbolic[0])) <= 1
+            assert abs(float(automatic[1][-1]) - float(symbolic[1][-1])) < 1e-12
+
+    # Test 2: high precision values with mpmath
+    function, variables = parse_expression("(exp(x)/x) + 3", logger)
+    variable = variables[0]
+    symbolic = newton_raphson(function, variable, -0.5, tolerance=0.5e-25, iterations=100, precision=30, compiled=True)
+    automatic = newton_raphson(function, variable, -0.5, tolerance=0.5e-25, iterations=100, precision=30, compiled=True, automatic_differentiation=True)
+    assert automatic[0] == symbolic[0]
+    assert automatic[1][-1][:28] == symbolic[1][-1][:28]
+
+    # Test 3: the second derivative of a function with an absolute value can only be computed automatically
+    function, variables = parse_expression("Abs(x)**3 - 8", logger)
+    variable = variables[0]
+    result = second_modified_newton_method(function, variable, 3, tolerance=0.5e-10, iterations=100, precision=15, compiled=True, automatic_differentiation=True)
+    assert abs(float(result[1][-1]) - 2) < 1e-9
+
+    # Test 4: the derivatives provided are used instead of the automatic derivatives
+    function, variables = parse_expression("erf(x) - 1/2", logger)
+    variable = variables[0]
+    derivative = parse_expression("2*exp(-x**2)/sqrt(pi)", logger, variable_character=variable.name)[0]
+    automatic = newton_raphson(function, variable, 1, tolerance=0.5e-10, iterations=100, precision=15, compiled=True, automatic_differentiation=True)
+    provided = newton_raphson(function, variable, 1, derivative=derivative, tolerance=0.5e-10, iterations=100, precision=15, automatic_differentiation=True)
+    assert abs(float(automatic[1][-1]) - 0.4769362762044699) < 1e-9
+    assert abs(float(provided[1][-1]) - 0.4769362762044699) < 1e-9
+
+def test_brent():
+    # Test 1: converges to the root with less evaluations than the bisection method
+    function, variables = parse_expression("x**3 - 2*x - 5", logger)
+    variable = variables[0]
+    result = brent(function, variable, 2, 3, 0.5e-12, 100, True, 15, True)
+    bisection_result = bisection(function, variable, 2, 3, 0.5e-12, 100, True, 15, True)
+
+    assert abs(float(result[1][-1]) - 2.0945514815423265) < 1e-12
+    assert float(result[3][-1]) < 0.5e-12
+    assert "raíz" in result[4]
+    assert len(result[0]) * 5 < len(bisection_result[0])
+
+    # Test 2: the error is the width of the bracket, so it bounds the distance to the root
+    for x, error in zip(result[1], result[3]):
+        assert abs(float(x) - 2.0945514815423265) <= float(error) + 1e-15
+
+    # Test 3: symbolic evaluation with the same precision
+    result = brent(function, variable, 2, 3, 0.5e-12, 100, True)
+    assert abs(float(result[1][-1]) - 2.0945514815423265) < 1e-12
+
+    # Test 4: multiple root, where the interpolation is rejected and it takes as many steps as the bisection method
+    function, variables = parse_expression("(x - 1)**3", logger)
+    variable = variables[0]
+    result = brent(function, variable, 0, 3, 0.5e-12, 300, True, 15, True)
+    assert abs(float(result[1][-1]) - 1) < 1e-12
+    for tolerance in [1e-7, 1e-12]:
+        result = brent(function, variable, 0, 3, tolerance, 300, True, 15, True)
+        bisection_result = bisection(function, variable, 0, 3, tolerance, 300, True, 15, True)
+        assert len(result[0]) <= len(bisection_result[0]), "Test failed for the tolerance " + str(tolerance)
+
+    # Test 5: root in a bound and no sign change
+    result = brent(function, variable, 1, 3, 0.5e-12, 100, True)
+    assert result[4] == "1 es raíz de la función."
+    try:
+        brent(function, variable, 2, 3, 0.5e-12, 100, True)
+        assert False
+    except HTTPException as e:
+        assert e.detail == "La función no tiene cambio de signo en el intervalo dado"
+
+
+def test_illinois():
+    # Test 1: converges from both sides where the false rule method keeps one bound
+    function, variables = parse_expression("exp(x) - 10", logger)
+    variable = variables[0]
+    result = illinois(function, variable, 0, 5, 0.5e-12, 100, True, 15, True)
+    false_rule_result = false_rule(function, variable, 0, 5, 0.5e-12, 200, True, 15, True)
+
+    assert abs(float(result[1][-1]) - 2.302585092994046) < 1e-12
+    assert "raíz" in result[4]
+    assert len(result[0]) * 5 < len(false_rule_result[0])
+
+    # Test 2: relative error
+    result = illinois(function, variable, 0, 5, 0.5e-12, 100, False)
+    assert "raíz" in result[4]
+    assert abs(float(result[1][-1]) - 2.302585092994046) < 1e-11
+
+    # Test 3: not enough iterations
+    result = illinois(function, variable, 0, 5, 0.5e-12, 3, True)
+    assert len(result[0]) == 3
+    assert result[4] == "El método no converge en 3 iteraciones."
+
@@ -0,0 +1,81 @@
+from fastapi.testclient import TestClient
+from app.config.env import API_NAME, API_VERSION, DEFAULT_USER_NAME, DEFAULT_USER_PASSWORD
+from app.app import app
+
+client = TestClient(app)
+
+def test_batch():
+    """
+    Test the post batch endpoint /batch/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Prepare the data, with jobs of every kind of method and two jobs which fail
+    bisection = {"expression": "x**2 - 4", "initial": 0, "final": 28, "tolerance": 0.5e-100, "max_iterations": 100, "error_type": "absolute"}
+    newton_raphson = {"expression": "x**2 - 2", "initial": 1, "tolerance": 1e-10, "max_iterations": 100, "trace": "final"}
+    jacobi = {"A": [[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]], "b": [[-25], [82], [75], [-43]], "x_initial": [[2], [2], [2], [2]], "tol": 0.5e-4, "max_iter": 100, "order": 0, "precision": 16, "method_type": "iterative"}
+    vandermonde = {"x": [-2, -1, 2, 3], "y": [12.13533528, 6.367879441, -4.610943901, 2.085536923], "precision": 16}
+    data = {"jobs": [
+        {"method": "bisection", "data": bisection},
+        {"method": "newton_raphson", "data": newton_raphson},
+        {"method": "bisection", "data": {**bisection, "initial": 3}},
+        {"method": "jacobi", "data": jacobi},
+        {"method": "secant", "data": {"expression": "x**2 - 2"}},
+        {"method": "vandermonde", "data": vandermonde},
+    ]}
+
+    # Test the batch
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/batch/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["method"] for result in results] == ["bisection", "newton_raphson", "bisection", "jacobi", "secant", "vandermonde"]
+
+    # The results are the same as the results of the routes of every method
+    assert results[0]["error"] is None
+    assert results[0]["result"]["Iterations"][-1] == 55
+    assert results[0]["result"]["Xn"][-1] == "2.0"
+    assert results[1]["result"] == client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/", json=newton_raphson, headers=headers).json()
+    assert len(results[1]["result"]["Iterations"]) == 1
+    assert results[3]["result"] == client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/", json=jacobi, headers=headers).json()
+    assert results[3]["result"]["iterations"][-1] == 12
+    assert results[5]["result"]["polynomial"] == "0.4124120273166665*x**3 + 0.9393740418999997*x**2 - 5.836217904516666*x + 0.004699521900001835"
+
+    # The jobs which fail return their error without failing the other jobs
+    assert results[2]["result"] is None
+    assert results[2]["error"] == client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/", json={**bisection, "initial": 3}, headers=headers).json()["detail"]
+    assert results[4]["result"] is None
+    assert "validation error" in results[4]["error"]
+
+    # Test a batch with an unknown method
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/batch/", json={"jobs": [{"method": "unknown", "data": bisection}]}, headers=headers)
+
+    assert response.status_code == 422
+
+    # The factorizations of the batch jobs are stored in the cache of the server, so their handles work in the route and in later jobs
+    lu_factorization = {"A": [[3, 4, -2], [2, -3, 4], [1, -2, 3]], "b": [[0, 11, 7]]}
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/batch/", json={"jobs": [{"method": "lu_factorization", "data": lu_factorization}]}, headers=headers)
+
+    assert response.status_code == 200
+    result = response.json()["results"][0]["result"]
+    assert result["x"] == [['2', '-1', '1']]
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/lu_factorization/", json={"b": [[5, 3, 2]], "handle": result["handle"]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["x"] == [['1', '1', '1']]
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/batch/", json={"jobs": [{"method": "lu_factorization", "data": {"b": [[5, 3, 2]], "handle": result["handle"]}}]}, headers=headers)
+    assert response.json()["results"][0]["result"]["x"] == [['1', '1', '1']]
@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+import json
 from app.config.env import API_NAME, API_VERSION, DEFAULT_USER_NAME, DEFAULT_USER_PASSWORD
 from app.app import app
 
@@ -41,6 +42,23 @@ def test_gauss_elimination():
     assert answer["vectorial_error"] == [['0.0', '0.0', '0.0']]
     assert answer["absolute_error"] == '0.0'
 
+    # With 15 digits of precision the float64 engine is used
+    data["precision"] = 15
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/gauss_elimination/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["x"] == [['2.0', '-1.0', '1.0']]
+    assert answer["absolute_error"] == '0.0'
+
+    # The float64 engine can be chosen explicitly
+    data["precision"] = 16
+    data["engine"] = "float64"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/gauss_elimination/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["x"] == [['2.0', '-1.0', '1.0']]
+
 def test_lu_factorization():
     """
     Test the post lu factorization endpoint /linear_equations_system/lu_factorization/
@@ -78,6 +96,46 @@ def test_lu_factorization():
     assert answer["vectorial_error"] == [['0.0', '0.0', '0.0']]
     assert answer["absolute_error"] == "0.0"
 
+    # Solve new vectors of solutions with the handle of the stored factorization
+    handle = answer["handle"]
+    data = {
+        "b": [[0, 11, 7], [5, 3, 2]],
+        "handle": handle
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/lu_factorization/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["handle"] == handle
+    assert answer["x"][0] == ['2', '-1', '1']
+    assert answer["x"][1] == ['1', '1', '1']
+    assert answer["L"] == [['1.0', '0.0', '0.0'], ['0.6666666666666667', '1.0', '0.0'], ['0.3333333333333333', '0.5882352941176470', '1.0']]
+
+    # Without A the errors are computed with the matrix given back by the factors
+    assert len(answer["vectorial_error"]) == 2
+    assert float(answer["absolute_error"]) < 1e-12
+
+    # Test with a handle which is not stored
+    data["handle"] = "0" * 64
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/lu_factorization/", json=data, headers=headers)
+    assert response.status_code == 404
+
+    # With 15 digits of precision the blocked float64 factorization is used
+    data = {
+        "A": [[4, 3, 2, 1], [3, 12, 3, -2], [-2, 8, -9, -5], [-7, -3, 3, 6]],
+        "b": [[0, 8, 7, 1]],
+        "precision": 15,
+        "pivot_type": 1,
+        "block_size": 2
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/lu_factorization/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["L"][0] == ['1.0', '0.0', '0.0', '0.0']
+    assert answer["U"][0] == ['-7.0', '-3.0', '3.0', '6.0']
+    assert answer["x"][0][0].startswith("-0.574331953330824")
+
 def test_jacobi():
     """
     Test the post lu factorization endpoint /linear_equations_system/jacobi/
@@ -137,6 +195,70 @@ def test_jacobi():
     assert "0.4700089" in answer["x"][3][12]
     assert "es una aproximación de la solución del sistema con una tolerancia de" in answer["message"]
 
+    # Test 3: only the final row of the table
+    data["trace"] = "final"
+
+    # Make the request
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+
+    assert answer["iterations"] == [12]
+    assert "0.38480376" in answer["x"][0][0]
+    assert "0.4700089" in answer["x"][3][0]
+
+    # Test 4: the matrix method with float64 numbers performs the same iterations
+    data["engine"] = "float64"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["iterations"] == [12]
+    assert "0.38480376" in answer["x"][0][0]
+    assert "0.4700089" in answer["x"][3][0]
+    del data["engine"]
+
+    # Test 5: the same matrix as COO triplets and in CSR format
+    A = data["A"]
+    data["A"] = {
+        "format": "coo",
+        "shape": [4, 4],
+        "rows": [i for i in range(4) for j in range(4)],
+        "indices": [j for i in range(4) for j in range(4)],
+        "data": [A[i][j] for i in range(4) for j in range(4)]
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["iterations"] == [12]
+    assert "0.38480376" in answer["x"][0][0]
+    assert "0.4700089" in answer["x"][3][0]
+
+    data["A"] = {
+        "format": "csr",
+        "shape": [4, 4],
+        "indptr": [0, 4, 8, 12, 16],
+        "indices": [j for i in range(4) for j in range(4)],
+        "data": [A[i][j] for i in range(4) for j in range(4)]
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["x"] == answer["x"]
+
+    # Test 6: the spectral radius of a sparse matrix
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/spectral_radius_and_convergence/", json=data, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["spectral_radius"].startswith("0.3397416095456")
+
+    # Test 7: a CSR matrix without the pointers of the rows
+    del data["A"]["indptr"]
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/jacobi/", json=data, headers=headers)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "La matriz dispersa en formato csr debe tener los punteros de las filas"
+
 def test_gauss_seidel():
     """
     Test the post lu factorization endpoint /linear_equations_system/gauss_seidel/
@@ -257,6 +379,33 @@ def test_sor():
     assert "0.47001185882341" in answer["x"][3][10]
     assert "es una aproximación de la solución del sistema con una tolerancia de" in answer["message"]
 
+    # Test 3, the multicolor ordering of a dense matrix, which uses float64 numbers and is rejected with 16 digits of precision
+    data["ordering"] = "multicolor"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/sor/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "El ordenamiento multicolor usa números float64, use una precisión de 15 dígitos o menos o el motor float64"
+
+    data["engine"] = "float64"
+
+    # Make the request
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/sor/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+
+    assert abs(float(answer["x"][0][-1]) - 0.3848001) < 1e-5
+    assert abs(float(answer["x"][1][-1]) + 2.9618719) < 1e-5
+    assert abs(float(answer["x"][2][-1]) - 1.8929358) < 1e-5
+    assert abs(float(answer["x"][3][-1]) - 0.4700118) < 1e-5
+    assert "es una aproximación de la solución del sistema con una tolerancia de" in answer["message"]
+
+    # Make the request for the spectral radius of the multicolor ordering
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/sor/spectral_radius_and_convergence/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert float(response.json()["spectral_radius"]) < 1
+
 
 def test_jacobi_spectral_radius_and_convergence():
     """
@@ -379,4 +528,352 @@ def test_sor_spectral_radius_and_convergence():
     answer = response.json()
     assert "0.19091650493849" in answer["spectral_radius"]
     assert answer["convergence"] == "El método converge, el radio espectral de T es menor a 1 y/o la matriz es estrictamente diagonal dominante"
-    
\ No newline at end of file
+    
+
+
+def test_sor_optimal_w():
+    """
+    Test the post sor optimal relaxation factor endpoint /linear_equations_system/sor/optimal_w/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Test 1, a tridiagonal matrix uses the theorem of Young
+    data = {
+        "A": {"format": "coo", "shape": [4, 4], "rows": [0, 0, 1, 1, 1, 2, 2, 2, 3, 3], "indices": [0, 1, 0, 1, 2, 1, 2, 3, 2, 3],
+              "data": [2, -1, -1, 2, -1, -1, 2, -1, -1, 2]},
+        "w_min": 1,
+        "w_max": 1.5,
+        "points": 6,
+        "tol": 1e-6,
+        "precision": 10
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/sor/optimal_w/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["analytic"] is True
+    assert len(answer["w"]) == 6 and answer["w"][0] == "1.000000000"
+    assert answer["spectral_radius"][0].startswith("0.654508497")
+    assert answer["optimal_w"].startswith("1.259616184")
+    assert answer["optimal_spectral_radius"].startswith("0.2596161837")
+    assert answer["expected_iterations"] == 11
+    assert answer["iterations"][0] == 33
+
+    # Test 2, a list of relaxation factors for a matrix which isn't tridiagonal
+    data = {
+        "A": [[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]],
+        "w_values": [0.8, 1.001, 1.2],
+        "precision": 16
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/sor/optimal_w/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["analytic"] is False
+    assert answer["spectral_radius"][1].startswith("0.19091650493849")
+    assert answer["optimal_w"] in answer["w"]
+
+    # Test 3, an empty range
+    data = {
+        "A": [[4, 1], [1, 3]],
+        "w_min": 1.5,
+        "w_max": 1.2
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/sor/optimal_w/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "El factor de relajación mínimo debe ser menor al máximo"
+
+
+def test_conjugate_gradient():
+    """
+    Test the post conjugate gradient endpoint /linear_equations_system/conjugate_gradient/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Test 1, dense matrix with the Jacobi preconditioner
+    data = {
+        "A": [[4, -1, 0], [-1, 4, -1], [0, -1, 4]],
+        "b": [[2], [4], [10]],
+        "x_initial": [[0], [0], [0]],
+        "tol": 1e-10,
+        "max_iter": 100
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/conjugate_gradient/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["iterations"][-1] <= 4
+    assert abs(float(answer["x"][0][-1]) - 1) < 1e-10
+    assert abs(float(answer["x"][1][-1]) - 2) < 1e-10
+    assert abs(float(answer["x"][2][-1]) - 3) < 1e-10
+
+    # Test 2, sparse matrix with the incomplete Cholesky preconditioner and the last row of the table
+    data = {
+        "A": {"format": "coo", "shape": [3, 3], "rows": [0, 0, 1, 1, 1, 2, 2], "indices": [0, 1, 0, 1, 2, 1, 2], "data": [4, -1, -1, 4, -1, -1, 4]},
+        "b": [[2], [4], [10]],
+        "x_initial": [[0], [0], [0]],
+        "tol": 1e-10,
+        "max_iter": 100,
+        "preconditioner": "incomplete_cholesky",
+        "trace": "final"
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/conjugate_gradient/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert len(answer["iterations"]) == 1
+    assert abs(float(answer["x"][2][0]) - 3) < 1e-10
+
+    # Test 3, a matrix which isn't symmetric
+    data["A"] = [[4, -1, 0], [-2, 4, -1], [0, -1, 4]]
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/conjugate_gradient/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "La matriz A no es simétrica, el método del gradiente conjugado requiere una matriz simétrica definida positiva"
+
+
+def test_gmres_and_bicgstab():
+    """
+    Test the post gmres and bicgstab endpoints /linear_equations_system/gmres/ and /linear_equations_system/bicgstab/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Test 1, a nonsymmetric dense matrix whose Jacobi method doesn't converge
+    data = {
+        "A": [[1, 2, -2], [1, 1, 1], [2, 2, 1]],
+        "b": [[1], [2], [3]],
+        "x_initial": [[0], [0], [0]],
+        "tol": 1e-10,
+        "max_iter": 100
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/gmres/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["iterations"][-1] <= 3
+    assert float(answer["residual"][-1]) <= 1e-10
+    assert len(answer["residual"]) == len(answer["iterations"])
+    assert abs(float(answer["x"][0][-1]) + 1) < 1e-9
+    assert abs(float(answer["x"][1][-1]) - 2) < 1e-9
+    assert abs(float(answer["x"][2][-1]) - 1) < 1e-9
+
+    # Test 2, a sparse matrix with the BiCGSTAB method and the incomplete LU factorization
+    data = {
+        "A": {"format": "coo", "shape": [3, 3], "rows": [0, 0, 1, 1, 1, 2, 2], "indices": [0, 1, 0, 1, 2, 1, 2], "data": [4, -2, -1, 4, -2, -1, 4]},
+        "b": [[2], [-1], [7]],
+        "x_initial": [[0], [0], [0]],
+        "tol": 1e-10,
+        "error_type": "relative",
+        "preconditioner": "ilu"
+    }
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/bicgstab/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert float(answer["residual"][-1]) <= 1e-10
+    assert abs(float(answer["x"][0][-1]) - 1) < 1e-9
+    assert abs(float(answer["x"][1][-1]) - 1) < 1e-9
+    assert abs(float(answer["x"][2][-1]) - 2) < 1e-9
+
+
+def test_cholesky():
+    """
+    Test the post cholesky factorization endpoint /linear_equations_system/cholesky/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Prepare the data, with a symmetric positive definite matrix
+    data = {
+        "A": [[4, 12, -16], [12, 37, -43], [-16, -43, 98]],
+        "b": [[0, 6, 39]],
+        "n": 3
+    }
+
+    # Make the request
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/cholesky/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["method"] == "cholesky"
+    assert answer["x"] == [['1', '1', '1']]
+    assert answer["L"] == [['2.0', '0.0', '0.0'], ['6', '1.0', '0.0'], ['-8', '5', '3.0']]
+    assert answer["D"] is None and answer["U"] is None
+    assert answer["absolute_error"] == "0.0"
+
+    # Solve new vectors of solutions with the handle of the stored factorization
+    handle = answer["handle"]
+    data = {
+        "b": [[0, 6, 39], [-40, -111, 223]],
+        "handle": handle
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/cholesky/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["handle"] == handle
+    assert answer["x"] == [['1', '1', '1'], ['1', '-1', '2']]
+    assert float(answer["absolute_error"]) < 1e-12
+
+    # Test the LDL^T factorization with the float64 engine
+    data = {
+        "A": [[4, 12, -16], [12, 37, -43], [-16, -43, 98]],
+        "b": [[0, 6, 39]],
+        "method": "ldlt",
+        "precision": 15
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/cholesky/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["method"] == "ldlt"
+    assert answer["x"] == [['1.0', '1.0', '1.0']]
+    assert answer["L"] == [['1.0', '0.0', '0.0'], ['3.0', '1.0', '0.0'], ['-4.0', '5.0', '1.0']]
+    assert answer["D"] == ['4.0', '1.0', '9.0']
+    assert answer["handle"] != handle
+
+    # A matrix which is not symmetric is solved with the LU factorization
+    data = {
+        "A": [[3, 4, -2], [2, -3, 4], [1, -2, 3]],
+        "b": [[0, 11, 7]]
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/cholesky/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["method"] == "lu"
+    assert answer["x"] == [['2', '-1', '1']]
+    assert answer["U"] == [['3.0', '4.0', '-2.0'], ['0.0', '-5.666666666666667', '5.333333333333333'], ['0.0', '0.0', '0.529411764705883']]
+
+    # Test with a handle which is not stored
+    data = {
+        "b": [[0, 11, 7]],
+        "handle": "0" * 64
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/cholesky/", json=data, headers=headers)
+    assert response.status_code == 404
+
+    # The handles of one method are rejected by the other one
+    data["handle"] = handle
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/lu_factorization/", json=data, headers=headers)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "El identificador no corresponde a una factorización del método de Factorización LU"
+
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/lu_factorization/", json={"A": [[3, 4, -2], [2, -3, 4], [1, -2, 3]], "b": [[0, 11, 7]]}, headers=headers)
+    data["handle"] = response.json()["handle"]
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/cholesky/", json=data, headers=headers)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "El identificador no corresponde a una factorización del método de Cholesky"
+
+
+def test_streaming():
+    """
+    Test the streaming responses of the post endpoints /linear_equations_system/jacobi/, /linear_equations_system/gauss_seidel/ and /linear_equations_system/sor/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Prepare the data
+    data = {
+        "A": [[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]],
+        "b": [[-25], [82], [75], [-43]],
+        "x_initial": [[2], [2], [2], [2]],
+        "tol": 0.5e-4,
+        "max_iter": 100,
+        "order": 0,
+        "precision": 16,
+        "w": 1.1
+    }
+
+    for method in ["jacobi", "gauss_seidel", "sor"]:
+        for method_type in ["iterative", "matrix"]:
+            # Get the whole table
+            data["method_type"] = method_type
+            data.pop("stream", None)
+            response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/{method}/", json=data, headers=headers)
+            assert response.status_code == 200
+            table = response.json()
+
+            # Stream the same table as newline delimited JSON
+            data["stream"] = "ndjson"
+            response = client.post(f"/api/{API_VERSION}/{API_NAME}/linear_equations_system/{method}/", json=data, headers=headers)
+
+            assert response.status_code == 200
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert [line["iterations"] for line in lines[:-1]] == table["iterations"]
+            assert [line["x"] for line in lines[:-1]] == [list(row) for row in zip(*table["x"])]
+            assert [line["error"] for line in lines[:-1]] == table["error"]
+            assert lines[-1] == {"message": table["message"]}
+
@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+import json
 from app.config.env import API_NAME, API_VERSION, DEFAULT_USER_NAME, DEFAULT_USER_PASSWORD
 from app.app import app
 
@@ -248,6 +249,24 @@ def test_fixed_point():
     assert answer["Fx"][-1] == "0"
     assert answer["Error"][-1] == "0"
 
+    # Test the fixed point method with Steffensen's acceleration
+    data = {
+        "expression": "x**2 - 2",
+        "g_expression": "x - 0.01*(x**2 - 2)",
+        "initial": 1,
+        "tolerance": 0.5e-12,
+        "max_iterations": 100,
+        "error_type": "relative",
+        "precision": 16,
+        "acceleration": "steffensen"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/fixed_point/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["Iterations"][-1] == 6
+    assert abs(float(answer["Xn"][-1]) - 1.4142135623730951) < 1e-12
+    assert abs(float(answer["Order"]) - 2) < 0.01
 
 def test_newton_raphson():
     """
@@ -316,6 +335,55 @@ def test_newton_raphson():
     assert answer["Fx"][-1] == "0"
     assert answer["Error"][-1] == "0"
 
+    # Test the newton raphson method with automatic differentiation
+    data = {
+        "expression": "(exp(x)/x) + 3",
+        "initial": -1,
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute",
+        "precision": 15,
+        "automatic_differentiation": True
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert abs(float(answer["Xn"][-1]) + 0.2576276530497367) < 1e-12
+    assert "aproximación" in answer["Message"] or "raíz" in answer["Message"]
+
+    # Test the newton raphson method returning only some rows of the table
+    data = {
+        "expression": "(exp(x)/x) + 3",
+        "initial": -1,
+        "tolerance": 0.5e-100,
+        "max_iterations": 100,
+        "error_type": "absolute",
+        "precision": 16,
+        "trace": "final"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["Iterations"] == [12]
+    assert answer["Xn"] == ["-0.2576276530497367"]
+    assert answer["Error"] == ["1.679212324745549e-15"]
+
+    data["trace"] = "last"
+    data["trace_size"] = 3
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["Iterations"] == [10, 11, 12]
+
+    data["trace"] = "every"
+    data["trace_size"] = 5
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["Iterations"] == [0, 5, 10, 12]
+
 
 def test_secant():
     """
@@ -511,4 +579,315 @@ def test_second_modified_newton_method():
     assert answer["Xn"][-1] == "0.0"
     assert answer["Fx"][-1] == "0"
     assert answer["Error"][-1] == "0"
-    
\ No newline at end of file
+    
+
+def test_multi_start():
+    """
+    Test the post multi-start endpoints /methods/bisection/batch/, /methods/newton_raphson/batch/ and /methods/secant/batch/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Test the multi-start bisection method
+    data = {
+        "expression": "x**2 - 4",
+        "initials": [0, -3, 5],
+        "finals": [3, 0, 6],
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/batch/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert len(answer["Xn"]) == 3
+    assert abs(float(answer["Xn"][0]) - 2) < 1e-10
+    assert abs(float(answer["Xn"][1]) + 2) < 1e-10
+    assert answer["Message"][2] == "La función no tiene cambio de signo en el intervalo dado"
+
+    # Test the multi-start newton raphson method
+    data = {
+        "expression": "x**3 - x",
+        "initials": [-2, 0.3, 2],
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/batch/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert [round(float(x), 8) for x in answer["Xn"]] == [-1.0, 0.0, 1.0]
+
+    # Test the multi-start secant method
+    data = {
+        "expression": "x**2 - 4",
+        "initials": [0, -3],
+        "second_initials": [3, -1],
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/secant/batch/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["Xn"] == ["2.0", "-2.0"]
+
+    # Test the multi-start secant method with lists of different lengths
+    data["second_initials"] = [3]
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/secant/batch/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Las listas de valores iniciales deben tener la misma longitud"
+
+
+def test_roots_scan():
+    """
+    Test the post roots scan endpoint /methods/roots_scan/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Test the roots scan with the false rule method
+    data = {
+        "expression": "x**3 - x",
+        "initial": -2,
+        "final": 2.5,
+        "samples": 100,
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/roots_scan/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert [round(float(root), 10) for root in answer["Roots"]] == [-1.0, 0.0, 1.0]
+    assert len(answer["Traces"]) == 3
+    assert answer["Message"] == "Se encontraron 3 raíces en el intervalo [-2.0, 2.5]."
+
+    # Test the roots scan with the bisection method
+    data["method"] = "bisection"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/roots_scan/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert [round(float(root), 10) for root in response.json()["Roots"]] == [-1.0, 0.0, 1.0]
+
+    # Test an invalid interval
+    data["initial"] = 3
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/roots_scan/", json=data, headers=headers)
+
+    assert response.status_code == 500
+
+
+
+def test_polynomial_roots():
+    """
+    Test the post polynomial roots endpoint /methods/polynomial_roots/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Prepare the data
+    data = {
+        "expression": "x**4 - 1",
+        "precision": 30
+    }
+
+    # Test the polynomial roots
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/polynomial_roots/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert answer["Roots"] == ["-1.0", "0.0 - 1.0*I", "0.0 + 1.0*I", "1.0"]
+    assert answer["RealRoots"] == ["-1.0", "1.0"]
+    assert answer["Message"] == "Se encontraron las 4 raíces del polinomio, 2 de ellas reales."
+
+    # Test the polynomial roots with float64 numbers
+    data["precision"] = 15
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/polynomial_roots/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert [round(float(root), 12) for root in answer["RealRoots"]] == [-1.0, 1.0]
+    assert answer["Iterations"] == 0
+
+    # Test an expression which is not a polynomial
+    data["expression"] = "cos(x) - x"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/polynomial_roots/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "La función no es un polinomio con coeficientes numéricos en la variable x"
+
+def test_streaming():
+    """
+    Test the streaming responses of the post endpoints /methods/bisection/ and /methods/newton_raphson/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Get the whole table of the bisection method
+    data = {
+        "expression": "x**2 - 4",
+        "initial": 0,
+        "final": 3,
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute",
+        "precision": 16
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/", json=data, headers=headers)
+    assert response.status_code == 200
+    table = response.json()
+
+    # Stream the same table as newline delimited JSON
+    data["stream"] = "ndjson"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["Xn"] for line in lines[:-1]] == table["Xn"]
+    assert [line["Error"] for line in lines[:-1]] == table["Error"]
+    assert lines[-1] == {"Message": table["Message"]}
+
+    # Stream as server-sent events
+    data["stream"] = "sse"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = response.text.strip().split("\n\n")
+    assert len(events) == len(table["Xn"]) + 1
+    assert events[-1] == "event: result\ndata: " + json.dumps({"Message": table["Message"]})
+
+    # The errors raised before the first row keep their status code
+    data["final"] = 1
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "La función no tiene cambio de signo en el intervalo dado"
+
+    # Stream a compiled Newton Raphson method
+    data = {
+        "expression": "x**3 - 2",
+        "initial": 1,
+        "tolerance": 0.5e-10,
+        "max_iterations": 100,
+        "error_type": "absolute",
+        "precision": 15,
+        "compiled": True,
+        "stream": "ndjson"
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/newton_raphson/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["Iterations"] == 0
+    assert abs(float(lines[-2]["Xn"]) - 2 ** (1 / 3)) < 1e-10
+    assert "raíz" in lines[-1]["Message"]
+
+
+def test_brent():
+    """
+    Test the post brent endpoint /methods/brent/
+    """
+    # First, we need to login
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+
+    # Prepare the headers
+    answer = response.json()
+    token = answer["access_token"]
+    token_type = answer["token_type"]
+    headers = {
+        "Authorization": f"{token_type} {token}"
+    }
+
+    # Test Brent's method
+    data = {
+        "expression": "x**3 - 2*x - 5",
+        "initial": 2,
+        "final": 3,
+        "tolerance": 0.5e-12,
+        "max_iterations": 100,
+        "error_type": "absolute",
+        "precision": 15,
+        "compiled": True
+    }
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/brent/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert abs(float(answer["Xn"][-1]) - 2.0945514815423265) < 1e-12
+    assert len(answer["Iterations"]) < 10
+
+    # Test the Illinois method
+    data["method"] = "illinois"
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/brent/", json=data, headers=headers)
+
+    assert response.status_code == 200
+    answer = response.json()
+    assert abs(float(answer["Xn"][-1]) - 2.0945514815423265) < 1e-12
+    assert len(answer["Iterations"]) < 15
+
+    # Test an interval without a sign change
+    data["final"] = 2.05
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/brent/", json=data, headers=headers)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "La función no tiene cambio de signo en el intervalo dado"
+
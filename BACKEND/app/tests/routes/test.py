@@ -46,4 +46,32 @@ def test_protected():
     assert response.status_code == 200
     data = response.json()
     assert f"This is a protected endpoint. Welcome, {DEFAULT_USER_NAME}!" == data
-    
\ No newline at end of file
+    
+
+
+def test_cache_stats():
+    """
+    Test the get cache statistics endpoint /cache/stats/
+    """
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/login/", json={
+        "username": DEFAULT_USER_NAME,
+        "password": DEFAULT_USER_PASSWORD
+    })
+    assert response.status_code == 200
+    data = response.json()
+    headers = {
+        "Authorization": f"{data['token_type']} {data['access_token']}"
+    }
+    response = client.get(f"/api/{API_VERSION}/{API_NAME}/cache/stats/", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    for cache in ["expressions", "derivatives", "compiled", "factorizations"]:
+        assert set(data[cache].keys()) == {"size", "max_size", "hits", "misses", "evictions"}
+
+    # The expressions parsed by the methods in the worker processes are counted
+    lookups = data["expressions"]["hits"] + data["expressions"]["misses"]
+    response = client.post(f"/api/{API_VERSION}/{API_NAME}/methods/bisection/", json={"expression": "x**2 - 2", "initial": 0, "final": 2, "tolerance": 0.5e-5, "max_iterations": 100}, headers=headers)
+    assert response.status_code == 200
+    data = client.get(f"/api/{API_VERSION}/{API_NAME}/cache/stats/", headers=headers).json()
+    assert data["expressions"]["hits"] + data["expressions"]["misses"] > lookups
+
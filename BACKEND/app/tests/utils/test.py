@@ -1,6 +1,19 @@
 from app.utils.utils import parse_expression, construct_augmented_matrix, calculate_spectral_radius, is_strictly_diagonally_dominant
+from app.utils.cache import LRUCache, expressions_cache, derivatives_cache, add_caches_stats
+from app.utils.compiler import compile_autodiff_expression, compile_expression, compile_fused_expressions, create_fused_evaluator, differentiate
+from app.utils.autodiff import forward_mode
+from app.utils.tables import IterationTable, create_table, stream_table
+from app.utils.workers import ProcessRunner, ThreadRunner, stream_job
+from app.utils import workers
+from app.utils.sparse import CSRMatrix, greedy_coloring
+from app.utils.parallel import RowBlockProduct
 from app.routes.routes import logger
 from fastapi.exceptions import HTTPException
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import math
+import time
 import numpy as np
 import sympy as sp
 
@@ -121,6 +134,22 @@ def test_calculate_spectral_radius():
     A = sp.Matrix([[1, 2], [3, 4]])
     assert calculate_spectral_radius(A) == "5.372281323269014", "Test failed for a 2x2 matrix"
 
+    # Test 4: the eigenvalue is refined to the requested precision
+    assert calculate_spectral_radius(A, 40) == str(sp.N((5 + sp.sqrt(33)) / 2, 40)), "Test failed for 40 digits"
+
+    # Test 5: complex eigenvalues and an exact eigenvalue
+    A = sp.Matrix([[sp.Rational(1, 3), -sp.Rational(1, 2)], [sp.Rational(1, 2), sp.Rational(1, 3)]])
+    assert calculate_spectral_radius(A, 30) == str(sp.N(sp.sqrt(sp.Rational(13, 36)), 30)), "Test failed for complex eigenvalues"
+    assert calculate_spectral_radius(sp.Matrix([[2, 0], [0, -2]]), 20) == str(sp.Float(2, 20)), "Test failed for an exact eigenvalue"
+
+    # Test 6: a NumPy matrix isn't refined, so it only gets the digits of the float64 numbers
+    A = np.array([[0, 0.1], [1, 0]])
+    assert calculate_spectral_radius(A, 20) == "0.316227766016838", "Test failed for a float64 matrix"
+
+    # Test 7: a big matrix uses the Arnoldi iteration
+    A = np.random.default_rng(1).standard_normal((500, 500)) / 30
+    assert abs(float(calculate_spectral_radius(A, 12)) - np.max(np.abs(np.linalg.eigvals(A)))) < 1e-10, "Test failed for a 500x500 matrix"
+
 def test_is_strictly_diagonally_dominant():
     # Test 1
     A = np.array([[10, 2, 3], [4, 20, 6], [7, 8, 30]])
@@ -137,3 +166,425 @@ def test_is_strictly_diagonally_dominant():
     # Test 4
     A = np.array([[45, 13, -4, 8], [-5, -28, 4, -14], [9, 15, 63, -7], [2, 3, -8, -42]])
     assert is_strictly_diagonally_dominant(A), "Test failed for a 4x4 matrix"
+
+
+def test_lru_cache():
+    # Test 1: hits, misses and evictions
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "max_size": 2, "hits": 2, "misses": 1, "evictions": 1}
+
+    # Test 2: the value is created only once
+    calls = []
+    assert cache.get_or_create("d", lambda: calls.append(1) or 4) == 4
+    assert cache.get_or_create("d", lambda: calls.append(1) or 4) == 4
+    assert len(calls) == 1
+
+    # Test 3: failed creations are not stored
+    try:
+        cache.get_or_create("e", lambda: 1 / 0)
+        raise AssertionError("The creation should raise an exception")
+    except ZeroDivisionError:
+        assert cache.get("e") is None
+
+    # Test 4: the cache is cleared
+    cache.clear()
+    assert cache.stats() == {"size": 0, "max_size": 2, "hits": 0, "misses": 0, "evictions": 0}
+
+    # Test 5: the counters of the caches of several processes are added
+    first = {"expressions": {"size": 2, "max_size": 2, "hits": 2, "misses": 1, "evictions": 1}}
+    second = {"expressions": {"size": 1, "max_size": 2, "hits": 0, "misses": 1, "evictions": 0}}
+    assert add_caches_stats([first, second]) == {"expressions": {"size": 3, "max_size": 4, "hits": 2, "misses": 2, "evictions": 1}}
+    assert add_caches_stats([]) == {}
+
+
+def test_expressions_cache():
+    # Test 1: repeated expressions are parsed once
+    expression = "x**3 - 7*x + cos(x)"
+    hits = expressions_cache.stats()["hits"]
+    first, first_variables = parse_expression(expression, logger)
+    second, second_variables = parse_expression(expression, logger)
+    assert first is second
+    assert first_variables == second_variables
+    assert expressions_cache.stats()["hits"] == hits + 1
+
+    # Test 2: repeated derivatives and compilations are reused
+    variable = first_variables[0]
+    hits = derivatives_cache.stats()["hits"]
+    assert differentiate(first, variable) is differentiate(first, variable)
+    assert derivatives_cache.stats()["hits"] == hits + 1
+    assert compile_expression(first, variable, 10) is compile_expression(first, variable, 15)
+    assert compile_expression(first, variable, 20) is not compile_expression(first, variable, 30)
+
+    # Test 3: invalid expressions are not stored
+    for _ in range(2):
+        try:
+            parse_expression("x**2 + xx", logger)
+            raise AssertionError("The expression is invalid and should raise an exception")
+        except HTTPException as e:
+            assert e.detail == "Expresión Inválida, verifique la guía de expresiones"
+
+
+def test_fused_expressions():
+    function, variables = parse_expression("exp(sin(x)**2)*log(x + 2)", logger)
+    variable = variables[0]
+    derivative = differentiate(function, variable)
+    second_derivative = differentiate(derivative, variable)
+    expressions = (function, derivative, second_derivative)
+
+    # Test 1: the fused callable matches the callables of every expression
+    fused = compile_fused_expressions(expressions, variable, 15)
+    values = fused(1.3)
+    assert len(values) == 3
+    for value, expression in zip(values, expressions):
+        assert abs(value - compile_expression(expression, variable, 15)(1.3)) < 1e-12
+
+    # Test 2: high precision values
+    values = compile_fused_expressions(expressions, variable, 40)(1.3)
+    for value, expression in zip(values, expressions):
+        assert abs(value - compile_expression(expression, variable, 40)(1.3)) < 1e-35
+
+    # Test 3: the symbolic evaluator gives the same values as subs and evalf
+    values = create_fused_evaluator(expressions, variable, 16)(1.3)
+    assert values == tuple(expression.subs(variable, 1.3).evalf(16) for expression in expressions)
+
+    # Test 4: the derivatives are nan where only they are not defined, and an error is raised where the function is not defined
+    function, variables = parse_expression("x**(1/3)", logger)
+    variable = variables[0]
+    fused = compile_fused_expressions((function, differentiate(function, variable)), variable, 15)
+    value, derivative_value = fused(0)
+    assert value == 0
+    assert np.isnan(derivative_value)
+    try:
+        compile_fused_expressions((parse_expression("log(x)", logger)[0], derivative), variable, 15)(-1)
+        assert False
+    except ValueError as e:
+        assert str(e) == "La función no está definida en x = -1"
+
+def test_autodiff_expressions():
+    function, variables = parse_expression("exp(sin(x)**2)*log(x + 2) + sqrt(x)/tan(x) - acosh(x + 2)*atan(x) + 2**x + x**x", logger)
+    variable = variables[0]
+    derivative = differentiate(function, variable)
+    second_derivative = differentiate(derivative, variable)
+
+    # Test 1: the derivatives match the symbolic derivatives with float64 and mpmath numbers
+    for precision, error in [(15, 1e-12), (40, 1e-35)]:
+        values = compile_autodiff_expression(function, variable, 2, precision)(1.3)
+        expected = compile_fused_expressions((function, derivative, second_derivative), variable, precision)(1.3)
+        for value, expected_value in zip(values, expected):
+            assert abs(value - expected_value) < error * max(1, abs(expected_value))
+
+    # Test 2: only the requested derivatives are returned, and constant expressions have zero derivatives
+    assert len(compile_autodiff_expression(function, variable, 1, 15)(1.3)) == 2
+    assert compile_autodiff_expression(sp.Integer(3), variable, 2, 15)(1.3) == (3.0, 0.0, 0.0)
+
+    # Test 3: the derivatives are nan where only they are not defined
+    value, derivative_value = compile_autodiff_expression(parse_expression("x**(1/3)", logger)[0], variable, 1, 15)(0)
+    assert value == 0
+    assert np.isnan(derivative_value)
+
+    # Test 4: the program grows with the nodes of the expression, so nested expressions are differentiated without expanding them
+    nested = variable
+    for _ in range(6):
+        nested = sp.exp(sp.sin(nested)) * sp.log(nested**2 + 2) + sp.cos(variable * nested)
+    assignments, outputs = forward_mode(nested, variable, 2)
+    assert len(assignments) < 300
+    assert len(outputs) == 3
+
+    # Test 5: functions without a known derivative can't be differentiated automatically
+    assert forward_mode(sp.Function("f")(variable) + variable, variable, 1) is None
+    assert compile_autodiff_expression(sp.floor(variable), variable, 1, 15) is None
+
+def test_iteration_table():
+    # Test 1: the rows are returned by columns
+    table = IterationTable()
+    table.append(0, "1.0", "-")
+    table.append(1, "1.5", "0.5")
+    assert table.columns(3) == [[0, 1], ["1.0", "1.5"], ["-", "0.5"]]
+
+    # Test 2: an empty table has empty columns
+    assert IterationTable().columns(3) == [[], [], []]
+
+    # Test 3: the values are formatted when the columns are returned
+    table = IterationTable()
+    table.append(0, 0.5, [1.0, np.float64(2.5)], 0)
+    assert table.columns(4) == [[0], ["0.5"], [["1.0", "2.5"]], ["0"]]
+
+    # Test 4: only the last rows are kept
+    for rows, expected in [(2, [0, 1]), (3, [0, 1, 2]), (7, [4, 5, 6])]:
+        table = IterationTable(last=3)
+        for i in range(rows):
+            table.append(i, i / 2)
+        assert table.columns(2)[0] == expected
+    table = create_table("final")
+    for i in range(10):
+        table.append(i, i / 2)
+    assert table.columns(2) == [[9], ["4.5"]]
+
+    # Test 5: one of every n rows and the last row are kept
+    for rows, expected in [(7, [0, 3, 6]), (8, [0, 3, 6, 7])]:
+        table = create_table("every", 3)
+        for i in range(rows):
+            table.append(i, i / 2)
+        assert table.columns(2)[0] == expected
+
+    # Test 6: the columns are arrays which grow with the rows and change to object arrays for other values
+    table = IterationTable()
+    for i in range(100):
+        table.append(i, i / 2 if i < 99 else sp.Float("49.5", 20), 0 if i == 0 else 2.0 ** -i)
+    assert table.data[0].dtype == np.int64 and table.data[1].dtype == object and table.data[2].dtype == object
+    assert table.data[0].size == 128
+    columns = table.columns(3)
+    assert columns[0] == list(range(100))
+    assert columns[1][-2:] == ["49.0", "49.500000000000000000"]
+    assert columns[2][:2] == ["0", "0.5"]
+    table.append(2 ** 70, 0.5, 0.5)
+    assert table.columns(3)[0][-1] == 2 ** 70
+
+    # Test 7: invalid number of rows
+    try:
+        IterationTable(last=0)
+        assert False
+    except ValueError as e:
+        assert str(e) == "El número de filas de la tabla debe ser un entero positivo"
+
+
+def test_stream_table():
+    def solve(table, rows):
+        for i in range(rows):
+            table.append(i, str(i / 2))
+        return (*table.columns(2), "done")
+
+    async def read(response):
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    # Test 1: newline delimited JSON with one line per row and the result at the end
+    response = stream_table(lambda table: solve(table, 200), ["Iterations", "Xn"], ["Message"], "ndjson")
+    lines = [json.loads(line) for line in asyncio.run(read(response)).splitlines()]
+    assert response.media_type == "application/x-ndjson"
+    assert len(lines) == 201
+    assert lines[0] == {"Iterations": 0, "Xn": "0.0"}
+    assert lines[-1] == {"Message": "done"}
+
+    # Test 2: server-sent events
+    response = stream_table(lambda table: solve(table, 2), ["Iterations", "Xn"], ["Message"], "sse")
+    body = asyncio.run(read(response))
+    assert response.media_type == "text/event-stream"
+    assert body.startswith('event: row\ndata: {"Iterations": 0, "Xn": "0.0"}\n\n')
+    assert body.endswith('event: result\ndata: {"Message": "done"}\n\n')
+
+    # Test 3: the errors raised before the first row are raised by the route
+    def fail(table):
+        raise ValueError("invalid")
+    try:
+        stream_table(fail, ["Iterations"], ["Message"])
+        assert False
+    except ValueError as e:
+        assert str(e) == "invalid"
+
+    # Test 4: the errors raised after the first row are sent as an error event
+    def fail_later(table):
+        table.append(0)
+        raise ValueError("invalid")
+    response = stream_table(fail_later, ["Iterations"], ["Message"])
+    lines = [json.loads(line) for line in asyncio.run(read(response)).splitlines()]
+    assert lines == [{"Iterations": 0}, {"detail": "invalid"}]
+
+
+def test_runners():
+    """
+    Test the process and thread runners of the jobs from the workers module
+    """
+    async def run_jobs(runner):
+        results = []
+        # Results, errors and HTTP errors of the jobs are returned as they are raised in the worker
+        results.append(await runner.run(math.sqrt, 16))
+        for function, args in [(math.sqrt, (-1,)), (parse_expression, ("x +* 2", logger))]:
+            try:
+                await runner.run(function, *args)
+            except HTTPException as e:
+                results.append((e.status_code, e.detail))
+            except ValueError as e:
+                results.append(str(e))
+
+        # A job which exceeds the time limit fails without affecting the next jobs
+        start = time.perf_counter()
+        try:
+            await runner.run(time.sleep, 5)
+        except HTTPException as e:
+            results.append((e.status_code, e.detail))
+        results.append(time.perf_counter() - start < 4)
+        results.append(await asyncio.gather(*(runner.run(math.factorial, n) for n in range(6))))
+        return results
+
+    expected = [4.0, "math domain error", (500, "Expresión Inválida, verifique la guía de expresiones"), (504, "El método excedió el tiempo máximo de ejecución de 2 segundos"), True, [1, 1, 2, 6, 24, 120]]
+
+    runner = ProcessRunner(2, timeout=2)
+    try:
+        assert asyncio.run(run_jobs(runner)) == expected
+        # The worker which exceeded the time limit was killed and replaced
+        assert all(worker.process.is_alive() for worker in runner.workers)
+        assert len(runner.workers) <= 2
+    finally:
+        runner.shutdown()
+    assert not runner.workers
+
+    assert asyncio.run(run_jobs(ThreadRunner(timeout=2))) == expected
+
+    try:
+        ProcessRunner(0)
+        assert False
+    except ValueError as e:
+        assert str(e) == "El número de procesos debe ser un entero positivo"
+
+
+def stream_rows(rows, table):
+    """
+    Job with a streaming response for the tests of the runners, which sends a row every 10 milliseconds.
+    """
+    for i in range(rows):
+        table.append(i, i / 2)
+        time.sleep(0.01)
+    return (*table.columns(2), "done")
+
+
+def test_stream_runners():
+    """
+    Test the jobs with a streaming response of the process and thread runners from the workers module
+    """
+    async def read(response):
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    def stream(runner, rows):
+        response = stream_table(lambda table: runner.stream(stream_rows, (rows,), table), ["Iterations", "Xn"], ["Message"])
+        return [json.loads(line) for line in asyncio.run(read(response)).splitlines()]
+
+    runner = ProcessRunner(1, timeout=3)
+    try:
+        for job_runner in [runner, ThreadRunner(timeout=3, max_workers=1)]:
+            # The rows are relayed as they are computed and the result is the last event
+            lines = stream(job_runner, 5)
+            assert lines[0] == {"Iterations": 0, "Xn": "0.0"}
+            assert lines[-1] == {"Message": "done"}
+            assert len(lines) == 6
+
+            # A job which exceeds the time limit sends a 504 error after its last row
+            start = time.perf_counter()
+            lines = stream(job_runner, 10000)
+            assert lines[-1] == {"detail": "El método excedió el tiempo máximo de ejecución de 3 segundos"}
+            assert 1 < len(lines) < 400
+            assert time.perf_counter() - start < 5
+
+        # The worker which exceeded the time limit was killed, and the next job starts a new one
+        assert stream(runner, 2)[-1] == {"Message": "done"}
+        assert len(runner.workers) == 1
+    finally:
+        runner.shutdown()
+
+
+def test_stream_job():
+    """
+    Test that the streaming responses of the workers module don't wait for their first row in the default executor of the event loop
+    """
+    async def run():
+        # The only thread of the default executor is busy
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+        busy = asyncio.create_task(asyncio.to_thread(time.sleep, 1))
+        await asyncio.sleep(0.1)
+
+        start = time.perf_counter()
+        response = await stream_job(stream_rows, 2, ["Iterations", "Xn"], ["Message"])
+        elapsed = time.perf_counter() - start
+        await busy
+        return elapsed, "".join([chunk async for chunk in response.body_iterator])
+
+    previous_runner = workers.runner
+    workers.runner = ThreadRunner(timeout=3, max_workers=1)
+    try:
+        elapsed, body = asyncio.run(run())
+    finally:
+        workers.runner = previous_runner
+
+    assert elapsed < 0.5
+    assert json.loads(body.splitlines()[-1]) == {"Message": "done"}
+
+
+def test_csr_matrix():
+    A = np.array([[4, 0, -1], [0, 0, 2], [3, 5, 0]], dtype=float)
+
+    # The COO triplets can be unordered and repeated positions are added
+    matrix = CSRMatrix.from_coo([2, 0, 1, 0, 2, 0], [1, 2, 2, 0, 0, 0], [5, -1, 2, 1, 3, 3], (3, 3))
+    assert matrix.nnz == 5
+    assert np.array_equal(matrix.indptr, [0, 2, 3, 5])
+    assert np.array_equal(matrix.to_dense(), A)
+    assert np.array_equal(CSRMatrix.from_dense(A).to_dense(), A)
+
+    assert np.array_equal(matrix.diagonal(), [4, 0, 0])
+    x = np.array([1.0, -2.0, 0.5])
+    assert np.allclose(matrix.dot(x), A @ x)
+
+    # Test with invalid matrices
+    for arguments in [([1, 2], [0], [0, 2], (1, 2)), ([1], [3], [0, 1], (1, 2)), ([1, 2], [0, 1], [0, 1], (1, 2))]:
+        try:
+            CSRMatrix(*arguments)
+            assert False, "Test failed for an invalid matrix"
+        except ValueError:
+            pass
+    try:
+        CSRMatrix.from_coo([0, 3], [0, 0], [1, 1], (3, 3))
+        assert False, "Test failed for an index outside of the matrix"
+    except ValueError as e:
+        assert str(e) == "Los índices de la matriz dispersa están fuera de la matriz"
+
+
+def test_row_block_product():
+    """
+    Test the RowBlockProduct class from the parallel module
+    """
+    rng = np.random.default_rng(0)
+    T = rng.random((200, 200)) * (rng.random((200, 200)) < 0.05)
+    # Empty rows at the start, in the middle and at the end of the blocks
+    T[[0, 50, 51, 199], :] = 0
+    C = rng.random(200)
+    x = rng.random(200)
+    sparse_T = CSRMatrix.from_dense(T)
+
+    # The blocks computed by the threads give the same product for any number of threads
+    for threads in [1, 3, 8, 500]:
+        with RowBlockProduct(sparse_T, C, threads) as product:
+            assert len(product.blocks) <= min(threads, 200)
+            assert np.allclose(product(x), T @ x + C)
+            # The threads wait for the next iteration
+            assert np.allclose(product(2 * x), 2 * T @ x + C)
+        assert all(not thread.is_alive() for thread in product.threads)
+
+    # A matrix without values
+    with RowBlockProduct(CSRMatrix([], [], [0, 0, 0], (2, 2)), np.ones(2), 2) as product:
+        assert np.allclose(product(np.ones(2)), [1, 1])
+
+
+def test_greedy_coloring():
+    """
+    Test the greedy_coloring function from the sparse module
+    """
+    # The 5-point stencil of a grid gets the red-black coloring
+    m = 6
+    index = np.arange(m * m).reshape(m, m)
+    rows = np.concatenate([index.ravel(), index[1:, :].ravel(), index[:-1, :].ravel(), index[:, 1:].ravel(), index[:, :-1].ravel()])
+    columns = np.concatenate([index.ravel(), index[:-1, :].ravel(), index[1:, :].ravel(), index[:, :-1].ravel(), index[:, 1:].ravel()])
+    A = CSRMatrix.from_coo(rows, columns, np.where(rows == columns, 4.0, -1.0), (m * m, m * m))
+    colors = greedy_coloring(A)
+    assert colors.max() == 1
+    assert np.array_equal(colors.reshape(m, m), np.add.outer(np.arange(m), np.arange(m)) % 2)
+
+    # Adjacent rows have different colors, also when only one of A[i, j] and A[j, i] isn't zero
+    A = CSRMatrix.from_dense(np.array([[1, 1, 0, 1], [0, 1, 0, 0], [0, 1, 1, 0], [0, 0, 1, 1]]))
+    colors = greedy_coloring(A)
+    for i, j in zip(A.rows, A.indices):
+        assert i == j or colors[i] != colors[j]
+    assert colors.tolist() == [0, 1, 0, 1]
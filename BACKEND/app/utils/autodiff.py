@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional, Tuple
+import sympy as sp
+
+
+def forward_mode(expression: sp.Expr, variable: sp.Symbol, order: int = 1) -> Optional[Tuple[List[Tuple[sp.Symbol, sp.Expr]], List[sp.Expr]]]:
+    """
+    Build the forward-mode automatic differentiation program of an expression. Every node of the expression tree which depends on the
+    variable is assigned its value and its first and second tangents, computed from the tangents of its arguments with the chain rule.
+    Only the local derivatives of every node are differentiated symbolically, so the program grows linearly with the size of the
+    expression instead of growing like the symbolic derivatives, and repeated subtrees are computed only once
+
+    Arguments:
+        expression (sp.Expr) : The expression to differentiate
+        variable (sp.Symbol) : The independent variable of the expression
+        order (int) : The number of derivatives to compute, 1 or 2
+
+    Returns:
+        tuple : List of assignments of the intermediate values in evaluation order and list with the expressions of the value and the
+            derivatives, or None if a function of the expression has no known derivative
+    """
+    assignments = []
+    # Value and tangents of every node already visited
+    tangents: Dict[sp.Expr, Tuple[sp.Expr, ...]] = {variable: (variable, sp.Integer(1), sp.Integer(0))[:order + 1]}
+
+    def assign(value: sp.Expr, name: str) -> sp.Expr:
+        # Numbers are kept in place, so the tangents of the constant parts vanish from the program
+        if value.is_Number:
+            return value
+        symbol = sp.Symbol(f"_{name}{len(assignments)}", real=True)
+        assignments.append((symbol, value))
+        return symbol
+
+    def visit(node: sp.Expr) -> Optional[Tuple[sp.Expr, ...]]:
+        if node in tangents:
+            return tangents[node]
+        if variable not in node.free_symbols:
+            return (node,) + (sp.Integer(0),) * order
+
+        # Replace every argument which depends on the variable with its own placeholder, so the partial derivatives are taken with
+        # respect to every argument even when two of them have the same value, like in x**x
+        arguments = []
+        placeholders = {}
+        varying = []
+        for argument in node.args:
+            argument_tangents = visit(argument)
+            if argument_tangents is None:
+                return None
+            if variable in argument.free_symbols:
+                placeholder = sp.Dummy(real=True)
+                arguments.append(placeholder)
+                placeholders[placeholder] = argument_tangents[0]
+                varying.append((placeholder, argument_tangents))
+            else:
+                arguments.append(argument)
+
+        local = node.func(*arguments)
+        first_derivatives = [local.diff(placeholder) for placeholder, _ in varying]
+        result = [local, sp.Add(*(derivative * values[1] for derivative, (_, values) in zip(first_derivatives, varying)))]
+
+        if order > 1:
+            terms = [derivative * values[2] for derivative, (_, values) in zip(first_derivatives, varying)]
+            for derivative, (_, values) in zip(first_derivatives, varying):
+                terms.extend(derivative.diff(placeholder) * values[1] * other[1] for placeholder, other in varying)
+            result.append(sp.Add(*terms))
+
+        # The derivatives of the functions with jumps are zero almost everywhere
+        result = [value.replace(sp.DiracDelta, lambda *args: sp.Integer(0)) for value in result]
+        if any(value.has(sp.Derivative, sp.Subs) for value in result):
+            return None
+
+        # The derivatives which contain the value of the node, like the derivative of exp, reuse it instead of evaluating it again
+        value = assign(result[0].xreplace(placeholders), "value")
+        tangents[node] = (value,) + tuple(assign(derivative.xreplace({local: value}).xreplace(placeholders), name) for derivative, name in zip(result[1:], ("first", "second")))
+        return tangents[node]
+
+    outputs = visit(expression)
+    if outputs is None:
+        return None
+
+    return assignments, list(outputs)
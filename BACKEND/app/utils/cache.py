@@ -0,0 +1,136 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable
+from app.config.env import CACHE_MAX_SIZE, FACTORIZATIONS_CACHE_MAX_SIZE
+
+
+class LRUCache:
+    """
+    Bounded and thread-safe least recently used cache with hit, miss and eviction counters.
+    """
+    def __init__(self, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError("El tamaño máximo del caché debe ser un entero positivo")
+
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = Lock()
+
+        # Counters to monitor the cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the value stored with the key and mark it as the most recently used.
+
+        :param key: key of the value
+        :param default: value to return if the key is not in the cache
+        :return: the stored value or the default value
+        """
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                self.hits += 1
+                return self.items[key]
+
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a value in the cache, evicting the least recently used value if the cache is full.
+
+        :param key: key of the value
+        :param value: value to store
+        """
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+            self.items[key] = value
+
+            # Evict the least recently used values
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """
+        Get the value stored with the key, or create and store it if it is not in the cache.
+
+        The value is created outside the lock, so a slow creation doesn't block other threads. Exceptions raised while
+        creating the value are propagated and nothing is stored.
+
+        :param key: key of the value
+        :param create: function without arguments which creates the value
+        :return: the stored or created value
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = create()
+            self.put(key, value)
+
+        return value
+
+    def clear(self):
+        """
+        Remove all the values and reset the counters.
+        """
+        with self.lock:
+            self.items.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the counters of the cache.
+
+        :return: dictionary with the size, maximum size, hits, misses and evictions of the cache
+        """
+        with self.lock:
+            return {
+                "size": len(self.items),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# Shared caches for parsed expressions, symbolic derivatives and compiled callables
+expressions_cache = LRUCache(CACHE_MAX_SIZE)
+derivatives_cache = LRUCache(CACHE_MAX_SIZE)
+compiled_cache = LRUCache(CACHE_MAX_SIZE)
+
+# Shared cache for the LU factorizations, by their handles
+factorizations_cache = LRUCache(FACTORIZATIONS_CACHE_MAX_SIZE)
+
+
+def methods_caches_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the counters of the caches filled by the methods in the current process, the parsed expressions, derivatives and compiled
+    callables caches. Every worker process has its own caches.
+
+    :return: dictionary with the counters of every cache
+    """
+    return {"expressions": expressions_cache.stats(), "derivatives": derivatives_cache.stats(), "compiled": compiled_cache.stats()}
+
+
+def add_caches_stats(processes_stats: Iterable[Dict[str, Dict[str, int]]]) -> Dict[str, Dict[str, int]]:
+    """
+    Add the counters of the caches of several processes, cache by cache and counter by counter.
+
+    :param processes_stats: counters of the caches of every process, as returned by methods_caches_stats
+    :return: dictionary with the total counters of every cache
+    """
+    total = {}
+    for process_stats in processes_stats:
+        for cache, stats in process_stats.items():
+            cache_total = total.setdefault(cache, dict.fromkeys(stats, 0))
+            for counter, value in stats.items():
+                cache_total[counter] += value
+
+    return total
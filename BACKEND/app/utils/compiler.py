@@ -0,0 +1,355 @@
+import math
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+import mpmath
+import numpy as np
+import sympy as sp
+from sympy.printing.codeprinter import PrintMethodNotImplementedError
+from sympy.printing.pycode import PythonCodePrinter
+from app.utils.autodiff import forward_mode
+from app.utils.cache import compiled_cache, derivatives_cache
+
+# Highest precision (number of significant digits) that can be represented with float64 numbers
+FLOAT64_MAX_PRECISION = 15
+
+
+def create_float64_printer() -> PythonCodePrinter:
+    """
+    Create the code printer of the float64 callables. Lambdify selects the mpmath printer when mpmath is one of the modules, which turns
+    the rational numbers into mpf numbers and makes every operation with them an mpmath operation, so the plain Python printer is used
+
+    Returns:
+        PythonCodePrinter : The printer, with the same settings used by lambdify
+    """
+    return PythonCodePrinter({"fully_qualified_modules": False, "inline": True, "allow_unknown_functions": True})
+
+
+def create_mpmath_context(precision: int = 16) -> mpmath.MPContext:
+    """
+    Create an isolated mpmath context with the given precision, so concurrent requests with different precisions don't share the global mpmath state
+
+    Arguments:
+        precision (int) : The number of significant digits of the context
+
+    Returns:
+        mpmath.MPContext : The mpmath context
+    """
+    context = mpmath.MPContext()
+    context.dps = precision
+
+    return context
+
+
+def create_mpmath_namespace(context: mpmath.MPContext) -> Dict[str, Any]:
+    """
+    Create the namespace of a lambdified expression with the constants and functions of an mpmath context
+
+    Arguments:
+        context (mpmath.MPContext) : The mpmath context
+
+    Returns:
+        Dict[str, Any] : The namespace with the public names of the context
+    """
+    return {name: getattr(context, name) for name in dir(context) if not name.startswith("_")}
+
+
+def compile_expression(expression: sp.Expr, variable: sp.Symbol, precision: int = 16) -> Callable[[float], Union[float, mpmath.mpf]]:
+    """
+    Compile a sympy expression into a native callable of one variable. If the precision is less or equal than 15 the callable works with
+    float64 numbers, otherwise it works with mpmath numbers with the given precision. The callables are stored in an LRU cache, so
+    repeated expressions are compiled only once.
+
+    Arguments:
+        expression (sp.Expr) : The expression to compile
+        variable (sp.Symbol) : The independent variable of the expression
+        precision (int) : The number of significant digits to evaluate the expression
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns the value of the expression
+    """
+    # All the float64 callables are the same regardless of the precision
+    cache_key = (expression, variable, "float64" if precision <= FLOAT64_MAX_PRECISION else precision)
+
+    return compiled_cache.get_or_create(cache_key, lambda: build_callable(expression, variable, precision))
+
+
+def build_callable(expression: sp.Expr, variable: sp.Symbol, precision: int = 16) -> Callable[[float], Union[float, mpmath.mpf]]:
+    """
+    Build the native callable of one variable for a sympy expression, without using the cache
+
+    Arguments:
+        expression (sp.Expr) : The expression to compile
+        variable (sp.Symbol) : The independent variable of the expression
+        precision (int) : The number of significant digits to evaluate the expression
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns the value of the expression
+    """
+    if precision <= FLOAT64_MAX_PRECISION:
+        # Functions not available in the math module are taken from mpmath and sympy
+        function = sp.lambdify(variable, expression, modules=["math", "mpmath", "sympy"], printer=create_float64_printer())
+
+        def evaluate(value: float) -> float:
+            try:
+                return float(function(float(value)))
+            except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+                raise ValueError(f"La función no está definida en x = {value}")
+    else:
+        # Use a private context namespace so the constants and functions are evaluated with the requested precision
+        context = create_mpmath_context(precision)
+        function = sp.lambdify(variable, expression, modules=[create_mpmath_namespace(context), "mpmath"])
+
+        def evaluate(value: float) -> mpmath.mpf:
+            try:
+                return function(context.mpf(value))
+            except (ValueError, ZeroDivisionError):
+                raise ValueError(f"La función no está definida en x = {value}")
+
+    return evaluate
+
+
+def compile_fused_expressions(expressions: Sequence[sp.Expr], variable: sp.Symbol, precision: int = 16) -> Callable[[float], Tuple[Union[float, mpmath.mpf], ...]]:
+    """
+    Compile many sympy expressions of the same variable, like a function and its derivatives, into one native callable which returns
+    the values of all of them in one pass. The common subexpressions are eliminated, so they are evaluated only once. The callables are
+    stored in an LRU cache
+
+    Arguments:
+        expressions (Sequence[sp.Expr]) : The expressions to compile, the first one is the function
+        variable (sp.Symbol) : The independent variable of the expressions
+        precision (int) : The number of significant digits to evaluate the expressions
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns a tuple with the values of the expressions
+    """
+    expressions = tuple(expressions)
+    cache_key = (expressions, variable, "float64" if precision <= FLOAT64_MAX_PRECISION else precision, "fused")
+
+    return compiled_cache.get_or_create(cache_key, lambda: build_fused_callable(expressions, variable, precision))
+
+
+def build_fused_callable(expressions: Tuple[sp.Expr, ...], variable: sp.Symbol, precision: int = 16) -> Callable[[float], Tuple[Union[float, mpmath.mpf], ...]]:
+    """
+    Build the native callable which evaluates many expressions in one pass, without using the cache. If the fused evaluation fails, the
+    first expression is evaluated alone, so an error is raised only if the function is not defined and the other values are nan
+
+    Arguments:
+        expressions (Tuple[sp.Expr, ...]) : The expressions to compile, the first one is the function
+        variable (sp.Symbol) : The independent variable of the expressions
+        precision (int) : The number of significant digits to evaluate the expressions
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns a tuple with the values of the expressions
+    """
+    evaluate_first = build_callable(expressions[0], variable, precision)
+
+    if precision <= FLOAT64_MAX_PRECISION:
+        function = sp.lambdify(variable, list(expressions), modules=["math", "mpmath", "sympy"], printer=create_float64_printer(), cse=True)
+
+        def evaluate(value: float) -> Tuple[float, ...]:
+            try:
+                return tuple(float(result) for result in function(float(value)))
+            except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+                return (evaluate_first(value),) + (math.nan,) * (len(expressions) - 1)
+    else:
+        context = create_mpmath_context(precision)
+        function = sp.lambdify(variable, list(expressions), modules=[create_mpmath_namespace(context), "mpmath"], cse=True)
+
+        def evaluate(value: float) -> Tuple[mpmath.mpf, ...]:
+            try:
+                return tuple(function(context.mpf(value)))
+            except (ValueError, ZeroDivisionError):
+                return (evaluate_first(value),) + (context.nan,) * (len(expressions) - 1)
+
+    return evaluate
+
+
+def compile_autodiff_expression(expression: sp.Expr, variable: sp.Symbol, order: int = 1, precision: int = 16) -> Optional[Callable[[float], Tuple[Union[float, mpmath.mpf], ...]]]:
+    """
+    Compile a sympy expression into a native callable which returns the value of the expression and its derivatives, computed by
+    forward-mode automatic differentiation instead of symbolic differentiation, so the cost of every evaluation is a small constant
+    factor of the cost of evaluating the expression. The callables are stored in an LRU cache
+
+    Arguments:
+        expression (sp.Expr) : The expression to compile
+        variable (sp.Symbol) : The independent variable of the expression
+        order (int) : The number of derivatives to return, 1 or 2
+        precision (int) : The number of significant digits to evaluate the expression
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns a tuple with the value of the expression and its
+            derivatives, or None if the expression can't be differentiated automatically
+    """
+    cache_key = (expression, variable, "float64" if precision <= FLOAT64_MAX_PRECISION else precision, "autodiff", order)
+
+    return compiled_cache.get_or_create(cache_key, lambda: build_autodiff_callable(expression, variable, order, precision))
+
+
+def build_autodiff_callable(expression: sp.Expr, variable: sp.Symbol, order: int = 1, precision: int = 16) -> Optional[Callable[[float], Tuple[Union[float, mpmath.mpf], ...]]]:
+    """
+    Build the native callable which returns the value of the expression and its derivatives by automatic differentiation, without using
+    the cache. If the derivatives can't be evaluated, the expression is evaluated alone, so an error is raised only if the function is not
+    defined and the derivatives are nan
+
+    Arguments:
+        expression (sp.Expr) : The expression to compile
+        variable (sp.Symbol) : The independent variable of the expression
+        order (int) : The number of derivatives to return, 1 or 2
+        precision (int) : The number of significant digits to evaluate the expression
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns a tuple with the value of the expression and its
+            derivatives, or None if the expression can't be differentiated automatically
+    """
+    program = forward_mode(expression, variable, order)
+    if program is None:
+        return None
+
+    # The intermediate values of the program are generated as the common subexpressions of the outputs
+    assignments, outputs = program
+    evaluate_first = build_callable(expression, variable, precision)
+
+    try:
+        if precision <= FLOAT64_MAX_PRECISION:
+            function = sp.lambdify(variable, outputs, modules=["math", "mpmath", "sympy"], printer=create_float64_printer(), cse=lambda expressions: (assignments, expressions))
+        else:
+            context = create_mpmath_context(precision)
+            function = sp.lambdify(variable, outputs, modules=[create_mpmath_namespace(context), "mpmath"], cse=lambda expressions: (assignments, expressions))
+    except PrintMethodNotImplementedError:
+        return None
+
+    if precision <= FLOAT64_MAX_PRECISION:
+        def evaluate(value: float) -> Tuple[float, ...]:
+            try:
+                return tuple(float(result) for result in function(float(value)))
+            except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+                return (evaluate_first(value),) + (math.nan,) * order
+    else:
+        def evaluate(value: float) -> Tuple[mpmath.mpf, ...]:
+            try:
+                return tuple(context.mpf(result) for result in function(context.mpf(value)))
+            except (ValueError, ZeroDivisionError, TypeError):
+                return (evaluate_first(value),) + (context.nan,) * order
+
+    return evaluate
+
+
+def create_evaluator(expression: sp.Expr, variable: sp.Symbol, precision: int = 16, compiled: bool = False) -> Callable[[float], Union[float, mpmath.mpf, sp.Float]]:
+    """
+    Create a function which evaluates the expression at a given value of the variable
+
+    Arguments:
+        expression (sp.Expr) : The expression to evaluate
+        variable (sp.Symbol) : The independent variable of the expression
+        precision (int) : The number of significant digits to evaluate the expression
+        compiled (bool) : If True, the expression is compiled into a native callable, otherwise it is evaluated with sympy subs and evalf
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns the value of the expression
+    """
+    if compiled:
+        return compile_expression(expression, variable, precision)
+
+    return lambda value: expression.subs(variable, value).evalf(precision)
+
+
+def create_fused_evaluator(expressions: Sequence[sp.Expr], variable: sp.Symbol, precision: int = 16, compiled: bool = False) -> Callable[[float], Tuple[Union[float, mpmath.mpf, sp.Float], ...]]:
+    """
+    Create a function which evaluates many expressions, like a function and its derivatives, at the same value of the variable
+
+    Arguments:
+        expressions (Sequence[sp.Expr]) : The expressions to evaluate, the first one is the function
+        variable (sp.Symbol) : The independent variable of the expressions
+        precision (int) : The number of significant digits to evaluate the expressions
+        compiled (bool) : If True, the expressions are compiled together into one native callable, otherwise each one is evaluated with sympy subs and evalf
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns a tuple with the values of the expressions
+    """
+    if compiled:
+        return compile_fused_expressions(expressions, variable, precision)
+
+    expressions = tuple(expressions)
+    return lambda value: tuple(expression.subs(variable, value).evalf(precision) for expression in expressions)
+
+
+def create_derivatives_evaluator(function: sp.Expr, variable: sp.Symbol, derivatives: Sequence[Optional[sp.Expr]], precision: int = 16, compiled: bool = False, automatic: bool = False) -> Callable[[float], Tuple[Union[float, mpmath.mpf, sp.Float], ...]]:
+    """
+    Create a function which evaluates a function and its derivatives at the same value of the variable. The derivatives which are not
+    given are calculated symbolically, unless automatic differentiation is requested, none of them are given and all the functions of
+    the expression have known derivatives, in which case they are computed by forward-mode automatic differentiation over the compiled
+    function
+
+    Arguments:
+        function (sp.Expr) : The function to evaluate
+        variable (sp.Symbol) : The independent variable of the function
+        derivatives (Sequence[Optional[sp.Expr]]) : The first derivative and optionally the second derivative of the function, None if they are not given
+        precision (int) : The number of significant digits to evaluate the expressions
+        compiled (bool) : If True, the expressions are compiled into one native callable, otherwise each one is evaluated with sympy subs and evalf
+        automatic (bool) : If True, the derivatives are computed by automatic differentiation instead of symbolic differentiation
+
+    Returns:
+        Callable : Function which receives a value of the variable and returns a tuple with the values of the function and its derivatives
+    """
+    if automatic and all(derivative is None for derivative in derivatives):
+        evaluate = compile_autodiff_expression(function, variable, len(derivatives), precision)
+        if evaluate is not None:
+            return evaluate
+
+    # Every missing derivative is the derivative of the previous expression
+    expressions = [function]
+    for derivative in derivatives:
+        expressions.append(derivative if derivative is not None else differentiate(expressions[-1], variable))
+
+    return create_fused_evaluator(expressions, variable, precision, compiled)
+
+
+def compile_vectorized_expression(expression: sp.Expr, variable: sp.Symbol) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Compile a sympy expression into a float64 NumPy callable which evaluates the expression element-wise over an array. Points where the
+    expression is not defined are returned as nan or inf instead of raising an exception. The callables are stored in an LRU cache
+
+    Arguments:
+        expression (sp.Expr) : The expression to compile
+        variable (sp.Symbol) : The independent variable of the expression
+
+    Returns:
+        Callable : Function which receives an array of values of the variable and returns an array with the values of the expression
+    """
+    def build() -> Callable[[np.ndarray], np.ndarray]:
+        function = sp.lambdify(variable, expression, modules="numpy")
+
+        def evaluate(values: np.ndarray) -> np.ndarray:
+            values = np.asarray(values, dtype=float)
+            with np.errstate(all="ignore"):
+                try:
+                    result = np.asarray(function(values))
+                    # Constant expressions return a scalar, so they are broadcasted to the shape of the values
+                    return np.broadcast_to(result, values.shape).astype(float)
+                except (TypeError, ValueError, ZeroDivisionError):
+                    # Some expressions can't be evaluated element-wise, so they are evaluated point by point
+                    return np.array([evaluate_point(value) for value in values.ravel()], dtype=float).reshape(values.shape)
+
+        def evaluate_point(value: float) -> float:
+            try:
+                return float(function(value))
+            except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+                return np.nan
+
+        return evaluate
+
+    return compiled_cache.get_or_create((expression, variable, "numpy"), build)
+
+
+def differentiate(expression: sp.Expr, variable: sp.Symbol) -> sp.Expr:
+    """
+    Calculate the derivative of the expression with respect to the variable. The derivatives are stored in an LRU cache, so repeated
+    expressions skip the symbolic differentiation
+
+    Arguments:
+        expression (sp.Expr) : The expression to differentiate
+        variable (sp.Symbol) : The variable to differentiate with respect to
+
+    Returns:
+        sp.Expr : The derivative of the expression
+    """
+    return derivatives_cache.get_or_create((expression, variable), lambda: sp.diff(expression, variable))
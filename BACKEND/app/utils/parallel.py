@@ -0,0 +1,126 @@
+from threading import Barrier, Thread
+from typing import List, Tuple
+import numpy as np
+from app.utils.sparse import CSRMatrix
+
+# Smallest system whose Jacobi iterations are split between threads, smaller ones don't make up for the synchronization
+PARALLEL_MIN_SIZE = 10000
+
+
+class RowBlockProduct:
+    """
+    Affine map x_new = T x + C for the Jacobi method with a sparse matrix T, with the rows split in blocks of about the same number of
+    nonzero values. Every block is computed by its own thread, which keeps running between iterations and waits on a barrier for the
+    next vector, so an iteration only costs two barrier waits besides the products. The NumPy kernels of the blocks release the GIL, so
+    the threads run on different cores and share A and x without copying them.
+
+    The object is a context manager, which stops the threads when leaving it.
+    """
+    def __init__(self, T: CSRMatrix, C: np.ndarray, threads: int):
+        if threads < 1:
+            raise ValueError("El número de hilos debe ser un entero positivo")
+
+        self.T = T
+        self.C = np.asarray(C, dtype=float)
+        self.n = T.shape[0]
+        self.blocks = self.split_rows(min(threads, self.n))
+
+        self.x = None
+        self.x_new = None
+        self.error = None
+        self.closed = False
+
+        # The barrier is shared by the threads and the caller, which starts and waits for every iteration
+        self.barrier = Barrier(len(self.blocks) + 1)
+        self.threads = [Thread(target=self.work, args=(block,), daemon=True) for block in self.blocks]
+        for thread in self.threads:
+            thread.start()
+
+    def split_rows(self, size: int) -> List[Tuple[int, int, np.ndarray, np.ndarray]]:
+        """
+        Split the rows in blocks with about the same number of nonzero values.
+
+        :param size: number of blocks
+        :return: list with the first and last rows of every block, and the offsets and the positions of its nonempty rows
+        """
+        # First row of every block, the one where the nonzero values reach the next share of the values
+        interior = np.searchsorted(self.T.indptr, np.linspace(0, self.T.nnz, size + 1)[1:-1], side="left")
+        bounds = np.unique(np.concatenate(([0], interior.clip(0, self.n), [self.n])))
+        blocks = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if start == end:
+                continue
+            offsets = self.T.indptr[start:end] - self.T.indptr[start]
+            nonempty = np.flatnonzero(np.diff(self.T.indptr[start:end + 1]) > 0)
+            blocks.append((int(start), int(end), offsets[nonempty], nonempty))
+
+        return blocks
+
+    def multiply_block(self, start: int, end: int, offsets: np.ndarray, nonempty: np.ndarray):
+        """
+        Compute the rows of a block of the next approximation. The products of the row are added with one reduction, which skips the
+        empty rows.
+
+        :param start: first row of the block
+        :param end: row after the last row of the block
+        :param offsets: position of the first value of every nonempty row, from the first value of the block
+        :param nonempty: positions of the nonempty rows in the block
+        """
+        first, last = self.T.indptr[start], self.T.indptr[end]
+        result = self.C[start:end].copy()
+        if nonempty.size > 0:
+            products = self.T.data[first:last] * self.x[self.T.indices[first:last]]
+            result[nonempty] += np.add.reduceat(products, offsets)
+        self.x_new[start:end] = result
+
+    def work(self, block: Tuple[int, int, np.ndarray, np.ndarray]):
+        """
+        Loop of a thread, which computes its block of every iteration between two barrier waits.
+
+        :param block: the block of rows of the thread
+        """
+        while True:
+            self.barrier.wait()
+            if self.closed:
+                return
+            try:
+                self.multiply_block(*block)
+            except Exception as e:
+                self.error = e
+            self.barrier.wait()
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the next approximation of the solution, T x + C.
+
+        :param x: current approximation of the solution
+        :return: the next approximation
+        """
+        if self.closed:
+            raise RuntimeError("Los hilos del producto por bloques ya se detuvieron")
+
+        self.x = x
+        self.x_new = np.empty(self.n)
+        # The first wait starts the iteration and the second one waits for every block
+        self.barrier.wait()
+        self.barrier.wait()
+
+        if self.error is not None:
+            raise self.error
+        return self.x_new
+
+    def close(self):
+        """
+        Stop the threads.
+        """
+        if not self.closed:
+            self.closed = True
+            self.barrier.wait()
+            for thread in self.threads:
+                thread.join()
+
+    def __enter__(self) -> "RowBlockProduct":
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
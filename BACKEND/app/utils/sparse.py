@@ -0,0 +1,127 @@
+from typing import Sequence, Tuple
+import numpy as np
+
+
+class CSRMatrix:
+    """
+    Sparse matrix in compressed sparse row format. Only the nonzero values are stored, with their columns and the position where every
+    row starts, so the memory and the work of a matrix-vector product are O(nnz) instead of O(n^2).
+    """
+    def __init__(self, data: Sequence[float], indices: Sequence[int], indptr: Sequence[int], shape: Tuple[int, int]):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+        if self.shape[0] <= 0 or self.shape[1] <= 0:
+            raise ValueError("El número de filas y columnas de la matriz dispersa debe ser un entero positivo")
+        if self.data.ndim != 1 or self.indices.shape != self.data.shape:
+            raise ValueError("La matriz dispersa debe tener un índice de columna por cada valor")
+        if self.indptr.shape != (self.shape[0] + 1,) or self.indptr[0] != 0 or self.indptr[-1] != self.data.size or np.any(np.diff(self.indptr) < 0):
+            raise ValueError("Los punteros de las filas de la matriz dispersa deben empezar en 0, no decrecer y terminar en el número de valores")
+        if self.data.size > 0 and (self.indices.min() < 0 or self.indices.max() >= self.shape[1]):
+            raise ValueError("Los índices de las columnas de la matriz dispersa están fuera de la matriz")
+
+        # Row of every value, so the products are computed for every value at once
+        self.rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @classmethod
+    def from_coo(cls, rows: Sequence[int], columns: Sequence[int], values: Sequence[float], shape: Tuple[int, int]) -> "CSRMatrix":
+        """
+        Build a matrix from its triplets in coordinate format. The triplets can be in any order and repeated positions are added.
+
+        :param rows: row of every value
+        :param columns: column of every value
+        :param values: the nonzero values
+        :param shape: number of rows and columns of the matrix
+        :return: the matrix in compressed sparse row format
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+
+        if rows.ndim != 1 or rows.shape != columns.shape or rows.shape != values.shape:
+            raise ValueError("La matriz dispersa debe tener una fila y una columna por cada valor")
+        if rows.size > 0 and (rows.min() < 0 or rows.max() >= shape[0] or columns.min() < 0 or columns.max() >= shape[1]):
+            raise ValueError("Los índices de la matriz dispersa están fuera de la matriz")
+
+        # Sort the values by row and column, adding the values with the same position
+        keys, inverse = np.unique(rows * shape[1] + columns, return_inverse=True)
+        data = np.bincount(inverse, weights=values, minlength=keys.size)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(keys // shape[1], minlength=shape[0]))))
+
+        return cls(data, keys % shape[1], indptr, shape)
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray) -> "CSRMatrix":
+        """
+        Build a sparse matrix with the nonzero values of a dense matrix.
+
+        :param matrix: the dense matrix
+        :return: the matrix in compressed sparse row format
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        rows, columns = np.nonzero(matrix)
+
+        return cls.from_coo(rows, columns, matrix[rows, columns], matrix.shape)
+
+    @property
+    def nnz(self) -> int:
+        """
+        Number of stored values.
+        """
+        return self.data.size
+
+    def diagonal(self) -> np.ndarray:
+        """
+        Get the diagonal of the matrix.
+
+        :return: array with the values of the diagonal, zero where there is no stored value
+        """
+        on_diagonal = self.rows == self.indices
+        return np.bincount(self.rows[on_diagonal], weights=self.data[on_diagonal], minlength=min(self.shape))
+
+    def dot(self, x: np.ndarray) -> np.ndarray:
+        """
+        Multiply the matrix by a vector.
+
+        :param x: vector with one value per column
+        :return: vector with one value per row
+        """
+        return np.bincount(self.rows, weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Get the dense matrix.
+
+        :return: array with every value of the matrix
+        """
+        matrix = np.zeros(self.shape)
+        np.add.at(matrix, (self.rows, self.indices), self.data)
+
+        return matrix
+
+
+def greedy_coloring(A: CSRMatrix) -> np.ndarray:
+    """
+    Color the adjacency graph of a square matrix, where the rows i and j are adjacent if A[i, j] or A[j, i] isn't zero, so adjacent rows
+    have different colors. Every row takes the smallest color not used by its previous neighbours, which gives the red-black ordering of
+    the 5-point and 7-point stencils with the natural ordering of the grid.
+
+    :param A: square sparse matrix
+    :return: array with the color of every row, from 0
+    """
+    n = A.shape[0]
+    # Pattern of A + A^T, so the graph is undirected
+    pattern = CSRMatrix.from_coo(np.concatenate((A.rows, A.indices)), np.concatenate((A.indices, A.rows)), np.ones(2 * A.nnz), A.shape)
+    indices, indptr = pattern.indices.tolist(), pattern.indptr.tolist()
+
+    colors = [-1] * n
+    for i in range(n):
+        used = {colors[j] for j in indices[indptr[i]:indptr[i + 1]]}
+        color = 0
+        while color in used:
+            color += 1
+        colors[i] = color
+
+    return np.array(colors, dtype=np.int64)
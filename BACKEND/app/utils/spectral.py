@@ -0,0 +1,149 @@
+from typing import Callable, Tuple
+import mpmath
+import numpy as np
+import sympy as sp
+
+# Largest matrix whose eigenvalues are all computed with the dense eigenvalue solver of NumPy, larger ones use the Arnoldi iteration
+DENSE_EIGENVALUES_MAX_SIZE = 400
+
+# Dimension of the Krylov subspace of the Arnoldi iteration and maximum number of restarts
+ARNOLDI_SIZE = 30
+ARNOLDI_MAX_RESTARTS = 100
+
+# Extra decimal digits and maximum number of iterations used to refine the dominant eigenvalue with high precision numbers
+GUARD_DIGITS = 10
+REFINEMENT_ITERATIONS = 20
+
+
+def arnoldi(operator: Callable[[np.ndarray], np.ndarray], n: int, tol: float = 1e-14, size: int = ARNOLDI_SIZE, max_restarts: int = ARNOLDI_MAX_RESTARTS) -> Tuple[complex, np.ndarray, float]:
+    """
+    Find the eigenvalue with the largest modulus of a real matrix, given as the function which multiplies it by a vector, with the
+    explicitly restarted Arnoldi iteration. Every cycle builds an orthonormal basis of a Krylov subspace, takes the Ritz value with the
+    largest modulus of the projected Hessenberg matrix and restarts from its Ritz vector, until the norm of the residual of the Ritz pair is
+    less or equal than the tolerance relative to the eigenvalue.
+
+    :param operator: function which multiplies the matrix by a real vector
+    :param n: number of rows and columns of the matrix
+    :param tol: relative tolerance of the residual of the eigenvalue
+    :param size: dimension of the Krylov subspace
+    :param max_restarts: maximum number of restarts
+    :return: the eigenvalue, its eigenvector and the norm of the residual, an estimate of the error of the eigenvalue
+    """
+    size = min(size, n)
+    # A fixed random initial vector, so the results are repeatable and it isn't orthogonal to the eigenvector
+    vector = np.random.default_rng(0).standard_normal(n)
+
+    for _ in range(max_restarts):
+        V = np.zeros((n, size + 1))
+        H = np.zeros((size + 1, size))
+        V[:, 0] = vector / np.linalg.norm(vector)
+        dimension = size
+
+        for j in range(size):
+            w = operator(V[:, j])
+
+            # Gram-Schmidt orthogonalization against the basis, repeated once to keep the basis orthogonal
+            for _ in range(2):
+                h = V[:, :j + 1].T @ w
+                w = w - V[:, :j + 1] @ h
+                H[:j + 1, j] += h
+            H[j + 1, j] = np.linalg.norm(w)
+
+            # The subspace is invariant, so its Ritz values are eigenvalues of the matrix
+            if H[j + 1, j] <= np.finfo(float).eps * np.linalg.norm(H[:j + 2, j]):
+                dimension = j + 1
+                H[j + 1, j] = 0
+                break
+            V[:, j + 1] = w / H[j + 1, j]
+
+        values, vectors = np.linalg.eig(H[:dimension, :dimension])
+        k = np.argmax(np.abs(values))
+        eigenvalue = values[k]
+        eigenvector = V[:, :dimension] @ vectors[:, k]
+        residual = abs(H[dimension, dimension - 1] * vectors[dimension - 1, k])
+
+        if residual <= tol * abs(eigenvalue) or residual == 0:
+            break
+
+        # The real and imaginary parts of the Ritz vector span the same real subspace as a pair of complex conjugate eigenvectors
+        vector = eigenvector.real + eigenvector.imag
+
+    return eigenvalue, eigenvector, residual
+
+
+def dominant_eigenpair(matrix: np.ndarray) -> Tuple[complex, np.ndarray]:
+    """
+    Find the eigenvalue with the largest modulus of a matrix and its eigenvector with float64 numbers, with the dense eigenvalue solver for
+    small matrices and with the Arnoldi iteration for large ones.
+
+    :param matrix: square matrix
+    :return: the eigenvalue and its eigenvector
+    """
+    if matrix.shape[0] <= DENSE_EIGENVALUES_MAX_SIZE:
+        values, vectors = np.linalg.eig(matrix)
+        k = np.argmax(np.abs(values))
+        return values[k], vectors[:, k]
+
+    eigenvalue, eigenvector, _ = arnoldi(matrix.dot, matrix.shape[0])
+    return eigenvalue, eigenvector
+
+
+def operator_spectral_radius(operator: Callable[[np.ndarray], np.ndarray], n: int) -> float:
+    """
+    Calculate the spectral radius of a matrix given as the function which multiplies it by a vector. Small matrices are formed with one
+    product per column and use the dense eigenvalue solver, which is more reliable for the highly non-normal iteration matrices, and
+    large ones use the Arnoldi iteration.
+
+    :param operator: function which multiplies the matrix by a real vector
+    :param n: number of rows and columns of the matrix
+    :return: the spectral radius of the matrix
+    """
+    if n <= DENSE_EIGENVALUES_MAX_SIZE:
+        matrix = np.column_stack([operator(column) for column in np.eye(n)])
+        eigenvalue, _ = dominant_eigenpair(matrix)
+    else:
+        eigenvalue, _, _ = arnoldi(operator, n)
+
+    return abs(eigenvalue)
+
+
+def refine_spectral_radius(matrix: sp.Matrix, eigenvalue: complex, eigenvector: np.ndarray, precision: int) -> mpmath.mpf:
+    """
+    Refine the dominant eigenvalue computed with float64 numbers to the given precision with the inverse iteration shifted by the
+    eigenvalue, and get its modulus. The shifted matrix is factorized once and every iteration gains about as many digits as the float64
+    eigenvalue has, so a few iterations are enough.
+
+    :param matrix: matrix with exact or high precision values
+    :param eigenvalue: approximation of the eigenvalue with the largest modulus
+    :param eigenvector: approximation of its eigenvector
+    :param precision: number of significant digits of the eigenvalue
+    :return: the modulus of the refined eigenvalue, with the given precision
+    """
+    with mpmath.workdps(precision + GUARD_DIGITS):
+        n = matrix.shape[0]
+        M = mpmath.matrix([[mpmath.mpf(sp.Float(matrix[i, j], precision + GUARD_DIGITS)._mpf_) for j in range(n)] for i in range(n)])
+        shift = mpmath.mpc(eigenvalue)
+
+        try:
+            LU, permutation = mpmath.mp.LU_decomp(M - shift * mpmath.eye(n))
+        except ZeroDivisionError:
+            # The shifted matrix is singular, so the approximation is already an eigenvalue
+            return abs(shift)
+
+        x = mpmath.matrix([mpmath.mpc(value) for value in eigenvector])
+        tolerance = mpmath.mpf(10) ** -(precision + 2)
+        value = shift
+        for _ in range(REFINEMENT_ITERATIONS):
+            # The solution of the shifted system is dominated by the eigenvector of the eigenvalue nearest to the shift
+            y = mpmath.mp.U_solve(LU, mpmath.mp.L_solve(LU, x.copy(), permutation))
+            x = y / mpmath.norm(y)
+
+            # Rayleigh quotient of the new vector
+            new_value = (x.H * (M * x))[0] / (x.H * x)[0]
+            converged = abs(new_value - value) <= tolerance * abs(new_value)
+            value = new_value
+            if converged:
+                break
+
+        # The modulus is computed with the working precision, before leaving it
+        return abs(value)
@@ -0,0 +1,58 @@
+from typing import Callable, List, Tuple
+import numpy as np
+from app.utils.tables import IterationTable
+
+
+def iterate(step: Callable[[np.ndarray], np.ndarray], x_initial: np.ndarray, tol: float, max_iter: int = 100, absolute_error: bool = True, order: int = 0, table: IterationTable = None) -> Tuple[np.ndarray, float, Tuple[List[int], List[List[str]], List[str], str]]:
+    """
+    Run a stationary iterative method with float64 numbers, x_new = step(x), until the norm of the difference between two iterations is
+    less or equal than the tolerance or the maximum number of iterations is reached.
+
+    :param step: function which computes the next approximation of the solution from the current one
+    :param x_initial: vector with the initial guess for the solution
+    :param tol: tolerance for the solution
+    :param max_iter: maximum number of iterations
+    :param absolute_error: boolean to determine if the absolute or relative error is calculated
+    :param order: order of the vectorial norm, 0 for infinite
+    :param table: table to store the iterations, a streaming table sends every row as soon as it is computed
+    :return: the last approximation, its error and the result of the method, with the number of iterations, the solutions for each
+        iteration, the error for each iteration and a message with the result
+    """
+    if order == 0:
+        order = np.inf
+    elif order < 0:
+        raise ValueError("El orden de la norma no es válido, este debe ser 0 o entero positivo")
+
+    # Initialize the table to store the iterations, solutions and errors
+    if table is None:
+        table = IterationTable()
+    counter = 0
+    error = tol + 1
+
+    x_current = np.asarray(x_initial, dtype=float).ravel()
+    table.append(counter, x_current, "-")
+
+    # Iterate while the error is greater than the tolerance and the number of iterations is less than the maximum
+    while error > tol and counter < max_iter:
+        x_new = step(x_current)
+
+        # Calculate the error
+        if absolute_error:
+            error = np.linalg.norm(x_new - x_current, ord=order)
+        else:
+            error = np.linalg.norm((x_new - x_current) / x_new, ord=order)
+
+        # Update the current x vector
+        x_current = x_new
+
+        # Append the values to the table
+        counter += 1
+        table.append(counter, x_current, error)
+
+    if error > tol:
+        message = "El método no converge en {} iteraciones".format(max_iter)
+    else:
+        message = f"{[str(value) for value in x_current]} es una aproximación de la solución del sistema con una tolerancia de {tol}"
+
+    iterations, x, errors = table.columns(3)
+    return x_current, error, (iterations, [list(values) for values in zip(*x)], errors, message)
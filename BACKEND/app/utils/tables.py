@@ -0,0 +1,302 @@
+import json
+import time
+from queue import Queue, Full
+from threading import Thread, Event
+from typing import Any, Callable, Iterator, List, Sequence, Tuple, Union
+import numpy as np
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# Number of rows preallocated by the tables which keep every row, or one of every n rows, doubled when they are full
+TABLE_INITIAL_SIZE = 64
+
+# Python type of the values of the int64 and float64 columns of the tables
+NUMERIC_TYPES = {"i": int, "f": float}
+
+# Maximum number of rows waiting to be sent, the solver waits while the queue is full so the memory stays flat
+STREAM_QUEUE_SIZE = 64
+
+# Seconds to wait between checks of a cancelled stream
+STREAM_POLL_INTERVAL = 0.5
+
+# Media type of every streaming format
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+class StreamCancelled(Exception):
+    """
+    Raised inside the solver when the client of a streaming response disconnects.
+    """
+
+
+class StreamTimeout(Exception):
+    """
+    Raised inside the solver when a row of a streaming response is sent after the time limit of the method.
+    """
+
+
+class IterationTable:
+    """
+    Table of iterations of a numerical method, stored by columns and returned by columns.
+
+    Every column is a preallocated NumPy array with a counter of the stored rows: int64 or float64 while the column only has integers or
+    float64 numbers, and an object array for mpf, Decimal or SymPy numbers and vectors. The values are formatted as strings
+    only when the columns are returned. The table can keep only the last rows, in a ring buffer of that size, or only one of every n
+    rows and the last row, so long runs don't store every iteration.
+    """
+    def __init__(self, last: int = None, every: int = None):
+        if (last is not None and last <= 0) or (every is not None and every <= 0):
+            raise ValueError("El número de filas de la tabla debe ser un entero positivo")
+
+        self.last = last
+        self.every = every
+        # Arrays of the columns, created with the first row, and number of rows stored in them
+        self.data = None
+        self.stored = 0
+        # Number of rows appended to the table, including the ones which are not kept
+        self.size = 0
+        self.last_row = None
+
+    def store(self, position: int, row: Tuple[Any, ...]):
+        """
+        Store a row in a position of the arrays of the columns, growing the arrays if they are full and changing a column to an object
+        array when the value doesn't fit in its numeric type.
+
+        :param position: index of the row in the arrays
+        :param row: values of the iteration, one per column
+        """
+        if self.data is None:
+            capacity = self.last if self.last is not None else TABLE_INITIAL_SIZE
+            self.data = [np.empty(capacity, dtype=column_dtype(value)) for value in row]
+        elif position >= self.data[0].size:
+            self.data = [np.concatenate((column, np.empty(column.size, dtype=column.dtype))) for column in self.data]
+
+        for index, value in enumerate(row):
+            column = self.data[index]
+            # The exact int and float types are the common values, which don't need the checks of column_dtype
+            if column.dtype != object and type(value) is not NUMERIC_TYPES[column.dtype.kind] and column_dtype(value) != column.dtype:
+                column = self.data[index] = column.astype(object)
+            try:
+                column[position] = value
+            except OverflowError:
+                # An integer which doesn't fit in an int64 column
+                column = self.data[index] = column.astype(object)
+                column[position] = value
+
+    def append(self, *row: Any):
+        """
+        Add the row of an iteration to the table.
+
+        :param row: values of the iteration, one per column
+        """
+        if self.last is not None:
+            self.store(self.size % self.last, row)
+            self.stored = min(self.size + 1, self.last)
+        elif self.every is None or self.size % self.every == 0:
+            self.store(self.stored, row)
+            self.stored += 1
+
+        self.last_row = row
+        self.size += 1
+
+    def kept_columns(self) -> List[np.ndarray]:
+        """
+        Get the columns of the rows kept by the table, in the order the rows were appended.
+
+        :return: list with one array per column
+        """
+        if self.last is not None and self.size > self.last:
+            start = self.size % self.last
+            return [np.concatenate((column[start:], column[:start])) for column in self.data]
+
+        columns = [column[:self.stored] for column in self.data]
+
+        # The last row is always returned, even if it is not one of every n rows
+        if self.every is not None and (self.size - 1) % self.every != 0:
+            columns = [np.append(column, np.array([value], dtype=object)) for column, value in zip(columns, self.last_row)]
+
+        return columns
+
+    def columns(self, size: int) -> List[List[Any]]:
+        """
+        Get the columns of the table, with the values of every column except the first one formatted as strings.
+
+        :param size: number of columns of the table
+        :return: list with one list per column
+        """
+        if self.size == 0:
+            return [[] for _ in range(size)]
+
+        return [column.tolist() if index == 0 else [format_value(value) for value in column.tolist()] for index, column in enumerate(self.kept_columns())]
+
+
+def column_dtype(value: Any) -> np.dtype:
+    """
+    Get the type of the array of a column of a table of iterations which can store a value without changing how it is formatted.
+
+    :param value: value of the column
+    :return: int64 for integers, float64 for Python and float64 floats and object for any other value
+    """
+    if isinstance(value, (int, np.signedinteger)) and not isinstance(value, bool):
+        return np.dtype(np.int64)
+    # np.float64 is a subclass of float, the other NumPy floats would be formatted with other digits
+    if isinstance(value, float):
+        return np.dtype(np.float64)
+
+    return np.dtype(object)
+
+
+def format_value(value: Any) -> Union[str, List[Any]]:
+    """
+    Format a value of a table of iterations as a string, or every value of a vector as a list of strings.
+
+    :param value: value to format
+    :return: the formatted value
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [format_value(item) for item in value]
+
+    return str(value)
+
+
+def create_table(trace: str = "full", size: int = 10) -> IterationTable:
+    """
+    Create the table of iterations for the trace requested by a client.
+
+    :param trace: rows to return, full for every row, final for the last row, last for the last rows or every for one of every n rows
+    :param size: number of last rows to return, or step between the rows to return
+    :return: the table of iterations
+    """
+    if trace == "final":
+        return IterationTable(last=1)
+    if trace == "last":
+        return IterationTable(last=size)
+    if trace == "every":
+        return IterationTable(every=size)
+
+    return IterationTable()
+
+
+class StreamingTable(IterationTable):
+    """
+    Table of iterations which sends every row to a queue as soon as it is computed instead of storing it.
+
+    The runner of the method can set a deadline, the monotonic time after which sending a row raises StreamTimeout, so a method with a
+    streaming response stops at the same time limit as the others, even while it waits for a slow client.
+    """
+    def __init__(self, queue: Queue, cancelled: Event):
+        super().__init__()
+        self.queue = queue
+        self.cancelled = cancelled
+        self.deadline = None
+
+    def append(self, *row: Any):
+        """
+        Send the row of an iteration to the queue, waiting while the queue is full.
+
+        :param row: values of the iteration, one per column
+        """
+        self.send("row", (row[0], *(format_value(value) for value in row[1:])), self.deadline)
+
+    def send(self, kind: str, value: Any, deadline: float = None):
+        """
+        Send an event to the queue, waiting while the queue is full. If the stream is cancelled while waiting, StreamCancelled is raised,
+        and if the deadline passes, StreamTimeout is raised.
+
+        :param kind: kind of the event, row, result or error
+        :param value: value of the event
+        :param deadline: monotonic time after which the event isn't sent, None for no limit
+        """
+        while True:
+            if self.cancelled.is_set():
+                raise StreamCancelled()
+            if deadline is not None and time.monotonic() > deadline:
+                raise StreamTimeout()
+            try:
+                self.queue.put((kind, value), timeout=STREAM_POLL_INTERVAL)
+                return
+            except Full:
+                continue
+
+
+def encode_event(event: str, data: dict, stream_format: str) -> str:
+    """
+    Encode an event of a streaming response.
+
+    :param event: name of the event, row, result or error
+    :param data: data of the event
+    :param stream_format: format of the stream, ndjson or sse
+    :return: the encoded event
+    """
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    return json.dumps(data) + "\n"
+
+
+def stream_table(solve: Callable[[IterationTable], Union[Sequence[Any], BaseModel]], columns: Sequence[str], result_columns: Sequence[str], stream_format: str = "ndjson") -> StreamingResponse:
+    """
+    Run a numerical method in a thread and stream the rows of its table of iterations as they are computed. The thread can run the method
+    itself or wait for it in a worker process and send the rows relayed by the worker.
+
+    Every row is sent as an object with one value per column, and the last event has the values returned by the method which are not
+    part of the table, like the message. Errors raised before the first row are raised as usual, so they get the normal status code;
+    errors raised after the first row are sent as an error event.
+
+    :param solve: function which receives the table of iterations, runs the method and returns its result or its response model
+    :param columns: names of the columns of the table
+    :param result_columns: names of the values returned by the method after the columns of the table, or of the fields of the response
+    :param stream_format: format of the stream, ndjson for newline delimited JSON or sse for server-sent events
+    :return: the streaming response
+    """
+    queue = Queue(maxsize=STREAM_QUEUE_SIZE)
+    cancelled = Event()
+    table = StreamingTable(queue, cancelled)
+
+    def run():
+        try:
+            result = solve(table)
+            if isinstance(result, BaseModel):
+                table.send("result", tuple(getattr(result, name) for name in result_columns))
+            else:
+                table.send("result", result[len(columns):])
+        except StreamCancelled:
+            pass
+        except Exception as e:
+            try:
+                table.send("error", e)
+            except StreamCancelled:
+                pass
+
+    Thread(target=run, daemon=True).start()
+
+    # Wait for the first event, so the errors raised while validating the input are raised before the response starts
+    first_event = queue.get()
+    if first_event[0] == "error":
+        raise first_event[1]
+
+    def events() -> Iterator[str]:
+        kind, value = first_event
+        try:
+            while True:
+                if kind == "row":
+                    yield encode_event("row", dict(zip(columns, value)), stream_format)
+                elif kind == "result":
+                    yield encode_event("result", dict(zip(result_columns, value)), stream_format)
+                    return
+                else:
+                    detail = value.detail if isinstance(value, HTTPException) else str(value)
+                    yield encode_event("error", {"detail": detail}, stream_format)
+                    return
+                kind, value = queue.get()
+        finally:
+            # Stop the solver if the client disconnected before the end of the stream
+            cancelled.set()
+
+    return StreamingResponse(events(), media_type=STREAM_MEDIA_TYPES[stream_format])
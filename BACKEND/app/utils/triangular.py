@@ -0,0 +1,86 @@
+from typing import Callable, Union
+import numpy as np
+from app.utils.sparse import CSRMatrix
+
+
+def lower_solver(L: Union[np.ndarray, CSRMatrix], unit_diagonal: bool = False) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build the function which solves L y = r by forward substitution. Only the lower triangle of the matrix is read, so L can be stored
+    together with the upper factor of a factorization.
+
+    :param L: dense or sparse matrix with the lower triangular factor
+    :param unit_diagonal: whether the diagonal of L is made of ones and isn't read
+    :return: the function which computes y from r
+    """
+    n = L.shape[0]
+
+    if not isinstance(L, CSRMatrix):
+        L = np.asarray(L, dtype=float)
+
+        def solve(r: np.ndarray) -> np.ndarray:
+            y = np.zeros(n)
+            for i in range(n):
+                y[i] = r[i] - L[i, :i] @ y[:i]
+                if not unit_diagonal:
+                    y[i] /= L[i, i]
+            return y
+
+        return solve
+
+    # The substitution reads Python lists, which are faster than indexing NumPy arrays one value at a time
+    data, indices, indptr = L.data.tolist(), L.indices.tolist(), L.indptr.tolist()
+
+    def solve(r: np.ndarray) -> np.ndarray:
+        y = r.tolist()
+        for i in range(n):
+            value = y[i]
+            diagonal = 1.0
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if j < i:
+                    value -= data[k] * y[j]
+                elif j == i and not unit_diagonal:
+                    diagonal = data[k]
+            y[i] = value / diagonal
+        return np.array(y)
+
+    return solve
+
+
+def upper_solver(U: Union[np.ndarray, CSRMatrix]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build the function which solves U z = y by backward substitution. Only the upper triangle of the matrix, with the diagonal, is read.
+
+    :param U: dense or sparse matrix with the upper triangular factor
+    :return: the function which computes z from y
+    """
+    n = U.shape[0]
+
+    if not isinstance(U, CSRMatrix):
+        U = np.asarray(U, dtype=float)
+
+        def solve(y: np.ndarray) -> np.ndarray:
+            z = np.zeros(n)
+            for i in range(n - 1, -1, -1):
+                z[i] = (y[i] - U[i, i + 1:] @ z[i + 1:]) / U[i, i]
+            return z
+
+        return solve
+
+    data, indices, indptr = U.data.tolist(), U.indices.tolist(), U.indptr.tolist()
+
+    def solve(y: np.ndarray) -> np.ndarray:
+        z = y.tolist()
+        for i in range(n - 1, -1, -1):
+            value = z[i]
+            diagonal = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if j > i:
+                    value -= data[k] * z[j]
+                elif j == i:
+                    diagonal = data[k]
+            z[i] = value / diagonal
+        return np.array(z)
+
+    return solve
@@ -1,10 +1,13 @@
 from logging import Logger
 from fastapi import HTTPException, status
 import sympy as sp
-from typing import Tuple
+from typing import Optional, Tuple, Union
 from sympy.core.sympify import SympifyError
 import re
 import numpy as np
+from app.utils.cache import expressions_cache
+from app.utils.compiler import FLOAT64_MAX_PRECISION
+from app.utils.spectral import dominant_eigenpair, refine_spectral_radius
 
 
 def raise_exception(e: Exception, logger: Logger):
@@ -27,7 +30,8 @@ def raise_exception(e: Exception, logger: Logger):
 
 def parse_expression(expression: str, logger: Logger, variable_character: str = None) -> Tuple[sp.Expr, list[sp.Symbol]]:
     """
-    Parse the expression and return the sympy expression and the variables in the expression
+    Parse the expression and return the sympy expression and the variables in the expression. The parsed expressions are stored in an LRU cache
+    keyed by the expression text and the variable character, so repeated expressions skip the parsing and validation
 
     Arguments:
         expression (str) : The expression to parse
@@ -41,6 +45,13 @@ def parse_expression(expression: str, logger: Logger, variable_character: str =
     if not expression:
         raise_exception(ValueError("La expresión o función no puede ser vacía"), logger)
 
+    # Return the cached result if the expression was already parsed
+    cache_key = (expression, variable_character)
+    cached = expressions_cache.get(cache_key)
+    if cached is not None:
+        expr, variables = cached
+        return expr, list(variables)
+
     # Try to parse the expression, if it fails raise an exception
     try:
         expr = sp.sympify(expression)
@@ -61,6 +72,9 @@ def parse_expression(expression: str, logger: Logger, variable_character: str =
     for variable in variables:
         if re.search(rf"{variable.name}\(", expression) or re.search(rf"\){variable.name}", expression) or len(variable.name) > 1:
             raise_exception(SyntaxError("Expresión Inválida, verifique la guía de expresiones"), logger)
+
+    # Store the valid expression in the cache
+    expressions_cache.put(cache_key, (expr, tuple(variables)))
         
     # Return the expression and the variables
     return expr, variables
@@ -90,24 +104,52 @@ def construct_augmented_matrix(A: np.ndarray, b: np.ndarray) -> np.ndarray:
     return Ab
 
 
-def calculate_spectral_radius(A: sp.Matrix, precision: int = 16) -> str:
+def select_engine(precision: int, engine: Optional[str], logger: Logger) -> str:
     """
-    Calculate the spectral radius of the matrix A
+    Select the numbers used by the direct methods of the linear equation systems. By default float64 numbers are used when the
+    precision fits in them and Decimal numbers otherwise.
 
     Arguments:
-        A (sp.Matrix) : The matrix to calculate the spectral radius
+        precision (int) : The number of significant digits of the method
+        engine (str) : The engine requested by the client, float64, decimal or None to select it with the precision
+        logger (Logger) : The logger instance to log
+
+    Returns:
+        str : The engine to use, float64 or decimal
+    """
+    if engine is None:
+        return "float64" if precision <= FLOAT64_MAX_PRECISION else "decimal"
+    if engine not in ("float64", "decimal"):
+        raise_exception(ValueError("El motor de cálculo no es válido, este debe ser float64 o decimal"), logger)
+
+    return engine
+
+
+def calculate_spectral_radius(A: Union[sp.Matrix, np.ndarray], precision: int = 16) -> str:
+    """
+    Calculate the spectral radius of the matrix A. The eigenvalue with the largest modulus is computed with float64 numbers, with the
+    dense eigenvalue solver of NumPy for small matrices and with the Arnoldi iteration for large ones, and for a SymPy matrix and more
+    than 15 digits of precision it is refined with the inverse iteration using numbers of the given precision. A NumPy matrix only gets
+    the 15 digits of the float64 numbers.
+
+    Arguments:
+        A (Union[sp.Matrix, np.ndarray]) : The matrix to calculate the spectral radius
         precision (int) : The precision to calculate the spectral radius
 
     Returns:
         str : The spectral radius of the matrix A
     """
-    # Get the eigenvalues of the matrix A
-    eigenvalues = A.eigenvals()
+    # Get the eigenvalue with the largest modulus
+    eigenvalue, eigenvector = dominant_eigenpair(np.array(A, dtype=float))
 
-    # Get the maximum eigenvalue
-    max_eigenvalue = str(max([sp.Abs(eig.evalf(precision)).evalf(precision) for eig in eigenvalues.keys()]))
+    if precision > FLOAT64_MAX_PRECISION and isinstance(A, sp.MatrixBase):
+        spectral_radius = refine_spectral_radius(A, eigenvalue, eigenvector, precision)
+    else:
+        # A float64 spectral radius doesn't have more digits than a float64 number
+        spectral_radius = abs(eigenvalue)
+        precision = min(precision, FLOAT64_MAX_PRECISION)
 
-    return max_eigenvalue
+    return str(sp.Float(spectral_radius, precision))
 
 
 def is_strictly_diagonally_dominant(A: np.ndarray) -> bool:
@@ -0,0 +1,379 @@
+import asyncio
+import multiprocessing
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from multiprocessing.connection import Connection
+from threading import BoundedSemaphore, Lock, local
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from app.config.env import EXECUTION_MODE, MAX_WORKERS, JOB_TIMEOUT
+from app.utils.cache import methods_caches_stats, add_caches_stats
+from app.utils.tables import IterationTable, StreamingTable, StreamCancelled, StreamTimeout, format_value, stream_table
+
+
+def timeout_exception(timeout: float) -> HTTPException:
+    """
+    Create the exception raised when a job runs for longer than the time limit.
+
+    :param timeout: time limit of the jobs in seconds
+    :return: the exception
+    """
+    return HTTPException(status_code=504, detail=f"El método excedió el tiempo máximo de ejecución de {timeout:g} segundos")
+
+
+class ConnectionTable(IterationTable):
+    """
+    Table of iterations of a job with a streaming response, which sends every row through the connection of the worker process as soon
+    as it is computed. The send waits while the pipe is full, so a slow client also slows down the method instead of filling the memory.
+    """
+    def __init__(self, connection: Connection):
+        super().__init__()
+        self.connection = connection
+
+    def append(self, *row: Any):
+        """
+        Send the row of an iteration to the server process, with the values formatted as strings.
+
+        :param row: values of the iteration, one per column
+        """
+        self.connection.send(("row", (row[0], *(format_value(value) for value in row[1:]))))
+
+
+def worker_main(connection: Connection):
+    """
+    Main loop of a worker process, which runs the jobs received through the connection and sends back their results. The jobs with a
+    streaming response receive a table which sends their rows before the result.
+
+    :param connection: connection with the server process
+    """
+    # The server process handles the interruptions, and stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+
+        function, args, stream = job
+        try:
+            if stream:
+                args = (*args, ConnectionTable(connection))
+            message = ("result", function(*args))
+        except HTTPException as e:
+            # HTTPException can't be pickled, so its status code and detail are sent instead
+            message = ("http_error", e.status_code, e.detail)
+        except Exception as e:
+            message = ("error", e)
+
+        # The counters of the caches of the worker are sent before every result, so the server can report them
+        try:
+            connection.send(("stats", methods_caches_stats()))
+            connection.send(message)
+        except Exception:
+            connection.send(("error", RuntimeError(str(message[-1]))))
+
+
+class Worker:
+    """
+    Worker process which runs one job at a time, connected to the server process with a pipe.
+    """
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=worker_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+        # Counters of the caches of the process sent with its last result
+        self.stats = None
+
+    def stop(self, kill: bool = False):
+        """
+        Stop the worker process, waiting for its current job unless it is killed.
+
+        :param kill: whether to kill the process instead of asking it to stop
+        """
+        if not kill:
+            try:
+                self.connection.send(None)
+                self.process.join(timeout=5)
+            except (OSError, ValueError):
+                pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class ProcessRunner:
+    """
+    Bounded pool of worker processes which run the jobs of the routes outside of the server process, so the CPU-bound methods don't hold
+    the GIL of the server.
+
+    Every thread of the dispatcher owns one worker process, so at most max_workers jobs run at once and the others wait in the queue of
+    the dispatcher. A job which runs for longer than the time limit gets its worker killed and replaced, without affecting other jobs.
+    """
+    def __init__(self, max_workers: int, timeout: Optional[float] = None):
+        if max_workers <= 0:
+            raise ValueError("El número de procesos debe ser un entero positivo")
+
+        self.timeout = timeout
+        self.context = multiprocessing.get_context("spawn")
+        self.dispatcher = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="worker")
+        self.local = local()
+        self.workers: Set[Worker] = set()
+        self.lock = Lock()
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a job in a worker process and wait for its result without blocking the event loop.
+
+        :param function: function of the job, defined at the top level of a module so it can be pickled
+        :param args: arguments of the function
+        :return: the value returned by the function
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.dispatcher, self.call, function, args)
+
+    def stream(self, function: Callable[..., Any], args: tuple, table: StreamingTable) -> Any:
+        """
+        Run a job with a streaming response in a worker process, waiting in the queue of the dispatcher like the other jobs. The rows sent
+        by the worker are appended to the table as they arrive. It blocks the calling thread, which must not be the one of the event loop.
+
+        :param function: function of the job, which receives the table of iterations after the arguments
+        :param args: arguments of the function
+        :param table: streaming table of the response
+        :return: the value returned by the function
+        """
+        return self.dispatcher.submit(self.call, function, args, table).result()
+
+    def call(self, function: Callable[..., Any], args: tuple, table: StreamingTable = None) -> Any:
+        """
+        Run a job in the worker process of the current thread of the dispatcher, starting it if needed.
+
+        :param function: function of the job
+        :param args: arguments of the function
+        :param table: streaming table which receives the rows of the job, None if the response isn't streamed
+        :return: the value returned by the function
+        """
+        worker = getattr(self.local, "worker", None)
+        if worker is None or not worker.process.is_alive():
+            if worker is not None:
+                self.discard(worker)
+            worker = Worker(self.context)
+            self.local.worker = worker
+            with self.lock:
+                self.workers.add(worker)
+
+        try:
+            worker.connection.send((function, args, table is not None))
+        except (BrokenPipeError, ConnectionResetError):
+            self.discard(worker)
+            raise RuntimeError("El proceso que ejecutaba el método terminó inesperadamente")
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        if table is not None:
+            table.deadline = deadline
+
+        while True:
+            # The worker is killed if the job doesn't finish in time, the next job of this thread starts a new one
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not worker.connection.poll(remaining):
+                self.discard(worker)
+                raise timeout_exception(self.timeout)
+
+            try:
+                message = worker.connection.recv()
+            except EOFError:
+                self.discard(worker)
+                raise RuntimeError("El proceso que ejecutaba el método terminó inesperadamente")
+            if message[0] == "stats":
+                worker.stats = message[1]
+                continue
+            if message[0] != "row":
+                break
+
+            # The worker is killed too if the client disconnects or doesn't read the rows in time
+            try:
+                table.append(*message[1])
+            except StreamTimeout:
+                self.discard(worker)
+                raise timeout_exception(self.timeout)
+            except StreamCancelled:
+                self.discard(worker)
+                raise
+
+        if message[0] == "http_error":
+            raise HTTPException(status_code=message[1], detail=message[2])
+        if message[0] == "error":
+            raise message[1]
+        return message[1]
+
+    def caches_stats(self) -> List[Dict[str, Dict[str, int]]]:
+        """
+        Get the counters of the caches of the live worker processes, as they were after the last job of every worker.
+
+        :return: list with the counters of the caches of every worker which finished a job
+        """
+        with self.lock:
+            return [worker.stats for worker in self.workers if worker.stats is not None]
+
+    def discard(self, worker: Worker):
+        """
+        Kill a worker process and forget it.
+
+        :param worker: the worker to discard
+        """
+        with self.lock:
+            self.workers.discard(worker)
+        if getattr(self.local, "worker", None) is worker:
+            self.local.worker = None
+        worker.stop(kill=True)
+
+    def shutdown(self):
+        """
+        Stop the dispatcher and every worker process, cancelling the jobs which didn't start.
+        """
+        self.dispatcher.shutdown(wait=False, cancel_futures=True)
+        with self.lock:
+            workers = list(self.workers)
+            self.workers.clear()
+        for worker in workers:
+            worker.stop()
+
+
+class ThreadRunner:
+    """
+    Runner which runs the jobs in threads of the server process, without starting other processes. The event loop isn't blocked, but the
+    jobs share the GIL of the server and a job which runs for longer than the time limit keeps running after its request fails, except
+    the jobs with a streaming response, which stop at the first row sent after the time limit.
+    """
+    def __init__(self, timeout: Optional[float] = None, max_workers: Optional[int] = None):
+        self.timeout = timeout
+        # At most max_workers jobs with a streaming response run at once
+        self.semaphore = BoundedSemaphore(max_workers) if max_workers is not None else nullcontext()
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a job in a thread and wait for its result without blocking the event loop.
+
+        :param function: function of the job
+        :param args: arguments of the function
+        :return: the value returned by the function
+        """
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(function, *args), self.timeout)
+        except asyncio.TimeoutError:
+            raise timeout_exception(self.timeout)
+
+    def stream(self, function: Callable[..., Any], args: tuple, table: StreamingTable) -> Any:
+        """
+        Run a job with a streaming response in the calling thread, which must not be the one of the event loop.
+
+        :param function: function of the job, which receives the table of iterations after the arguments
+        :param args: arguments of the function
+        :param table: streaming table of the response
+        :return: the value returned by the function
+        """
+        with self.semaphore:
+            if self.timeout is not None:
+                table.deadline = time.monotonic() + self.timeout
+            try:
+                return function(*args, table)
+            except StreamTimeout:
+                raise timeout_exception(self.timeout)
+
+    def caches_stats(self) -> List[Dict[str, Dict[str, int]]]:
+        """
+        The jobs fill the caches of the server process, so there are no other counters.
+
+        :return: an empty list
+        """
+        return []
+
+    def shutdown(self):
+        """
+        Nothing to stop, the threads belong to the event loop.
+        """
+
+
+# Runner shared by every request, created with the first job
+runner = None
+runner_lock = Lock()
+
+# Threads which wait for the first event of the streaming responses, so the streams waiting for a worker don't take the threads of the
+# default executor of the event loop
+stream_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="stream")
+
+
+def get_runner():
+    """
+    Get the runner of the jobs, creating it if it doesn't exist. The runner is chosen with the EXECUTION_MODE environment variable,
+    process for a pool of worker processes or thread for threads of the server process.
+
+    :return: the runner of the jobs
+    """
+    global runner
+    with runner_lock:
+        if runner is None:
+            if EXECUTION_MODE not in ("process", "thread"):
+                raise ValueError("El modo de ejecución debe ser process o thread")
+            runner = ProcessRunner(MAX_WORKERS, JOB_TIMEOUT) if EXECUTION_MODE == "process" else ThreadRunner(JOB_TIMEOUT, MAX_WORKERS)
+        return runner
+
+
+def shutdown_runner():
+    """
+    Stop the runner of the jobs, if it exists. The next job creates a new runner.
+    """
+    global runner
+    with runner_lock:
+        if runner is not None:
+            runner.shutdown()
+            runner = None
+
+
+def caches_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the counters of the caches of the methods of the server process and of every worker process of the runner, added cache by cache.
+
+    :return: dictionary with the total counters of every cache
+    """
+    with runner_lock:
+        workers_stats = runner.caches_stats() if runner is not None else []
+
+    return add_caches_stats([methods_caches_stats(), *workers_stats])
+
+
+async def run_job(function: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a job with the runner of the jobs and wait for its result.
+
+    :param function: function of the job, defined at the top level of a module so it can be sent to a worker process
+    :param args: arguments of the function
+    :return: the value returned by the function
+    """
+    return await get_runner().run(function, *args)
+
+
+async def stream_job(function: Callable[[Any, IterationTable], BaseModel], data: Any, columns: Sequence[str], result_columns: Sequence[str], stream_format: str = "ndjson") -> StreamingResponse:
+    """
+    Run a job with the runner of the jobs and stream the rows of its table of iterations as they are computed, with the same limits of
+    workers and time as the other jobs. The first event is awaited in a thread of the stream executor, so the streams waiting for a
+    worker don't block other work of the event loop, like asyncio.to_thread.
+
+    :param function: function of the job, which receives the data of the request and the table of iterations
+    :param data: data of the request
+    :param columns: names of the columns of the table
+    :param result_columns: names of the fields of the response sent in the last event
+    :param stream_format: format of the stream, ndjson or sse
+    :return: the streaming response
+    """
+    job_runner = get_runner()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(stream_executor, stream_table, lambda table: job_runner.stream(function, (data,), table), columns, result_columns, stream_format)